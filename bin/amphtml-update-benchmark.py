@@ -0,0 +1,491 @@
+"""
+Benchmark for amphtml-update.py with synthetic validator spec fixtures.
+
+Writes a synthetic amphtml checkout for each scale, with a validator.proto, a
+validator-main.protoascii and extension protoascii files whose tags, attr_lists,
+value_properties and css_spec blocks are a multiple of the current spec's size.
+Each stage of the generator is then timed on it in a separate process, which
+also records the peak resident memory. Nothing is downloaded.
+
+To benchmark the default scales and write the results as JSON, type:
+
+`python bin/amphtml-update-benchmark.py --output=benchmark.json`
+
+Only the Python protobuf package is needed, as for amphtml-update.py itself.
+"""
+
+import argparse
+import imp
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(os.path.dirname(os.path.realpath(__file__)), 'amphtml-update.py'))
+import amphtml_spec
+
+# Size of the current spec, which a scale of 1 resembles.
+BASE_MAIN_TAGS = 350
+BASE_EXTENSIONS = 75
+BASE_ATTR_LISTS = 30
+BASE_DESCENDANT_TAG_LISTS = 8
+
+# The subset of amphtml's validator/validator.proto which amphtml-update.py reads.
+VALIDATOR_PROTO = '''syntax = "proto2";
+package amp.validator;
+
+message UrlSpec {
+  repeated string protocol = 1;
+  optional bool allow_relative = 2 [default = true];
+  optional bool allow_empty = 3;
+}
+message PropertySpec {
+  optional string name = 1;
+  optional string value = 2;
+  optional double value_double = 3;
+  optional bool mandatory = 4;
+}
+message PropertySpecList {
+  repeated PropertySpec properties = 1;
+}
+message AttrSpec {
+  enum DispatchKeyType {
+    NONE_DISPATCH = 0;
+    NAME_DISPATCH = 1;
+    NAME_VALUE_DISPATCH = 2;
+    NAME_VALUE_PARENT_DISPATCH = 3;
+  }
+  optional string name = 1;
+  repeated string alternative_names = 2;
+  optional bool mandatory = 3;
+  repeated string value = 4;
+  repeated string value_casei = 5;
+  optional string value_regex = 6;
+  optional string value_regex_casei = 7;
+  optional UrlSpec value_url = 8;
+  optional PropertySpecList value_properties = 9;
+  optional string blacklisted_value_regex = 10;
+  optional DispatchKeyType dispatch_key = 11;
+  repeated string requires_extension = 12;
+  repeated string enabled_by = 13;
+  repeated string disabled_by = 14;
+}
+message AttrList {
+  optional string name = 1;
+  repeated AttrSpec attrs = 2;
+}
+message BlackListedCDataRegex {
+  optional string regex = 1;
+  optional string error_message = 2;
+}
+message AtRuleSpec {
+  optional string name = 1;
+}
+message CssSpec {
+  repeated AtRuleSpec at_rule_spec = 1;
+  repeated string allowed_declarations = 2;
+  repeated string declaration = 3;
+  optional UrlSpec font_url_spec = 4;
+  optional UrlSpec image_url_spec = 5;
+  optional bool validate_keyframes = 6;
+}
+message CdataSpec {
+  optional int32 max_bytes = 1;
+  optional string max_bytes_spec_url = 2;
+  optional CssSpec css_spec = 3;
+  optional string cdata_regex = 4;
+  repeated BlackListedCDataRegex blacklisted_cdata_regex = 5;
+  optional string mandatory_cdata = 6;
+}
+message ChildTagSpec {
+  optional int32 mandatory_num_child_tags = 1 [default = -1];
+  repeated string child_tag_name_oneof = 2;
+  repeated string first_child_tag_name_oneof = 3;
+  optional int32 mandatory_min_num_child_tags = 4 [default = -1];
+}
+enum AmpLayout_Layout {
+  UNKNOWN = 0;
+  NODISPLAY = 1;
+  FIXED = 2;
+  FIXED_HEIGHT = 3;
+  RESPONSIVE = 4;
+  CONTAINER = 5;
+  FILL = 6;
+  FLEX_ITEM = 7;
+  FLUID = 8;
+  INTRINSIC = 9;
+}
+message AmpLayout {
+  repeated AmpLayout_Layout supported_layouts = 1;
+  optional bool defines_default_width = 2;
+  optional bool defines_default_height = 3;
+}
+message ExtensionSpec {
+  optional string name = 1;
+  repeated string version = 2;
+  repeated string deprecated_version = 3;
+  optional bool deprecated_allow_duplicates = 4;
+}
+message ReferencePoint {
+  optional string tag_spec_name = 1;
+  optional bool mandatory = 2;
+  optional bool unique = 3;
+}
+message TagSpec {
+  enum HtmlFormat {
+    UNKNOWN_CODE = 0;
+    AMP = 1;
+    AMP4ADS = 2;
+    AMP4EMAIL = 3;
+  }
+  optional string tag_name = 1;
+  optional string spec_name = 2;
+  optional string spec_url = 3;
+  optional string mandatory_parent = 4;
+  optional string mandatory_ancestor = 5;
+  optional string mandatory_ancestor_suggested_alternative = 6;
+  repeated string disallowed_ancestor = 7;
+  optional bool mandatory = 8;
+  optional string mandatory_alternatives = 9;
+  optional bool unique = 10;
+  optional bool unique_warning = 11;
+  repeated string also_requires_tag = 12;
+  repeated string also_requires_tag_warning = 13;
+  repeated string requires_extension = 14;
+  repeated AttrSpec attrs = 15;
+  repeated string attr_lists = 16;
+  optional CdataSpec cdata = 17;
+  optional ChildTagSpec child_tags = 18;
+  optional string descendant_tag_list = 19;
+  optional AmpLayout amp_layout = 20;
+  repeated HtmlFormat html_format = 21;
+  repeated string enabled_by = 22;
+  repeated string disabled_by = 23;
+  optional ExtensionSpec extension_spec = 24;
+  repeated ReferencePoint reference_points = 25;
+  optional string deprecation = 26;
+}
+message DescendantTagList {
+  optional string name = 1;
+  repeated string tag = 2;
+}
+message ValidatorRules {
+  optional int32 spec_file_revision = 1;
+  optional int32 min_validator_revision_required = 2;
+  repeated TagSpec tags = 3;
+  repeated AttrList attr_lists = 4;
+  repeated DescendantTagList descendant_tag_list = 5;
+}
+'''
+
+# Functions of amphtml-update.py and the spec model which are timed, besides the stages themselves.
+TIMED_FUNCTIONS = ((amphtml_spec, 'GetTagSpec'), (amphtml_spec, 'GetAttrSpecs'), (amphtml_update, 'Phpize'))
+
+
+def Quote(string):
+	"""Quotes a string for the protobuf text format.
+
+	Args:
+		string: string to quote.
+	Returns:
+		Quoted string.
+	"""
+	return '"%s"' % string.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def GetSyntheticAttr(name, i):
+	"""Builds an attribute spec in the protobuf text format.
+
+	Args:
+		name: attribute name.
+		i: number varying the kind of attribute spec.
+	Returns:
+		String with the AttrSpec message.
+	"""
+	fields = ['name: %s' % Quote(name)]
+	kind = i % 7
+	if 0 == kind:
+		fields.append('mandatory: true')
+	elif 1 == kind:
+		fields.extend('value: %s' % Quote('value-%d' % j) for j in range(i % 5 + 1))
+	elif 2 == kind:
+		fields.extend('value_casei: %s' % Quote('Value-%d' % j) for j in range(i % 4 + 1))
+	elif 3 == kind:
+		fields.append('value_regex: %s' % Quote('(\\d+)|([a-z-]+-%d)' % i))
+	elif 4 == kind:
+		fields.append('alternative_names: %s' % Quote('%sset' % name))
+		fields.append('value_url: { protocol: "https" protocol: "http" allow_relative: true }')
+		fields.append('blacklisted_value_regex: "__amp_source_origin"')
+	elif 5 == kind:
+		fields.append('value_regex_casei: %s' % Quote('(auto|none|%d)' % i))
+		fields.append('requires_extension: %s' % Quote('amp-synthetic-%d' % i))
+	return 'attrs: { %s }' % ' '.join(fields)
+
+
+def GetSyntheticTag(tag_name, i, attr_list_count, descendant_tag_list_count):
+	"""Builds a tag spec in the protobuf text format.
+
+	Args:
+		tag_name: upper case tag name.
+		i: number varying the kind of tag spec.
+		attr_list_count: number of attribute lists the tag spec can refer to.
+		descendant_tag_list_count: number of descendant tag lists the tag spec can refer to.
+	Returns:
+		String with the TagSpec message.
+	"""
+	lines = [
+		'tags: {',
+		'  tag_name: %s' % Quote(tag_name),
+		'  spec_name: %s' % Quote('%s synthetic %d' % (tag_name.lower(), i)),
+		'  spec_url: %s' % Quote('https://amp.dev/documentation/components/%s' % tag_name.lower()),
+		'  html_format: AMP',
+	]
+
+	# Some tags are skipped by the generator, like in the real spec.
+	if 0 == i % 29:
+		lines.append('  deprecation: "synthetic"')
+	elif 0 == i % 31:
+		lines[4] = '  html_format: AMP4EMAIL'
+	elif 0 == i % 37:
+		lines.append('  enabled_by: "transformed"')
+
+	if attr_list_count:
+		lines.append('  attr_lists: %s' % Quote('synthetic-attrs-%d' % (i % attr_list_count)))
+	for j in range(i % 6 + 2):
+		lines.append('  %s' % GetSyntheticAttr('data-attr-%d' % j, i + j))
+	if 0 == i % 3:
+		lines.append('  amp_layout: { supported_layouts: FIXED supported_layouts: RESPONSIVE supported_layouts: FILL }')
+	if 0 == i % 5:
+		lines.append('  disallowed_ancestor: "AMP-SIDEBAR"')
+		lines.append('  requires_extension: %s' % Quote(tag_name.lower()))
+	if 0 == i % 9:
+		lines.append('  child_tags: { mandatory_min_num_child_tags: 1 child_tag_name_oneof: "DIV" child_tag_name_oneof: "P" }')
+	if descendant_tag_list_count and 0 == i % 13:
+		lines.append('  descendant_tag_list: %s' % Quote('synthetic-descendants-%d' % (i % descendant_tag_list_count)))
+
+	# The value_properties of meta[name=viewport] and friends.
+	if 0 == i % 20:
+		lines.append('  attrs: { name: "content" mandatory: true value_properties: {')
+		for j in range(6):
+			lines.append('    properties: { name: %s value: %s }' % (Quote('property-%d' % j), Quote('value-%d' % j)))
+		lines.append('    properties: { name: "minimum-scale" value_double: 1.0 }')
+		lines.append('  } }')
+
+	# The css_spec of style[amp-custom] and friends.
+	if 0 == i % 50:
+		lines.append('  cdata: {')
+		lines.append('    max_bytes: 50000')
+		lines.append('    css_spec: {')
+		for at_rule in ('font-face', 'keyframes', 'media', 'supports', '$DEFAULT'):
+			lines.append('      at_rule_spec: { name: %s }' % Quote(at_rule))
+		for j in range(12):
+			lines.append('      declaration: %s' % Quote('synthetic-property-%d' % j))
+		lines.append('      font_url_spec: { protocol: "https" }')
+		lines.append('      image_url_spec: { protocol: "https" protocol: "data" }')
+		lines.append('      validate_keyframes: true')
+		lines.append('    }')
+		lines.append('    blacklisted_cdata_regex: { regex: "!important" error_message: "CSS !important" }')
+		lines.append('  }')
+
+	lines.append('}')
+	return '\n'.join(lines)
+
+
+def WriteSyntheticSpec(amphtml_directory, scale):
+	"""Writes the validator spec files of a synthetic amphtml checkout.
+
+	Args:
+		amphtml_directory: directory to write the checkout to.
+		scale: multiple of the size of the current spec.
+	"""
+	validator_directory = os.path.join(amphtml_directory, 'validator')
+	os.makedirs(validator_directory)
+	f = open(os.path.join(validator_directory, 'validator.proto'), 'w')
+	f.write(VALIDATOR_PROTO)
+	f.close()
+
+	attr_list_count = BASE_ATTR_LISTS * scale
+	descendant_tag_list_count = BASE_DESCENDANT_TAG_LISTS * scale
+
+	main = ['min_validator_revision_required: 375', 'spec_file_revision: 882']
+	for i in range(descendant_tag_list_count):
+		main.append('descendant_tag_list: { name: %s %s }' % (Quote('synthetic-descendants-%d' % i), ' '.join('tag: %s' % Quote(tag) for tag in ('A', 'B', 'DIV', 'P', 'SPAN', 'AMP-IMG'))))
+	for name in ('$GLOBAL_ATTRS', '$AMP_LAYOUT_ATTRS'):
+		main.append('attr_lists: { name: %s %s }' % (Quote(name), ' '.join(GetSyntheticAttr('global-attr-%d' % j, j) for j in range(12))))
+	for i in range(attr_list_count):
+		main.append('attr_lists: { name: %s %s }' % (Quote('synthetic-attrs-%d' % i), ' '.join(GetSyntheticAttr('list-attr-%d' % j, i + j) for j in range(8))))
+	for i in range(BASE_MAIN_TAGS * scale):
+		main.append(GetSyntheticTag('SYNTHETIC-%d' % (i % (BASE_MAIN_TAGS * scale / 2 or 1)), i, attr_list_count, descendant_tag_list_count))
+	f = open(os.path.join(validator_directory, 'validator-main.protoascii'), 'w')
+	f.write('\n'.join(main) + '\n')
+	f.close()
+
+	for i in range(BASE_EXTENSIONS * scale):
+		extension_name = 'amp-synthetic-%d' % i
+		extension_directory = os.path.join(amphtml_directory, 'extensions', extension_name)
+		os.makedirs(extension_directory)
+		extension = [
+			'tags: {',
+			'  tag_name: "SCRIPT"',
+			'  spec_name: %s' % Quote('%s extension .js script' % extension_name),
+			'  html_format: AMP',
+			'  mandatory_parent: "HEAD"',
+			'  extension_spec: { name: %s version: "0.1" version: "latest" }' % Quote(extension_name),
+			'  attr_lists: "synthetic-attrs-0"',
+			'}',
+			GetSyntheticTag(extension_name.upper(), i, attr_list_count, descendant_tag_list_count),
+			GetSyntheticTag(extension_name.upper(), i + 1, attr_list_count, descendant_tag_list_count),
+		]
+		f = open(os.path.join(extension_directory, 'validator-%s.protoascii' % extension_name), 'w')
+		f.write('\n'.join(extension) + '\n')
+		f.close()
+
+
+def TimeFunctions(names, timings):
+	"""Wraps functions of amphtml-update.py or the spec model to add up how often they are called and how long they take.
+
+	Calls of a function from within itself are only timed once.
+
+	Args:
+		names: tuples of the module and the name of the functions to wrap.
+		timings: dictionary to add the calls and seconds of each function to.
+	"""
+	def Wrap(name, function):
+		timing = timings.setdefault(name, {'calls': 0, 'seconds': 0.0})
+		depth = [0]
+
+		def Timed(*args, **kwargs):
+			timing['calls'] += 1
+			depth[0] += 1
+			start = time.time()
+			try:
+				return function(*args, **kwargs)
+			finally:
+				depth[0] -= 1
+				if 0 == depth[0]:
+					timing['seconds'] += time.time() - start
+		return Timed
+
+	for (module, name) in names:
+		setattr(module, name, Wrap(name, getattr(module, name)))
+
+
+def RunScale(amphtml_directory, out_dir):
+	"""Runs the stages of amphtml-update.py on a synthetic checkout and times each of them.
+
+	Args:
+		amphtml_directory: directory of the synthetic amphtml checkout.
+		out_dir: directory name of the output directory.
+	Returns:
+		Dictionary with the timings of the stages and functions, the output size and the peak memory.
+	"""
+	validator_directory = os.path.join(amphtml_directory, 'validator')
+	functions = {}
+	TimeFunctions(TIMED_FUNCTIONS, functions)
+	stages = {}
+
+	def TimeStage(name, run):
+		start = time.time()
+		result = run()
+		stages[name] = time.time() - start
+		return result
+
+	amphtml_update.SetupOutDir(out_dir)
+	TimeStage('descriptor', lambda: amphtml_update.GenValidatorDescriptor(validator_directory, out_dir))
+	TimeStage('parse', lambda: amphtml_update.GenValidatorRules(validator_directory, out_dir))
+
+	allowed_tags, attr_lists, descendant_lists, reference_points, versions = TimeStage('rules', lambda: amphtml_update.ParseRules(out_dir))
+
+	def Emit():
+		lines = []
+		amphtml_update.AddSpecFacts(allowed_tags, amphtml_update.GetLayoutNames(out_dir))
+		amphtml_update.AddPcrePatterns(out_dir, allowed_tags, attr_lists, reference_points)
+		amphtml_update.AddEnumSets(allowed_tags, attr_lists, reference_points, 'both')
+		amphtml_update.GenerateClassPHP(lines, out_dir, False, allowed_tags, attr_lists, descendant_lists, reference_points, versions)
+		return lines
+	lines = TimeStage('emit', Emit)
+
+	def Write():
+		out = amphtml_update.AtomicFileWriter(os.path.join(out_dir, amphtml_update.GENERATED_PHP_FILE))
+		for line in lines:
+			out.append(line)
+		out.commit()
+		return out.bytes_written
+	output_bytes = TimeStage('write', Write)
+
+	return {
+		'stages': stages,
+		'functions': functions,
+		'tag_specs': sum(len(tag_specs) for tag_specs in allowed_tags.values()),
+		'output_bytes': output_bytes,
+		'peak_memory_mb': amphtml_update.GetPeakMemory(),
+	}
+
+
+def GetSpecSize(amphtml_directory):
+	"""Gets the total size of the protoascii files of a checkout.
+
+	Args:
+		amphtml_directory: directory of the amphtml checkout.
+	Returns:
+		Number of bytes.
+	"""
+	files = amphtml_update.GetProtoasciiFiles(os.path.join(amphtml_directory, 'validator'))
+	return sum(os.path.getsize(path) for path in files)
+
+
+def Main():
+	parser = argparse.ArgumentParser(description='Benchmark amphtml-update.py with synthetic spec fixtures.')
+	parser.add_argument('--scales', default='1,5,20,50', help='Comma-separated multiples of the current spec size to benchmark.')
+	parser.add_argument('--output', help='Path to write the JSON results to, instead of writing them to STDOUT.')
+	parser.add_argument('--work-dir', help='Directory to write the fixtures and outputs to; a temporary directory by default.')
+	parser.add_argument('--run-scale', type=int, help=argparse.SUPPRESS)
+	args = parser.parse_args()
+
+	work_dir = args.work_dir or tempfile.mkdtemp(prefix='amp-wp-benchmark-')
+
+	# Each scale is run in its own process, so that the peak memory is its own.
+	if args.run_scale is not None:
+		scale_dir = os.path.join(work_dir, 'scale-%d' % args.run_scale)
+		result = RunScale(os.path.join(scale_dir, 'amphtml'), os.path.join(scale_dir, 'out'))
+		json.dump(result, sys.stdout)
+		return
+
+	results = []
+	try:
+		for scale in [int(scale) for scale in args.scales.split(',')]:
+			scale_dir = os.path.join(work_dir, 'scale-%d' % scale)
+			if os.path.exists(scale_dir):
+				shutil.rmtree(scale_dir)
+			amphtml_directory = os.path.join(scale_dir, 'amphtml')
+			WriteSyntheticSpec(amphtml_directory, scale)
+
+			output = subprocess.check_output([sys.executable, os.path.realpath(__file__), '--work-dir', work_dir, '--run-scale', str(scale)])
+			result = json.loads(output)
+			result['scale'] = scale
+			result['spec_bytes'] = GetSpecSize(amphtml_directory)
+			results.append(result)
+
+			sys.stderr.write('Scale %2dx: %d tag specs, %.1f MB spec, %.1f MB peak memory\n' % (scale, result['tag_specs'], result['spec_bytes'] / 1e6, result['peak_memory_mb']))
+			for stage in ('descriptor', 'parse', 'rules', 'emit', 'write'):
+				sys.stderr.write('  %-10s %8.3fs\n' % (stage, result['stages'][stage]))
+			for (name, timing) in sorted(result['functions'].items()):
+				sys.stderr.write('  %-22s %8.3fs %8d calls\n' % (name, timing['seconds'], timing['calls']))
+	finally:
+		if not args.work_dir:
+			shutil.rmtree(work_dir)
+
+	if args.output:
+		f = open(args.output, 'w')
+		json.dump(results, f, indent=2, sort_keys=True)
+		f.close()
+	else:
+		json.dump(results, sys.stdout, indent=2, sort_keys=True)
+		sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+	Main()
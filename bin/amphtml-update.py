@@ -11,23 +11,143 @@ from within a Linux environment such as VVV.
 See the Updating Allowed Tags and Attributes section of the Contributing guide
 https://github.com/ampproject/amp-wp/blob/develop/contributing.md#updating-allowed-tags-and-attributes.
 
+The outputs of each build step are cached in ~/.cache/amp-wp/amphtml-update, keyed
+by a hash of their inputs, so steps whose inputs have not changed are skipped. Use
+--cache-dir to cache elsewhere or --no-cache to run every step.
+
+The PHP is written to STDOUT, or with --output=<file> atomically to a file, which
+is only replaced once the new version has been completely written.
+
 Then have fun sanitizing your AMP posts!
 """
 
+import argparse
+import cProfile
+import fnmatch
 import glob
+import hashlib
 import logging
+import multiprocessing
 import os
 import platform
+import pstats
+import Queue
 import re
+import resource
 import shutil
+import stat
+import struct
 import subprocess
 import sys
+import tarfile
 import tempfile
+import time
+import types
 import collections
-import json
+import copy
 import google
-from collections import defaultdict
-import imp
+import json
+import numbers
+
+import amphtml_regex
+import amphtml_snapshot
+import amphtml_spec
+import amphtml_stages
+
+# The properties of a generated class, and the tokens of their PHP literals.
+PHP_PROPERTY_REGEX = re.compile(r'^\tprivate static \$(\w+) = (array\(\n.*?\n\t\)|[^\n]*);$', re.M | re.S)
+PHP_TOKEN_REGEX = re.compile(r'''\s+|array\(|\)|,|=>|\.|'(?:[^'\\]|\\.)*'|"\\0"|-?[0-9][0-9.E+-]*|true|false|NULL''')
+# The AMP component tags and the extension scripts of an HTML page, see ScanComponents().
+COMPONENT_TAG_REGEX = re.compile(r'<(amp-[a-z0-9-]+)', re.I)
+COMPONENT_SCRIPT_REGEX = re.compile(r'''\bcustom-(?:element|template)\s*=\s*["']?(amp-[a-z0-9-]+)''', re.I)
+
+GENERATED_PHP_FILE = 'class-amp-allowed-tags-generated.php'
+GENERATED_SHARD_DIR = 'allowed-tags-generated'
+RULES_SNAPSHOT_FILE = 'validator-rules.pb'
+CHANGELOG_FILE = 'changelog.json'
+VALIDATOR_DESCRIPTOR_FILE = 'validator.desc'
+
+# The files of the amphtml repo which the generator reads, which are the only
+# ones extracted from a tarball of it.
+AMPHTML_SOURCE_FILES = ('validator/validator.proto', 'validator/validator-main.protoascii', 'extensions/*/validator-*.protoascii')
+AMPHTML_SOURCE_MANIFEST = 'amphtml-source.json'
+
+# A protoascii file as a part of the assembled spec, with the line of the
+# assembled spec it starts on and the time parsing it started.
+ProtoasciiSegment = collections.namedtuple('ProtoasciiSegment', ['path', 'first_line', 'start_time'])
+
+# How enumerations are emitted, see AddEnumSets().
+ENUM_FORMATS = ('list', 'set', 'both')
+
+# The enumerations AddEnumSets() adds sets of, by the spec they are in.
+ENUM_SET_KEYS = {
+	'attr_spec': ('value', 'value_casei'),
+	'value_url': ('protocol',),
+	'child_tags': ('child_tag_name_oneof', 'first_child_tag_name_oneof'),
+}
+
+# The report of the regexes which are invalid or prone to catastrophic
+# backtracking, see AddPcrePatterns().
+REGEX_REPORT_FILE = 'regex-report.json'
+DEPENDENCY_REPORT_FILE = 'dependency-report.json'
+COMPONENTS_REPORT_FILE = 'components-report.json'
+
+# The AttrSpec.DispatchKeyType values which dispatch by the presence of an
+# attribute, and by its value along with the tag's mandatory parent.
+DISPATCH_KEY_NAME = 1
+DISPATCH_KEY_NAME_VALUE_PARENT = 3
+
+# The footprint of the generated class, written next to it with --footprint, and
+# the benchmark script measuring it in PHP. The default thresholds are the
+# percentages by which each measurement may exceed the baseline, see
+# CheckFootprint(); the timings are noisier than the sizes.
+GENERATED_FOOTPRINT_FILE = 'class-amp-allowed-tags-generated-footprint.json'
+FOOTPRINT_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'tests', 'benchmark', 'load-allowed-tags.php')
+FOOTPRINT_THRESHOLDS = {
+	'bytes': 10,
+	'compile': 25,
+	'all_tags': 25,
+	'memory': 10,
+	'opcache_memory': 10,
+	'opcache_interned_strings': 10,
+}
+
+# The options of a run, which the command line flags set, with their defaults.
+# See Main() for what each of them is; profile is the Profile of the run, set
+# with --profile.
+OPTION_DEFAULTS = collections.OrderedDict([
+	('cache_dir', None),
+	('jobs', 1),
+	('output', None),
+	('sharded', False),
+	('enum_format', 'both'),
+	('snapshot_format', None),
+	('diff_against', None),
+	('regex_report', None),
+	('strict_regexes', False),
+	('dependency_report', None),
+	('strict_dependencies', False),
+	('spec_profile', None),
+	('instrumented', False),
+	('components', None),
+	('exclude_extensions', None),
+	('footprint_php', None),
+	('footprint_baseline', None),
+	('footprint_thresholds', None),
+	('parse_stats', False),
+	('profile', None),
+])
+Options = collections.namedtuple('Options', OPTION_DEFAULTS.keys())
+Options.__new__.__defaults__ = tuple(OPTION_DEFAULTS.values())
+
+# The modules of the generator next to this script, which are hashed along with
+# it by GetGeneratorVersion().
+GENERATOR_MODULES = (amphtml_regex, amphtml_snapshot, amphtml_spec, amphtml_stages)
+
+# The validator_pb2 modules built by LoadValidatorPb2(), by descriptor path. Only
+# a memo of this process, as building them from the descriptor is slow.
+validator_pb2_modules = {}
+
 
 def Die(msg):
 	print >> sys.stderr, msg
@@ -48,8 +168,8 @@ def SetupOutDir(out_dir):
 	logging.info('... done')
 
 
-def GenValidatorPb2Py(validator_directory, out_dir):
-	"""Calls the proto compiler to generate validator_pb2.py.
+def GenValidatorDescriptor(validator_directory, out_dir):
+	"""Compiles validator.proto into a serialized FileDescriptorSet, without protoc.
 
 	Args:
 		validator_directory: directory name of the validator.
@@ -57,149 +177,2431 @@ def GenValidatorPb2Py(validator_directory, out_dir):
 	"""
 	logging.info('entering ...')
 
-	os.chdir( validator_directory )
-	subprocess.check_call(['protoc', 'validator.proto', '--python_out=%s' % out_dir])
-	os.chdir( out_dir )
-	open('__init__.py', 'w').close()
+	from google.protobuf import descriptor_pb2
+
+	proto_file = os.path.join(validator_directory, 'validator.proto')
+	f = open(proto_file)
+	file_proto = ProtoParser(f.read(), 'validator.proto').Parse()
+	f.close()
+
+	file_descriptor_set = descriptor_pb2.FileDescriptorSet()
+	file_descriptor_set.file.extend([file_proto])
+	f = open(os.path.join(out_dir, VALIDATOR_DESCRIPTOR_FILE), 'wb')
+	f.write(file_descriptor_set.SerializeToString())
+	f.close()
 	logging.info('... done')
 
 
-def GenValidatorProtoascii(validator_directory, out_dir):
-	"""Assembles the validator protoascii file from the main and extensions.
+class ProtoParser(object):
+	"""Parses a .proto file into a FileDescriptorProto.
+
+	Only the proto2 subset which validator.proto uses is supported: messages,
+	enums and oneofs, which may be nested, scalar, message and enum fields, and
+	the default, packed, deprecated and json_name options, whose values are
+	formatted the way protoc does. Other options, and reserved and extensions
+	statements, are skipped. Imports, extend blocks, groups and maps are rejected.
+	"""
+
+	SCALAR_TYPES = {
+		'double': 1,
+		'float': 2,
+		'int64': 3,
+		'uint64': 4,
+		'int32': 5,
+		'fixed64': 6,
+		'fixed32': 7,
+		'bool': 8,
+		'string': 9,
+		'bytes': 12,
+		'uint32': 13,
+		'sfixed32': 15,
+		'sfixed64': 16,
+		'sint32': 17,
+		'sint64': 18,
+	}
+	TYPE_MESSAGE = 11
+	TYPE_ENUM = 14
+	LABELS = {
+		'optional': 1,
+		'required': 2,
+		'repeated': 3,
+	}
+	BYTES_ESCAPES = {
+		'\n': '\\n',
+		'\r': '\\r',
+		'\t': '\\t',
+		'"': '\\"',
+		"'": "\\'",
+		'\\': '\\\\',
+	}
+	TOKEN_REGEX = re.compile(r'(\s+|//[^\n]*|/\*.*?\*/)|("(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'|[-+]?\.?[0-9](?:[eE][-+]|[\w.])*|[-+]?\.?[A-Za-z_][\w.]*|[{}\[\]()<>=;,])', re.S)
+
+	def __init__(self, source, name):
+		"""Tokenizes the source.
+
+		Args:
+			source: contents of the .proto file.
+			name: name of the .proto file, for the FileDescriptorProto and errors.
+		"""
+		self.name = name
+		self.tokens = []
+		self.lines = []
+		self.position = 0
+		line = 1
+		offset = 0
+		while offset < len(source):
+			match = self.TOKEN_REGEX.match(source, offset)
+			if match is None:
+				raise ValueError('%s:%d: unexpected character %r' % (name, line, source[offset]))
+			if match.group(2) is not None:
+				self.tokens.append(match.group(2))
+				self.lines.append(line)
+			line += match.group(0).count('\n')
+			offset = match.end()
+
+	def Error(self, message):
+		"""Builds an error pointing at the current token.
+
+		Args:
+			message: description of the error.
+		Returns:
+			ValueError to raise.
+		"""
+		line = self.lines[min(self.position, len(self.lines) - 1)] if self.lines else 1
+		return ValueError('%s:%d: %s' % (self.name, line, message))
+
+	def Peek(self):
+		if self.position < len(self.tokens):
+			return self.tokens[self.position]
+		return None
+
+	def Next(self):
+		token = self.Peek()
+		if token is None:
+			raise self.Error('unexpected end of file')
+		self.position += 1
+		return token
+
+	def Expect(self, expected):
+		token = self.Next()
+		if token != expected:
+			raise self.Error('expected %r, got %r' % (expected, token))
+
+	def SkipStatement(self):
+		"""Skips tokens up to and including the next semicolon."""
+		while self.Next() != ';':
+			pass
+
+	def ParseConstant(self):
+		"""Parses a constant, joining adjacent string literals.
+
+		Returns:
+			Tuple of the value as a string, and whether it was a string literal.
+		"""
+		token = self.Next()
+		if token[0] not in '"\'':
+			return token, False
+		value = token[1:-1].decode('string_escape')
+		while self.Peek() is not None and self.Peek()[0] in '"\'':
+			value += self.Next()[1:-1].decode('string_escape')
+		return value, True
+
+	def Parse(self):
+		"""Parses the file.
+
+		Returns:
+			FileDescriptorProto with the type names of fields resolved.
+		"""
+		from google.protobuf import descriptor_pb2
+
+		file_proto = descriptor_pb2.FileDescriptorProto()
+		file_proto.name = self.name
+		while self.Peek() is not None:
+			token = self.Next()
+			if 'syntax' == token:
+				self.Expect('=')
+				syntax = self.ParseConstant()[0]
+				if 'proto2' != syntax:
+					raise self.Error('unsupported syntax %r' % syntax)
+				self.Expect(';')
+			elif 'package' == token:
+				file_proto.package = self.Next()
+				self.Expect(';')
+			elif 'option' == token:
+				self.SkipStatement()
+			elif 'message' == token:
+				self.ParseMessage(file_proto.message_type.add())
+			elif 'enum' == token:
+				self.ParseEnum(file_proto.enum_type.add())
+			elif ';' != token:
+				raise self.Error('unsupported statement %r' % token)
+
+		self.ResolveTypes(file_proto)
+		return file_proto
+
+	def ParseMessage(self, message_proto):
+		"""Parses the name and body of a message.
+
+		Args:
+			message_proto: DescriptorProto to fill.
+		"""
+		message_proto.name = self.Next()
+		self.Expect('{')
+		while True:
+			token = self.Next()
+			if '}' == token:
+				return
+			elif 'message' == token:
+				self.ParseMessage(message_proto.nested_type.add())
+			elif 'enum' == token:
+				self.ParseEnum(message_proto.enum_type.add())
+			elif 'oneof' == token:
+				oneof_index = len(message_proto.oneof_decl)
+				message_proto.oneof_decl.add().name = self.Next()
+				self.Expect('{')
+				while '}' != self.Peek():
+					self.ParseField(message_proto.field.add(), self.LABELS['optional'], self.Next(), oneof_index)
+				self.Next()
+			elif token in ('option', 'reserved', 'extensions'):
+				self.SkipStatement()
+			elif token in self.LABELS:
+				self.ParseField(message_proto.field.add(), self.LABELS[token], self.Next())
+			elif ';' != token:
+				raise self.Error('unsupported field or statement %r' % token)
+
+	def ParseField(self, field_proto, label, type_name, oneof_index=None):
+		"""Parses the name, number and options of a field.
+
+		Message and enum type names are resolved by ResolveTypes() once the whole file is parsed.
+
+		Args:
+			field_proto: FieldDescriptorProto to fill.
+			label: label of the field.
+			type_name: type of the field as written.
+			oneof_index: index of the oneof the field is in, if any.
+		"""
+		if type_name in ('group', 'map') or type_name.startswith('map<'):
+			raise self.Error('unsupported field type %r' % type_name)
+		field_proto.label = label
+		if type_name in self.SCALAR_TYPES:
+			field_proto.type = self.SCALAR_TYPES[type_name]
+		else:
+			field_proto.type_name = type_name
+		if oneof_index is not None:
+			field_proto.oneof_index = oneof_index
+		field_proto.name = self.Next()
+		self.Expect('=')
+		field_proto.number = int(self.Next(), 0)
+
+		if '[' == self.Peek():
+			self.Next()
+			while True:
+				name = self.Next()
+				self.Expect('=')
+				value = self.ParseConstant()[0]
+				if 'default' == name and field_proto.HasField('type'):
+					field_proto.default_value = self.NormalizeDefault(field_proto.type, value)
+				elif 'default' == name:
+					field_proto.default_value = value
+				elif 'json_name' == name:
+					field_proto.json_name = value
+				elif 'packed' == name:
+					field_proto.options.packed = 'true' == value
+				elif 'deprecated' == name:
+					field_proto.options.deprecated = 'true' == value
+				if ']' == self.Next():
+					break
+		self.Expect(';')
+		if not field_proto.HasField('json_name'):
+			field_proto.json_name = re.sub(r'_+([a-z]?)', lambda match: match.group(1).upper(), field_proto.name)
+
+	def NormalizeDefault(self, field_type, value):
+		"""Formats the default value of a numeric field the way protoc does.
+
+		Args:
+			field_type: type of the field.
+			value: default value as written.
+		Returns:
+			Default value for the FieldDescriptorProto.
+		"""
+		if field_type in (self.SCALAR_TYPES['double'], self.SCALAR_TYPES['float']):
+			if value.lstrip('-+') in ('inf', 'nan'):
+				return value
+			# Like protoc, use the shortest precision which round-trips the value.
+			number = float(value)
+			if self.SCALAR_TYPES['float'] == field_type:
+				number = struct.unpack('<f', struct.pack('<f', number))[0]
+				precisions = (6, 9)
+			else:
+				precisions = (15, 17)
+			for precision in precisions:
+				formatted = '%.*g' % (precision, number)
+				if float(formatted) == number:
+					break
+			return formatted
+		if self.SCALAR_TYPES['bytes'] == field_type:
+			# protoc keeps the default of a bytes field C-escaped.
+			return ''.join(self.BYTES_ESCAPES.get(c, c if ' ' <= c <= '~' else '\\%03o' % ord(c)) for c in value)
+		if field_type in self.SCALAR_TYPES.values() and field_type not in (self.SCALAR_TYPES['bool'], self.SCALAR_TYPES['string'], self.SCALAR_TYPES['bytes']):
+			return str(int(value, 0))
+		return value
+
+	def ParseEnum(self, enum_proto):
+		"""Parses the name and values of an enum.
+
+		Args:
+			enum_proto: EnumDescriptorProto to fill.
+		"""
+		enum_proto.name = self.Next()
+		self.Expect('{')
+		while True:
+			token = self.Next()
+			if '}' == token:
+				return
+			elif 'option' == token:
+				name = self.Next()
+				self.Expect('=')
+				value = self.ParseConstant()[0]
+				if 'allow_alias' == name:
+					enum_proto.options.allow_alias = 'true' == value
+				self.Expect(';')
+			elif 'reserved' == token:
+				self.SkipStatement()
+			elif ';' != token:
+				value_proto = enum_proto.value.add()
+				value_proto.name = token
+				self.Expect('=')
+				value_proto.number = int(self.Next(), 0)
+				if '[' == self.Peek():
+					self.Next()
+					while True:
+						name = self.Next()
+						self.Expect('=')
+						if 'deprecated' == name:
+							value_proto.options.deprecated = 'true' == self.ParseConstant()[0]
+						else:
+							self.ParseConstant()
+						if ']' == self.Next():
+							break
+				self.Expect(';')
+
+	def ResolveTypes(self, file_proto):
+		"""Resolves the type names of message and enum fields like protoc, from the innermost scope out.
+
+		Args:
+			file_proto: FileDescriptorProto whose fields to resolve.
+		"""
+		package = '.' + file_proto.package if file_proto.package else ''
+		types = {}
+
+		def CollectTypes(scope, message_protos, enum_protos):
+			for enum_proto in enum_protos:
+				types['%s.%s' % (scope, enum_proto.name)] = self.TYPE_ENUM
+			for message_proto in message_protos:
+				name = '%s.%s' % (scope, message_proto.name)
+				types[name] = self.TYPE_MESSAGE
+				CollectTypes(name, message_proto.nested_type, message_proto.enum_type)
+
+		def Resolve(scope, message_protos):
+			for message_proto in message_protos:
+				name = '%s.%s' % (scope, message_proto.name)
+				for field_proto in message_proto.field:
+					if field_proto.HasField('type_name'):
+						field_proto.type_name = ResolveType(name, field_proto.type_name)
+						field_proto.type = types[field_proto.type_name]
+				Resolve(name, message_proto.nested_type)
+
+		def ResolveType(scope, type_name):
+			if type_name.startswith('.'):
+				candidates = [type_name]
+			else:
+				parts = scope.split('.')
+				candidates = ['.'.join(parts[:i] + [type_name]) for i in range(len(parts), 0, -1)]
+			for candidate in candidates:
+				if candidate in types:
+					return candidate
+			raise ValueError('%s: unknown type %r in %s' % (self.name, type_name, scope[1:]))
+
+		CollectTypes(package, file_proto.message_type, file_proto.enum_type)
+		Resolve(package, file_proto.message_type)
+
+
+def GetProtoasciiLines(protoascii_files, segments):
+	"""Streams the lines of the protoascii files of the main spec and the extensions, as one assembled spec.
+
+	The assembled spec is parsed as it is read from the files, rather than
+	written out and read back in. As each file is started, it is recorded in
+	segments with the line of the assembled spec it starts on, so that a parse
+	error can be mapped back to the file it is in, see GetSegmentParseError().
 
 	Args:
-		validator_directory: directory for where the validator is located, inside the amphtml repo.
-		out_dir: directory name of the output directory.
+		protoascii_files: list of file paths, in the order they are merged.
+		segments: list to append the ProtoasciiSegment of each file to.
+	Yields:
+		Each line of the files, with a newline added to a last line which has none.
 	"""
-	logging.info('entering ...')
+	line_number = 1
+	for protoascii_file in protoascii_files:
+		segments.append(ProtoasciiSegment(protoascii_file, line_number, time.time()))
+		f = open(protoascii_file)
+		for line in f:
+			line_number += 1
+			yield line if line.endswith('\n') else line + '\n'
+		f.close()
+
+
+def GetSegmentParseError(error, segments):
+	"""Maps the location of an error parsing the assembled spec to the file it is in.
+
+	Args:
+		error: the text_format.ParseError, with the line and column in the assembled spec.
+		segments: list of the ProtoasciiSegment of each file, as recorded by GetProtoasciiLines().
+	Returns:
+		A text_format.ParseError with the path of the file, and the line and column in it.
+	"""
+	from google.protobuf import text_format
+
+	line = error.GetLine()
+	if line is None or not segments:
+		return error
+	segment = [segment for segment in segments if segment.first_line <= line][-1]
+	location = '%s:%d' % (os.path.normpath(segment.path), line - segment.first_line + 1)
+	if error.GetColumn() is not None:
+		location += ':%d' % error.GetColumn()
+	return text_format.ParseError('%s : %s' % (location, str(error).split(' : ', 1)[-1]))
+
+
+def GetProtoasciiFiles(validator_directory):
+	"""Gets the protoascii files of the main spec and the extensions, in the order they are merged.
 
-	protoascii_segments = [open(os.path.join(validator_directory, 'validator-main.protoascii')).read()]
+	Args:
+		validator_directory: directory for where the validator is located, inside the amphtml repo.
+	Returns:
+		List of file paths.
+	"""
 	extensions = glob.glob(os.path.join(validator_directory, '../extensions/*/validator-*.protoascii'))
 	extensions.sort()
-	for extension in extensions:
-		protoascii_segments.append(open(extension).read())
-	f = open('%s/validator.protoascii' % out_dir, 'w')
-	f.write(''.join(protoascii_segments))
-	f.close()
-
-	logging.info('... done')
+	return [os.path.join(validator_directory, 'validator-main.protoascii')] + extensions
 
 
-def GeneratePHP(out_dir):
+def GeneratePHP(out_dir, options=Options()):
 	"""Generates PHP for WordPress AMP plugin to consume.
 
+	Each section is written out as soon as it is generated, into a temporary file
+	which only replaces the PHP file once it is complete.
+
+	In sharded mode the specs of each tag, descendant tag list and reference point
+	are written to their own file in the GENERATED_SHARD_DIR directory, which the
+	class only requires when they are first accessed.
+
+	With a snapshot format the rules are written to a snapshot file in that
+	format instead, which the class loads when they are first accessed.
+
+	When diffing against a previous generated file or rules snapshot, a changelog
+	of the rules is written to CHANGELOG_FILE. The sections of a previous
+	generated file whose rules are unchanged are copied instead of generated again.
+
+	See AddSpecFacts() and AddSpecDependencies() for the facts precomputed for
+	each tag spec, AddPcrePatterns() for the PCRE patterns of the regexes, which are checked
+	before anything is written, and AddEnumSets() for the enum formats.
+
+	With a spec match profile, the tag specs of each tag are ordered by how often
+	they matched, see OrderTagSpecsByProfile(). An instrumented class records the
+	spec matches for such a profile, see AddSpecProfileKeys().
+
+	With components or excluded extensions, the rules of the other AMP components
+	are dropped, see PruneComponents().
+
 	Args:
-		validator_directory: directory for where the validator is located, inside the amphtml repo.
-		out_dir: directory name of the output directory
+		out_dir: directory name of the output directory, containing the rules snapshot and the validator descriptor.
+		options: the Options of the run. The PHP is generated with the sharded,
+			enum_format, snapshot_format, diff_against, strict_regexes,
+			strict_dependencies, spec_profile, instrumented, components,
+			exclude_extensions, parse_stats and profile options.
+	Returns:
+		Path to the generated PHP file.
 	"""
 	logging.info('entering ...')
 
-	allowed_tags, attr_lists, descendant_lists, reference_points, versions = ParseRules(out_dir)
+	# The sections of the file diffed against, for PhpizeProperty() to copy the unchanged ones of.
+	previous_sections = {}
+	php_file = os.path.join(out_dir, GENERATED_PHP_FILE)
+	out = AtomicFileWriter(php_file)
+	try:
+		allowed_tags, attr_lists, descendant_lists, reference_points, versions = ParseRules(out_dir, None, options.parse_stats, options.profile and options.profile.Count)
+		if options.components is not None or options.exclude_extensions is not None:
+			PruneComponents(out_dir, allowed_tags, attr_lists, descendant_lists, reference_points, options.components, options.exclude_extensions)
+		if options.diff_against is not None:
+			WriteChangelog(out_dir, options.diff_against, allowed_tags, attr_lists, descendant_lists, reference_points, previous_sections, options.parse_stats)
+		if options.instrumented:
+			AddSpecProfileKeys(allowed_tags)
+		if options.spec_profile is not None:
+			OrderTagSpecsByProfile(allowed_tags, reference_points, LoadSpecProfile(options.spec_profile))
+		AddSpecFacts(allowed_tags, GetLayoutNames(out_dir))
+		AddPcrePatterns(out_dir, allowed_tags, attr_lists, reference_points, options.strict_regexes)
+		AddEnumSets(allowed_tags, attr_lists, reference_points, options.enum_format)
+		AddSpecDependencies(out_dir, allowed_tags, reference_points, options.strict_dependencies)
+		GenerateClassPHP(out, out_dir, options.sharded, allowed_tags, attr_lists, descendant_lists, reference_points, versions, options.snapshot_format, options.instrumented, previous_sections)
+		out.commit()
+	except:
+		out.abort()
+		raise
+
+	logging.info('Wrote %d bytes, first byte after %.3fs, peak memory %.1f MB' % (out.bytes_written, out.first_byte_time, GetPeakMemory()))
+	logging.info('... done')
+	return php_file
+
+
+def GenerateClassPHP(out, out_dir, sharded, allowed_tags, attr_lists, descendant_lists, reference_points, versions, snapshot_format=None, instrumented=False, previous_sections=None):
+	"""Generates the AMP_Allowed_Tags_Generated class from the parsed rules.
+
+	Args:
+		out: list of output lines, or a writer with an append() method.
+		out_dir: directory name of the output directory, where shards are written to.
+		sharded: whether to generate the sharded output.
+		allowed_tags: dictionary of tag name to its list of tag specs.
+		attr_lists: dictionary of attribute list name to its attribute specs.
+		descendant_lists: dictionary of descendant tag list name to its tag names.
+		reference_points: dictionary of reference point spec name to its tag spec.
+		versions: dictionary of the spec file and validator revisions.
+		snapshot_format: one of amphtml_snapshot.SNAPSHOT_FORMATS to write the rules to a snapshot file in out_dir, or None.
+		instrumented: whether to generate the methods which record the spec matches.
+		previous_sections: dictionary of the sections of a previous generated file to
+			copy the unchanged ones of, as filled by LoadGeneratedRules(), or None.
+	"""
+	shared_attr_specs, shared_attr_spec_lists, allowed_tag_refs, reference_point_refs = GetSharedAttrSpecs(allowed_tags, reference_points)
 
 	#Generate the output
-	out = []
 	GenerateHeaderPHP(out)
 	GenerateSpecVersionPHP(out, versions)
-	GenerateDescendantListsPHP(out, descendant_lists)
-	GenerateAllowedTagsPHP(out, allowed_tags)
-	GenerateLayoutAttributesPHP(out, attr_lists)
-	GenerateGlobalAttributesPHP(out, attr_lists)
-	GenerateReferencePointsPHP(out, reference_points)
-	GenerateFooterPHP(out)
+	if snapshot_format:
+		GenerateSnapshotPHP(out, out_dir, snapshot_format, collections.OrderedDict([
+			('descendant_tag_lists', descendant_lists),
+			('allowed_tags', allowed_tag_refs),
+			('layout_allowed_attrs', attr_lists['$AMP_LAYOUT_ATTRS']),
+			('globally_allowed_attrs', attr_lists['$GLOBAL_ATTRS']),
+			('reference_points', reference_point_refs),
+			('shared_attr_specs', shared_attr_specs),
+			('shared_attr_spec_lists', shared_attr_spec_lists),
+			('spec_name_index', GetSpecNameIndex(allowed_tags)),
+			('dispatch_tables', GetDispatchTables(allowed_tags)),
+			('css_rules', GetCssRules(allowed_tags)),
+			('extension_script_index', GetExtensionScriptIndex(allowed_tags)),
+		]))
+		GenerateFooterPHP(out, sharded, snapshot_format, instrumented)
+		return
+	if sharded:
+		GenerateShardsPHP(out, out_dir, descendant_lists, allowed_tag_refs, reference_point_refs, previous_sections)
+	else:
+		GenerateDescendantListsPHP(out, descendant_lists, previous_sections)
+		GenerateAllowedTagsPHP(out, allowed_tag_refs, previous_sections)
+	GenerateLayoutAttributesPHP(out, attr_lists, previous_sections)
+	GenerateGlobalAttributesPHP(out, attr_lists, previous_sections)
+	if sharded:
+		GenerateShardCachesPHP(out)
+	else:
+		GenerateReferencePointsPHP(out, reference_point_refs, previous_sections)
+	GenerateSharedAttrSpecsPHP(out, sharded, shared_attr_specs, shared_attr_spec_lists, previous_sections)
+	GenerateIndexesPHP(out, allowed_tags, previous_sections)
+	GenerateFooterPHP(out, sharded, instrumented=instrumented)
+
+
+def GetSharedAttrSpecs(allowed_tags, reference_points):
+	"""Deduplicates the attribute specs which tag specs have in common.
+
+	Attribute lists like the extended src attributes are merged into the
+	attr_spec_list of every tag spec using them, so the same attribute specs, and
+	often whole attr_spec_lists, are repeated across many tag specs. Each one
+	occurring more than once is only kept once, in a list of shared attr_spec_lists
+	or shared attribute specs, and the tag specs refer to it by its index instead.
+	Empty attribute specs are not shared, as array() is shorter than an index.
 
-	# join out array into a single string and remove unneeded whitespace
-	output = re.sub("\\(\\s*\\)", "()", '\n'.join(out))
+	Args:
+		allowed_tags: dictionary of tag name to its list of tag specs.
+		reference_points: dictionary of reference point spec name to its tag spec.
+	Returns:
+		Tuple of the shared attribute specs, the shared attr_spec_lists, and the
+		allowed tags and reference points referring to them.
+	"""
+	logging.info('entering ...')
 
-	# replace 'True' with true and 'False' with false
-	output = re.sub("'True'", "true", output)
-	output = re.sub("'False'", "false", output)
+	tag_specs = []
+	for tag_name in sorted(allowed_tags):
+		tag_specs.extend(allowed_tags[tag_name])
+	for spec_name in sorted(reference_points):
+		tag_specs.append(reference_points[spec_name])
+
+	# Key the attr_spec_lists and attribute specs by their canonical JSON, which is
+	# the same only if their PHP is. Each object is only encoded once, as the specs
+	# merged from attribute lists are the same objects in many attr_spec_lists.
+	keys = {}
+
+	def GetKey(spec):
+		if id(spec) not in keys:
+			keys[id(spec)] = json.dumps(spec, sort_keys=True, separators=(',', ':'))
+		return keys[id(spec)]
+
+	# Count the attr_spec_lists.
+	attr_spec_list_counts = collections.Counter()
+	for tag_spec in tag_specs:
+		if tag_spec['attr_spec_list']:
+			attr_spec_list_counts[GetKey(tag_spec['attr_spec_list'])] += 1
+
+	# Then count the attribute specs of each attr_spec_list which is output.
+	attr_spec_counts = collections.Counter()
+	counted_attr_spec_lists = set()
+	for tag_spec in tag_specs:
+		attr_spec_list_key = GetKey(tag_spec['attr_spec_list'])
+		if attr_spec_list_key in counted_attr_spec_lists:
+			continue
+		if attr_spec_list_counts[attr_spec_list_key] > 1:
+			counted_attr_spec_lists.add(attr_spec_list_key)
+		for attr_spec in tag_spec['attr_spec_list'].values():
+			if attr_spec:
+				attr_spec_counts[GetKey(attr_spec)] += 1
+
+	shared_attr_specs = []
+	shared_attr_spec_ids = {}
+	shared_attr_spec_lists = []
+	shared_attr_spec_list_ids = {}
+
+	def GetAttrSpecListRefs(attr_spec_list):
+		attr_spec_list_refs = {}
+		for attr_name in sorted(attr_spec_list):
+			attr_spec = attr_spec_list[attr_name]
+			attr_spec_key = GetKey(attr_spec) if attr_spec else None
+			if attr_spec_counts[attr_spec_key] > 1:
+				if attr_spec_key not in shared_attr_spec_ids:
+					shared_attr_spec_ids[attr_spec_key] = len(shared_attr_specs)
+					shared_attr_specs.append(attr_spec)
+				attr_spec = shared_attr_spec_ids[attr_spec_key]
+			attr_spec_list_refs[attr_name] = attr_spec
+		return attr_spec_list_refs
+
+	def GetTagSpecRefs(tag_spec):
+		tag_spec_refs = dict(tag_spec)
+		attr_spec_list_key = GetKey(tag_spec['attr_spec_list'])
+		if attr_spec_list_counts[attr_spec_list_key] > 1:
+			if attr_spec_list_key not in shared_attr_spec_list_ids:
+				shared_attr_spec_list_ids[attr_spec_list_key] = len(shared_attr_spec_lists)
+				shared_attr_spec_lists.append(GetAttrSpecListRefs(tag_spec['attr_spec_list']))
+			tag_spec_refs['attr_spec_list'] = shared_attr_spec_list_ids[attr_spec_list_key]
+		else:
+			tag_spec_refs['attr_spec_list'] = GetAttrSpecListRefs(tag_spec['attr_spec_list'])
+		return tag_spec_refs
+
+	allowed_tag_refs = {}
+	for tag_name in sorted(allowed_tags):
+		allowed_tag_refs[tag_name] = [GetTagSpecRefs(tag_spec) for tag_spec in allowed_tags[tag_name]]
+	reference_point_refs = {}
+	for spec_name in sorted(reference_points):
+		reference_point_refs[spec_name] = GetTagSpecRefs(reference_points[spec_name])
+
+	logging.info('Shared %d attribute specs and %d attr_spec_lists' % (len(shared_attr_specs), len(shared_attr_spec_lists)))
+	logging.info('... done')
+	return shared_attr_specs, shared_attr_spec_lists, allowed_tag_refs, reference_point_refs
 
-	# Write the php file to STDOUT.
-	print output
+
+def PruneComponents(out_dir, allowed_tags, attr_lists, descendant_lists, reference_points, components=None, exclude_extensions=None):
+	"""Drops the rules of the AMP components which are not used, for a site which only uses a known set of them.
+
+	The extensions which are kept are either the components, or all extensions
+	but the excluded ones. A component is an extension name, or a tag name for
+	the extensions its tag specs require. Tag specs are dropped if they are the
+	script of an extension which is not kept or require one, and so are
+	attributes requiring one. The result stays closed under the dependencies of
+	the tag specs: tag specs whose also_requires_tag was dropped are dropped too,
+	and of the reference points and descendant tag lists only those which kept tag
+	specs refer to are kept. A report of what was kept and the size of the allowed
+	tags and reference points before and after is written to COMPONENTS_REPORT_FILE.
+
+	Args:
+		out_dir: directory name of the output directory, where the report is written to.
+		allowed_tags: dictionary of tag name to its list of tag specs.
+		attr_lists: dictionary of attribute list name to its attribute specs.
+		descendant_lists: dictionary of descendant tag list name to its tag names.
+		reference_points: dictionary of reference point spec name to its tag spec.
+		components: list of the names of the components to keep, or None.
+		exclude_extensions: list of the names of the extensions to drop, or None.
+	"""
+	logging.info('entering ...')
+
+	extensions = set()
+	for tag_specs in allowed_tags.values():
+		for tag_spec in tag_specs:
+			extensions.update(GetTagSpecExtensions(tag_spec))
+
+	unknown = []
+	if components is not None:
+		kept_extensions = set()
+		for component in components:
+			component_extensions = set([component]) & extensions
+			for tag_spec in allowed_tags.get(component, []):
+				component_extensions.update(GetTagSpecExtensions(tag_spec))
+			if not component_extensions and component not in allowed_tags:
+				unknown.append(component)
+			kept_extensions.update(component_extensions)
+	else:
+		kept_extensions = extensions - set(exclude_extensions or [])
+	if unknown:
+		logging.warning('Unknown AMP components: %s' % ', '.join(sorted(unknown)))
+
+	before = {
+		'tag_specs': sum(len(tag_specs) for tag_specs in allowed_tags.values()),
+		'reference_points': len(reference_points),
+		'bytes': len(Phpize(allowed_tags)) + len(Phpize(reference_points)),
+	}
+
+	def IsKept(tag_spec):
+		return GetTagSpecExtensions(tag_spec) <= kept_extensions
+
+	def PruneAttrs(attr_spec_list):
+		for attr_name in list(attr_spec_list):
+			attr_spec = attr_spec_list[attr_name]
+			if attr_spec and not set(attr_spec.get('requires_extension', [])) <= kept_extensions:
+				del attr_spec_list[attr_name]
+
+	# Drop the tag specs which also require a tag spec that was dropped, until none do.
+	dropped_spec_names = set()
+	for tag_name in list(allowed_tags):
+		tag_specs = []
+		for tag_spec in allowed_tags[tag_name]:
+			if IsKept(tag_spec):
+				tag_specs.append(tag_spec)
+			elif 'spec_name' in tag_spec['tag_spec']:
+				dropped_spec_names.add(tag_spec['tag_spec']['spec_name'])
+		allowed_tags[tag_name] = tag_specs
+	while True:
+		dropped = 0
+		for tag_name in list(allowed_tags):
+			tag_specs = []
+			for tag_spec in allowed_tags[tag_name]:
+				if set(tag_spec['tag_spec'].get('also_requires_tag', [])) & dropped_spec_names:
+					dropped_spec_names.add(tag_spec['tag_spec'].get('spec_name'))
+					dropped += 1
+				else:
+					tag_specs.append(tag_spec)
+			allowed_tags[tag_name] = tag_specs
+		if 0 == dropped:
+			break
+
+	for tag_name in list(allowed_tags):
+		if not allowed_tags[tag_name]:
+			del allowed_tags[tag_name]
+			continue
+		for tag_spec in allowed_tags[tag_name]:
+			PruneAttrs(tag_spec['attr_spec_list'])
+	for attr_list in attr_lists.values():
+		PruneAttrs(attr_list)
+
+	# Keep the reference points and descendant tag lists which the kept tag specs refer to, transitively.
+	kept_reference_points = set()
+	kept_descendant_lists = set()
+	pending = [tag_spec for tag_specs in allowed_tags.values() for tag_spec in tag_specs]
+	while pending:
+		tag_spec = pending.pop()
+		if 'descendant_tag_list' in tag_spec['tag_spec']:
+			kept_descendant_lists.add(tag_spec['tag_spec']['descendant_tag_list'])
+		for spec_name in tag_spec['tag_spec'].get('reference_points', {}):
+			if spec_name in reference_points and spec_name not in kept_reference_points:
+				kept_reference_points.add(spec_name)
+				pending.append(reference_points[spec_name])
+	for spec_name in list(reference_points):
+		if spec_name not in kept_reference_points:
+			del reference_points[spec_name]
+		else:
+			PruneAttrs(reference_points[spec_name]['attr_spec_list'])
+	for name in list(descendant_lists):
+		if name not in kept_descendant_lists:
+			del descendant_lists[name]
+
+	after = {
+		'tag_specs': sum(len(tag_specs) for tag_specs in allowed_tags.values()),
+		'reference_points': len(reference_points),
+		'bytes': len(Phpize(allowed_tags)) + len(Phpize(reference_points)),
+	}
+	report = {
+		'extensions': sorted(kept_extensions),
+		'dropped_extensions': sorted(extensions - kept_extensions),
+		'unknown_components': sorted(unknown),
+		'before': before,
+		'after': after,
+	}
+	f = open(os.path.join(out_dir, COMPONENTS_REPORT_FILE), 'w')
+	json.dump(report, f, indent=2, separators=(',', ': '), sort_keys=True)
+	f.write('\n')
+	f.close()
 
 	logging.info('... done')
 
-def GenerateHeaderPHP(out):
+
+def GetTagSpecExtensions(tag_spec):
+	"""Gets the extensions a tag spec is for, as the script of the extension or by requiring it.
+
+	Args:
+		tag_spec: tag spec.
+	Returns:
+		Set of extension names.
+	"""
+	extensions = set(tag_spec['tag_spec'].get('requires_extension', []))
+	if 'extension_spec' in tag_spec['tag_spec']:
+		extensions.add(tag_spec['tag_spec']['extension_spec']['name'])
+	return extensions
+
+
+def ReportComponents(out_dir):
+	"""Writes the summary of the report of PruneComponents() to STDERR.
+
+	Args:
+		out_dir: directory name of the output directory, containing the report.
+	"""
+	f = open(os.path.join(out_dir, COMPONENTS_REPORT_FILE))
+	report = json.load(f)
+	f.close()
+	before = report['before']
+	after = report['after']
+	sys.stderr.write('Kept %d of %d extensions: %s\n' % (len(report['extensions']), len(report['extensions']) + len(report['dropped_extensions']), ', '.join(report['extensions']) or 'none'))
+	sys.stderr.write('Kept %d of %d tag specs and %d of %d reference points, %.1f of %.1f KB of PHP (%.0f%% smaller)\n' % (
+		after['tag_specs'], before['tag_specs'], after['reference_points'], before['reference_points'],
+		after['bytes'] / 1024.0, before['bytes'] / 1024.0, 100.0 * (before['bytes'] - after['bytes']) / before['bytes'] if before['bytes'] else 0,
+	))
+
+
+def GetSpecProfileKey(tag_name, tag_spec, index):
+	"""Gets the key by which a spec match profile counts the matches of a tag spec.
+
+	Args:
+		tag_name: tag name.
+		tag_spec: tag spec.
+		index: position of the tag spec among the tag specs of the tag, in the order of the spec.
+	Returns:
+		The spec_name of the tag spec, or the tag name and the index if it has none.
+	"""
+	return tag_spec['tag_spec'].get('spec_name', '%s #%d' % (tag_name, index))
+
+
+def AddSpecProfileKeys(allowed_tags):
+	"""Adds the key of each tag spec in a spec match profile to the tag spec, for an instrumented class.
+
+	The sanitizer records the matches of a tag spec with a 'profile_key', which
+	together with record_spec_match() and get_spec_match_counts() of the
+	instrumented class gives the profile OrderTagSpecsByProfile() reads.
+
+	Args:
+		allowed_tags: dictionary of tag name to its list of tag specs, in the order of the spec.
+	"""
+	for tag_name in allowed_tags:
+		for (i, tag_spec) in enumerate(allowed_tags[tag_name]):
+			tag_spec['tag_spec']['profile_key'] = GetSpecProfileKey(tag_name, tag_spec, i)
+
+
+def LoadSpecProfile(spec_profile):
+	"""Loads a spec match profile.
+
+	Args:
+		spec_profile: path of a JSON file with the number of matches by the key of each tag spec, by tag name.
+	Returns:
+		Dictionary of tag name to a dictionary of the keys of its tag specs to their number of matches.
+	Raises:
+		ValueError: if the file is not a spec match profile.
+	"""
+	f = open(spec_profile)
+	profile = json.load(f)
+	f.close()
+	if not isinstance(profile, dict) or not all(isinstance(counts, dict) for counts in profile.values()):
+		raise ValueError('%s is not a spec match profile' % spec_profile)
+	return profile
+
+
+def OrderTagSpecsByProfile(allowed_tags, reference_points, profile):
+	"""Orders the tag specs of each tag by how often they matched in a spec match profile.
+
+	The sanitizer tries the tag specs of a tag in order, and where several match
+	a node equally well, the order decides which one is used. So a tag spec only
+	moves ahead of the tag specs it is mutually exclusive with, see
+	AreTagSpecsExclusive(), and otherwise keeps its order relative to the others.
+	Of the tag specs which may come next, the one with the most matches does, and
+	tag specs with as many matches keep their order.
+
+	Args:
+		allowed_tags: dictionary of tag name to its list of tag specs, in the order of the spec.
+		reference_points: dictionary of reference point spec name to its tag spec.
+		profile: dictionary of tag name to a dictionary of the keys of its tag specs to their number of matches.
+	"""
 	logging.info('entering ...')
 
-	# Output the file's header
-	out.append('<?php')
-	out.append('/**')
-	out.append(' * Generated by %s - do not edit.' % os.path.basename(__file__))
-	out.append(' *')
-	out.append(' * This is a list of HTML tags and attributes that are allowed by the')
-	out.append(' * AMP specification. Note that tag names have been converted to lowercase.')
-	out.append(' *')
-	out.append(' * Note: This file only contains tags that are relevant to the `body` of')
-	out.append(' * an AMP page. To include additional elements modify the variable')
-	out.append(' * `mandatory_parent_blacklist` in the amp_wp_build.py script.')
-	out.append(' *')
-	out.append(' * phpcs:ignoreFile')
-	out.append(' */')
-	out.append('class AMP_Allowed_Tags_Generated {')
-	out.append('')
+	# The attributes of reference points replace those of the tag specs of the children at runtime.
+	reference_point_attrs = set()
+	for tag_spec in reference_points.values():
+		reference_point_attrs.update(tag_spec['attr_spec_list'])
+
+	reordered = 0
+	for tag_name in sorted(allowed_tags):
+		tag_specs = allowed_tags[tag_name]
+		matches = profile.get(tag_name)
+		if len(tag_specs) < 2 or not matches:
+			continue
+		counts = [matches.get(GetSpecProfileKey(tag_name, tag_spec, i), 0) for (i, tag_spec) in enumerate(tag_specs)]
+
+		# Count the tag specs before each one which it has to stay after.
+		after = [[] for tag_spec in tag_specs]
+		predecessors = [0] * len(tag_specs)
+		for i in range(len(tag_specs)):
+			for j in range(i + 1, len(tag_specs)):
+				if not AreTagSpecsExclusive(tag_specs[i], tag_specs[j], reference_point_attrs):
+					after[i].append(j)
+					predecessors[j] += 1
+
+		order = []
+		ready = [i for i in range(len(tag_specs)) if 0 == predecessors[i]]
+		while ready:
+			i = max(ready, key=lambda i: (counts[i], -i))
+			ready.remove(i)
+			order.append(i)
+			for j in after[i]:
+				predecessors[j] -= 1
+				if 0 == predecessors[j]:
+					ready.append(j)
+
+		if order != range(len(tag_specs)):
+			allowed_tags[tag_name] = [tag_specs[i] for i in order]
+			reordered += 1
+
+	logging.info('Ordered the tag specs of %d tags by the spec match profile' % reordered)
 	logging.info('... done')
 
 
-def GenerateSpecVersionPHP(out, versions):
+def AreTagSpecsExclusive(tag_spec, other_tag_spec, reference_point_attrs):
+	"""Checks whether no node can match both of two tag specs of a tag.
+
+	Tag specs are mutually exclusive if they are for different extension
+	scripts, need different parents, or have a mandatory attribute in common with
+	values which have none in common. Attributes of reference points are not
+	considered, as the sanitizer replaces them at runtime. Tag specs with a
+	descendant_tag_list are never exclusive, as checking them removes descendants,
+	which the checks of the tag specs after them see.
+
+	Args:
+		tag_spec: tag spec.
+		other_tag_spec: another tag spec of the same tag.
+		reference_point_attrs: set of the names of the attributes of reference points.
+	Returns:
+		Whether the tag specs are mutually exclusive.
+	"""
+	rules = tag_spec['tag_spec']
+	other_rules = other_tag_spec['tag_spec']
+	if 'descendant_tag_list' in rules or 'descendant_tag_list' in other_rules:
+		return False
+	if 'extension_spec' in rules and 'extension_spec' in other_rules and rules['extension_spec'].get('name') != other_rules['extension_spec'].get('name'):
+		return True
+	if 'mandatory_parent' in rules and 'mandatory_parent' in other_rules and rules['mandatory_parent'] != other_rules['mandatory_parent']:
+		return True
+	for (attr_name, attr_spec) in tag_spec['attr_spec_list'].items():
+		other_attr_spec = other_tag_spec['attr_spec_list'].get(attr_name)
+		if attr_name in reference_point_attrs or not attr_spec or not other_attr_spec or not attr_spec.get('mandatory') or not other_attr_spec.get('mandatory'):
+			continue
+		values = GetAttrSpecValues(attr_spec)
+		other_values = GetAttrSpecValues(other_attr_spec)
+		if values is not None and other_values is not None and not values & other_values:
+			return True
+	return False
+
+
+def GetAttrSpecValues(attr_spec):
+	"""Gets the values an attribute spec allows, if it only allows a fixed set.
+
+	The values are lowercased, so that case-sensitive and case-insensitive values compare conservatively.
+
+	Args:
+		attr_spec: attribute spec.
+	Returns:
+		Set of the lowercased values, or None if the attribute spec allows other values.
+	"""
+	if 'value' in attr_spec:
+		return set(value.lower() for value in attr_spec['value'])
+	if 'value_casei' in attr_spec:
+		return set(value.lower() for value in attr_spec['value_casei'])
+	return None
+
+
+def AddSpecFacts(allowed_tags, layout_names):
+	"""Adds facts which the sanitizer would otherwise derive from each tag spec on every request.
+
+	The facts are added to each tag spec under the 'precomputed' key:
+	mandatory_attrs, the names of its mandatory attributes; attr_aliases, the
+	attribute each alternative name is an alias of; and supported_layouts, the set of
+	the names of the layouts it supports. Facts which are empty are left out.
+
+	Args:
+		allowed_tags: dictionary of tag name to its list of tag specs.
+		layout_names: dictionary of the AmpLayout.Layout values to their names, as returned by GetLayoutNames().
+	"""
 	logging.info('entering ...')
 
-	# Output the version of the spec file and matching validator version
-	if versions['spec_file_revision']:
-		out.append('\tprivate static $spec_file_revision = %d;' % versions['spec_file_revision'])
-	if versions['min_validator_revision_required']:
-		out.append('\tprivate static $minimum_validator_revision_required = %d;' % versions['min_validator_revision_required'])
+	for tag_name in allowed_tags:
+		for tag_spec in allowed_tags[tag_name]:
+			facts = {}
+			mandatory_attrs = []
+			attr_aliases = {}
+			for attr_name in sorted(tag_spec['attr_spec_list']):
+				attr_spec = tag_spec['attr_spec_list'][attr_name]
+				if attr_spec.get('mandatory'):
+					mandatory_attrs.append(attr_name)
+				for alternative_name in attr_spec.get('alternative_names', []):
+					attr_aliases[alternative_name] = attr_name
+			if mandatory_attrs:
+				facts['mandatory_attrs'] = mandatory_attrs
+			if attr_aliases:
+				facts['attr_aliases'] = attr_aliases
+			if 'supported_layouts' in tag_spec['tag_spec'].get('amp_layout', {}):
+				facts['supported_layouts'] = collections.OrderedDict((layout_names[layout], True) for layout in tag_spec['tag_spec']['amp_layout']['supported_layouts'])
+			tag_spec['precomputed'] = facts
+
 	logging.info('... done')
 
-def GenerateDescendantListsPHP(out, descendant_lists):
+
+def GetLayoutNames(out_dir):
+	"""Gets the names of the AmpLayout.Layout values, as the layout attribute takes them.
+
+	Args:
+		out_dir: directory name of the output directory, containing the validator descriptor.
+	Returns:
+		Dictionary of each layout value to its name, like 'fixed-height' for FIXED_HEIGHT.
+	"""
+	validator_pb2 = LoadValidatorPb2(os.path.join(out_dir, VALIDATOR_DESCRIPTOR_FILE))
+	layout_enum = validator_pb2.AmpLayout.DESCRIPTOR.fields_by_name['supported_layouts'].enum_type
+	return dict((value.number, value.name.lower().replace('_', '-')) for value in layout_enum.values)
+
+
+def AddEnumSets(allowed_tags, attr_lists, reference_points, enum_format):
+	"""Adds the enumerations of the specs as sets, for isset() lookups instead of in_array().
+
+	The set of an enumeration is a dictionary of each of its values to True, stored
+	next to the list with a '_set' suffix. The values of value_casei are lowercased.
+	With the 'list' format nothing is added, with the 'set' format the lists are
+	replaced by the sets, and with the 'both' format the specs have both.
+
+	Only the enumerations the sanitizer looks values up in are added as sets: the
+	attribute values and URL protocols, and the allowed child tags.
+
+	Args:
+		allowed_tags: dictionary of tag name to its list of tag specs.
+		attr_lists: dictionary of attribute list name to its attribute specs.
+		reference_points: dictionary of reference point spec name to its tag spec.
+		enum_format: one of ENUM_FORMATS.
+	"""
 	logging.info('entering ...')
 
-	out.append('')
-	out.append('\tprivate static $descendant_tag_lists = %s;' % Phpize( descendant_lists, 1 ).lstrip() )
+	if 'list' == enum_format:
+		return
+
+	# Attribute specs are shared between the tag specs which use an attribute list.
+	attr_specs = []
+	for attrs in attr_lists.values():
+		attr_specs.extend(attrs.values())
+
+	tag_specs = list(reference_points.values())
+	for tag_name in allowed_tags:
+		tag_specs.extend(allowed_tags[tag_name])
+	for tag_spec in tag_specs:
+		attr_specs.extend(tag_spec['attr_spec_list'].values())
+		for key in ENUM_SET_KEYS['child_tags']:
+			AddEnumSet(tag_spec['tag_spec'].get('child_tags'), key, enum_format)
+
+	for attr_spec in attr_specs:
+		for key in ENUM_SET_KEYS['attr_spec']:
+			AddEnumSet(attr_spec, key, enum_format, 'value_casei' == key)
+		for key in ENUM_SET_KEYS['value_url']:
+			AddEnumSet(attr_spec.get('value_url'), key, enum_format)
+
 	logging.info('... done')
 
 
-def GenerateAllowedTagsPHP(out, allowed_tags):
+def AddEnumSet(spec, key, enum_format, casei=False):
+	"""Adds the set of one enumeration of a spec.
+
+	Args:
+		spec: dictionary containing the enumeration, or None.
+		key: key of the enumeration.
+		enum_format: 'set' or 'both'.
+		casei: whether to lowercase the values.
+	"""
+	if spec is None or key not in spec:
+		return
+	enum_set = {}
+	for value in spec[key]:
+		enum_set[value.lower() if casei else value] = True
+	spec[key + '_set'] = enum_set
+	if 'set' == enum_format:
+		del spec[key]
+
+
+def AddSpecDependencies(out_dir, allowed_tags, reference_points, strict=False):
+	"""Adds the dependencies of each tag spec, which the sanitizer would otherwise resolve on every request.
+
+	The dependencies are added to each tag spec under the 'precomputed' key, next
+	to the facts of AddSpecFacts(): required_extensions, the sorted names of the
+	extensions it requires, either itself or through the tag specs named by its
+	also_requires_tag and also_requires_tag_warning, transitively; and
+	reference_point_attrs, the attribute specs which the reference points of the
+	tag spec allow on its children, merged with the attributes of each reference
+	and without their mandatory constraint. Dependencies which are empty are left
+	out. Run it after the attribute specs are complete, as reference_point_attrs
+	has copies of them.
+
+	Cycles of tag specs requiring each other, and requirements of tag specs,
+	reference points or extensions which do not exist, are written to
+	DEPENDENCY_REPORT_FILE. They are logged as warnings, or fail the build when
+	strict, as with --strict-dependencies.
+
+	Args:
+		out_dir: directory name of the output directory, where the report is written to.
+		allowed_tags: dictionary of tag name to its list of tag specs.
+		reference_points: dictionary of reference point spec name to its tag spec.
+		strict: whether dependency cycles and missing dependencies fail the build.
+	Raises:
+		ValueError: if there are dependency cycles or missing dependencies when strict.
+	"""
 	logging.info('entering ...')
 
-  # Output the allowed tags dictionary along with each tag's allowed attributes
-	out.append('')
-	out.append('\tprivate static $allowed_tags = %s;' % Phpize( allowed_tags, 1 ).lstrip() )
+	tag_specs = []
+	for tag_name in sorted(allowed_tags):
+		tag_specs.extend((tag_name, tag_spec) for tag_spec in allowed_tags[tag_name])
+	specs_by_name = {}
+	for (tag_name, tag_spec) in tag_specs:
+		if 'spec_name' in tag_spec['tag_spec']:
+			specs_by_name.setdefault(tag_spec['tag_spec']['spec_name'], tag_spec)
+	extensions = set()
+	for (tag_name, tag_spec) in tag_specs:
+		if 'extension_spec' in tag_spec['tag_spec']:
+			extensions.add(tag_spec['tag_spec']['extension_spec']['name'])
+
+	cycles = []
+	missing = []
+
+	def GetRequiredSpecNames(tag_spec):
+		return tag_spec['tag_spec'].get('also_requires_tag', []) + tag_spec['tag_spec'].get('also_requires_tag_warning', [])
+
+	for cycle in sorted(set(GetSpecDependencyCycles(specs_by_name, GetRequiredSpecNames))):
+		cycles.append(cycle)
+
+	for (tag_name, tag_spec) in tag_specs:
+		name = tag_spec['tag_spec'].get('spec_name', tag_name)
+		required_extensions = set(tag_spec['tag_spec'].get('requires_extension', []))
+		for spec_name in GetRequiredSpecNames(tag_spec):
+			if spec_name not in specs_by_name:
+				missing.append({'spec': name, 'type': 'tag_spec', 'name': spec_name})
+		for extension in sorted(required_extensions - extensions):
+			missing.append({'spec': name, 'type': 'extension', 'name': extension})
+		seen = set()
+		pending = list(GetRequiredSpecNames(tag_spec))
+		while pending:
+			spec_name = pending.pop()
+			if spec_name in seen or spec_name not in specs_by_name:
+				continue
+			seen.add(spec_name)
+			required_spec = specs_by_name[spec_name]
+			required_extensions.update(GetTagSpecExtensions(required_spec))
+			pending.extend(GetRequiredSpecNames(required_spec))
+
+		reference_point_attrs = {}
+		for spec_name in sorted(tag_spec['tag_spec'].get('reference_points', {})):
+			if spec_name not in reference_points:
+				missing.append({'spec': name, 'type': 'reference_point', 'name': spec_name})
+				continue
+			for (attr_name, attr_spec) in reference_points[spec_name]['attr_spec_list'].items():
+				attr_spec = dict(attr_spec)
+				attr_spec.update(tag_spec['tag_spec']['reference_points'][spec_name])
+				attr_spec.pop('mandatory', None)
+				reference_point_attrs[attr_name] = attr_spec
+
+		if required_extensions:
+			tag_spec['precomputed']['required_extensions'] = sorted(required_extensions)
+		if reference_point_attrs:
+			tag_spec['precomputed']['reference_point_attrs'] = reference_point_attrs
+
+	f = open(os.path.join(out_dir, DEPENDENCY_REPORT_FILE), 'w')
+	json.dump({'cycles': cycles, 'missing': missing}, f, indent=2, sort_keys=True)
+	f.write('\n')
+	f.close()
+
+	problems = ['Dependency cycle: %s' % cycle for cycle in cycles]
+	for dependency in missing:
+		if 'tag_spec' == dependency['type']:
+			problems.append("%(spec)s requires the tag spec '%(name)s', which does not exist" % dependency)
+		elif 'extension' == dependency['type']:
+			problems.append("%(spec)s requires the extension '%(name)s', which has no script tag spec" % dependency)
+		else:
+			problems.append("%(spec)s has the reference point '%(name)s', which does not exist" % dependency)
+	if problems and strict:
+		raise ValueError('Dependency cycles and missing dependencies:\n%s' % '\n'.join(problems))
+	for problem in problems:
+		logging.warning(problem)
 	logging.info('... done')
 
 
-def GenerateLayoutAttributesPHP(out, attr_lists):
+def GetSpecDependencyCycles(specs_by_name, get_required_spec_names):
+	"""Finds the cycles of tag specs which require each other.
+
+	Args:
+		specs_by_name: dictionary of spec name to its tag spec.
+		get_required_spec_names: function returning the names of the tag specs a tag spec requires.
+	Returns:
+		List of the cycles, each as the names of its tag specs joined by arrows.
+	"""
+	cycles = []
+	done = set()
+	for start in sorted(specs_by_name):
+		if start in done:
+			continue
+		# Depth-first search, with the path of the tag specs being visited on a stack.
+		path = [start]
+		iterators = [iter(get_required_spec_names(specs_by_name[start]))]
+		while iterators:
+			spec_name = next(iterators[-1], None)
+			if spec_name is None:
+				done.add(path.pop())
+				iterators.pop()
+			elif spec_name in path:
+				cycle = path[path.index(spec_name):]
+				cycles.append(' -> '.join(cycle + [spec_name]))
+			elif spec_name in specs_by_name and spec_name not in done:
+				path.append(spec_name)
+				iterators.append(iter(get_required_spec_names(specs_by_name[spec_name])))
+	return cycles
+
+
+def AddPcrePatterns(out_dir, allowed_tags, attr_lists, reference_points, strict=False):
+	"""Adds the regexes of the specs as PCRE patterns, and checks that they are safe to match with.
+
+	The sanitizer matches each regex as a pattern which is delimited, anchored and
+	has the modifiers given by amphtml_regex.PCRE_PATTERN_FORMATS. The pattern is
+	stored next to the regex with a '_pcre' suffix, so that it can be passed to
+	preg_match() as is.
+
+	The regexes which are invalid or prone to catastrophic backtracking are written
+	to REGEX_REPORT_FILE, along with the specs using them; see
+	amphtml_regex.GetRegexProblems().
+	Invalid regexes fail the build, and so do regexes prone to backtracking when
+	strict, as with --strict-regexes.
+
+	Args:
+		out_dir: directory name of the output directory, where the report is written to.
+		allowed_tags: dictionary of tag name to its list of tag specs.
+		attr_lists: dictionary of attribute list name to its attribute specs.
+		reference_points: dictionary of reference point spec name to its tag spec.
+		strict: whether regexes prone to catastrophic backtracking fail the build.
+	Raises:
+		ValueError: if a regex is invalid, or prone to backtracking when strict.
+	"""
 	logging.info('entering ...')
 
-	# Output the attribute list allowed for layouts.
-	out.append('')
-	out.append('\tprivate static $layout_allowed_attrs = %s;' % Phpize( attr_lists['$AMP_LAYOUT_ATTRS'], 1 ).lstrip() )
-	out.append('')
+	# The specs which have regexes, with where they are for the report.
+	specs = []
+	for list_name in sorted(attr_lists):
+		for (attr_name, attr_spec) in sorted(attr_lists[list_name].items()):
+			specs.append((attr_spec, '%s[%s]' % (list_name, attr_name)))
+	tag_specs = sorted(reference_points.items())
+	for tag_name in sorted(allowed_tags):
+		for tag_spec in allowed_tags[tag_name]:
+			tag_specs.append((tag_spec['tag_spec'].get('spec_name', tag_name), tag_spec))
+	for (spec_name, tag_spec) in tag_specs:
+		for (attr_name, attr_spec) in sorted(tag_spec['attr_spec_list'].items()):
+			specs.append((attr_spec, '%s[%s]' % (spec_name, attr_name)))
+		if 'cdata' in tag_spec:
+			specs.append((tag_spec['cdata'], spec_name))
+
+	regexes = collections.OrderedDict()
+	for (spec, where) in specs:
+		for key in sorted(amphtml_regex.PCRE_PATTERN_FORMATS):
+			if key not in spec:
+				continue
+			regex = spec[key]['regex'] if 'blacklisted_cdata_regex' == key else spec[key]
+			spec[key + '_pcre'] = amphtml_regex.GetPcrePattern(regex, key)
+			if (key, regex) not in regexes:
+				regexes[(key, regex)] = {
+					'key': key,
+					'regex': regex,
+					'pattern': spec[key + '_pcre'],
+					'problems': amphtml_regex.GetRegexProblems(regex, 'value_regex_casei' == key),
+					'specs': [],
+				}
+			regexes[(key, regex)]['specs'].append(where)
+
+	report = [entry for entry in regexes.values() if entry['problems']]
+	f = open(os.path.join(out_dir, REGEX_REPORT_FILE), 'w')
+	json.dump(report, f, indent=2, sort_keys=True)
+	f.write('\n')
+	f.close()
+
+	failures = []
+	for entry in report:
+		invalid = any(problem.startswith('invalid') for problem in entry['problems'])
+		message = '%s %s (%s): %s' % (entry['key'], entry['regex'], ', '.join(entry['specs']), '; '.join(entry['problems']))
+		if invalid or strict:
+			failures.append(message)
+		else:
+			logging.warning(message)
+	if failures:
+		raise ValueError('Regexes which are %s:\n%s' % ('invalid or prone to catastrophic backtracking' if strict else 'invalid', '\n'.join(failures)))
+
 	logging.info('... done')
 
 
-def GenerateGlobalAttributesPHP(out, attr_lists):
-	logging.info('entering ...')
+def WriteChangelog(out_dir, diff_against, allowed_tags, attr_lists, descendant_lists, reference_points, previous_sections=None, parse_stats=False):
+	"""Writes the changes to the rules since a previous generated file or rules snapshot to CHANGELOG_FILE.
+
+	Tag specs are matched up by their spec_name, or else by their position among
+	the tag's specs. For each tag, attribute list, descendant tag list and
+	reference point the changelog has the keys which were added and removed, and
+	the old and new values of the keys which changed.
+
+	A previous generated file only has the layout and global attribute lists,
+	and the sections of it are added to previous_sections for PhpizeProperty() to
+	reuse.
+
+	Args:
+		out_dir: directory name of the output directory, containing the validator descriptor.
+		diff_against: path of a previous generated PHP file or rules snapshot.
+		allowed_tags: dictionary of tag name to its list of tag specs.
+		attr_lists: dictionary of attribute list name to its attribute specs.
+		descendant_lists: dictionary of descendant tag list name to its tag names.
+		reference_points: dictionary of reference point spec name to its tag spec.
+		previous_sections: dictionary to add the sections of a previous generated file to, or None.
+		parse_stats: whether to write how long loading a previous rules snapshot took to STDERR.
+	"""
+	logging.info('entering ...')
+
+	new_rules = GetPhpValue({
+		'allowed_tags': allowed_tags,
+		'attr_lists': attr_lists,
+		'descendant_lists': descendant_lists,
+		'reference_points': reference_points,
+	})
+	if diff_against.endswith('.php'):
+		old_rules = LoadGeneratedRules(diff_against, previous_sections)
+		new_rules['attr_lists'] = dict((name, attrs) for (name, attrs) in new_rules['attr_lists'].items() if name in old_rules['attr_lists'])
+	else:
+		old_rules = GetPhpValue(dict(zip(('allowed_tags', 'attr_lists', 'descendant_lists', 'reference_points'), ParseRules(out_dir, diff_against, parse_stats)[:4])))
+
+	changelog = {}
+	for (name, diff_value) in (('allowed_tags', DiffTagSpecLists), ('attr_lists', DiffDicts), ('descendant_lists', DiffLists), ('reference_points', DiffTagSpecs)):
+		diff = DiffDicts(old_rules[name], new_rules[name], diff_value)
+		if diff:
+			changelog[name] = diff
+
+	f = open(os.path.join(out_dir, CHANGELOG_FILE), 'w')
+	json.dump(changelog, f, indent=2, separators=(',', ': '), sort_keys=True)
+	f.write('\n')
+	f.close()
+	logging.info('... done')
+
+
+def LoadGeneratedRules(php_file, previous_sections=None):
+	"""Loads the rules from a generated PHP file, in the form ParseRules() returns them in.
+
+	The references to shared attribute specs are resolved, and the facts added
+	by AddSpecFacts(), the patterns added by AddPcrePatterns(), the sets added
+	by AddEnumSets() and the keys added by AddSpecProfileKeys() are removed. The lists of a file generated with the 'set' enum
+	format are restored from its sets.
+
+	Args:
+		php_file: path of the generated PHP file.
+		previous_sections: dictionary to add the sections of the file to, by property
+			name, as tuples of their value as returned by GetPhpValue() and their PHP
+			source, or None.
+	Returns:
+		Dictionary with the allowed_tags, attr_lists, descendant_lists and reference_points, as returned by GetPhpValue().
+	"""
+	f = open(php_file)
+	php_sections = ParsePhpSections(f.read())
+	f.close()
+	if 'allowed_tags' not in php_sections:
+		raise ValueError('%s has no allowed_tags; diff against a file generated without --sharded or --snapshot-format' % php_file)
+	if previous_sections is not None:
+		previous_sections.update(php_sections)
+
+	sections = dict((name, value) for (name, (value, _)) in php_sections.items())
+	shared_attr_specs = sections.get('shared_attr_specs', [])
+	shared_attr_spec_lists = sections.get('shared_attr_spec_lists', [])
+
+	def RemoveEnumSets(spec, keys):
+		if not isinstance(spec, dict):
+			return
+		for key in keys:
+			if key + '_set' in spec:
+				if key not in spec:
+					spec[key] = list(GetPhpArrayKeys(spec[key + '_set']))
+				del spec[key + '_set']
+
+	def RemovePcrePatterns(spec):
+		if not isinstance(spec, dict):
+			return
+		for key in amphtml_regex.PCRE_PATTERN_FORMATS:
+			spec.pop(key + '_pcre', None)
+
+	def ResolveAttrSpecList(attr_spec_list):
+		if isinstance(attr_spec_list, int):
+			attr_spec_list = shared_attr_spec_lists[attr_spec_list]
+		if not attr_spec_list:
+			return []
+		resolved = {}
+		for (name, attr_spec) in attr_spec_list.items():
+			if isinstance(attr_spec, int):
+				attr_spec = shared_attr_specs[attr_spec]
+			attr_spec = copy.deepcopy(attr_spec)
+			RemoveEnumSets(attr_spec, ENUM_SET_KEYS['attr_spec'])
+			RemovePcrePatterns(attr_spec)
+			if attr_spec:
+				RemoveEnumSets(attr_spec.get('value_url'), ENUM_SET_KEYS['value_url'])
+			resolved[name] = attr_spec or []
+		return resolved
+
+	def ResolveTagSpec(tag_spec):
+		tag_spec = dict(tag_spec)
+		tag_spec.pop('precomputed', None)
+		if tag_spec.get('cdata'):
+			tag_spec['cdata'] = dict(tag_spec['cdata'])
+			RemovePcrePatterns(tag_spec['cdata'])
+		tag_spec['tag_spec'] = copy.deepcopy(tag_spec['tag_spec'])
+		if tag_spec['tag_spec']:
+			tag_spec['tag_spec'].pop('profile_key', None)
+			RemoveEnumSets(tag_spec['tag_spec'].get('child_tags'), ENUM_SET_KEYS['child_tags'])
+		tag_spec['attr_spec_list'] = ResolveAttrSpecList(tag_spec['attr_spec_list'])
+		return tag_spec
+
+	allowed_tags = sections['allowed_tags'] or {}
+	reference_points = sections.get('reference_points') or {}
+	attr_lists = {}
+	for (name, attr_list_name) in (('layout_allowed_attrs', '$AMP_LAYOUT_ATTRS'), ('globally_allowed_attrs', '$GLOBAL_ATTRS')):
+		if name in sections:
+			attr_lists[attr_list_name] = ResolveAttrSpecList(sections[name])
+	return {
+		'allowed_tags': dict((tag_name, [ResolveTagSpec(tag_spec) for tag_spec in tag_specs]) for (tag_name, tag_specs) in allowed_tags.items()),
+		'attr_lists': attr_lists,
+		'descendant_lists': sections.get('descendant_tag_lists') or {},
+		'reference_points': dict((name, ResolveTagSpec(tag_spec)) for (name, tag_spec) in reference_points.items()),
+	}
+
+
+def DiffDicts(old, new, diff_value=None):
+	"""Compares two dictionaries.
+
+	Args:
+		old: the old dictionary, or an empty list.
+		new: the new dictionary, or an empty list.
+		diff_value: function comparing the old and new value of a key, or None to include both values.
+	Returns:
+		Dictionary with the sorted keys which were added and removed, and the changes of the keys which changed, or an empty dictionary.
+	"""
+	old = old or {}
+	new = new or {}
+	diff = {}
+	added = sorted(set(new) - set(old))
+	if added:
+		diff['added'] = added
+	removed = sorted(set(old) - set(new))
+	if removed:
+		diff['removed'] = removed
+	changed = {}
+	for key in sorted(set(old) & set(new)):
+		if old[key] != new[key]:
+			changed[key] = diff_value(old[key], new[key]) if diff_value else {'old': old[key], 'new': new[key]}
+	if changed:
+		diff['changed'] = changed
+	return diff
+
+
+def DiffLists(old, new):
+	"""Compares two lists of names.
+
+	Args:
+		old: the old list.
+		new: the new list.
+	Returns:
+		Dictionary with the sorted names which were added and removed.
+	"""
+	return DiffDicts(dict.fromkeys(old), dict.fromkeys(new))
+
+
+def DiffTagSpecs(old, new):
+	"""Compares two tag specs.
+
+	Args:
+		old: the old tag spec.
+		new: the new tag spec.
+	Returns:
+		Dictionary with the changes to each part of the tag spec which changed.
+	"""
+	diff = {}
+	for key in ('tag_spec', 'attr_spec_list', 'cdata'):
+		key_diff = DiffDicts(old.get(key), new.get(key))
+		if key_diff:
+			diff[key] = key_diff
+	return diff
+
+
+def DiffTagSpecLists(old, new):
+	"""Compares the tag specs of a tag.
+
+	Args:
+		old: the old list of tag specs.
+		new: the new list of tag specs.
+	Returns:
+		Dictionary with the keys of the tag specs which were added and removed, and the changes to those which changed.
+	"""
+	return DiffDicts(GetTagSpecsByKey(old), GetTagSpecsByKey(new), DiffTagSpecs)
+
+
+def GetTagSpecsByKey(tag_specs):
+	"""Keys the tag specs of a tag by their spec_name, or else by their position.
+
+	Args:
+		tag_specs: list of tag specs.
+	Returns:
+		Dictionary of key to tag spec.
+	"""
+	tag_specs_by_key = {}
+	for (i, tag_spec) in enumerate(tag_specs):
+		key = (tag_spec.get('tag_spec') or {}).get('spec_name') or '#%d' % i
+		if key in tag_specs_by_key:
+			key = '%s#%d' % (key, i)
+		tag_specs_by_key[key] = tag_spec
+	return tag_specs_by_key
+
+
+def GetPeakMemory():
+	"""Gets the peak resident memory of this process.
+
+	Returns:
+		Peak resident memory in megabytes.
+	"""
+	max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	if 'darwin' == sys.platform:
+		return max_rss / 1024.0 / 1024.0
+	return max_rss / 1024.0
+
+
+class AtomicFileWriter(object):
+	"""Writes a file by way of a temporary file that is moved into place once complete.
+
+	If writing fails before commit(), the file at the destination is left untouched.
+	"""
+
+	def __init__(self, path):
+		self.path = path
+		fd, self.tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.%s.' % os.path.basename(path), suffix='.tmp')
+		self.file = os.fdopen(fd, 'w')
+		self.start = time.time()
+		self.first_byte_time = None
+		self.bytes_written = 0
+
+	def write(self, data):
+		if self.first_byte_time is None:
+			self.first_byte_time = time.time() - self.start
+		self.file.write(data)
+		self.bytes_written += len(data)
+
+	def append(self, line):
+		"""Writes a line, so that the writer can stand in for a list of output lines."""
+		self.write(line + '\n')
+
+	def commit(self):
+		"""Flushes the temporary file to disk and renames it to the destination."""
+		self.file.flush()
+		os.fsync(self.file.fileno())
+		self.file.close()
+		if os.path.exists(self.path):
+			os.chmod(self.tmp_path, stat.S_IMODE(os.stat(self.path).st_mode))
+		else:
+			os.chmod(self.tmp_path, 0o644)
+		os.rename(self.tmp_path, self.path)
+
+	def abort(self):
+		"""Removes the temporary file."""
+		self.file.close()
+		os.unlink(self.tmp_path)
+
+
+class Profile(object):
+	"""Records the wall and CPU time of each stage, the calls of each function and counters.
+
+	Each stage is profiled with cProfile in the thread it runs in. The protoascii
+	files parsed in other processes with --jobs are only counted in the CPU time
+	of the children of the rules stage.
+	"""
+
+	def __init__(self):
+		self.stages = collections.OrderedDict()
+		self.counters = collections.Counter()
+		self.profilers = []
+
+	def RunStage(self, stage, out_dir):
+		"""Runs a stage while profiling it.
+
+		Args:
+			stage: the stage to run.
+			out_dir: directory name of the output directory.
+		"""
+		profiler = cProfile.Profile()
+		start_times = os.times()
+		start = time.time()
+		profiler.enable()
+		try:
+			stage.run(out_dir)
+		finally:
+			profiler.disable()
+			end_times = os.times()
+			self.stages[stage.name] = {
+				'cached': False,
+				'wall_time': time.time() - start,
+				'cpu_time': end_times[0] + end_times[1] - start_times[0] - start_times[1],
+				'children_cpu_time': end_times[2] + end_times[3] - start_times[2] - start_times[3],
+			}
+			self.profilers.append(profiler)
+
+	def Count(self, counter):
+		"""Increments a counter.
+
+		Args:
+			counter: name of the counter.
+		"""
+		self.counters[counter] += 1
+
+	def GetStats(self, stream=None):
+		"""Merges the profiles of the stages.
+
+		Args:
+			stream: file to print the statistics to.
+		Returns:
+			pstats.Stats instance, or None if no stage ran.
+		"""
+		if not self.profilers:
+			return None
+		stats = pstats.Stats(self.profilers[0], stream=stream)
+		for profiler in self.profilers[1:]:
+			stats.add(profiler)
+		return stats
+
+	def GetSummary(self):
+		"""Summarizes the profile.
+
+		Returns:
+			Dictionary with the stages, the counters and the calls of the functions of
+			the generator, by name and line. The names of the functions of the
+			GENERATOR_MODULES are qualified with their module.
+		"""
+		script_file = os.path.realpath(__file__)
+		generator_files = GetGeneratorFiles()
+		functions = {}
+		stats = self.GetStats()
+		if stats is not None:
+			for ((filename, line, name), (primitive_calls, calls, own_time, cumulative_time, _)) in stats.stats.items():
+				path = os.path.splitext(os.path.realpath(filename))[0] + '.py'
+				if path in generator_files:
+					if path != script_file:
+						name = '%s.%s' % (os.path.splitext(os.path.basename(path))[0], name)
+					functions['%s:%d' % (name, line)] = {
+						'calls': calls,
+						'primitive_calls': primitive_calls,
+						'own_time': own_time,
+						'cumulative_time': cumulative_time,
+					}
+		return {
+			'stages': self.stages,
+			'counters': self.counters,
+			'functions': functions,
+			'peak_memory_mb': GetPeakMemory(),
+		}
+
+	def Write(self, profile_dir):
+		"""Writes the pstats file and JSON summary to a directory, and a report to STDERR.
+
+		Args:
+			profile_dir: directory to write amphtml-update.pstats and amphtml-update.json to.
+		"""
+		if not os.path.isdir(profile_dir):
+			os.makedirs(profile_dir)
+
+		summary = self.GetSummary()
+		f = open(os.path.join(profile_dir, 'amphtml-update.json'), 'w')
+		json.dump(summary, f, indent=2, separators=(',', ': '), sort_keys=True)
+		f.close()
+
+		for (name, stage) in summary['stages'].items():
+			if stage['cached']:
+				sys.stderr.write('%-20s cached\n' % name)
+			else:
+				sys.stderr.write('%-20s %8.3fs wall %8.3fs CPU %8.3fs children CPU\n' % (name, stage['wall_time'], stage['cpu_time'], stage['children_cpu_time']))
+		for (counter, count) in sorted(summary['counters'].items()):
+			sys.stderr.write('%-32s %8d\n' % (counter, count))
+
+		stats = self.GetStats(sys.stderr)
+		if stats is not None:
+			stats.dump_stats(os.path.join(profile_dir, 'amphtml-update.pstats'))
+			stats.sort_stats('cumulative').print_stats(20)
+
+
+def InstallFile(src, dest):
+	"""Atomically copies a file to its destination.
+
+	Args:
+		src: path of the file to copy.
+		dest: path of the destination.
+	"""
+	out = AtomicFileWriter(dest)
+	try:
+		f = open(src)
+		shutil.copyfileobj(f, out)
+		f.close()
+		out.commit()
+	except:
+		out.abort()
+		raise
+
+
+def InstallDirectory(src, dest):
+	"""Copies a directory to its destination, replacing any directory there.
+
+	The copy is made next to the destination first, so that the destination is
+	only briefly missing while the directories are renamed.
+
+	Args:
+		src: path of the directory to copy.
+		dest: path of the destination.
+	"""
+	parent_dir = os.path.dirname(os.path.abspath(dest))
+	tmp_dir = tempfile.mkdtemp(dir=parent_dir, prefix='.%s.' % os.path.basename(dest))
+	try:
+		shutil.rmtree(tmp_dir)
+		shutil.copytree(src, tmp_dir)
+		os.chmod(tmp_dir, 0o755)
+		if os.path.exists(dest):
+			old_dir = tempfile.mkdtemp(dir=parent_dir, prefix='.%s.' % os.path.basename(dest))
+			os.rmdir(old_dir)
+			os.rename(dest, old_dir)
+			os.rename(tmp_dir, dest)
+			shutil.rmtree(old_dir)
+		else:
+			os.rename(tmp_dir, dest)
+	except:
+		if os.path.exists(tmp_dir):
+			shutil.rmtree(tmp_dir)
+		raise
+
+
+def GenerateHeaderPHP(out):
+	logging.info('entering ...')
+
+	# Output the file's header
+	out.append('<?php')
+	out.append('/**')
+	out.append(' * Generated by %s - do not edit.' % os.path.basename(__file__))
+	out.append(' *')
+	out.append(' * This is a list of HTML tags and attributes that are allowed by the')
+	out.append(' * AMP specification. Note that tag names have been converted to lowercase.')
+	out.append(' *')
+	out.append(' * Note: This file only contains tags that are relevant to the `body` of')
+	out.append(' * an AMP page. To include additional elements modify the variable')
+	out.append(' * `mandatory_parent_blacklist` in the amp_wp_build.py script.')
+	out.append(' *')
+	out.append(' * phpcs:ignoreFile')
+	out.append(' */')
+	out.append('class AMP_Allowed_Tags_Generated {')
+	out.append('')
+	logging.info('... done')
+
+
+def GenerateSpecVersionPHP(out, versions):
+	logging.info('entering ...')
+
+	# Output the version of the spec file and matching validator version
+	if versions['spec_file_revision']:
+		out.append('\tprivate static $spec_file_revision = %d;' % versions['spec_file_revision'])
+	if versions['min_validator_revision_required']:
+		out.append('\tprivate static $minimum_validator_revision_required = %d;' % versions['min_validator_revision_required'])
+	logging.info('... done')
+
+def GenerateDescendantListsPHP(out, descendant_lists, previous_sections=None):
+	logging.info('entering ...')
+
+	out.append('')
+	PhpizeProperty(out, 'descendant_tag_lists', descendant_lists, previous_sections)
+	logging.info('... done')
+
+
+def GenerateAllowedTagsPHP(out, allowed_tags, previous_sections=None):
+	logging.info('entering ...')
+
+  # Output the allowed tags dictionary along with each tag's allowed attributes
+	out.append('')
+	PhpizeProperty(out, 'allowed_tags', allowed_tags, previous_sections)
+	logging.info('... done')
+
+
+def GenerateLayoutAttributesPHP(out, attr_lists, previous_sections=None):
+	logging.info('entering ...')
+
+	# Output the attribute list allowed for layouts.
+	out.append('')
+	PhpizeProperty(out, 'layout_allowed_attrs', attr_lists['$AMP_LAYOUT_ATTRS'], previous_sections)
+	out.append('')
+	logging.info('... done')
+
+
+def GenerateGlobalAttributesPHP(out, attr_lists, previous_sections=None):
+	logging.info('entering ...')
+
+	# Output the globally allowed attribute list.
+	out.append('')
+	PhpizeProperty(out, 'globally_allowed_attrs', attr_lists['$GLOBAL_ATTRS'], previous_sections)
+	out.append('')
+	logging.info('... done')
+
+def GenerateReferencePointsPHP(out, reference_points, previous_sections=None):
+	logging.info('entering ...')
+
+	# Output the reference points.
+	out.append('')
+	PhpizeProperty(out, 'reference_points', reference_points, previous_sections)
+	out.append('')
+	logging.info('... done')
+
+def GenerateShardsPHP(out, out_dir, descendant_lists, allowed_tags, reference_points, previous_sections=None):
+	logging.info('entering ...')
+
+	shard_dir = os.path.join(out_dir, GENERATED_SHARD_DIR)
+	os.mkdir(shard_dir)
+
+	# Write the shards and output the index of which shard holds which entry.
+	for (name, data) in (('descendant_tag_list', descendant_lists), ('allowed_tag', allowed_tags), ('reference_point', reference_points)):
+		out.append('')
+		PhpizeProperty(out, '%s_shards' % name, WriteShards(shard_dir, name.replace('_', '-') + 's', data), previous_sections)
+	logging.info('... done')
+
+
+def WriteShards(shard_dir, name, data):
+	"""Writes each entry of a dictionary to its own PHP file returning the entry.
+
+	Args:
+		shard_dir: directory name of the shards directory.
+		name: name of the subdirectory to write the files to.
+		data: dictionary of the entries to write.
+	Returns:
+		Dictionary of key to the path of its file, relative to the generated class.
+	"""
+	os.mkdir(os.path.join(shard_dir, name))
+	shards = {}
+	used_file_names = set()
+	for key in sorted(data):
+		file_name = re.sub(r'[^a-z0-9-]+', '-', key.lower()).strip('-') or name
+		unique_file_name = file_name
+		i = 1
+		while unique_file_name in used_file_names:
+			i += 1
+			unique_file_name = '%s-%d' % (file_name, i)
+		used_file_names.add(unique_file_name)
+		shard_file = '%s/%s/%s.php' % (GENERATED_SHARD_DIR, name, unique_file_name)
+
+		out = []
+		out.append('<?php')
+		out.append('// Generated by %s - do not edit.' % os.path.basename(__file__))
+		out.append('// phpcs:ignoreFile')
+		PhpizeValue(data[key], '', '', 'return ', ';', out)
+		f = open(os.path.join(os.path.dirname(shard_dir), shard_file), 'w')
+		f.write('\n'.join(out) + '\n')
+		f.close()
+
+		shards[key] = shard_file
+	return shards
+
+
+def GenerateShardCachesPHP(out):
+	logging.info('entering ...')
+
+	# Output the properties holding the shards loaded so far.
+	out.append('')
+	for name in ('descendant_tag_lists', 'allowed_tags', 'reference_points'):
+		out.append('\tprivate static $%s = array();' % name)
+	out.append('')
+	logging.info('... done')
+
+
+def GenerateSnapshotPHP(out, out_dir, snapshot_format, sections):
+	"""Writes the rules to a snapshot file and outputs the properties they are loaded into.
+
+	Args:
+		out: list of output lines, or a writer with an append() method.
+		out_dir: directory name of the output directory, where the snapshot is written to.
+		snapshot_format: one of amphtml_snapshot.SNAPSHOT_FORMATS.
+		sections: ordered dictionary of property name to the data it holds.
+	"""
+	logging.info('entering ...')
+
+	f = open(os.path.join(out_dir, GetSnapshotFile(snapshot_format)), 'wb')
+	f.write(amphtml_snapshot.SerializeSnapshot(sections, snapshot_format))
+	f.close()
+
+	# Output the properties, which are filled from the snapshot on first access.
+	out.append('')
+	for name in sections.keys() + ['resolved_allowed_tags', 'resolved_reference_points', 'resolved_attr_spec_lists']:
+		out.append('\tprivate static $%s = array();' % name)
+	out.append('\tprivate static $snapshot_loaded = false;')
+	out.append('')
+	logging.info('... done')
+
+
+def GetSnapshotFile(snapshot_format):
+	"""Gets the name of the snapshot file for a format, which is written next to the generated class.
+
+	Args:
+		snapshot_format: one of amphtml_snapshot.SNAPSHOT_FORMATS.
+	Returns:
+		File name.
+	"""
+	return '%s.%s' % (os.path.splitext(GENERATED_PHP_FILE)[0], amphtml_snapshot.SNAPSHOT_FORMATS[snapshot_format][0])
+
+
+def GenerateSharedAttrSpecsPHP(out, sharded, shared_attr_specs, shared_attr_spec_lists, previous_sections=None):
+	logging.info('entering ...')
+
+	# Output the attribute specs the tag specs refer to by index, and which of them have been resolved.
+	PhpizeProperty(out, 'shared_attr_specs', shared_attr_specs, previous_sections)
+	out.append('')
+	PhpizeProperty(out, 'shared_attr_spec_lists', shared_attr_spec_lists, previous_sections)
+	out.append('')
+	names = ['resolved_attr_spec_lists']
+	if not sharded:
+		names = ['resolved_allowed_tags', 'resolved_reference_points'] + names
+	for name in names:
+		out.append('\tprivate static $%s = array();' % name)
+	out.append('')
+	logging.info('... done')
+
+
+def GenerateIndexesPHP(out, allowed_tags, previous_sections=None):
+	logging.info('entering ...')
+
+	# Output the lookup tables for finding tag specs without looping over a tag's specs.
+	PhpizeProperty(out, 'spec_name_index', GetSpecNameIndex(allowed_tags), previous_sections)
+	out.append('')
+	PhpizeProperty(out, 'dispatch_tables', GetDispatchTables(allowed_tags), previous_sections)
+	out.append('')
+	PhpizeProperty(out, 'css_rules', GetCssRules(allowed_tags), previous_sections)
+	out.append('')
+	PhpizeProperty(out, 'extension_script_index', GetExtensionScriptIndex(allowed_tags), previous_sections)
+	out.append('')
+	logging.info('... done')
+
+
+def GetSpecNameIndex(allowed_tags):
+	"""Builds the lookup of where the tag spec with a given spec_name is.
+
+	Args:
+		allowed_tags: dictionary of tag name to its list of tag specs.
+	Returns:
+		Dictionary of spec_name to a list of the tag name and the index of the tag spec.
+	"""
+	spec_name_index = {}
+	for tag_name in sorted(allowed_tags):
+		for (i, tag_spec) in enumerate(allowed_tags[tag_name]):
+			spec_name = tag_spec['tag_spec'].get('spec_name')
+			if spec_name is not None and spec_name not in spec_name_index:
+				spec_name_index[spec_name] = [tag_name, i]
+	return spec_name_index
+
+
+def GetDispatchTables(allowed_tags):
+	"""Builds the lookup of which tag specs are dispatched by an attribute.
+
+	An attribute spec with a dispatch_key of NAME_DISPATCH dispatches its tag spec by
+	the presence of the attribute, NAME_VALUE_DISPATCH by the attribute's value, and
+	NAME_VALUE_PARENT_DISPATCH by the attribute's value when the element's parent is
+	the tag spec's mandatory parent. The value_casei values are lowercased.
+
+	Args:
+		allowed_tags: dictionary of tag name to its list of tag specs.
+	Returns:
+		Dictionary of tag name to attribute name to a dictionary with the indexes of
+		the tag specs dispatched by 'name', by 'value' and 'value_casei', and by
+		'value_parent' and 'value_casei_parent', which are keyed by the value and
+		then by the parent's tag name.
+	"""
+	dispatch_tables = {}
+	for tag_name in sorted(allowed_tags):
+		for (i, tag_spec) in enumerate(allowed_tags[tag_name]):
+			for (attr_name, attr_spec) in tag_spec['attr_spec_list'].items():
+				dispatch_key = attr_spec.get('dispatch_key')
+				if not dispatch_key:
+					continue
+				dispatch_table = dispatch_tables.setdefault(tag_name, {}).setdefault(attr_name, {})
+				if DISPATCH_KEY_NAME == dispatch_key:
+					dispatch_table.setdefault('name', []).append(i)
+					continue
+				parent = tag_spec['tag_spec'].get('mandatory_parent') if DISPATCH_KEY_NAME_VALUE_PARENT == dispatch_key else None
+				for value in attr_spec.get('value', attr_spec.get('value_set', [])):
+					if parent:
+						dispatch_table.setdefault('value_parent', {}).setdefault(value, {}).setdefault(parent, []).append(i)
+					else:
+						dispatch_table.setdefault('value', {}).setdefault(value, []).append(i)
+				for value in attr_spec.get('value_casei', attr_spec.get('value_casei_set', [])):
+					if parent:
+						dispatch_table.setdefault('value_casei_parent', {}).setdefault(value.lower(), {}).setdefault(parent, []).append(i)
+					else:
+						dispatch_table.setdefault('value_casei', {}).setdefault(value.lower(), []).append(i)
+	return dispatch_tables
+
+
+def GetExtensionScriptIndex(allowed_tags):
+	"""Builds the lookup of the script tag specs of each extension.
+
+	Args:
+		allowed_tags: dictionary of tag name to its list of tag specs.
+	Returns:
+		Dictionary of extension name to the indexes of its script tag specs.
+	"""
+	extension_script_index = {}
+	for (i, tag_spec) in enumerate(allowed_tags.get('script', [])):
+		if 'extension_spec' in tag_spec['tag_spec']:
+			extension_script_index.setdefault(tag_spec['tag_spec']['extension_spec']['name'], []).append(i)
+	return extension_script_index
+
+
+def GetCssRules(allowed_tags):
+	"""Builds the CSS rules of the style and font stylesheet tag specs.
+
+	The style sanitizer needs the CSS rules of style[amp-custom] and
+	style[amp-keyframes], and the URLs font stylesheets may be loaded from, which
+	are otherwise nested in the tag specs. The allowed at-rules and declarations are
+	sets, and the href value_regex of a font stylesheet link is the PCRE pattern
+	of amphtml_regex.GetPcrePattern(), which can be passed to preg_match() as is.
+
+	Args:
+		allowed_tags: dictionary of tag name to its list of tag specs.
+	Returns:
+		Dictionary of spec_name to its CSS rules.
+	"""
+	css_rules = {}
+	for tag_name in sorted(allowed_tags):
+		for tag_spec in allowed_tags[tag_name]:
+			spec_name = tag_spec['tag_spec'].get('spec_name')
+			if spec_name is None or spec_name in css_rules:
+				continue
+
+			cdata = tag_spec.get('cdata', {})
+			if 'css_spec' in cdata:
+				css_spec = cdata['css_spec']
+				rules = {}
+				for key in ('allowed_at_rules', 'allowed_declarations', 'declaration'):
+					if key in css_spec:
+						rules[key] = dict((value, True) for value in css_spec[key])
+				rules['validate_keyframes'] = bool(css_spec.get('validate_keyframes'))
+				if 'max_bytes' in cdata:
+					rules['max_bytes'] = cdata['max_bytes']
+				css_rules[spec_name] = rules
+				continue
+
+			rel = tag_spec['attr_spec_list'].get('rel', {})
+			href = tag_spec['attr_spec_list'].get('href', {})
+			rel_values = list(rel.get('value_casei', [])) + list(rel.get('value_casei_set', {}).keys())
+			if 'link' == tag_name and 'stylesheet' in rel_values and 'value_regex' in href:
+				css_rules[spec_name] = {'font_url_regex': amphtml_regex.GetPcrePattern(href['value_regex'], 'value_regex')}
+	return css_rules
+
+
+def GenerateFooterPHP(out, sharded=False, snapshot_format=None, instrumented=False):
+	logging.info('entering ...')
+
+	# Output the footer.
+	footer = []
+	if sharded:
+		GenerateShardedAccessorsPHP(footer)
+	else:
+		GenerateAccessorsPHP(footer)
+
+	footer.append('''
+	/**
+	 * Get the tag spec with a given spec name.
+	 *
+	 * @since 1.2
+	 * @param string $spec_name Spec name.
+	 * @return array|null Tag spec, or null if there is no tag spec with the name.
+	 */
+	public static function get_tag_spec_by_spec_name( $spec_name ) {
+		{load}
+		if ( ! isset( self::$spec_name_index[ $spec_name ] ) ) {
+			return null;
+		}
+		list( $node_name, $spec_id ) = self::$spec_name_index[ $spec_name ];
+		$tag_specs                   = self::get_allowed_tag( $node_name );
+		return $tag_specs[ $spec_id ];
+	}
+
+	/**
+	 * Get the indexes of the tag specs of a tag which are dispatched by an attribute.
+	 *
+	 * Dispatching narrows down the specs a tag can match by an attribute such as script[type],
+	 * link[rel] or meta[name], without looping over each of the tag's specs. Some specs are only
+	 * dispatched by the attribute's value when the element's parent is their mandatory parent.
+	 *
+	 * @since 1.2
+	 * @param string      $node_name   Tag name.
+	 * @param string      $attr_name   Attribute name.
+	 * @param string|null $attr_value  Attribute value, or null to only get the tag specs dispatched by the presence of the attribute.
+	 * @param string|null $parent_name Tag name of the element's parent, or null to leave out the tag specs dispatched along with their parent.
+	 * @return int[] Indexes of the tag specs in the tag's specs, in ascending order.
+	 */
+	public static function get_dispatched_tag_spec_ids( $node_name, $attr_name, $attr_value = null, $parent_name = null ) {
+		{load}
+		if ( ! isset( self::$dispatch_tables[ $node_name ][ $attr_name ] ) ) {
+			return array();
+		}
+		$dispatch_table = self::$dispatch_tables[ $node_name ][ $attr_name ];
+
+		$spec_ids = isset( $dispatch_table['name'] ) ? $dispatch_table['name'] : array();
+		if ( null !== $attr_value ) {
+			if ( isset( $dispatch_table['value'][ $attr_value ] ) ) {
+				$spec_ids = array_merge( $spec_ids, $dispatch_table['value'][ $attr_value ] );
+			}
+			if ( isset( $dispatch_table['value_parent'][ $attr_value ][ $parent_name ] ) ) {
+				$spec_ids = array_merge( $spec_ids, $dispatch_table['value_parent'][ $attr_value ][ $parent_name ] );
+			}
+			$attr_value = strtolower( $attr_value );
+			if ( isset( $dispatch_table['value_casei'][ $attr_value ] ) ) {
+				$spec_ids = array_merge( $spec_ids, $dispatch_table['value_casei'][ $attr_value ] );
+			}
+			if ( isset( $dispatch_table['value_casei_parent'][ $attr_value ][ $parent_name ] ) ) {
+				$spec_ids = array_merge( $spec_ids, $dispatch_table['value_casei_parent'][ $attr_value ][ $parent_name ] );
+			}
+		}
+		$spec_ids = array_unique( $spec_ids );
+		sort( $spec_ids );
+		return $spec_ids;
+	}
+
+	/**
+	 * Get the tag specs of a tag which are dispatched by an attribute.
+	 *
+	 * @since 1.2
+	 * @see AMP_Allowed_Tags_Generated::get_dispatched_tag_spec_ids()
+	 * @param string      $node_name   Tag name.
+	 * @param string      $attr_name   Attribute name.
+	 * @param string|null $attr_value  Attribute value, or null to only get the tag specs dispatched by the presence of the attribute.
+	 * @param string|null $parent_name Tag name of the element's parent, or null to leave out the tag specs dispatched along with their parent.
+	 * @return array Tag specs, keyed by their index in the tag's specs.
+	 */
+	public static function get_dispatched_tag_specs( $node_name, $attr_name, $attr_value = null, $parent_name = null ) {
+		{load}
+		$spec_ids = self::get_dispatched_tag_spec_ids( $node_name, $attr_name, $attr_value, $parent_name );
+		if ( empty( $spec_ids ) ) {
+			return array();
+		}
+
+		$tag_specs            = self::get_allowed_tag( $node_name );
+		$dispatched_tag_specs = array();
+		foreach ( $spec_ids as $spec_id ) {
+			$dispatched_tag_specs[ $spec_id ] = $tag_specs[ $spec_id ];
+		}
+		return $dispatched_tag_specs;
+	}
+
+	/**
+	 * Get the CSS rules of a style or font stylesheet tag spec.
+	 *
+	 * The CSS rules of style[amp-custom] and style[amp-keyframes] have the allowed at-rules and declarations as sets,
+	 * along with validate_keyframes and max_bytes. The CSS rules of a font stylesheet link have the font_url_regex
+	 * the href has to match, which is anchored and delimited for preg_match().
+	 *
+	 * @since 1.2
+	 * @param string $spec_name Spec name, such as 'style amp-custom', 'style[amp-keyframes]' or 'link rel=stylesheet for fonts'.
+	 * @return array|null CSS rules, or null if the tag spec does not exist or has no CSS rules.
+	 */
+	public static function get_css_rules( $spec_name ) {
+		{load}
+		if ( ! isset( self::$css_rules[ $spec_name ] ) ) {
+			return null;
+		}
+		return self::$css_rules[ $spec_name ];
+	}
+
+	/**
+	 * Get the names of the extensions, which each have a script tag spec.
+	 *
+	 * @since 1.2
+	 * @return string[] Extension names, such as 'amp-carousel'.
+	 */
+	public static function get_extension_names() {
+		{load}
+		return array_keys( self::$extension_script_index );
+	}
+
+	/**
+	 * Get the script tag specs of an extension.
+	 *
+	 * @since 1.2
+	 * @param string $extension_name Extension name, such as 'amp-carousel'.
+	 * @return array Script tag specs, keyed by their index in the specs of the script tag.
+	 */
+	public static function get_extension_script_specs( $extension_name ) {
+		{load}
+		if ( ! isset( self::$extension_script_index[ $extension_name ] ) ) {
+			return array();
+		}
+
+		$tag_specs    = self::get_allowed_tag( 'script' );
+		$script_specs = array();
+		foreach ( self::$extension_script_index[ $extension_name ] as $spec_id ) {
+			$script_specs[ $spec_id ] = $tag_specs[ $spec_id ];
+		}
+		return $script_specs;
+	}
+
+	/**
+	 * Get list of globally-allowed attributes.
+	 *
+	 * @since 0.5
+	 * @return array Allowed tag.
+	 */
+	public static function get_allowed_attributes() {
+		{load}
+		return self::$globally_allowed_attrs;
+	}
+
+	/**
+	 * Get layout attributes.
+	 *
+	 * @since 0.5
+	 * @return array Allowed tag.
+	 */
+	public static function get_layout_attributes() {
+		{load}
+		return self::$layout_allowed_attrs;
+	}
+
+	/**
+	 * Resolve the references of tag specs to the attribute specs they share with other tag specs.
+	 *
+	 * @since 1.2
+	 * @param array $tag_specs Tag specs.
+	 * @return array Tag specs.
+	 */
+	private static function resolve_tag_specs( $tag_specs ) {
+		foreach ( $tag_specs as $i => $tag_spec ) {
+			$tag_specs[ $i ] = self::resolve_tag_spec( $tag_spec );
+		}
+		return $tag_specs;
+	}
+
+	/**
+	 * Resolve the references of a tag spec to the attribute specs it shares with other tag specs.
+	 *
+	 * @since 1.2
+	 * @param array $tag_spec Tag spec.
+	 * @return array Tag spec.
+	 */
+	private static function resolve_tag_spec( $tag_spec ) {
+		$tag_spec['attr_spec_list'] = self::resolve_attr_spec_list( $tag_spec['attr_spec_list'] );
+		return $tag_spec;
+	}
+
+	/**
+	 * Resolve an attribute spec list, which is either the index of a shared list or has the indexes of shared attribute specs.
+	 *
+	 * @since 1.2
+	 * @param array|int $attr_spec_list Attribute spec list, or the index of a shared attribute spec list.
+	 * @return array Attribute spec list.
+	 */
+	private static function resolve_attr_spec_list( $attr_spec_list ) {
+		if ( is_int( $attr_spec_list ) ) {
+			$id = $attr_spec_list;
+			if ( ! isset( self::$resolved_attr_spec_lists[ $id ] ) ) {
+				self::$shared_attr_spec_lists[ $id ]   = self::resolve_attr_spec_list( self::$shared_attr_spec_lists[ $id ] );
+				self::$resolved_attr_spec_lists[ $id ] = true;
+			}
+			return self::$shared_attr_spec_lists[ $id ];
+		}
+		foreach ( $attr_spec_list as $attr_name => $attr_spec ) {
+			if ( is_int( $attr_spec ) ) {
+				$attr_spec_list[ $attr_name ] = self::$shared_attr_specs[ $attr_spec ];
+			}
+		}
+		return $attr_spec_list;
+	}''')
+
+	# Each accessor starts with a {load} line, which has it load the snapshot
+	# before using the rules, and which is left out when there is no snapshot.
+	load = '\t\tself::load_snapshot();\n' if snapshot_format else ''
+	footer = [php.replace('\t\t{load}\n', load) for php in footer]
+	if snapshot_format:
+		GenerateSnapshotLoaderPHP(footer, snapshot_format)
+	if instrumented:
+		GenerateSpecMatchRecorderPHP(footer)
+	for php in footer:
+		out.append(php)
+
+	out.append('')
+
+	out.append('}')
+	out.append('')
+
+	logging.info('... done')
+
+
+def GenerateAccessorsPHP(out):
+	# Output the accessors for the tag specs held in the class.
+	out.append('''
+	/**
+	 * Get allowed tags.
+	 *
+	 * @since 0.5
+	 * @return array Allowed tags.
+	 */
+	public static function get_allowed_tags() {
+		{load}
+		if ( count( self::$resolved_allowed_tags ) !== count( self::$allowed_tags ) ) {
+			foreach ( array_keys( self::$allowed_tags ) as $node_name ) {
+				self::get_allowed_tag( $node_name );
+			}
+		}
+		return self::$allowed_tags;
+	}
+
+	/**
+	 * Get allowed tag.
+	 *
+	 * Get the rules for a single tag so that the entire data structure needn't be passed around.
+	 *
+	 * @since 0.7
+	 * @param string $node_name Tag name.
+	 * @return array|null Allowed tag, or null if the tag does not exist.
+	 */
+	public static function get_allowed_tag( $node_name ) {
+		{load}
+		if ( ! isset( self::$allowed_tags[ $node_name ] ) ) {
+			return null;
+		}
+		if ( ! isset( self::$resolved_allowed_tags[ $node_name ] ) ) {
+			self::$allowed_tags[ $node_name ]          = self::resolve_tag_specs( self::$allowed_tags[ $node_name ] );
+			self::$resolved_allowed_tags[ $node_name ] = true;
+		}
+		return self::$allowed_tags[ $node_name ];
+	}
+
+	/**
+	 * Get descendant tag lists.
+	 *
+	 * @since 1.1
+	 * @return array Descendant tags list.
+	 */
+	public static function get_descendant_tag_lists() {
+		{load}
+		return self::$descendant_tag_lists;
+	}
+
+	/**
+	 * Get allowed descendant tag list for a tag.
+	 *
+	 * Get the descendant rules for a single tag so that the entire data structure needn't be passed around.
+	 *
+	 * @since 1.1
+	 * @param string $name Name for the descendants list.
+	 * @return array|bool Allowed tags list, or false if there are no restrictions.
+	 */
+	public static function get_descendant_tag_list( $name ) {
+		{load}
+		if ( isset( self::$descendant_tag_lists[ $name ] ) ) {
+			return self::$descendant_tag_lists[ $name ];
+		}
+		return false;
+	}
+
+	/**
+	 * Get reference point spec.
+	 *
+	 * @since 1.0
+	 * @param string $tag_spec_name Tag spec name.
+	 * @return array|null Reference point spec, or null if does not exist.
+	 */
+	public static function get_reference_point_spec( $tag_spec_name ) {
+		{load}
+		if ( ! isset( self::$reference_points[ $tag_spec_name ] ) ) {
+			return null;
+		}
+		if ( ! isset( self::$resolved_reference_points[ $tag_spec_name ] ) ) {
+			self::$reference_points[ $tag_spec_name ]          = self::resolve_tag_spec( self::$reference_points[ $tag_spec_name ] );
+			self::$resolved_reference_points[ $tag_spec_name ] = true;
+		}
+		return self::$reference_points[ $tag_spec_name ];
+	}''')
+
 
-	# Output the globally allowed attribute list.
-	out.append('')
-	out.append('\tprivate static $globally_allowed_attrs = %s;' % Phpize( attr_lists['$GLOBAL_ATTRS'], 1 ).lstrip() )
-	out.append('')
-	logging.info('... done')
+def GenerateSnapshotLoaderPHP(out, snapshot_format):
+	# Output the method filling the properties from the snapshot.
+	out.append('''
+	/**
+	 * Load the rules from the snapshot next to this file, the first time they are accessed.
+	 *
+	 * @since 1.2
+	 */
+	private static function load_snapshot() {
+		if ( self::$snapshot_loaded ) {
+			return;
+		}
+		self::$snapshot_loaded = true;
+
+		$snapshot = %s( file_get_contents( __DIR__ . '/%s' ) );
+
+		self::$descendant_tag_lists   = $snapshot['descendant_tag_lists'];
+		self::$allowed_tags           = $snapshot['allowed_tags'];
+		self::$layout_allowed_attrs   = $snapshot['layout_allowed_attrs'];
+		self::$globally_allowed_attrs = $snapshot['globally_allowed_attrs'];
+		self::$reference_points       = $snapshot['reference_points'];
+		self::$shared_attr_specs      = $snapshot['shared_attr_specs'];
+		self::$shared_attr_spec_lists = $snapshot['shared_attr_spec_lists'];
+		self::$spec_name_index        = $snapshot['spec_name_index'];
+		self::$dispatch_tables        = $snapshot['dispatch_tables'];
+		self::$css_rules              = $snapshot['css_rules'];
+		self::$extension_script_index = $snapshot['extension_script_index'];
+	}''' % (amphtml_snapshot.SNAPSHOT_FORMATS[snapshot_format][1], GetSnapshotFile(snapshot_format)))
+
+
+def GenerateSpecMatchRecorderPHP(out):
+	# Output the methods of the instrumented class which count the spec matches for a spec match profile.
+	out.append('''
+	/**
+	 * Number of times each tag spec matched, by tag name and the profile_key of the tag spec.
+	 *
+	 * @var array
+	 */
+	private static $spec_match_counts = array();
 
-def GenerateReferencePointsPHP(out, reference_points):
-	logging.info('entering ...')
+	/**
+	 * Record that the sanitizer matched a node with a tag spec.
+	 *
+	 * @since 1.2
+	 * @param string $node_name   Tag name.
+	 * @param string $profile_key Profile key of the tag spec.
+	 */
+	public static function record_spec_match( $node_name, $profile_key ) {
+		if ( ! isset( self::$spec_match_counts[ $node_name ][ $profile_key ] ) ) {
+			self::$spec_match_counts[ $node_name ][ $profile_key ] = 0;
+		}
+		self::$spec_match_counts[ $node_name ][ $profile_key ]++;
+	}
 
-	# Output the reference points.
-	out.append('')
-	out.append('\tprivate static $reference_points = %s;' % Phpize( reference_points, 1 ).lstrip() )
-	out.append('')
-	logging.info('... done')
+	/**
+	 * Get the spec match profile recorded so far, which amphtml-update.py orders the tag specs by with --spec-profile.
+	 *
+	 * @since 1.2
+	 * @return array Number of times each tag spec matched, by tag name and the profile_key of the tag spec.
+	 */
+	public static function get_spec_match_counts() {
+		return self::$spec_match_counts;
+	}''')
 
-def GenerateFooterPHP(out):
-	logging.info('entering ...')
 
-	# Output the footer.
+def GenerateShardedAccessorsPHP(out):
+	# Output the accessors which load tag specs from their shards on first access.
 	out.append('''
 	/**
 	 * Get allowed tags.
@@ -208,6 +2610,13 @@ def GenerateFooterPHP(out):
 	 * @return array Allowed tags.
 	 */
 	public static function get_allowed_tags() {
+		if ( count( self::$allowed_tags ) !== count( self::$allowed_tag_shards ) ) {
+			$allowed_tags = array();
+			foreach ( array_keys( self::$allowed_tag_shards ) as $node_name ) {
+				$allowed_tags[ $node_name ] = self::get_allowed_tag( $node_name );
+			}
+			self::$allowed_tags = $allowed_tags;
+		}
 		return self::$allowed_tags;
 	}
 
@@ -221,10 +2630,13 @@ def GenerateFooterPHP(out):
 	 * @return array|null Allowed tag, or null if the tag does not exist.
 	 */
 	public static function get_allowed_tag( $node_name ) {
-		if ( isset( self::$allowed_tags[ $node_name ] ) ) {
-			return self::$allowed_tags[ $node_name ];
+		if ( ! isset( self::$allowed_tags[ $node_name ] ) ) {
+			if ( ! isset( self::$allowed_tag_shards[ $node_name ] ) ) {
+				return null;
+			}
+			self::$allowed_tags[ $node_name ] = self::resolve_tag_specs( self::load_shard( self::$allowed_tag_shards[ $node_name ] ) );
 		}
-		return null;
+		return self::$allowed_tags[ $node_name ];
 	}
 
 	/**
@@ -234,6 +2646,13 @@ def GenerateFooterPHP(out):
 	 * @return array Descendant tags list.
 	 */
 	public static function get_descendant_tag_lists() {
+		if ( count( self::$descendant_tag_lists ) !== count( self::$descendant_tag_list_shards ) ) {
+			$descendant_tag_lists = array();
+			foreach ( array_keys( self::$descendant_tag_list_shards ) as $name ) {
+				$descendant_tag_lists[ $name ] = self::get_descendant_tag_list( $name );
+			}
+			self::$descendant_tag_lists = $descendant_tag_lists;
+		}
 		return self::$descendant_tag_lists;
 	}
 
@@ -247,10 +2666,13 @@ def GenerateFooterPHP(out):
 	 * @return array|bool Allowed tags list, or false if there are no restrictions.
 	 */
 	public static function get_descendant_tag_list( $name ) {
-		if ( isset( self::$descendant_tag_lists[ $name ] ) ) {
-			return self::$descendant_tag_lists[ $name ];
+		if ( ! isset( self::$descendant_tag_lists[ $name ] ) ) {
+			if ( ! isset( self::$descendant_tag_list_shards[ $name ] ) ) {
+				return false;
+			}
+			self::$descendant_tag_lists[ $name ] = self::load_shard( self::$descendant_tag_list_shards[ $name ] );
 		}
-		return false;
+		return self::$descendant_tag_lists[ $name ];
 	}
 
 	/**
@@ -261,469 +2683,1208 @@ def GenerateFooterPHP(out):
 	 * @return array|null Reference point spec, or null if does not exist.
 	 */
 	public static function get_reference_point_spec( $tag_spec_name ) {
-		if ( isset( self::$reference_points[ $tag_spec_name ] ) ) {
-			return self::$reference_points[ $tag_spec_name ];
+		if ( ! isset( self::$reference_points[ $tag_spec_name ] ) ) {
+			if ( ! isset( self::$reference_point_shards[ $tag_spec_name ] ) ) {
+				return null;
+			}
+			self::$reference_points[ $tag_spec_name ] = self::resolve_tag_spec( self::load_shard( self::$reference_point_shards[ $tag_spec_name ] ) );
 		}
-		return null;
-	}
-
-	/**
-	 * Get list of globally-allowed attributes.
-	 *
-	 * @since 0.5
-	 * @return array Allowed tag.
-	 */
-	public static function get_allowed_attributes() {
-		return self::$globally_allowed_attrs;
+		return self::$reference_points[ $tag_spec_name ];
 	}
 
 	/**
-	 * Get layout attributes.
+	 * Load a shard of the generated rules.
 	 *
-	 * @since 0.5
-	 * @return array Allowed tag.
+	 * @param string $file Path of the shard, relative to this file.
+	 * @return array Rules in the shard.
 	 */
-	public static function get_layout_attributes() {
-		return self::$layout_allowed_attrs;
+	private static function load_shard( $file ) {
+		return require __DIR__ . '/' . $file;
 	}''')
 
-	out.append('')
 
-	out.append('}')
-	out.append('')
+def GenValidatorRules(validator_directory, out_dir, jobs=1, segment_cache_dir=None, parse_stats=False):
+	"""Parses the protoascii files into a binary ValidatorRules snapshot.
 
-	logging.info('... done')
+	Parsing the text format is the slowest step of a regeneration, so the result
+	is serialized for later runs to load with LoadRules().
 
+	With more than one job or a segment cache, the main spec and each extension
+	are parsed into their own ValidatorRules message, and the messages are merged
+	in the same order as the files are assembled, which gives the same result as
+	parsing the assembled file. Otherwise the assembled spec is parsed in one pass
+	as it is streamed from the files.
 
-def ParseRules(out_dir):
+	Args:
+		validator_directory: directory for where the validator is located, inside the amphtml repo.
+		out_dir: directory name of the output directory, containing the validator descriptor.
+		jobs: number of processes to parse with.
+		segment_cache_dir: directory name of the cache of the messages of single protoascii files, or None.
+		parse_stats: whether to write how long parsing each file took to STDERR.
+	Raises:
+		text_format.ParseError: with the path of the protoascii file, and the line and column in it.
+	"""
 	logging.info('entering ...')
 
-	# These imports happen late, within this method because they don't necessarily
-	# exist when the module starts running, and the ones that probably do
-	# are checked by CheckPrereqs.
+	descriptor_file = os.path.join(out_dir, VALIDATOR_DESCRIPTOR_FILE)
+	validator_pb2 = LoadValidatorPb2(descriptor_file)
+	protoascii_files = GetProtoasciiFiles(validator_directory)
 
+	start = time.time()
+	rules = validator_pb2.ValidatorRules()
+	if jobs > 1 or segment_cache_dir is not None:
+		results = ParseProtoasciiFiles([(descriptor_file, protoascii_file) for protoascii_file in protoascii_files], jobs, segment_cache_dir)
+		for (protoascii_file, (serialized_rules, duration)) in zip(protoascii_files, results):
+			if parse_stats:
+				if duration is None:
+					sys.stderr.write('Loaded %s from the segment cache\n' % os.path.relpath(protoascii_file, os.path.dirname(validator_directory)))
+				else:
+					sys.stderr.write('Parsed %s in %.3fs\n' % (os.path.relpath(protoascii_file, os.path.dirname(validator_directory)), duration))
+			segment_rules = validator_pb2.ValidatorRules()
+			segment_rules.ParseFromString(serialized_rules)
+			rules.MergeFrom(segment_rules)
+		if parse_stats:
+			ReportParseStats('Parsed %d protoascii files with %d processes' % (len(protoascii_files), jobs), start)
+	else:
+		from google.protobuf import text_format
+
+		# Merge the assembled spec with message buffers as it is streamed from the files.
+		segments = []
+		try:
+			text_format.MergeLines(GetProtoasciiLines(protoascii_files, segments), rules)
+		except text_format.ParseError as e:
+			raise GetSegmentParseError(e, segments)
+		if parse_stats:
+			end_times = [segment.start_time for segment in segments[1:]] + [time.time()]
+			for (segment, end_time) in zip(segments, end_times):
+				sys.stderr.write('Parsed %s in %.3fs\n' % (os.path.relpath(segment.path, os.path.dirname(validator_directory)), end_time - segment.start_time))
+			ReportParseStats('Parsed %d protoascii files in one pass' % len(protoascii_files), start)
+
+	f = open(os.path.join(out_dir, RULES_SNAPSHOT_FILE), 'wb')
+	f.write(rules.SerializeToString())
+	f.close()
+
+	logging.info('... done')
+
+
+def ParseProtoasciiFiles(files, jobs, segment_cache_dir=None, stats=None):
+	"""Parses protoascii files into ValidatorRules messages, taking the ones in the segment cache from there.
+
+	Segments are cached by the hash of the protoascii file and the validator
+	descriptor, so an extension which is the same in several amphtml revisions
+	is only parsed once.
+
+	Args:
+		files: list of tuples of the path to a validator descriptor and the path to a protoascii file to parse with it.
+		jobs: number of processes to parse with.
+		segment_cache_dir: directory name of the segment cache, or None.
+		stats: collections.Counter to add how many files were 'cached' and how many were 'parsed' to, or None.
+	Returns:
+		List of tuples of the serialized ValidatorRules message of each file and the time parsing it took, or None if it was cached.
+	"""
+	results = [None] * len(files)
+	to_parse = collections.OrderedDict()
+	descriptor_hashes = {}
+	for (i, (descriptor_file, protoascii_file)) in enumerate(files):
+		segment_file = None
+		if segment_cache_dir is not None:
+			if descriptor_file not in descriptor_hashes:
+				descriptor_hashes[descriptor_file] = amphtml_stages.HashFiles([descriptor_file])
+			segment_file = os.path.join(segment_cache_dir, amphtml_stages.HashFiles([protoascii_file], descriptor_hashes[descriptor_file]) + '.pb')
+			if os.path.exists(segment_file):
+				f = open(segment_file, 'rb')
+				results[i] = (f.read(), None)
+				f.close()
+				continue
+		# Files with the same segment are only parsed once.
+		to_parse.setdefault(segment_file or i, []).append(i)
+
+	if stats is not None:
+		stats['cached'] += len(files) - sum(len(indexes) for indexes in to_parse.values())
+		stats['parsed'] += len(to_parse)
+	args = [files[indexes[0]] for indexes in to_parse.values()]
+	if jobs > 1 and len(args) > 1:
+		pool = multiprocessing.Pool(min(jobs, len(args)))
+		try:
+			parsed = pool.map(ParseProtoasciiFile, args)
+		finally:
+			pool.close()
+			pool.join()
+	else:
+		parsed = map(ParseProtoasciiFile, args)
+
+	for ((segment_file, indexes), result) in zip(to_parse.items(), parsed):
+		for i in indexes:
+			results[i] = result
+		if segment_cache_dir is not None:
+			if not os.path.isdir(segment_cache_dir):
+				try:
+					os.makedirs(segment_cache_dir)
+				except OSError:
+					# Another process made it first.
+					pass
+			fd, tmp_path = tempfile.mkstemp(dir=segment_cache_dir, suffix='.tmp')
+			f = os.fdopen(fd, 'wb')
+			f.write(result[0])
+			f.close()
+			os.rename(tmp_path, segment_file)
+
+	return results
+
+
+def ParseProtoasciiFile(args):
+	"""Parses a single protoascii file, in a worker process of ParseProtoasciiFiles().
+
+	Args:
+		args: tuple of the path to the validator descriptor and the path to the protoascii file.
+	Returns:
+		Tuple of the serialized ValidatorRules message and the time parsing took.
+	"""
 	from google.protobuf import text_format
-	validator_pb2 = imp.load_source('validator_pb2', os.path.join( out_dir, 'validator_pb2.py' ))
 
-	allowed_tags = {}
-	attr_lists = {}
-	descendant_lists = {}
-	reference_points = {}
-	versions = {}
+	descriptor_file, protoascii_file = args
+	start = time.time()
+	rules = LoadValidatorPb2(descriptor_file).ValidatorRules()
+	segments = []
+	try:
+		text_format.MergeLines(GetProtoasciiLines([protoascii_file], segments), rules)
+	except text_format.ParseError as e:
+		raise GetSegmentParseError(e, segments)
+	return rules.SerializeToString(), time.time() - start
 
-	specfile='%s/validator.protoascii' % out_dir
 
-	validator_pb2=validator_pb2
-	text_format=text_format
+def LoadValidatorPb2(descriptor_file):
+	"""Builds the message classes of validator.proto from the descriptor written by GenValidatorDescriptor(), once per process.
 
-	# Merge specfile with message buffers.
-	rules = validator_pb2.ValidatorRules()
-	text_format.Merge(open(specfile).read(), rules)
-
-	# Record the version of this specfile and the corresponding validator version.
-	if rules.HasField('spec_file_revision'):
-		versions['spec_file_revision'] = rules.spec_file_revision
-
-	if rules.HasField('min_validator_revision_required'):
-		versions['min_validator_revision_required'] = rules.min_validator_revision_required
-
-	# Build a dictionary of the named attribute lists that are used by multiple tags.
-	for (field_desc, field_val) in rules.ListFields():
-		if 'attr_lists' == field_desc.name:
-			for attr_spec in field_val:
-				attr_lists[UnicodeEscape(attr_spec.name)] = GetAttrs(attr_spec.attrs)
-
-	# Build a dictionary of allowed tags and an associated list of their allowed
-	# attributes, values and other criteria.
-
-	# Don't include tags that have a mandatory parent with one of these tag names
-	# since we're only concerned with using this tag list to validate the HTML
-	# of the DOM
-	mandatory_parent_blacklist = [
-		'$ROOT',
-		'!DOCTYPE',
-	]
+	Args:
+		descriptor_file: path to the serialized FileDescriptorSet.
+	Returns:
+		Module with the top-level message classes, like the validator_pb2 module protoc would generate.
+	"""
+	if descriptor_file not in validator_pb2_modules:
+		from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
 
-	for (field_desc, field_val) in rules.ListFields():
-		if 'tags' == field_desc.name:
-			for tag_spec in field_val:
+		f = open(descriptor_file, 'rb')
+		file_descriptor_set = descriptor_pb2.FileDescriptorSet.FromString(f.read())
+		f.close()
 
-				# Ignore tags that are outside of the body
-				if tag_spec.HasField('mandatory_parent') and tag_spec.mandatory_parent in mandatory_parent_blacklist and tag_spec.tag_name != 'HTML':
-					continue
+		pool = descriptor_pool.DescriptorPool()
+		factory = message_factory.MessageFactory(pool)
+		validator_pb2 = types.ModuleType('validator_pb2')
+		for file_proto in file_descriptor_set.file:
+			pool.Add(file_proto)
+			for message_proto in file_proto.message_type:
+				message_descriptor = pool.FindMessageTypeByName('%s.%s' % (file_proto.package, message_proto.name) if file_proto.package else message_proto.name)
+				setattr(validator_pb2, message_proto.name, factory.GetPrototype(message_descriptor))
+		validator_pb2_modules[descriptor_file] = validator_pb2
+	return validator_pb2_modules[descriptor_file]
 
-				# Ignore deprecated tags
-				if tag_spec.HasField('deprecation'):
-					continue
 
-				# Handle the special $REFERENCE_POINT tag
-				if '$REFERENCE_POINT' == tag_spec.tag_name:
-					gotten_tag_spec = GetTagSpec(tag_spec, attr_lists)
-					if gotten_tag_spec is not None:
-						reference_points[ tag_spec.spec_name ] = gotten_tag_spec
-					continue
+def LoadRules(out_dir, snapshot_file=None, parse_stats=False):
+	"""Loads the binary ValidatorRules snapshot written by GenValidatorRules().
 
-				# If we made it here, then start adding the tag_spec
-				if tag_spec.tag_name.lower() not in allowed_tags:
-					tag_list = []
-				else:
-					tag_list = allowed_tags[UnicodeEscape(tag_spec.tag_name).lower()]
-				# AddTag(allowed_tags, tag_spec, attr_lists)
+	Args:
+		out_dir: directory name of the output directory, containing the rules snapshot and the validator descriptor.
+		snapshot_file: path of another rules snapshot to load, such as one from the cache, or None.
+		parse_stats: whether to write how long loading took to STDERR.
+	Returns:
+		ValidatorRules message.
+	"""
+	validator_pb2 = LoadValidatorPb2(os.path.join(out_dir, VALIDATOR_DESCRIPTOR_FILE))
+	if snapshot_file is None:
+		snapshot_file = os.path.join(out_dir, RULES_SNAPSHOT_FILE)
 
-				gotten_tag_spec = GetTagSpec(tag_spec, attr_lists)
-				if gotten_tag_spec is not None:
-					tag_list.append(gotten_tag_spec)
-					allowed_tags[UnicodeEscape(tag_spec.tag_name).lower()] = tag_list
-		elif 'descendant_tag_list' == field_desc.name:
-			for list in field_val:
-				descendant_lists[list.name] = []
-				for val in list.tag:
+	start = time.time()
+	rules = validator_pb2.ValidatorRules()
+	f = open(snapshot_file, 'rb')
+	rules.ParseFromString(f.read())
+	f.close()
+	if parse_stats:
+		ReportParseStats('Loaded %s' % os.path.basename(snapshot_file), start)
 
-					# Skip tags specific to transformed AMP.
-					if val in ( 'I-AMPHTML-SIZER', ):
-						continue
+	return rules
 
-					descendant_lists[list.name].append( val.lower() )
 
-	logging.info('... done')
-	return allowed_tags, attr_lists, descendant_lists, reference_points, versions
+def ReportParseStats(description, start):
+	"""Writes how long parsing took and which protobuf backend did it, for --parse-stats.
 
+	Args:
+		description: what was parsed.
+		start: time at which parsing started.
+	"""
+	from google.protobuf.internal import api_implementation
+	sys.stderr.write('%s in %.3fs using the %s protobuf backend\n' % (description, time.time() - start, api_implementation.Type()))
+
+
+def ParseRules(out_dir, snapshot_file=None, parse_stats=False, count=None):
+	"""Parses the rules in the form the PHP is generated from.
 
-def GetTagSpec(tag_spec, attr_lists):
+	See amphtml_spec.Spec.ToRules().
+
+	Args:
+		out_dir: directory name of the output directory, containing the rules snapshot and the validator descriptor.
+		snapshot_file: path of another rules snapshot to load, such as one from the cache, or None.
+		parse_stats: whether to write how long loading the snapshot took to STDERR.
+		count: function which is called with the name of a counter of the tags and attributes kept and skipped, or None.
+	Returns:
+		Tuple of the allowed tags, the attribute lists, the descendant tag lists, the
+		reference points and the versions.
+	"""
 	logging.info('entering ...')
+	rules = LoadSpec(out_dir, snapshot_file, parse_stats, count).ToRules()
+	logging.info('... done')
+	return rules
 
-	tag_dict = GetTagRules(tag_spec)
-	if tag_dict is None:
-		return None
-	attr_dict = {}
 
-	# First add attributes from any attribute lists to this tag.
-	for (tag_field_desc, tag_field_val) in tag_spec.ListFields():
-		if 'attr_lists' == tag_field_desc.name:
-			for attr_list in tag_field_val:
-				attr_dict.update(attr_lists[UnicodeEscape(attr_list)])
+def LoadSpec(out_dir, snapshot_file=None, parse_stats=False, count=None):
+	"""Loads the model of the spec from the rules snapshot written by GenValidatorRules().
+
+	Args:
+		out_dir: directory name of the output directory, containing the rules snapshot and the validator descriptor.
+		snapshot_file: path of another rules snapshot to load, such as one from the cache, or None.
+		parse_stats: whether to write how long loading the snapshot took to STDERR.
+		count: function which is called with the name of a counter of the tags and attributes kept and skipped, or None.
+	Returns:
+		amphtml_spec.Spec instance.
+	"""
+	return amphtml_spec.Spec(LoadRules(out_dir, snapshot_file, parse_stats), count)
 
-	# Then merge the spec-specific attributes on top to override any list definitions.
-	attr_dict.update(GetAttrs(tag_spec.attrs))
 
-	logging.info('... done')
-	tag_spec_dict = {'tag_spec':tag_dict, 'attr_spec_list':attr_dict}
-	if tag_spec.HasField('cdata'):
-		cdata_dict = {}
-		for (field_descriptor, field_value) in tag_spec.cdata.ListFields():
-			if isinstance(field_value, (unicode, str, bool, int)):
-				cdata_dict[ field_descriptor.name ] = field_value
-			elif isinstance( field_value, google.protobuf.pyext._message.RepeatedCompositeContainer ):
-				cdata_dict[ field_descriptor.name ] = {}
-				for value in field_value:
-					for (key,val) in value.ListFields():
-						cdata_dict[ field_descriptor.name ][ key.name ] = val
-			elif hasattr( field_value, '_values' ):
-				cdata_dict[ field_descriptor.name ] = {}
-				for _value in field_value._values:
-					for (key,val) in _value.ListFields():
-						cdata_dict[ field_descriptor.name ][ key.name ] = val
-			elif 'css_spec' == field_descriptor.name:
-				css_spec = {}
-
-				css_spec['allowed_at_rules'] = []
-				for at_rule_spec in field_value.at_rule_spec:
-					if '$DEFAULT' == at_rule_spec.name:
-						continue
-					css_spec['allowed_at_rules'].append( at_rule_spec.name )
-
-				for css_spec_field_name in ( 'allowed_declarations', 'declaration', 'font_url_spec', 'image_url_spec', 'validate_keyframes' ):
-					if not hasattr( field_value, css_spec_field_name ):
-						continue
-					css_spec_field_value = getattr( field_value, css_spec_field_name )
-					if isinstance(css_spec_field_value, (list, collections.Sequence, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
-						css_spec[ css_spec_field_name ] = [ val for val in css_spec_field_value ]
-					elif hasattr( css_spec_field_value, 'ListFields' ):
-						css_spec[ css_spec_field_name ] = {}
-						for (css_spec_field_item_descriptor, css_spec_field_item_value) in getattr( field_value, css_spec_field_name ).ListFields():
-							if isinstance(css_spec_field_item_value, (list, collections.Sequence, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
-								css_spec[ css_spec_field_name ][ css_spec_field_item_descriptor.name ] = [ val for val in css_spec_field_item_value ]
-							else:
-								css_spec[ css_spec_field_name ][ css_spec_field_item_descriptor.name ] = css_spec_field_item_value
-					else:
-						css_spec[ css_spec_field_name ] = css_spec_field_value
+def Phpize(data, indent=0):
+	"""Helper function to convert JSON-serializable data into PHP literals.
 
-				cdata_dict['css_spec'] = css_spec
-		if len( cdata_dict ) > 0:
-			tag_spec_dict['cdata'] = cdata_dict
+	The output is identical to running the JSON-encoded data through PHP's
+	var_export() and converting it to tab indentation, except that empty arrays
+	are written as array() and the strings 'True' and 'False' as booleans. It
+	is written directly in a single pass without spawning a PHP process.
 
-	return tag_spec_dict
+	Args:
+		data: Any JSON-serializable.
+		indent: Number of tabs to prefix each line with.
+	Returns:
+		String formatted as PHP literal.
+	"""
+	lines = []
+	PhpizeValue(data, '\t' * indent, '\t' * indent, '', '', lines)
+	return '\n'.join(lines)
 
 
-def GetTagRules(tag_spec):
-	logging.info('entering ...')
+def PhpizeProperty(out, name, data, previous_sections=None):
+	"""Helper function which outputs a private static property holding the data.
 
-	tag_rules = {}
-
-	if hasattr(tag_spec, 'also_requires_tag') and tag_spec.also_requires_tag:
-		also_requires_tag_list = []
-		for also_requires_tag in tag_spec.also_requires_tag:
-			also_requires_tag_list.append(UnicodeEscape(also_requires_tag))
-		tag_rules['also_requires_tag'] = also_requires_tag_list
-
-	if hasattr(tag_spec, 'requires_extension') and len( tag_spec.requires_extension ) != 0:
-		requires_extension_list = []
-		for requires_extension in tag_spec.requires_extension:
-			requires_extension_list.append(requires_extension)
-		tag_rules['requires_extension'] = requires_extension_list
-
-	if hasattr(tag_spec, 'reference_points') and len( tag_spec.reference_points ) != 0:
-		tag_reference_points = {}
-		for reference_point_spec in tag_spec.reference_points:
-			tag_reference_points[ reference_point_spec.tag_spec_name ] = {
-				"mandatory": reference_point_spec.mandatory,
-				"unique": reference_point_spec.unique
-			}
-		if len( tag_reference_points ) > 0:
-			tag_rules['reference_points'] = tag_reference_points
-
-	if hasattr(tag_spec, 'also_requires_tag_warning') and len( tag_spec.also_requires_tag_warning ) != 0:
-		also_requires_tag_warning_list = []
-		for also_requires_tag_warning in tag_spec.also_requires_tag_warning:
-			also_requires_tag_warning_list.append(also_requires_tag_warning)
-		tag_rules['also_requires_tag_warning'] = also_requires_tag_warning_list
-
-	if tag_spec.disallowed_ancestor:
-		disallowed_ancestor_list = []
-		for disallowed_ancestor in tag_spec.disallowed_ancestor:
-			disallowed_ancestor_list.append(UnicodeEscape(disallowed_ancestor).lower())
-		tag_rules['disallowed_ancestor'] = disallowed_ancestor_list
-
-	if tag_spec.html_format:
-		html_format_list = []
-		has_amp_format = False
-		for html_format in tag_spec.html_format:
-			if 1 == html_format:
-				has_amp_format = True
-		if not has_amp_format:
-			return None
+	Args:
+		out: list of output lines, or a writer with an append() method.
+		name: name of the property.
+		data: Any JSON-serializable.
+		previous_sections: dictionary of the sections of a previous generated file, as
+			filled by LoadGeneratedRules(), to copy the section from if it is unchanged, or None.
+	"""
+	if previous_sections and name in previous_sections and previous_sections[name][0] == GetPhpValue(data):
+		# The section is unchanged since the file given with --diff-against.
+		logging.info('%s: unchanged' % name)
+		out.append(previous_sections[name][1])
+		return
+	PhpizeValue(data, '\t', '\t', 'private static $%s = ' % name, ';', out)
 
-	# Ignore transformed AMP for now.
-	if tag_spec.enabled_by and 'transformed' in tag_spec.enabled_by:
-		return None
 
-	if tag_spec.HasField('extension_spec'):
-		extension_spec = {}
-		for field in tag_spec.extension_spec.ListFields():
-			if isinstance(field[1], (list, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
-				extension_spec[ field[0].name ] = []
-				for val in field[1]:
-					extension_spec[ field[0].name ].append( val )
-			else:
-				extension_spec[ field[0].name ] = field[1]
-		tag_rules['extension_spec'] = extension_spec
+def PhpizeValue(data, indent, tabs, prefix, suffix, lines):
+	"""Helper function which appends the PHP literal lines for a value.
+
+	Args:
+		data: Any JSON-serializable.
+		indent: Indentation added to every line of the literal.
+		tabs: Indentation for the lines of this value.
+		prefix: Array key to output before the value, if any.
+		suffix: String to output after the value, such as a trailing comma.
+		lines: List of lines to append to, or a writer with an append() method.
+	"""
+	if isinstance(data, (dict, list, tuple)) and not data:
+		lines.append(tabs + prefix + 'array()' + suffix)
+	elif isinstance(data, dict):
+		lines.append(tabs + prefix + 'array(')
+		child_tabs = tabs + '\t'
+		position = 0
+		for key in sorted(data):
+			PhpizeValue(data[key], indent, child_tabs, PhpizeKey(key, position), ',', lines)
+			int_key = amphtml_snapshot.GetPhpIntKey(key)
+			if int_key is not None and int_key >= position:
+				position = int_key + 1
+		lines.append(tabs + ')' + suffix)
+	elif isinstance(data, (list, tuple)):
+		lines.append(tabs + prefix + 'array(')
+		child_tabs = tabs + '\t'
+		for item in data:
+			PhpizeValue(item, indent, child_tabs, '', ',', lines)
+		lines.append(tabs + ')' + suffix)
+	else:
+		lines.append(tabs + prefix + PhpizeScalar(data, indent) + suffix)
+
+
+def PhpizeKey(key, position=0):
+	"""Helper function to convert a dictionary key into a PHP array key prefix.
+
+	Keys that json_decode() turns into integers are omitted when they are
+	positional, that is when they are the index PHP would assign next.
+
+	Args:
+		key: A dictionary key.
+		position: the index PHP would assign to the next value.
+	Returns:
+		String to prefix the array value with.
+	"""
+	int_key = amphtml_snapshot.GetPhpIntKey(key)
+	if int_key is not None:
+		if int_key == position:
+			return ''
+		return '%d => ' % int_key
+	if isinstance(key, bool):
+		key = 'true' if key else 'false'
+	elif isinstance(key, float):
+		key = repr(key)
+	return PhpizeString(key) + ' => '
+
+
+def PhpizeScalar(data, indent=''):
+	"""Helper function to convert a scalar into a PHP literal.
+
+	Args:
+		data: A string, number, boolean or None.
+		indent: Indentation added to continuation lines of multi-line strings.
+	Returns:
+		String formatted as PHP literal.
+	"""
+	if data is None:
+		return 'NULL'
+	if isinstance(data, bool):
+		return 'true' if data else 'false'
+	if isinstance(data, numbers.Integral):
+		return str(data)
+	if isinstance(data, float):
+		exported = repr(data)
+		if 'e' in exported:
+			mantissa, exponent = exported.split('e')
+			if '.' not in mantissa:
+				mantissa += '.0'
+			return '%sE%+d' % (mantissa, int(exponent))
+		if '.' not in exported:
+			exported += '.0'
+		return exported
+	if isinstance(data, basestring):
+		exported = PhpizeString(data)
+		if '\n' in exported:
+			# Continuation lines of multi-line strings are not indented by var_export().
+			exported_lines = exported.split('\n')
+			for i in range(1, len(exported_lines)):
+				exported_lines[i] = indent + re.sub(r'^ +', lambda match: (len(match.group(0)) // 2) * '\t', exported_lines[i])
+			exported = '\n'.join(exported_lines)
+		return exported
+	raise TypeError('%r is not JSON serializable' % (data,))
+
+
+def PhpizeString(string):
+	"""Helper function to convert a string into a single-quoted PHP literal.
+
+	Args:
+		string: A string.
+	Returns:
+		String formatted as PHP literal.
+	"""
+	# Strings that read as booleans are output as booleans.
+	if string in ('True', 'False'):
+		return string.lower()
+
+	exported = "'" + string.replace('\\', '\\\\').replace("'", "\\'") + "'"
+	if '\0' in exported:
+		exported = exported.replace('\0', '\' . "\\0" . \'')
+	return exported
 
-	if tag_spec.HasField('mandatory'):
-		tag_rules['mandatory'] = tag_spec.mandatory
 
-	if tag_spec.HasField('mandatory_alternatives'):
-		tag_rules['mandatory_alternatives'] = UnicodeEscape(tag_spec.mandatory_alternatives)
+def GetPhpValue(data):
+	"""Converts data into the value PHP gets for it from Phpize(), for comparing it to parsed PHP.
+
+	Args:
+		data: Any JSON-serializable.
+	Returns:
+		The value, with PHP arrays as lists if their keys are positional and dictionaries otherwise.
+	"""
+	if isinstance(data, (dict, list, tuple)):
+		return GetPhpArray((key, GetPhpValue(value)) for (key, value) in amphtml_snapshot.GetPhpArrayItems(data))
+	return amphtml_snapshot.GetPhpScalar(data)
 
-	if tag_spec.HasField('mandatory_ancestor'):
-		tag_rules['mandatory_ancestor'] = UnicodeEscape(tag_spec.mandatory_ancestor).lower()
 
-	if tag_spec.HasField('mandatory_ancestor_suggested_alternative'):
-		tag_rules['mandatory_ancestor_suggested_alternative'] = UnicodeEscape(tag_spec.mandatory_ancestor_suggested_alternative).lower()
+def GetPhpArray(items):
+	"""Helper function to build the value of a PHP array from its items.
 
-	if tag_spec.HasField('mandatory_parent'):
-		tag_rules['mandatory_parent'] = UnicodeEscape(tag_spec.mandatory_parent).lower()
+	Args:
+		items: iterable of tuples of the integer or string key and the value.
+	Returns:
+		List if the keys are positional, or else a dictionary.
+	"""
+	items = list(items)
+	if [key for (key, _) in items] == range(len(items)):
+		return [value for (_, value) in items]
+	return dict(items)
 
-	if tag_spec.HasField('spec_name'):
-		tag_rules['spec_name'] = UnicodeEscape(tag_spec.spec_name)
 
-	if tag_spec.HasField('spec_url'):
-		tag_rules['spec_url'] = UnicodeEscape(tag_spec.spec_url)
+def GetPhpArrayKeys(data):
+	"""Helper function to get the keys of a value returned by GetPhpValue() for a PHP array.
 
-	if tag_spec.HasField('unique'):
-		tag_rules['unique'] = tag_spec.unique
+	Args:
+		data: list or dictionary.
+	Returns:
+		List of keys.
+	"""
+	if isinstance(data, dict):
+		return data.keys()
+	return range(len(data))
 
-	if tag_spec.HasField('unique_warning'):
-		tag_rules['unique_warning'] = tag_spec.unique_warning
 
-	if tag_spec.HasField('child_tags'):
-		child_tags = defaultdict( lambda: [] )
-		for field in tag_spec.child_tags.ListFields():
-			if isinstance(field[1], (int)):
-				child_tags[ field[0].name ] = field[1]
-			elif isinstance(field[1], (list, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
-				for val in field[1]:
-					child_tags[ field[0].name ].append( val.lower() )
-		tag_rules['child_tags'] = child_tags
+def ParsePhpSections(php):
+	"""Parses the properties of a class generated by Phpize().
 
-	if tag_spec.HasField('descendant_tag_list'):
-		tag_rules['descendant_tag_list'] = tag_spec.descendant_tag_list
+	Args:
+		php: source of the class.
+	Returns:
+		Dictionary of property name to a tuple of its value, as returned by GetPhpValue(), and its source.
+	"""
+	sections = {}
+	for match in PHP_PROPERTY_REGEX.finditer(php):
+		tokens = PHP_TOKEN_REGEX.findall(match.group(2))
+		if ''.join(tokens) != match.group(2):
+			raise ValueError('Unexpected PHP in the value of $%s' % match.group(1))
+		tokens = [token for token in tokens if not token.isspace()]
+		value, position = ParsePhpTokens(tokens, 0)
+		if position != len(tokens):
+			raise ValueError('Unexpected %r in the value of $%s' % (tokens[position], match.group(1)))
+		sections[match.group(1)] = (value, match.group(0))
+	return sections
+
+
+def ParsePhpTokens(tokens, position):
+	"""Helper function which parses a PHP literal.
 
-	if tag_spec.HasField('amp_layout'):
-		amp_layout = {}
-		for field in tag_spec.amp_layout.ListFields():
-			if 'supported_layouts' == field[0].name:
-				amp_layout['supported_layouts'] = [ val for val in field[1] ]
+	Args:
+		tokens: list of tokens.
+		position: index of the first token of the literal.
+	Returns:
+		Tuple of the value and the index of the token after it.
+	"""
+	token = tokens[position]
+	position += 1
+	if 'array(' == token:
+		items = []
+		next_index = 0
+		while ')' != tokens[position]:
+			key, position = ParsePhpTokens(tokens, position)
+			if '=>' == tokens[position]:
+				value, position = ParsePhpTokens(tokens, position + 1)
+				if isinstance(key, bool):
+					key = int(key)
+				elif amphtml_snapshot.GetPhpIntKey(key) is not None:
+					key = amphtml_snapshot.GetPhpIntKey(key)
 			else:
-				amp_layout[ field[0].name ] = field[1]
-		tag_rules['amp_layout'] = amp_layout
+				key, value = next_index, key
+			if isinstance(key, int) and key >= next_index:
+				next_index = key + 1
+			items.append((key, value))
+			if ',' == tokens[position]:
+				position += 1
+		return GetPhpArray(items), position + 1
+	if token.startswith("'"):
+		string = re.sub(r"\\([\\'])", r'\1', token[1:-1])
+		# Null bytes are concatenated as double-quoted strings by PhpizeString().
+		while position < len(tokens) and '.' == tokens[position]:
+			part = tokens[position + 1]
+			string += '\0' if '"\\0"' == part else re.sub(r"\\([\\'])", r'\1', part[1:-1])
+			position += 2
+		return string, position
+	if token in ('true', 'false'):
+		return 'true' == token, position
+	if 'NULL' == token:
+		return None, position
+	if re.match(r'^-?[0-9]+$', token):
+		return int(token), position
+	return float(token), position
+
+
+def GetStages(validator_directory, options=Options()):
+	"""Describes the build steps as a dependency graph.
 
-	logging.info('... done')
-	return tag_rules
+	Args:
+		validator_directory: directory for where the validator is located, inside the amphtml repo.
+		options: the Options of the run. The protoascii files are parsed with the
+			jobs processes, into the segment cache inside cache_dir, and the PHP is
+			generated with the options GeneratePHP() takes.
+	Returns:
+		List of stages, ordered so that each stage comes after its dependencies.
+	"""
+	generator_version = GetGeneratorVersion()
+	segment_cache_dir = GetSegmentCacheDir(options.cache_dir)
+	php_outputs = (GENERATED_PHP_FILE, REGEX_REPORT_FILE, DEPENDENCY_REPORT_FILE)
+	if options.sharded:
+		php_outputs += (GENERATED_SHARD_DIR,)
+	if options.snapshot_format:
+		php_outputs += (GetSnapshotFile(options.snapshot_format),)
+	if options.diff_against:
+		php_outputs += (CHANGELOG_FILE,)
+	pruned = ''
+	if options.components is not None or options.exclude_extensions is not None:
+		php_outputs += (COMPONENTS_REPORT_FILE,)
+		# The stage name is part of the cache key, so that each set of components has its own cached stage.
+		pruned = '-%s-%s' % ('components' if options.components is not None else 'excluded', hashlib.sha1(','.join(sorted(options.components if options.components is not None else options.exclude_extensions))).hexdigest()[:8])
+
+	return [
+		amphtml_stages.Stage(
+			name='validator_descriptor',
+			deps=(),
+			input_files=[os.path.join(validator_directory, 'validator.proto')],
+			outputs=(VALIDATOR_DESCRIPTOR_FILE,),
+			run=lambda out_dir: GenValidatorDescriptor(validator_directory, out_dir),
+			version=generator_version,
+		),
+		amphtml_stages.Stage(
+			name='rules',
+			deps=('validator_descriptor',),
+			input_files=GetProtoasciiFiles(validator_directory),
+			outputs=(RULES_SNAPSHOT_FILE,),
+			run=lambda out_dir: GenValidatorRules(validator_directory, out_dir, options.jobs, segment_cache_dir, options.parse_stats),
+			version='1',
+		),
+		amphtml_stages.Stage(
+			name='php-%s%s%s%s%s%s%s%s%s' % (options.enum_format, '-sharded' if options.sharded else '', '-' + options.snapshot_format if options.snapshot_format else '', '-diff' if options.diff_against else '', '-strict-regexes' if options.strict_regexes else '', '-strict-dependencies' if options.strict_dependencies else '', '-profiled' if options.spec_profile else '', '-instrumented' if options.instrumented else '', pruned),
+			deps=('rules', 'validator_descriptor'),
+			input_files=[path for path in (options.diff_against, options.spec_profile) if path],
+			outputs=php_outputs,
+			run=lambda out_dir: GeneratePHP(out_dir, options),
+			version=generator_version,
+		),
+	]
 
 
-def GetAttrs(attrs):
-	logging.info('entering ...')
+def GetGeneratorVersion():
+	"""Gets a hash of this script and the GENERATOR_MODULES, so that changes to them invalidate cached stages.
 
-	attr_dict = {}
-	for attr_spec in attrs:
+	Returns:
+		Hex digest of the generator source.
+	"""
+	return amphtml_stages.HashFiles(GetGeneratorFiles())
 
-		value_dict = GetValues(attr_spec)
 
-		if value_dict is not None:
-			# Add attribute name and alternative_names
-			attr_dict[UnicodeEscape(attr_spec.name)] = value_dict
+def GetGeneratorFiles():
+	"""Gets the source files of the generator.
 
-	logging.info('... done')
-	return attr_dict
+	Returns:
+		List of the paths of this script and of the .py files of the GENERATOR_MODULES.
+	"""
+	return [os.path.realpath(__file__)] + [os.path.splitext(os.path.realpath(module.__file__))[0] + '.py' for module in GENERATOR_MODULES]
 
 
-def GetValues(attr_spec):
-	logging.info('entering ...')
+def Main( validator_directory, out_dir, options=Options() ):
+	"""The main method, which executes all build steps and runs the tests.
 
-	value_dict = {}
+	Args:
+		validator_directory: directory for where the validator is located, inside the amphtml repo.
+		out_dir: directory name of the output directory.
+		options: the Options of the run, of which these are used here:
+			cache_dir: directory name of the persistent stage cache, or None to disable caching.
+			jobs: number of processes to parse the protoascii files with.
+			output: path to write the PHP file to, or None to write it to STDOUT.
+			sharded: whether to generate the sharded output, which is written next to the PHP file.
+			enum_format: one of ENUM_FORMATS.
+			snapshot_format: one of amphtml_snapshot.SNAPSHOT_FORMATS to write the rules to a snapshot file next to the PHP file, or None.
+			diff_against: path of a previous generated PHP file or rules snapshot to write a changelog against to STDOUT, or None.
+			regex_report: path to write the report of the regexes which are invalid or prone to catastrophic backtracking to, or None.
+			strict_regexes: whether regexes prone to catastrophic backtracking fail the build.
+			dependency_report: path to write the report of the dependency cycles and missing dependencies of the specs to, or None.
+			strict_dependencies: whether dependency cycles and missing dependencies of the specs fail the build.
+			spec_profile: path of a spec match profile to order the tag specs by, or None.
+			instrumented: whether to generate the class which records the spec matches.
+			components: list of the names of the AMP components to keep the rules of, or None.
+			exclude_extensions: list of the names of the extensions to drop the rules of, or None.
+			footprint_php: path of the PHP binary to measure the footprint of the generated class with, or None not to measure it. Requires output.
+			footprint_baseline: path of the footprint to compare with, or None for the one next to output, if any.
+			footprint_thresholds: dictionary of the percentage by which each measurement may exceed the baseline, or None for FOOTPRINT_THRESHOLDS.
+			parse_stats: whether to write which protobuf backend parsed the spec and how long it took to STDERR.
+			profile: the Profile to record the stages which run in, or None.
+	"""
+	logging.basicConfig(format='[[%(filename)s %(funcName)s]] - %(message)s', level=logging.INFO)
 
-	# Ignore transformed AMP for now.
-	if 'transformed' in attr_spec.enabled_by:
-		return None
+	validator_directory = os.path.realpath(validator_directory)
+	out_dir = os.path.realpath(out_dir)
+	if options.cache_dir is not None:
+		options = options._replace(cache_dir=os.path.realpath(options.cache_dir))
+
+	SetupOutDir(out_dir)
+	amphtml_stages.RunStages(GetStages(validator_directory, options), out_dir, options.cache_dir, options.profile)
+
+	if options.regex_report is not None:
+		InstallFile(os.path.join(out_dir, REGEX_REPORT_FILE), options.regex_report)
+	if options.dependency_report is not None:
+		InstallFile(os.path.join(out_dir, DEPENDENCY_REPORT_FILE), options.dependency_report)
+	if options.components is not None or options.exclude_extensions is not None:
+		ReportComponents(out_dir)
+
+	output = options.output
+	if output is not None:
+		if options.footprint_php is not None:
+			footprint_file = os.path.join(os.path.dirname(output), GENERATED_FOOTPRINT_FILE)
+			footprint = MeasureFootprint(out_dir, options.footprint_php, options.sharded, options.snapshot_format)
+			footprint_baseline = options.footprint_baseline
+			if footprint_baseline is None and os.path.exists(footprint_file):
+				footprint_baseline = footprint_file
+			footprint_report = CheckFootprint(footprint, footprint_baseline, options.footprint_thresholds or FOOTPRINT_THRESHOLDS)
+		InstallOutputs(out_dir, output, options.sharded, options.snapshot_format)
+		if options.footprint_php is not None:
+			WriteJsonFile(footprint_file, footprint_report)
+		if options.diff_against is not None:
+			f = open(os.path.join(out_dir, CHANGELOG_FILE))
+			shutil.copyfileobj(f, sys.stdout)
+			f.close()
+		return
+
+	# Write the php file to STDOUT.
+	f = open(os.path.join(out_dir, GENERATED_PHP_FILE))
+	shutil.copyfileobj(f, sys.stdout)
+	f.close()
 
-	# Add alternative names
-	if attr_spec.alternative_names:
-		alt_names_list = []
-		for alternative_name in attr_spec.alternative_names:
-			alt_names_list.append(UnicodeEscape(alternative_name))
-		value_dict['alternative_names'] = alt_names_list
-
-	# Add blacklisted value regex
-	if attr_spec.HasField('blacklisted_value_regex'):
-		value_dict['blacklisted_value_regex'] = attr_spec.blacklisted_value_regex
-
-	# dispatch_key is an int
-	if attr_spec.HasField('dispatch_key'):
-		value_dict['dispatch_key'] = attr_spec.dispatch_key
-
-	# mandatory is a boolean
-	if attr_spec.HasField('mandatory'):
-		value_dict['mandatory'] = attr_spec.mandatory
-
-	# Add allowed value
-	if attr_spec.value:
-		value_dict['value'] = list( attr_spec.value )
-
-	# value_casei
-	if attr_spec.value_casei:
-		value_dict['value_casei'] = list( attr_spec.value_casei )
-
-	# value_regex
-	if attr_spec.HasField('value_regex'):
-		value_dict['value_regex'] = attr_spec.value_regex
-
-	# value_regex_casei
-	if attr_spec.HasField('value_regex_casei'):
-		value_dict['value_regex_casei'] = attr_spec.value_regex_casei
-
-	#value_properties is a dictionary of dictionaries
-	if attr_spec.HasField('value_properties'):
-		value_properties_dict = {}
-		for (value_properties_key, value_properties_val) in attr_spec.value_properties.ListFields():
-			for value_property in value_properties_val:
-				property_dict = {}
-				# print 'value_property.name: %s' % value_property.name
-				for (key,val) in value_property.ListFields():
-					if val != value_property.name:
-						if isinstance(val, unicode):
-							val = UnicodeEscape(val)
-						property_dict[UnicodeEscape(key.name)] = val
-				value_properties_dict[UnicodeEscape(value_property.name)] = property_dict
-		value_dict['value_properties'] = value_properties_dict
-
-	# value_url is a dictionary
-	if attr_spec.HasField('value_url'):
-		value_url_dict = {}
-		for (value_url_key, value_url_val) in attr_spec.value_url.ListFields():
-			if isinstance(value_url_val, (list, collections.Sequence, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
-				value_url_val_val = []
-				for val in value_url_val:
-					value_url_val_val.append(UnicodeEscape(val))
-			else:
-				value_url_val_val = value_url_val
-			value_url_dict[value_url_key.name] = value_url_val_val
-		value_dict['value_url'] = value_url_dict
 
-	if hasattr(attr_spec, 'requires_extension') and len( attr_spec.requires_extension ) != 0:
-		requires_extension_list = []
-		for requires_extension in attr_spec.requires_extension:
-			requires_extension_list.append(requires_extension)
-		value_dict['requires_extension'] = requires_extension_list
+def MeasureFootprint(out_dir, php, sharded=False, snapshot_format=None):
+	"""Measures the footprint of the generated class by loading it in PHP with FOOTPRINT_SCRIPT.
+
+	Args:
+		out_dir: directory name of the output directory, containing the generated class.
+		php: path of the PHP binary.
+		sharded: whether the sharded output was generated.
+		snapshot_format: the format of the generated snapshot file, or None.
+	Returns:
+		Dictionary of the measurements of FOOTPRINT_SCRIPT, which include the PHP version,
+		with the size in bytes of the class and its shards or snapshot.
+	"""
+	logging.info('entering ...')
+
+	php_file = os.path.join(out_dir, GENERATED_PHP_FILE)
+	try:
+		process = subprocess.Popen([php, FOOTPRINT_SCRIPT, '--footprint', php_file], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+	except OSError as e:
+		Die('Error: Running %s failed: %s' % (php, e))
+	stdout, stderr = process.communicate()
+	if process.returncode != 0:
+		Die('Error: Measuring the footprint of the generated class failed:\n%s' % stderr)
+	footprint = json.loads(stdout)
+
+	paths = [php_file]
+	if sharded:
+		for root, dirs, files in os.walk(os.path.join(out_dir, GENERATED_SHARD_DIR)):
+			paths.extend(os.path.join(root, name) for name in files)
+	if snapshot_format:
+		paths.append(os.path.join(out_dir, GetSnapshotFile(snapshot_format)))
+	footprint['bytes'] = sum(os.path.getsize(path) for path in paths)
 
 	logging.info('... done')
-	return value_dict
+	return footprint
+
+
+def CheckFootprint(footprint, baseline_file, thresholds):
+	"""Compares the footprint of the generated class with a baseline, and fails if it grew beyond the thresholds.
 
+	Measurements which are missing from either footprint, such as those of opcache
+	when the extension is not loaded, are not compared, and neither are footprints
+	measured with different PHP versions. The measurements are written to STDERR.
 
-def UnicodeEscape(string):
-	"""Helper function which escapes unicode characters.
+	Args:
+		footprint: dictionary of the measurements, as returned by MeasureFootprint().
+		baseline_file: path of a footprint file written by a previous run, or None.
+		thresholds: dictionary of the percentage by which each measurement may exceed the baseline.
+	Returns:
+		Dictionary of the footprint, the baseline and the thresholds, to be written to GENERATED_FOOTPRINT_FILE.
+	"""
+	baseline = None
+	if baseline_file is not None:
+		f = open(baseline_file)
+		baseline = json.load(f)['footprint']
+		f.close()
+		if baseline.get('php_version') != footprint['php_version']:
+			logging.warning('The footprint baseline was measured with PHP %s rather than %s, so it is not compared' % (baseline.get('php_version'), footprint['php_version']))
+			baseline = None
+
+	regressions = []
+	for metric in sorted(FOOTPRINT_THRESHOLDS):
+		value = footprint.get(metric)
+		if value is None:
+			continue
+		line = '%s: %s' % (metric, FormatFootprintValue(metric, value))
+		if baseline is not None and baseline.get(metric):
+			change = 100.0 * (value - baseline[metric]) / baseline[metric]
+			line += ' (baseline %s, %+.1f%%)' % (FormatFootprintValue(metric, baseline[metric]), change)
+			if metric in thresholds and change > thresholds[metric]:
+				regressions.append('%s, more than the threshold of %s%%' % (line, thresholds[metric]))
+		sys.stderr.write(line + '\n')
+
+	if regressions:
+		Die('Error: The footprint of the generated class grew beyond the thresholds, so it was not installed:\n%s' % '\n'.join(regressions))
+	return {
+		'footprint': footprint,
+		'baseline': baseline,
+		'thresholds': thresholds,
+	}
+
+
+def FormatFootprintValue(metric, value):
+	"""Formats a measurement of the footprint of the generated class.
 
 	Args:
-		string: A string which may contain unicode characters.
+		metric: name of the measurement, one of the keys of FOOTPRINT_THRESHOLDS.
+		value: the measurement, in seconds for the timings and in bytes otherwise.
 	Returns:
-		An escaped string.
+		The measurement in milliseconds or kilobytes.
 	"""
-	return ('' + string).encode('unicode-escape')
+	if metric in ('compile', 'all_tags'):
+		return '%.2f ms' % (value * 1000)
+	return '%.1f KB' % (value / 1024.0)
 
-def Phpize(data, indent=0):
-	"""Helper function to convert JSON-serializable data into PHP literals.
+
+def WriteJsonFile(path, data):
+	"""Atomically writes data to a JSON file.
 
 	Args:
+		path: path of the file.
 		data: Any JSON-serializable.
+	"""
+	out = AtomicFileWriter(path)
+	try:
+		out.append(json.dumps(data, indent=2, separators=(',', ': '), sort_keys=True))
+		out.commit()
+	except:
+		out.abort()
+		raise
+
+
+def GetSegmentCacheDir(cache_dir):
+	"""Gets the directory of the segment cache of ParseProtoasciiFiles() inside the stage cache.
+
+	Args:
+		cache_dir: directory name of the persistent stage cache, or None.
 	Returns:
-		String formatted as PHP literal.
+		Directory name of the segment cache, or None if caching is disabled.
 	"""
-	json_string = json.dumps(data, sort_keys=True, ensure_ascii=False)
+	if cache_dir is None:
+		return None
+	return os.path.join(cache_dir, 'rules-segments')
 
-	pipe = subprocess.Popen(['php', '-r', 'var_export( json_decode( file_get_contents( "php://stdin" ), true ) );'], stdout=subprocess.PIPE, stdin=subprocess.PIPE, stderr=subprocess.STDOUT)
-	php_stdout = pipe.communicate(input=json_string)[0]
-	php_exported = php_stdout.decode()
 
-	# Clean up formatting.
-	# TODO: Just use PHPCBF for this.
-	php_exported = re.sub( r'^ +', lambda match: ( len(match.group(0))/2 ) * '\t', php_exported, flags=re.MULTILINE )
-	php_exported = php_exported.replace( 'array (', 'array(' )
-	php_exported = re.sub( r' => \n\s+', ' => ', php_exported, flags=re.MULTILINE )
-	php_exported = re.sub( r'^(\s+)\d+ =>\s*', r'\1', php_exported, flags=re.MULTILINE )
+def InstallOutputs(out_dir, output, sharded=False, snapshot_format=None):
+	"""Installs the generated PHP file, and its shards or snapshot, and removes stale ones of previous runs.
 
-	# Add additional indents.
-	if indent > 0:
-		php_exported = re.sub( r'^', '\t' * indent, php_exported, flags=re.MULTILINE )
-	return php_exported
+	Args:
+		out_dir: directory name of the output directory.
+		output: path to write the PHP file to.
+		sharded: whether the sharded output was generated.
+		snapshot_format: the format of the generated snapshot file, or None.
+	"""
+	shard_dir = os.path.join(os.path.dirname(output), GENERATED_SHARD_DIR)
+	if sharded:
+		InstallDirectory(os.path.join(out_dir, GENERATED_SHARD_DIR), shard_dir)
+	elif os.path.isdir(shard_dir):
+		# The shards of a previous sharded run would be stale.
+		shutil.rmtree(shard_dir)
+
+	for other_format in amphtml_snapshot.SNAPSHOT_FORMATS:
+		snapshot_file = os.path.join(os.path.dirname(output), GetSnapshotFile(other_format))
+		if other_format == snapshot_format:
+			InstallFile(os.path.join(out_dir, GetSnapshotFile(other_format)), snapshot_file)
+		elif os.path.exists(snapshot_file):
+			# The snapshot of a previous run in another format would be stale.
+			os.remove(snapshot_file)
+	InstallFile(os.path.join(out_dir, GENERATED_PHP_FILE), output)
+
+
+def MainMatrix( revisions, out_dir, output_dir, options=Options() ):
+	"""Generates the PHP for several amphtml revisions at once, each in its own process.
+
+	The processes share the stage cache. Before they start, the protoascii files
+	of all the revisions are parsed into the segment cache in one pool of
+	processes, so that a validator.proto or an extension which is the same in
+	several revisions is only compiled or parsed once. The PHP of each revision
+	is written to a subdirectory of output_dir named after it, and a summary of
+	the time and the cache hits of each revision to STDERR and to matrix.json in
+	output_dir.
 
-def Main( validator_directory, out_dir ):
-	"""The main method, which executes all build steps and runs the tests."""
+	Args:
+		revisions: ordered dictionary of revision name to the directory of its validator, inside its amphtml repo.
+		out_dir: directory name of the output directory, in which each revision gets a subdirectory.
+		output_dir: directory to write the PHP files to.
+		options: the Options of the run, with the number of processes to parse the
+			protoascii files of all the revisions with as jobs. The output options
+			and those which only apply to Main() are not used.
+	"""
 	logging.basicConfig(format='[[%(filename)s %(funcName)s]] - %(message)s', level=logging.INFO)
 
-	validator_directory = os.path.realpath(validator_directory)
 	out_dir = os.path.realpath(out_dir)
+	output_dir = os.path.realpath(output_dir)
+	if options.cache_dir is not None:
+		options = options._replace(cache_dir=os.path.realpath(options.cache_dir))
+
+	SetupOutDir(out_dir)
+	start = time.time()
+	files = []
+	segment_cache_stats = collections.Counter()
+	if options.cache_dir is not None:
+		for (name, validator_directory) in revisions.items():
+			revision_out_dir = os.path.join(out_dir, name)
+			SetupOutDir(revision_out_dir)
+			stages = GetStages(validator_directory)
+			amphtml_stages.RunStages(stages[:1], revision_out_dir, options.cache_dir)
+			descriptor_file = os.path.join(revision_out_dir, VALIDATOR_DESCRIPTOR_FILE)
+			files.extend((descriptor_file, protoascii_file) for protoascii_file in GetProtoasciiFiles(validator_directory))
+		ParseProtoasciiFiles(files, options.jobs, GetSegmentCacheDir(options.cache_dir), segment_cache_stats)
+
+	revision_jobs = max(1, options.jobs // len(revisions))
+	queue = multiprocessing.Queue()
+	processes = []
+	for (name, validator_directory) in revisions.items():
+		revision_output = os.path.join(output_dir, name, GENERATED_PHP_FILE)
+		if not os.path.isdir(os.path.dirname(revision_output)):
+			os.makedirs(os.path.dirname(revision_output))
+		# The processes are not daemonic, so that they can parse with a pool of processes of their own.
+		process = multiprocessing.Process(target=GenerateRevision, args=(queue, name, os.path.realpath(validator_directory), os.path.join(out_dir, name), options._replace(jobs=revision_jobs, output=revision_output)))
+		process.start()
+		processes.append((name, process))
+
+	# The results are read before the processes are joined, since a process which has put its result
+	# on the queue does not exit until the result is flushed to the pipe.
+	results = {}
+	while len(results) < len(processes):
+		try:
+			result = queue.get(True, 1)
+		except Queue.Empty:
+			# A process which died without putting its result would otherwise be waited for forever.
+			if any(process.is_alive() for (name, process) in processes):
+				continue
+			try:
+				result = queue.get(False)
+			except Queue.Empty:
+				break
+		results[result['name']] = result
+	for (name, process) in processes:
+		process.join()
+		if 0 != process.exitcode:
+			results.pop(name, None)
+
+	summary = {
+		'wall_time': time.time() - start,
+		'jobs_per_revision': revision_jobs,
+		'files': len(files),
+		'files_parsed': segment_cache_stats['parsed'],
+		'revisions': [results[name] for name in revisions if name in results],
+		'failed': [name for name in revisions if name not in results],
+	}
+	cached_stages = sum(result['stages']['cached'] for result in summary['revisions'])
+	total_stages = sum(result['stages']['total'] for result in summary['revisions'])
+	summary['stages_hit_rate'] = float(cached_stages) / total_stages if total_stages else None
+	summary['files_hit_rate'] = 1 - float(summary['files_parsed']) / len(files) if files else None
+
+	f = open(os.path.join(output_dir, 'matrix.json'), 'w')
+	json.dump(summary, f, indent=2, separators=(',', ': '), sort_keys=True)
+	f.write('\n')
+	f.close()
+
+	sys.stderr.write('\n%-30s %10s %15s\n' % ('Revision', 'Time (s)', 'Stages cached'))
+	for result in summary['revisions']:
+		sys.stderr.write('%-30s %10.2f %15s\n' % (result['name'], result['wall_time'], '%(cached)d/%(total)d' % result['stages']))
+	for name in summary['failed']:
+		sys.stderr.write('%-30s %10s\n' % (name, 'failed'))
+	sys.stderr.write('Generated %d revisions in %.2fs, parsing %d of their %d protoascii files\n' % (len(summary['revisions']), summary['wall_time'], summary['files_parsed'], summary['files']))
+
+	if summary['failed']:
+		Die('Error: Generating failed for: %s' % ', '.join(summary['failed']))
 
+
+def GenerateRevision(queue, name, validator_directory, out_dir, options):
+	"""Generates the PHP for one revision of MainMatrix(), in a process of its own.
+
+	Args:
+		queue: multiprocessing.Queue to put the statistics of the revision on.
+		name: name of the revision.
+		validator_directory: directory for where the validator is located, inside the amphtml repo.
+		out_dir: directory name of the output directory of the revision.
+		options: the Options of the revision, with the path to write its PHP file to as output.
+	"""
+	start = time.time()
 	SetupOutDir(out_dir)
-	GenValidatorProtoascii(validator_directory, out_dir)
-	GenValidatorPb2Py(validator_directory, out_dir)
-	GenValidatorProtoascii(validator_directory,out_dir)
-	GeneratePHP(out_dir)
+	stages = GetStages(validator_directory, options)
+	ran_stages = amphtml_stages.RunStages(stages, out_dir, options.cache_dir)
+	InstallOutputs(out_dir, options.output, options.sharded, options.snapshot_format)
+	queue.put({
+		'name': name,
+		'output': options.output,
+		'wall_time': time.time() - start,
+		'cpu_time': sum(os.times()[:4]),
+		'stages': {'cached': len(stages) - len(ran_stages), 'total': len(stages)},
+	})
+
+
+def GetAmphtmlDirectory(path, source_cache_dir):
+	"""Gets the amphtml directory at a path, extracting the validator files first if it is a tarball.
+
+	The validator files of a tarball are extracted into a directory of the source
+	cache named after the revision, along with a manifest of the hash of the
+	tarball, and are reused as long as the tarball has the same hash. A path which
+	does not exist is looked up as the name of a revision in the source cache, so
+	that a pre-seeded cache can be used without the tarballs.
+
+	Args:
+		path: path to an amphtml directory or a tarball of one, such as a GitHub archive, or the name of a cached revision.
+		source_cache_dir: directory to extract tarballs into.
+	Returns:
+		Directory name of the amphtml repo, or None if there is none at the path.
+	"""
+	if os.path.isdir(path):
+		return path
+	if not os.path.exists(path):
+		cached_directory = os.path.join(source_cache_dir, path)
+		if os.sep in path or not os.path.isfile(os.path.join(cached_directory, AMPHTML_SOURCE_MANIFEST)):
+			return None
+		logging.info('Using the cached amphtml revision %s' % path)
+		return cached_directory
+	if not tarfile.is_tarfile(path):
+		return path
+
+	tarball_hash = amphtml_stages.HashFiles([path])
+	amphtml_directory = os.path.join(source_cache_dir, GetRevisionName(path))
+	manifest_file = os.path.join(amphtml_directory, AMPHTML_SOURCE_MANIFEST)
+	if os.path.isfile(manifest_file):
+		f = open(manifest_file)
+		manifest = json.load(f)
+		f.close()
+		if manifest.get('tarball_hash') == tarball_hash:
+			logging.info('Using the cached validator files of %s' % path)
+			return amphtml_directory
+
+	if not os.path.exists(source_cache_dir):
+		os.makedirs(source_cache_dir)
+	tmp_dir = tempfile.mkdtemp(dir=source_cache_dir, prefix='.tmp.')
+	try:
+		files = ExtractAmphtmlSources(path, tmp_dir)
+		f = open(os.path.join(tmp_dir, AMPHTML_SOURCE_MANIFEST), 'w')
+		json.dump({'tarball': os.path.basename(path), 'tarball_hash': tarball_hash, 'files': files}, f, indent=2, separators=(',', ': '), sort_keys=True)
+		f.close()
+		InstallDirectory(tmp_dir, amphtml_directory)
+	finally:
+		shutil.rmtree(tmp_dir)
+	logging.info('Extracted %d validator files of %s' % (len(files), path))
+	return amphtml_directory
+
+
+def ExtractAmphtmlSources(path, amphtml_directory):
+	"""Extracts the files the generator reads from a tarball of the amphtml repo.
+
+	The tarball is read as a stream, without its top-level directory like
+	amphtml-update.sh extracts it, and only the members matching
+	AMPHTML_SOURCE_FILES are written.
+
+	Args:
+		path: path to a tarball of the amphtml repo.
+		amphtml_directory: directory to extract the files into.
+	Returns:
+		Sorted list of the paths of the extracted files, relative to the directory.
+	"""
+	files = []
+	tar = tarfile.open(path, 'r|*')
+	try:
+		for member in tar:
+			parts = member.name.split('/', 1)
+			if not member.isfile() or len(parts) < 2 or not IsAmphtmlSourceFile(parts[1]):
+				continue
+			file_path = os.path.join(amphtml_directory, *parts[1].split('/'))
+			if not os.path.isdir(os.path.dirname(file_path)):
+				os.makedirs(os.path.dirname(file_path))
+			src = tar.extractfile(member)
+			dest = open(file_path, 'wb')
+			shutil.copyfileobj(src, dest)
+			dest.close()
+			files.append(parts[1])
+	finally:
+		tar.close()
+	return sorted(files)
+
+
+def IsAmphtmlSourceFile(name):
+	"""Checks whether a file of the amphtml repo is read by the generator.
+
+	Args:
+		name: path of the file, relative to the root of the repo.
+	Returns:
+		Whether the path matches one of AMPHTML_SOURCE_FILES.
+	"""
+	parts = name.split('/')
+	if '..' in parts or '' in parts:
+		return False
+	for pattern in AMPHTML_SOURCE_FILES:
+		pattern_parts = pattern.split('/')
+		if len(parts) == len(pattern_parts) and all(fnmatch.fnmatchcase(part, pattern_part) for part, pattern_part in zip(parts, pattern_parts)):
+			return True
+	return False
+
+
+def ScanComponents(path):
+	"""Scans HTML files for the AMP components they use.
+
+	Args:
+		path: path to an HTML file, or a directory to scan the HTML files in recursively.
+	Returns:
+		Set of the names of the components, as tag names and the extension names of custom-element and custom-template scripts.
+	"""
+	if os.path.isdir(path):
+		paths = []
+		for root, dirs, files in os.walk(path):
+			paths.extend(os.path.join(root, name) for name in files if os.path.splitext(name)[1].lower() in ('.html', '.htm'))
+	else:
+		paths = [path]
+
+	components = set()
+	for file_path in sorted(paths):
+		f = open(file_path)
+		html = f.read()
+		f.close()
+		components.update(name.lower() for name in COMPONENT_TAG_REGEX.findall(html))
+		components.update(name.lower() for name in COMPONENT_SCRIPT_REGEX.findall(html))
+	logging.info('Found %d AMP components in %d files in %s' % (len(components), len(paths), path))
+	return components
+
+
+def GetRevisionName(path):
+	"""Gets the name of an amphtml revision from the path of its directory or tarball.
+
+	Args:
+		path: path to an amphtml directory or a tarball of one.
+	Returns:
+		Name of the revision.
+	"""
+	name = os.path.basename(os.path.normpath(path))
+	for extension in ('.tar.gz', '.tgz', '.tar.bz2', '.tar'):
+		if name.endswith(extension):
+			return name[:-len(extension)]
+	return name
 
 if __name__ == '__main__':
-	if len( sys.argv ) == 0:
-		Die( "Error: Must supply amphtml directory as first argument" )
-	validator_directory = os.path.join( sys.argv[1], 'validator' )
-	if not os.path.exists( validator_directory ):
-		Die( "Error: The amphtml directory does not exist: %s" % validator_directory )
-	validator_directory = os.path.realpath( validator_directory )
-	out_dir = os.path.join( tempfile.gettempdir(), 'amp_wp' )
-	Main( validator_directory, out_dir )
+	parser = argparse.ArgumentParser(description='Generate class-amp-allowed-tags-generated.php from the AMPHTML validator spec.')
+	parser.add_argument('amphtml', nargs='+', help='Path to the amphtml repo, or to a tarball of it, of which only the validator files are extracted into the cache, or the name of a revision in the cache. Pass several together with --output-dir to generate the PHP for each of them at once.')
+	parser.add_argument('--output', help='Path to atomically write the PHP file to, instead of writing it to STDOUT.')
+	parser.add_argument('--output-dir', help='Directory to write the PHP file of each amphtml revision to, in a subdirectory named after the revision, along with a matrix.json summary of the time and cache hits of each.')
+	parser.add_argument('--sharded', action='store_true', help='Write the specs of each tag to their own file, which is only loaded on first access. Requires --output.')
+	parser.add_argument('--enum-format', choices=ENUM_FORMATS, default='both', help='Emit enumerations such as attribute values as lists, as value => true sets for isset() lookups, or both.')
+	parser.add_argument('--snapshot-format', choices=amphtml_snapshot.SNAPSHOT_FORMATS.keys(), help='Write the rules to a snapshot file in this format next to the PHP file, which the class loads on first access, instead of as PHP array literals. Requires --output.')
+	parser.add_argument('--diff-against', help='Path to a previous generated PHP file, or a rules snapshot such as %s from the cache, to write a JSON changelog of the rules against to STDOUT. Sections of a previous PHP file which are unchanged are copied from it. Requires --output.' % RULES_SNAPSHOT_FILE)
+	parser.add_argument('--regex-report', help='Path to write a JSON report of the regexes of the spec which are invalid or prone to catastrophic backtracking to, along with the specs using them.')
+	parser.add_argument('--strict-regexes', action='store_true', help='Fail when a regex of the spec is prone to catastrophic backtracking, instead of only reporting it. Invalid regexes always fail.')
+	parser.add_argument('--dependency-report', help='Path to write a JSON report of the cycles of tag specs requiring each other, and of the tag specs, extensions and reference points which specs require but do not exist, to.')
+	parser.add_argument('--strict-dependencies', action='store_true', help='Fail when the specs have dependency cycles or missing dependencies, instead of only reporting them.')
+	parser.add_argument('--spec-profile', help='Path to a spec match profile recorded with an instrumented class, to order the tag specs of each tag by how often they matched. Tag specs only move ahead of tag specs which cannot match the same element.')
+	parser.add_argument('--instrument-spec-matches', action='store_true', help='Generate a class which records how often each tag spec matches, for tests/benchmark/sanitize-corpus.php to write a spec match profile with.')
+	parser.add_argument('--components', help='Comma-separated list of the AMP components a site uses, as extension or tag names, to only keep the rules of these extensions. Tag specs and attributes of other extensions are dropped, along with what only they refer to. Combine with --components-from to add the components found in HTML files.')
+	parser.add_argument('--components-from', metavar='PATH', action='append', default=[], help='HTML file, or directory of them, to scan for the AMP components a site uses, like --components. Can be passed several times.')
+	parser.add_argument('--exclude-extensions', help='Comma-separated list of the extensions to drop the rules of, keeping those of all other extensions.')
+	parser.add_argument('--footprint', action='store_true', help='Load the generated class with PHP to measure its compile time, memory and opcache usage with tests/benchmark/load-allowed-tags.php, and write them to %s next to it. Fails without installing the class if they grew beyond the thresholds compared to the baseline. Requires --output.' % GENERATED_FOOTPRINT_FILE)
+	parser.add_argument('--footprint-baseline', help='Path to the %s to compare the footprint with, instead of the one next to --output.' % GENERATED_FOOTPRINT_FILE)
+	parser.add_argument('--footprint-threshold', metavar='METRIC=PERCENT', action='append', default=[], help='Percentage by which a measurement of the footprint may exceed the baseline, for one of %s. Can be passed several times. Defaults to %s.' % (', '.join(sorted(FOOTPRINT_THRESHOLDS)), ', '.join('%s=%s' % item for item in sorted(FOOTPRINT_THRESHOLDS.items()))))
+	parser.add_argument('--php', default='php', help='PHP binary to measure the footprint with.')
+	parser.add_argument('--cache-dir', default=os.path.join(os.path.expanduser('~'), '.cache', 'amp-wp', 'amphtml-update'), help='Directory for caching the outputs of build steps between runs.')
+	parser.add_argument('--no-cache', action='store_true', help='Run every build step regardless of the cache.')
+	parser.add_argument('--jobs', type=int, default=multiprocessing.cpu_count(), help='Number of processes to parse the main spec and the extensions with; 1 parses them in this process, and the assembled spec at once with --no-cache.')
+	parser.add_argument('--parse-stats', action='store_true', help='Report which protobuf backend parsed the spec and how long it took.')
+	parser.add_argument('--profile', metavar='DIR', help='Profile the stages that run and write amphtml-update.pstats and a JSON summary to DIR. Combine with --no-cache to profile every stage.')
+	args = parser.parse_args()
+	if args.sharded and not ( args.output or args.output_dir ):
+		Die( "Error: --sharded requires --output" )
+	if args.snapshot_format and not ( args.output or args.output_dir ):
+		Die( "Error: --snapshot-format requires --output" )
+	if args.snapshot_format and args.sharded:
+		Die( "Error: --snapshot-format cannot be combined with --sharded" )
+	if args.diff_against and not args.output:
+		Die( "Error: --diff-against requires --output" )
+	if args.diff_against and not os.path.isfile( args.diff_against ):
+		Die( "Error: The file to diff against does not exist: %s" % args.diff_against )
+	if args.spec_profile and not os.path.isfile( args.spec_profile ):
+		Die( "Error: The spec match profile does not exist: %s" % args.spec_profile )
+	if ( args.components is not None or args.components_from ) and args.exclude_extensions is not None:
+		Die( "Error: --components and --components-from cannot be combined with --exclude-extensions" )
+	for path in args.components_from:
+		if not os.path.exists( path ):
+			Die( "Error: The path to scan for AMP components does not exist: %s" % path )
+	if ( args.footprint_baseline or args.footprint_threshold ) and not args.footprint:
+		Die( "Error: --footprint-baseline and --footprint-threshold require --footprint" )
+	if args.footprint and not args.output:
+		Die( "Error: --footprint requires --output" )
+	if args.footprint_baseline and not os.path.isfile( args.footprint_baseline ):
+		Die( "Error: The footprint baseline does not exist: %s" % args.footprint_baseline )
+	footprint_thresholds = dict( FOOTPRINT_THRESHOLDS )
+	for threshold in args.footprint_threshold:
+		metric, _, percent = threshold.partition( '=' )
+		if metric not in FOOTPRINT_THRESHOLDS or not re.match( r'^[0-9]+(\.[0-9]+)?$', percent ):
+			Die( "Error: Invalid footprint threshold, expected METRIC=PERCENT with a metric of %s: %s" % ( ', '.join( sorted( FOOTPRINT_THRESHOLDS ) ), threshold ) )
+		footprint_thresholds[ metric ] = float( percent )
+
+	if len( args.amphtml ) > 1 and not args.output_dir:
+		Die( "Error: Several amphtml revisions require --output-dir" )
+	if args.output_dir and args.output:
+		Die( "Error: --output-dir cannot be combined with --output" )
+	if args.output_dir and ( args.diff_against or args.profile or args.regex_report or args.dependency_report or args.spec_profile or args.instrument_spec_matches or args.components is not None or args.components_from or args.exclude_extensions is not None ):
+		Die( "Error: --output-dir cannot be combined with --diff-against, --profile, --regex-report, --dependency-report, --spec-profile, --instrument-spec-matches, --components, --components-from or --exclude-extensions" )
+	if len( set( map( GetRevisionName, args.amphtml ) ) ) < len( args.amphtml ):
+		Die( "Error: The names of the amphtml revisions are not unique: %s" % ', '.join( map( GetRevisionName, args.amphtml ) ) )
+
+	logging.basicConfig( format='[[%(filename)s %(funcName)s]] - %(message)s', level=logging.INFO )
+	components = None
+	if args.components is not None or args.components_from:
+		components = set( name.strip().lower() for name in ( args.components or '' ).split( ',' ) if name.strip() )
+		for path in args.components_from:
+			components.update( ScanComponents( path ) )
+		components = sorted( components )
+	exclude_extensions = None
+	if args.exclude_extensions is not None:
+		exclude_extensions = sorted( set( name.strip().lower() for name in args.exclude_extensions.split( ',' ) if name.strip() ) )
+
+	tmp_dir = tempfile.mkdtemp( prefix='amp_wp_amphtml' )
+	try:
+		source_cache_dir = tmp_dir if args.no_cache else os.path.join( args.cache_dir, 'amphtml-sources' )
+		revisions = collections.OrderedDict()
+		for amphtml in args.amphtml:
+			amphtml_directory = GetAmphtmlDirectory( amphtml, source_cache_dir )
+			if amphtml_directory is None:
+				Die( "Error: The amphtml directory does not exist: %s" % amphtml )
+			validator_directory = os.path.join( amphtml_directory, 'validator' )
+			if not os.path.exists( validator_directory ):
+				Die( "Error: The amphtml directory does not exist: %s" % validator_directory )
+			revisions[ GetRevisionName( amphtml ) ] = os.path.realpath( validator_directory )
+
+		out_dir = os.path.join( tempfile.gettempdir(), 'amp_wp' )
+		options = Options(
+			cache_dir=None if args.no_cache else args.cache_dir,
+			jobs=args.jobs,
+			output=args.output and os.path.realpath( args.output ),
+			sharded=args.sharded,
+			enum_format=args.enum_format,
+			snapshot_format=args.snapshot_format,
+			diff_against=args.diff_against and os.path.realpath( args.diff_against ),
+			regex_report=args.regex_report and os.path.realpath( args.regex_report ),
+			strict_regexes=args.strict_regexes,
+			dependency_report=args.dependency_report and os.path.realpath( args.dependency_report ),
+			strict_dependencies=args.strict_dependencies,
+			spec_profile=args.spec_profile and os.path.realpath( args.spec_profile ),
+			instrumented=args.instrument_spec_matches,
+			components=components,
+			exclude_extensions=exclude_extensions,
+			footprint_php=args.php if args.footprint else None,
+			footprint_baseline=args.footprint_baseline and os.path.realpath( args.footprint_baseline ),
+			footprint_thresholds=footprint_thresholds,
+			parse_stats=args.parse_stats,
+			profile=Profile() if args.profile else None,
+		)
+		if args.output_dir:
+			MainMatrix( revisions, out_dir, args.output_dir, options )
+		else:
+			Main( revisions.values()[0], out_dir, options )
+	finally:
+		shutil.rmtree( tmp_dir )
+	if options.profile is not None:
+		options.profile.Write( args.profile )
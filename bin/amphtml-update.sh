@@ -10,18 +10,39 @@
 # $ git clone git@github.com:ampproject/amphtml.git amphtml
 # $ cd amphtml; git checkout ec5fd60; cd -
 # $ ./amphtml-update.sh amphtml/
+#
+# Or from a tarball of it, of which only the validator files are extracted:
+#
+# $ ./amphtml-update.sh 1911070201480.tar.gz
+#
+# The validator files of each release are kept in the cache of amphtml-update.py,
+# so that hosts without network access can update to a release in a pre-seeded
+# cache by setting its version:
+#
+# $ AMPHTML_VERSION=1911070201480 ./amphtml-update.sh
+#
+# Any further arguments are passed on to amphtml-update.py, for example to split
+# the rules into lazily-loaded shards:
+#
+# $ ./amphtml-update.sh amphtml/ --sharded
+#
+# Or to fail if the generated class takes much more memory or time to load than
+# the committed one, measured with the local PHP CLI:
+#
+# $ ./amphtml-update.sh amphtml/ --footprint
 
 set -e
 
 BIN_PATH="$(dirname "$0")"
 PROJECT_PATH=$(dirname $BIN_PATH)
 AMPHTML_LOCATION="$1"
+shift $(( $# > 0 ? 1 : 0 ))
 
 if ! command -v python >/dev/null 2>&1 || ! python -c "import google.protobuf" 2>/dev/null; then
 	echo "Error: The google.protobuf Python module is not installed."
 	echo
 	echo "On Linux, you can install the required dependencies via:"
-	echo "# apt-get install python protobuf-compiler python-protobuf"
+	echo "# apt-get install python python-protobuf"
 	echo
 	echo "On MacOS, Python is already installed but you may install via:"
 	echo "$ pip install --upgrade protobuf"
@@ -29,8 +50,9 @@ if ! command -v python >/dev/null 2>&1 || ! python -c "import google.protobuf" 2
 fi
 
 if [[ -z "$AMPHTML_LOCATION" ]]; then
-	AMPHTML_VERSION=$( curl -s https://cdn.ampproject.org/rtv/metadata | sed 's/.*"ampRuntimeVersion":"01\([0-9]*\)".*/\1/' )
-	CLEANUP=1
+	if [[ -z "$AMPHTML_VERSION" ]]; then
+		AMPHTML_VERSION=$( curl -s https://cdn.ampproject.org/rtv/metadata | sed 's/.*"ampRuntimeVersion":"01\([0-9]*\)".*/\1/' )
+	fi
 
 	if [[ "$AMPHTML_VERSION" =~ ^[0-9][0-9]*$ ]]; then
 		echo "Current AMP version: $AMPHTML_VERSION"
@@ -39,23 +61,28 @@ if [[ -z "$AMPHTML_LOCATION" ]]; then
 		exit 2
 	fi
 
-	AMPHTML_LOCATION=$( mktemp -d )
-
-	curl -L "https://github.com/ampproject/amphtml/archive/$AMPHTML_VERSION.tar.gz" | tar -xzf - --strip-components=1 -C "$AMPHTML_LOCATION"
+	if [[ -f "$HOME/.cache/amp-wp/amphtml-update/amphtml-sources/$AMPHTML_VERSION/amphtml-source.json" ]]; then
+		CLEANUP=0
+		AMPHTML_LOCATION="$AMPHTML_VERSION"
+	else
+		CLEANUP=1
+		AMPHTML_LOCATION="$( mktemp -d )/$AMPHTML_VERSION.tar.gz"
+		curl -L -o "$AMPHTML_LOCATION" "https://github.com/ampproject/amphtml/archive/$AMPHTML_VERSION.tar.gz"
+	fi
 else
 	CLEANUP=0
 	echo "Using amphtml as located in: $AMPHTML_LOCATION"
-	if [[ ! -d "$AMPHTML_LOCATION" ]]; then
-		echo "Error: Directory does not exist."
+	if [[ ! -e "$AMPHTML_LOCATION" ]]; then
+		echo "Error: Directory or tarball does not exist."
 		exit 3
 	fi
 fi
 
 # Run script.
-python "$BIN_PATH/amphtml-update.py" "$AMPHTML_LOCATION" > "$PROJECT_PATH/includes/sanitizers/class-amp-allowed-tags-generated.php"
+python "$BIN_PATH/amphtml-update.py" "$AMPHTML_LOCATION" --output="$PROJECT_PATH/includes/sanitizers/class-amp-allowed-tags-generated.php" "$@"
 
 if [[ $CLEANUP == 1 ]]; then
-	rm -r "$AMPHTML_LOCATION"
+	rm -r "$( dirname "$AMPHTML_LOCATION" )"
 fi
 
 if [[ ! -z "$AMPHTML_VERSION" ]]; then
@@ -0,0 +1,284 @@
+"""
+Checks of the regexes of the AMPHTML validator spec, and the PCRE patterns the sanitizer matches them with.
+
+The regexes of the specs are written for the validator's JavaScript engine, and
+are matched by PHP's PCRE. GetRegexProblems() finds those which PCRE would not
+compile or which are prone to catastrophic backtracking, and GetPcrePattern()
+turns a regex into the pattern the sanitizer passes to preg_match():
+
+	import amphtml_regex
+	problems = amphtml_regex.GetRegexProblems(r'(\w|\d)+')
+	pattern = amphtml_regex.GetPcrePattern('[0-9]+', 'value_regex')
+"""
+
+import re
+import sre_compile
+import sre_constants
+import sre_parse
+
+# How the sanitizer matches the regexes of the specs, by their key: with which
+# PCRE delimiter and modifiers, and whether the regex has to match the whole value.
+PCRE_PATTERN_FORMATS = {
+	'value_regex': ('/', 'u', True),
+	'value_regex_casei': ('/', 'ui', True),
+	'blacklisted_value_regex': ('/', 'u', False),
+	'cdata_regex': ('@', 'u', False),
+	'blacklisted_cdata_regex': ('@', 'u', False),
+}
+
+# The characters GetRegexProblems() compares what the parts of a regex match by:
+# ASCII and a few others, which is what the specs' regexes distinguish between.
+REGEX_ALPHABET = frozenset([unichr(i) for i in range(128)] + [u'\xa0', u'\xe9', u'\u4e00'])
+
+# The characters each single character item of a parsed regex matches, see
+# GetRegexCharset(). Only a memo of this process, as the items are the same for
+# every spec.
+_regex_charsets = {}
+
+
+def GetPcrePattern(regex, key):
+	"""Gets the PCRE pattern the sanitizer matches a regex of the specs with.
+
+	Args:
+		regex: the regex, as it is in the spec.
+		key: the key of the regex in the spec, one of PCRE_PATTERN_FORMATS.
+	Returns:
+		The delimited pattern with its modifiers.
+	"""
+	(delimiter, modifiers, anchored) = PCRE_PATTERN_FORMATS[key]
+
+	# Escape the delimiter, unless the regex already does.
+	pattern = []
+	escaped = False
+	for char in regex:
+		if delimiter == char and not escaped:
+			pattern.append('\\')
+		pattern.append(char)
+		escaped = '\\' == char and not escaped
+	pattern = ''.join(pattern)
+
+	if anchored:
+		pattern = '^(%s)$' % pattern
+	return delimiter + pattern + delimiter + modifiers
+
+
+def GetRegexProblems(regex, casei=False):
+	"""Checks whether a regex is valid, and whether it is prone to catastrophic backtracking.
+
+	A regex is prone to catastrophic backtracking when a part of it which repeats
+	without bound can match the same characters in several ways, so that a value
+	which almost matches has exponentially many ways to try. There are two such
+	cases: a repetition inside an unbounded repetition, when all else the outer
+	one requires could be matched by the inner one too, like ([0-9]+\\.?)+; and an
+	unbounded repetition of alternatives, two of which match the same single
+	characters, like (\\w|\\d)+.
+
+	The regex is parsed by Python's regex parser once the PCRE syntax it does not
+	know is translated, so this is a static check which does not run PCRE.
+
+	Args:
+		regex: the regex, as it is in the spec.
+		casei: whether the regex is matched case-insensitively.
+	Returns:
+		Sorted list of the problems of the regex, which is empty if there are none.
+	"""
+	flags = re.I if casei else 0
+	try:
+		items = list(sre_parse.parse(GetParsableRegex(regex), flags))
+	except (ValueError, OverflowError, sre_constants.error) as e:
+		return ['invalid: %s' % e]
+
+	problems = set()
+	FindBacktrackingProblems(items, flags, problems)
+	return sorted(problems)
+
+
+def GetParsableRegex(regex):
+	"""Translates the PCRE syntax of a regex which Python's regex parser does not know.
+
+	Unicode properties are replaced by the character classes closest to them.
+
+	Args:
+		regex: the regex, as it is in the spec.
+	Returns:
+		The regex for sre_parse.
+	Raises:
+		ValueError: if the regex has escapes which PCRE does not support.
+	"""
+	def Translate(match):
+		escape = match.group(0)
+		if escape.startswith('(?'):
+			return '(?P<'
+		if escape[1] in 'LlUu':
+			raise ValueError('PCRE does not support the escape %s' % escape)
+		if escape[1] in 'pP':
+			return '\\w' if 'p' == escape[1] else '\\W'
+		if escape.startswith('\\x{'):
+			return re.escape(unichr(int(escape[3:-1], 16)))
+		return escape
+	return re.sub(r'\\(?:[pP]\{[^}]*\}|x\{[0-9a-fA-F]+\}|.)|\(\?<(?=[A-Za-z_])', Translate, unicode(regex), flags=re.S)
+
+
+def FindBacktrackingProblems(items, flags, problems):
+	"""Finds the parts of a parsed regex which are prone to catastrophic backtracking.
+
+	Args:
+		items: list of the (opcode, argument) items of the parsed regex.
+		flags: the flags the regex is parsed with.
+		problems: set to add the problems found to.
+	"""
+	for (op, av) in items:
+		if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and sre_constants.MAXREPEAT == av[1]:
+			body = list(av[2])
+			for repeat in GetUnboundedRepeats(body):
+				repeat_chars = GetRegexChars(list(repeat[1][2]), flags)
+				if all(chars <= repeat_chars for chars in GetRequiredChars(body, repeat, flags)):
+					problems.add('nested quantifier: an unbounded repetition contains another which can match the same characters')
+					break
+			for branches in GetAlternatives(body):
+				# The parser moves a prefix which all alternatives share out of them, so (a|a) has two empty alternatives.
+				contents = [repr(list(branch)) for branch in branches]
+				single_chars = [GetRegexChars(list(branch), flags) for branch in branches if (1, 1) == branch.getwidth()]
+				if len(set(contents)) < len(contents) or any(chars & other for (i, chars) in enumerate(single_chars) for other in single_chars[i + 1:]):
+					problems.add('overlapping alternatives: an unbounded repetition has alternatives which match the same characters')
+		for child in GetRegexChildren(op, av):
+			FindBacktrackingProblems(list(child), flags, problems)
+
+
+def GetRegexChildren(op, av):
+	"""Gets the sequences of items nested in an item of a parsed regex.
+
+	Args:
+		op: the opcode of the item.
+		av: the argument of the item.
+	Returns:
+		List of the nested sequences.
+	"""
+	if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+		return [av[2]]
+	if op in (sre_constants.SUBPATTERN, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+		return [av[-1]]
+	if sre_constants.BRANCH == op:
+		return av[1]
+	if sre_constants.GROUPREF_EXISTS == op:
+		return [child for child in av[1:] if child]
+	return []
+
+
+def GetUnboundedRepeats(items):
+	"""Gets the unbounded repetitions in a sequence of items of a parsed regex, however deeply nested.
+
+	Args:
+		items: list of the (opcode, argument) items.
+	Returns:
+		List of the items which are unbounded repetitions.
+	"""
+	repeats = []
+	for item in items:
+		(op, av) = item
+		if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and sre_constants.MAXREPEAT == av[1]:
+			repeats.append(item)
+		for child in GetRegexChildren(op, av):
+			repeats.extend(GetUnboundedRepeats(list(child)))
+	return repeats
+
+
+def GetRequiredChars(items, exclude, flags):
+	"""Gets what each character a sequence of items of a parsed regex requires can be.
+
+	Args:
+		items: list of the (opcode, argument) items.
+		exclude: item to leave out, along with the alternatives containing it.
+		flags: the flags the regex is parsed with.
+	Returns:
+		List of the sets of the characters each required character can be.
+	"""
+	required = []
+	for item in items:
+		(op, av) = item
+		if item is exclude:
+			continue
+		if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.ANY, sre_constants.IN):
+			required.append(GetRegexCharset(item, flags))
+		elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+			if av[0] > 0:
+				required.extend(GetRequiredChars(list(av[2]), exclude, flags))
+		elif sre_constants.SUBPATTERN == op:
+			required.extend(GetRequiredChars(list(av[-1]), exclude, flags))
+		elif sre_constants.BRANCH == op:
+			# An alternative containing the excluded item need not be taken.
+			if not ContainsRegexItem(item, exclude) and all(branch.getwidth()[0] > 0 for branch in av[1]):
+				required.append(frozenset().union(*[GetRegexChars(list(branch), flags) for branch in av[1]]))
+		elif sre_constants.GROUPREF == op:
+			required.append(REGEX_ALPHABET)
+	return required
+
+
+def ContainsRegexItem(item, target):
+	"""Checks whether an item of a parsed regex is another item, or contains it.
+
+	Args:
+		item: the (opcode, argument) item.
+		target: the item to look for.
+	Returns:
+		Boolean.
+	"""
+	if item is target:
+		return True
+	return any(ContainsRegexItem(child_item, target) for child in GetRegexChildren(*item) for child_item in child)
+
+
+def GetRegexChars(items, flags):
+	"""Gets all the characters a sequence of items of a parsed regex can match.
+
+	Args:
+		items: list of the (opcode, argument) items.
+		flags: the flags the regex is parsed with.
+	Returns:
+		Set of characters of REGEX_ALPHABET.
+	"""
+	chars = frozenset()
+	for item in items:
+		(op, av) = item
+		if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.ANY, sre_constants.IN):
+			chars |= GetRegexCharset(item, flags)
+		elif sre_constants.GROUPREF == op:
+			chars = REGEX_ALPHABET
+		for child in GetRegexChildren(op, av):
+			chars |= GetRegexChars(list(child), flags)
+	return chars
+
+
+def GetAlternatives(items):
+	"""Gets the alternatives which a sequence of items of a parsed regex consists of, outside of repetitions.
+
+	Args:
+		items: list of the (opcode, argument) items.
+	Returns:
+		List of the lists of alternatives.
+	"""
+	alternatives = []
+	for (op, av) in items:
+		if sre_constants.BRANCH == op:
+			alternatives.append(av[1])
+		elif sre_constants.SUBPATTERN == op:
+			alternatives.extend(GetAlternatives(list(av[-1])))
+	return alternatives
+
+
+def GetRegexCharset(item, flags):
+	"""Gets the characters a single character item of a parsed regex matches.
+
+	Args:
+		item: the (opcode, argument) item.
+		flags: the flags the regex is parsed with.
+	Returns:
+		Set of characters of REGEX_ALPHABET.
+	"""
+	key = (repr(item), flags)
+	if key not in _regex_charsets:
+		pattern = sre_parse.Pattern()
+		pattern.flags = flags
+		regex = sre_compile.compile(sre_parse.SubPattern(pattern, [item]), flags)
+		_regex_charsets[key] = frozenset(char for char in REGEX_ALPHABET if regex.match(char))
+	return _regex_charsets[key]
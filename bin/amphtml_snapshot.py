@@ -0,0 +1,259 @@
+"""
+Encoders of the snapshot formats amphtml-update.py can write the generated rules in.
+
+The rules are encoded as the PHP function of each format would encode the
+values which the PHP array literals of the generated class evaluate to, so that
+the class can load them with the decoding function of the format instead:
+
+	import amphtml_snapshot
+	(extension, unserialize) = amphtml_snapshot.SNAPSHOT_FORMATS['serialize']
+	data = amphtml_snapshot.SerializeSnapshot({'amp-img': [{'tag_spec': {}}]}, 'serialize')
+
+Like the literals, keys which json_decode() turns into integers are integers,
+and the strings 'True' and 'False' are booleans; see GetPhpArrayItems() and
+GetPhpScalar().
+"""
+
+import collections
+import numbers
+import re
+import struct
+
+# Formats the rules can be written in instead of PHP array literals, with the
+# extension of the snapshot file and the PHP function decoding it.
+SNAPSHOT_FORMATS = collections.OrderedDict([
+	('serialize', ('ser', 'unserialize')),
+	('igbinary', ('igbinary', 'igbinary_unserialize')),
+	('msgpack', ('msgpack', 'msgpack_unpack')),
+])
+
+# Array keys which json_decode() converts to integers.
+PHP_INT_KEY_REGEX = re.compile(r'^(0|-?[1-9][0-9]*)\Z')
+PHP_INT_MAX = 2 ** 63 - 1
+PHP_INT_MIN = -PHP_INT_MAX - 1
+
+
+def SerializeSnapshot(data, snapshot_format):
+	"""Encodes data in a snapshot format, as the PHP function of the format would encode the values Phpize() outputs.
+
+	Args:
+		data: Any JSON-serializable.
+		snapshot_format: one of SNAPSHOT_FORMATS.
+	Returns:
+		Encoded string.
+	"""
+	out = []
+	if 'serialize' == snapshot_format:
+		PhpSerializeValue(data, out)
+	elif 'igbinary' == snapshot_format:
+		out.append(struct.pack('>I', 2))
+		IgbinarySerializeValue(data, {}, out)
+	elif 'msgpack' == snapshot_format:
+		MsgpackPackValue(data, out)
+	else:
+		raise ValueError('Unknown snapshot format %r' % snapshot_format)
+	return ''.join(out)
+
+
+def GetPhpIntKey(key):
+	"""Helper function to get the integer that json_decode() turns a dictionary key into.
+
+	Args:
+		key: A dictionary key.
+	Returns:
+		The integer, or None if the key remains a string.
+	"""
+	if isinstance(key, bool):
+		return None
+	elif isinstance(key, numbers.Integral):
+		key = str(key)
+	elif isinstance(key, float):
+		return None
+	if PHP_INT_KEY_REGEX.match(key) and PHP_INT_MIN <= int(key) <= PHP_INT_MAX:
+		return int(key)
+	return None
+
+
+def GetPhpArrayItems(data):
+	"""Helper function to get the items of the PHP array a dictionary or list becomes, in the order Phpize() outputs them.
+
+	Args:
+		data: A dictionary, list or tuple.
+	Returns:
+		List of tuples of the integer or UTF-8 encoded key and the value.
+	"""
+	if not isinstance(data, dict):
+		return list(enumerate(data))
+	items = []
+	for key in sorted(data):
+		int_key = GetPhpIntKey(key)
+		if int_key is not None:
+			items.append((int_key, data[key]))
+		elif isinstance(key, bool):
+			items.append(('true' if key else 'false', data[key]))
+		elif isinstance(key, float):
+			items.append((repr(key), data[key]))
+		else:
+			items.append((GetPhpScalar(key), data[key]))
+	return items
+
+
+def GetPhpScalar(data):
+	"""Helper function to get the value PHP gets for a scalar, with strings UTF-8 encoded.
+
+	Args:
+		data: A string, number, boolean or None.
+	Returns:
+		The value, where strings that Phpize() outputs as booleans are booleans.
+	"""
+	if isinstance(data, basestring):
+		if data in ('True', 'False'):
+			return 'True' == data
+		if isinstance(data, unicode):
+			return data.encode('utf-8')
+	elif data is not None and not isinstance(data, (bool, numbers.Integral, float)):
+		raise TypeError('%r is not JSON serializable' % (data,))
+	return data
+
+
+def PhpSerializeValue(data, out):
+	"""Helper function which appends the serialize() encoding of a value.
+
+	Args:
+		data: Any JSON-serializable.
+		out: list of strings to append to.
+	"""
+	if isinstance(data, (dict, list, tuple)):
+		items = GetPhpArrayItems(data)
+		out.append('a:%d:{' % len(items))
+		for (key, value) in items:
+			PhpSerializeValue(key, out)
+			PhpSerializeValue(value, out)
+		out.append('}')
+		return
+
+	data = GetPhpScalar(data)
+	if data is None:
+		out.append('N;')
+	elif isinstance(data, bool):
+		out.append('b:%d;' % data)
+	elif isinstance(data, numbers.Integral):
+		out.append('i:%d;' % data)
+	elif isinstance(data, float):
+		if data != data:
+			out.append('d:NAN;')
+		elif data in (float('inf'), float('-inf')):
+			out.append('d:%sINF;' % ('-' if data < 0 else ''))
+		else:
+			out.append('d:%s;' % repr(data).upper())
+	else:
+		out.append('s:%d:"%s";' % (len(data), data))
+
+
+def IgbinarySerializeValue(data, string_ids, out):
+	"""Helper function which appends the igbinary_serialize() encoding of a value.
+
+	Args:
+		data: Any JSON-serializable.
+		string_ids: dictionary of the strings encoded so far to their ID, which later occurrences refer to.
+		out: list of strings to append to.
+	"""
+	if isinstance(data, (dict, list, tuple)):
+		items = GetPhpArrayItems(data)
+		out.append(PackSized(len(items), '\x14', '\x15', '\x16'))
+		for (key, value) in items:
+			IgbinarySerializeValue(key, string_ids, out)
+			IgbinarySerializeValue(value, string_ids, out)
+		return
+
+	data = GetPhpScalar(data)
+	if data is None:
+		out.append('\x00')
+	elif isinstance(data, bool):
+		out.append('\x05' if data else '\x04')
+	elif isinstance(data, numbers.Integral):
+		if data >= 0:
+			out.append(PackSized(data, '\x06', '\x08', '\x0a', '\x20'))
+		else:
+			out.append(PackSized(-data, '\x07', '\x09', '\x0b', '\x21'))
+	elif isinstance(data, float):
+		out.append('\x0c' + struct.pack('>d', data))
+	elif not data:
+		out.append('\x0d')
+	elif data in string_ids:
+		out.append(PackSized(string_ids[data], '\x0e', '\x0f', '\x10'))
+	else:
+		string_ids[data] = len(string_ids)
+		out.append(PackSized(len(data), '\x11', '\x12', '\x13') + data)
+
+
+def MsgpackPackValue(data, out):
+	"""Helper function which appends the msgpack_pack() encoding of a value.
+
+	Lists become msgpack arrays and dictionaries maps, which msgpack_unpack() both
+	decodes into PHP arrays.
+
+	Args:
+		data: Any JSON-serializable.
+		out: list of strings to append to.
+	"""
+	if isinstance(data, (dict, list, tuple)):
+		items = GetPhpArrayItems(data)
+		if isinstance(data, dict):
+			out.append(chr(0x80 | len(items)) if len(items) < 16 else PackSized(len(items), None, '\xde', '\xdf'))
+		else:
+			out.append(chr(0x90 | len(items)) if len(items) < 16 else PackSized(len(items), None, '\xdc', '\xdd'))
+		for (key, value) in items:
+			if isinstance(data, dict):
+				MsgpackPackValue(key, out)
+			MsgpackPackValue(value, out)
+		return
+
+	data = GetPhpScalar(data)
+	if data is None:
+		out.append('\xc0')
+	elif isinstance(data, bool):
+		out.append('\xc3' if data else '\xc2')
+	elif isinstance(data, numbers.Integral):
+		if 0 <= data < 128:
+			out.append(chr(data))
+		elif -32 <= data < 0:
+			out.append(struct.pack('b', data))
+		elif data >= 0:
+			out.append(PackSized(data, '\xcc', '\xcd', '\xce', '\xcf'))
+		elif data >= -0x80:
+			out.append('\xd0' + struct.pack('>b', data))
+		elif data >= -0x8000:
+			out.append('\xd1' + struct.pack('>h', data))
+		elif data >= -0x80000000:
+			out.append('\xd2' + struct.pack('>i', data))
+		else:
+			out.append('\xd3' + struct.pack('>q', data))
+	elif isinstance(data, float):
+		out.append('\xcb' + struct.pack('>d', data))
+	elif len(data) < 32:
+		# The str 8 type is avoided, which older versions of the extension do not decode.
+		out.append(chr(0xa0 | len(data)) + data)
+	else:
+		out.append(PackSized(len(data), None, '\xda', '\xdb') + data)
+
+
+def PackSized(number, type8, type16, type32, type64=None):
+	"""Helper function to pack an unsigned number big-endian, prefixed with the type for its size.
+
+	Args:
+		number: The number.
+		type8: type for numbers up to 0xff, or None to use type16 for them.
+		type16: type for numbers up to 0xffff.
+		type32: type for numbers up to 0xffffffff.
+		type64: type for larger numbers, if any.
+	Returns:
+		Packed string.
+	"""
+	if type8 is not None and number <= 0xff:
+		return type8 + struct.pack('>B', number)
+	if number <= 0xffff:
+		return type16 + struct.pack('>H', number)
+	if number <= 0xffffffff or type64 is None:
+		return type32 + struct.pack('>I', number)
+	return type64 + struct.pack('>Q', number)
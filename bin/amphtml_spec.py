@@ -0,0 +1,659 @@
+"""
+Model of the AMPHTML validator spec which amphtml-update.py generates the PHP from.
+
+The ValidatorRules message parsed from the protoascii files is turned into
+compact TagSpec, AttrSpec, CdataSpec and ReferencePoint objects, with indexes of
+the tag specs by tag name, spec_name, attribute name and required extension. Only
+the tags and attributes which the PHP is generated for are kept, so the model
+answers questions about the generated rules without generating and parsing the
+PHP, such as which tag specs allow an attribute:
+
+	import amphtml_spec
+	spec = amphtml_spec.Spec(rules)
+	for tag_spec in spec.GetTagSpecsByAttr('autoplay'):
+		print tag_spec.tag_name, tag_spec.spec_name
+
+The rules can be a ValidatorRules message of any validator_pb2 module, such as
+the one amphtml-update.py loads with LoadSpec() from its rules snapshot.
+"""
+
+import collections
+import google
+
+
+# Don't include tags that have a mandatory parent with one of these tag names
+# since we're only concerned with using this tag list to validate the HTML
+# of the DOM
+MANDATORY_PARENT_BLACKLIST = (
+	'$ROOT',
+	'!DOCTYPE',
+)
+
+# The tag name of the tag specs which only exist to be referenced by the reference_points of other tag specs.
+REFERENCE_POINT_TAG_NAME = '$REFERENCE_POINT'
+
+
+class AttrSpec(object):
+	"""The rules of an attribute of a tag spec or an attribute list.
+
+	Fields which are not set in the spec are None.
+	"""
+
+	__slots__ = ('name', 'alternative_names', 'blacklisted_value_regex', 'dispatch_key', 'mandatory', 'value', 'value_casei', 'value_regex', 'value_regex_casei', 'value_properties', 'value_url', 'requires_extension')
+
+	def __init__(self, name):
+		for field in self.__slots__:
+			setattr(self, field, None)
+		self.name = name
+
+	def ToDict(self):
+		"""Gets the attribute spec in the form of the generated PHP.
+
+		Returns:
+			Dictionary of the fields which are set, except the name.
+		"""
+		attr_dict = {}
+		for field in self.__slots__[1:]:
+			value = getattr(self, field)
+			if value is not None:
+				attr_dict[field] = value
+		return attr_dict
+
+
+class CdataSpec(object):
+	"""The rules of the text contents of a tag spec.
+
+	The css_spec is a dictionary of the allowed at-rules and the declaration,
+	URL and keyframes rules. Fields of CdataSpec which are not known to this model
+	are kept in other_fields by their name, so that newer versions of the spec are
+	still generated in full.
+	"""
+
+	__slots__ = ('max_bytes', 'max_bytes_spec_url', 'cdata_regex', 'mandatory_cdata', 'blacklisted_cdata_regex', 'css_spec', 'other_fields')
+
+	def __init__(self):
+		for field in self.__slots__:
+			setattr(self, field, None)
+
+	def ToDict(self):
+		"""Gets the cdata spec in the form of the generated PHP.
+
+		Returns:
+			Dictionary of the fields which are set.
+		"""
+		cdata_dict = dict(self.other_fields or {})
+		for field in self.__slots__[:-1]:
+			value = getattr(self, field)
+			if value is not None:
+				cdata_dict[field] = value
+		return cdata_dict
+
+
+class ReferencePoint(object):
+	"""A reference of a tag spec to the $REFERENCE_POINT tag spec with the tag_spec_name."""
+
+	__slots__ = ('tag_spec_name', 'mandatory', 'unique')
+
+	def __init__(self, tag_spec_name, mandatory, unique):
+		self.tag_spec_name = tag_spec_name
+		self.mandatory = mandatory
+		self.unique = unique
+
+	def ToDict(self):
+		"""Gets the reference point in the form of the generated PHP.
+
+		Returns:
+			Dictionary of whether the reference point is mandatory and unique.
+		"""
+		return {'mandatory': self.mandatory, 'unique': self.unique}
+
+
+class TagSpec(object):
+	"""The rules of a tag, or of a $REFERENCE_POINT.
+
+	The attr_specs are the attribute specs of the attribute lists the tag spec
+	uses, overridden by its own attribute specs, by attribute name. Attribute specs
+	of the lists are shared by all tag specs using them. The index is the position
+	of the tag spec among the tag specs of its tag name, or None for reference points.
+	Fields which are not set in the spec are None.
+	"""
+
+	# The fields which are output in the tag_spec of the generated PHP.
+	RULE_FIELDS = ('also_requires_tag', 'requires_extension', 'reference_points', 'also_requires_tag_warning', 'disallowed_ancestor', 'extension_spec', 'mandatory', 'mandatory_alternatives', 'mandatory_ancestor', 'mandatory_ancestor_suggested_alternative', 'mandatory_parent', 'spec_name', 'spec_url', 'unique', 'unique_warning', 'child_tags', 'descendant_tag_list', 'amp_layout')
+
+	__slots__ = ('tag_name', 'index', 'attr_lists', 'attr_specs', 'cdata') + RULE_FIELDS
+
+	def __init__(self, tag_name):
+		for field in self.__slots__:
+			setattr(self, field, None)
+		self.tag_name = tag_name
+
+	def GetRequiredExtensions(self):
+		"""Gets the extensions the tag spec or any of its attributes require.
+
+		Returns:
+			Sorted list of extension names.
+		"""
+		extensions = set(self.requires_extension or [])
+		for attr_spec in self.attr_specs.itervalues():
+			extensions.update(attr_spec.requires_extension or [])
+		return sorted(extensions)
+
+	def ToDict(self, attr_dicts=None):
+		"""Gets the tag spec in the form of the generated PHP.
+
+		Args:
+			attr_dicts: dictionary of the ids of the attribute specs which were already converted to their dictionaries, to share them like the attribute specs are shared, or None.
+		Returns:
+			Dictionary with the 'tag_spec' rules, the 'attr_spec_list' and the 'cdata' if there is any.
+		"""
+		if attr_dicts is None:
+			attr_dicts = {}
+		tag_dict = {}
+		for field in self.RULE_FIELDS:
+			value = getattr(self, field)
+			if value is not None:
+				tag_dict[field] = value
+		if self.reference_points is not None:
+			tag_dict['reference_points'] = dict((reference_point.tag_spec_name, reference_point.ToDict()) for reference_point in self.reference_points)
+		attr_dict = {}
+		for (attr_name, attr_spec) in self.attr_specs.iteritems():
+			if id(attr_spec) not in attr_dicts:
+				attr_dicts[id(attr_spec)] = attr_spec.ToDict()
+			attr_dict[attr_name] = attr_dicts[id(attr_spec)]
+		tag_spec_dict = {'tag_spec': tag_dict, 'attr_spec_list': attr_dict}
+		if self.cdata is not None:
+			tag_spec_dict['cdata'] = self.cdata.ToDict()
+		return tag_spec_dict
+
+
+class Spec(object):
+	"""The tags, attribute lists, descendant tag lists and reference points of the spec, with indexes of the tag specs.
+
+	The tags are the lists of tag specs by lowercase tag name, and the reference
+	points the $REFERENCE_POINT tag specs by spec_name. Tag specs for tags outside
+	of the body, deprecated ones and those only for transformed AMP are left out.
+	"""
+
+	__slots__ = ('versions', 'attr_lists', 'descendant_lists', 'tags', 'reference_points', 'spec_names', 'attrs', 'extensions')
+
+	def __init__(self, rules, count=None):
+		"""Builds the model of a ValidatorRules message.
+
+		Args:
+			rules: ValidatorRules message.
+			count: function which is called with the name of a counter of the tags and attributes kept and skipped, or None.
+		"""
+		if count is None:
+			count = lambda counter: None
+		self.versions = {}
+		self.attr_lists = {}
+		self.descendant_lists = {}
+		self.tags = {}
+		self.reference_points = {}
+
+		# Record the version of this specfile and the corresponding validator version.
+		if rules.HasField('spec_file_revision'):
+			self.versions['spec_file_revision'] = rules.spec_file_revision
+
+		if rules.HasField('min_validator_revision_required'):
+			self.versions['min_validator_revision_required'] = rules.min_validator_revision_required
+
+		# Build a dictionary of the named attribute lists that are used by multiple tags.
+		for attr_list in rules.attr_lists:
+			self.attr_lists[UnicodeEscape(attr_list.name)] = GetAttrSpecs(attr_list.attrs, count)
+
+		for tag_spec in rules.tags:
+
+			# Ignore tags that are outside of the body
+			if tag_spec.HasField('mandatory_parent') and tag_spec.mandatory_parent in MANDATORY_PARENT_BLACKLIST and tag_spec.tag_name != 'HTML':
+				count('tags skipped: mandatory_parent')
+				continue
+
+			# Ignore deprecated tags
+			if tag_spec.HasField('deprecation'):
+				count('tags skipped: deprecation')
+				continue
+
+			gotten_tag_spec = GetTagSpec(tag_spec, self.attr_lists, count)
+			if gotten_tag_spec is None:
+				continue
+
+			# Handle the special $REFERENCE_POINT tag
+			if REFERENCE_POINT_TAG_NAME == tag_spec.tag_name:
+				self.reference_points[tag_spec.spec_name] = gotten_tag_spec
+				count('reference points kept')
+				continue
+
+			tag_specs = self.tags.setdefault(gotten_tag_spec.tag_name, [])
+			gotten_tag_spec.index = len(tag_specs)
+			tag_specs.append(gotten_tag_spec)
+			count('tags kept')
+
+		for descendant_list in rules.descendant_tag_list:
+			self.descendant_lists[descendant_list.name] = []
+			for val in descendant_list.tag:
+
+				# Skip tags specific to transformed AMP.
+				if val in ( 'I-AMPHTML-SIZER', ):
+					continue
+
+				self.descendant_lists[descendant_list.name].append( val.lower() )
+
+		self.BuildIndexes()
+
+	def BuildIndexes(self):
+		"""Builds the indexes of the tag specs by spec_name, attribute name and required extension.
+
+		The tag specs of the allowed tags come in the order of their tag names and
+		then their index, followed by the reference points in the order of their
+		spec_names. Of tag specs with the same spec_name, the first one is indexed.
+		"""
+		self.spec_names = {}
+		self.attrs = {}
+		self.extensions = {}
+		for tag_spec in self.GetTagSpecs():
+			if tag_spec.spec_name is not None and tag_spec.spec_name not in self.spec_names:
+				self.spec_names[tag_spec.spec_name] = tag_spec
+			for attr_name in tag_spec.attr_specs:
+				self.attrs.setdefault(attr_name, []).append(tag_spec)
+			for extension in tag_spec.GetRequiredExtensions():
+				self.extensions.setdefault(extension, []).append(tag_spec)
+
+	def GetTagSpecs(self):
+		"""Gets all tag specs, including the reference points.
+
+		Returns:
+			List of TagSpec, in the order of the indexes.
+		"""
+		tag_specs = []
+		for tag_name in sorted(self.tags):
+			tag_specs.extend(self.tags[tag_name])
+		for spec_name in sorted(self.reference_points):
+			tag_specs.append(self.reference_points[spec_name])
+		return tag_specs
+
+	def GetTagSpecsByTag(self, tag_name):
+		"""Gets the tag specs of a tag.
+
+		Args:
+			tag_name: tag name, in any case.
+		Returns:
+			List of TagSpec, which is empty if the tag is not allowed.
+		"""
+		return self.tags.get(tag_name.lower(), [])
+
+	def GetTagSpecByName(self, spec_name):
+		"""Gets the tag spec or reference point with a spec_name.
+
+		Args:
+			spec_name: spec_name of the tag spec.
+		Returns:
+			TagSpec, or None if there is no tag spec with the spec_name.
+		"""
+		return self.spec_names.get(spec_name)
+
+	def GetTagSpecsByAttr(self, attr_name):
+		"""Gets the tag specs and reference points which allow an attribute, including by their attribute lists.
+
+		Globally allowed attributes and layout attributes are not included, unless a tag spec has them itself.
+
+		Args:
+			attr_name: attribute name.
+		Returns:
+			List of TagSpec.
+		"""
+		return self.attrs.get(attr_name, [])
+
+	def GetTagSpecsByExtension(self, extension):
+		"""Gets the tag specs and reference points which require an extension, themselves or for one of their attributes.
+
+		Args:
+			extension: name of the extension, such as amp-bind.
+		Returns:
+			List of TagSpec.
+		"""
+		return self.extensions.get(extension, [])
+
+	def ToRules(self):
+		"""Gets the rules in the form the PHP is generated from.
+
+		The attribute specs which are shared in the model are shared dictionaries in the rules.
+
+		Returns:
+			Tuple of the allowed tags, the attribute lists, the descendant tag lists, the
+			reference points and the versions.
+		"""
+		attr_dicts = {}
+		attr_lists = {}
+		for (name, attr_specs) in self.attr_lists.iteritems():
+			attr_lists[name] = {}
+			for (attr_name, attr_spec) in attr_specs.iteritems():
+				if id(attr_spec) not in attr_dicts:
+					attr_dicts[id(attr_spec)] = attr_spec.ToDict()
+				attr_lists[name][attr_name] = attr_dicts[id(attr_spec)]
+		allowed_tags = {}
+		for (tag_name, tag_specs) in self.tags.iteritems():
+			allowed_tags[tag_name] = [tag_spec.ToDict(attr_dicts) for tag_spec in tag_specs]
+		reference_points = {}
+		for (spec_name, tag_spec) in self.reference_points.iteritems():
+			reference_points[spec_name] = tag_spec.ToDict(attr_dicts)
+		descendant_lists = dict((name, list(tag_names)) for (name, tag_names) in self.descendant_lists.iteritems())
+		return allowed_tags, attr_lists, descendant_lists, reference_points, dict(self.versions)
+
+
+def GetTagSpec(tag_spec, attr_lists, count):
+	"""Builds the model of a TagSpec message.
+
+	Args:
+		tag_spec: TagSpec message.
+		attr_lists: dictionary of attribute list name to its attribute specs by name.
+		count: function which is called with the name of a counter.
+	Returns:
+		TagSpec, or None if the tag spec is left out.
+	"""
+	gotten_tag_spec = GetTagRules(tag_spec, count)
+	if gotten_tag_spec is None:
+		return None
+
+	# First add attributes from any attribute lists to this tag.
+	gotten_tag_spec.attr_lists = [UnicodeEscape(attr_list) for attr_list in tag_spec.attr_lists]
+	gotten_tag_spec.attr_specs = {}
+	for attr_list in gotten_tag_spec.attr_lists:
+		gotten_tag_spec.attr_specs.update(attr_lists[attr_list])
+
+	# Then merge the spec-specific attributes on top to override any list definitions.
+	gotten_tag_spec.attr_specs.update(GetAttrSpecs(tag_spec.attrs, count))
+
+	if tag_spec.HasField('cdata'):
+		gotten_tag_spec.cdata = GetCdataSpec(tag_spec.cdata)
+
+	return gotten_tag_spec
+
+
+def GetCdataSpec(cdata):
+	"""Builds the model of a CdataSpec message.
+
+	Args:
+		cdata: CdataSpec message.
+	Returns:
+		CdataSpec, or None if none of its fields are kept.
+	"""
+	cdata_spec = CdataSpec()
+	cdata_fields = {}
+	for (field_descriptor, field_value) in cdata.ListFields():
+		if isinstance(field_value, (unicode, str, bool, int)):
+			cdata_fields[ field_descriptor.name ] = field_value
+		elif isinstance( field_value, google.protobuf.pyext._message.RepeatedCompositeContainer ):
+			cdata_fields[ field_descriptor.name ] = {}
+			for value in field_value:
+				for (key,val) in value.ListFields():
+					cdata_fields[ field_descriptor.name ][ key.name ] = val
+		elif hasattr( field_value, '_values' ):
+			cdata_fields[ field_descriptor.name ] = {}
+			for _value in field_value._values:
+				for (key,val) in _value.ListFields():
+					cdata_fields[ field_descriptor.name ][ key.name ] = val
+		elif 'css_spec' == field_descriptor.name:
+			cdata_fields['css_spec'] = GetCssSpec(field_value)
+	if len( cdata_fields ) == 0:
+		return None
+
+	for field in CdataSpec.__slots__:
+		if field in cdata_fields:
+			setattr(cdata_spec, field, cdata_fields.pop(field))
+	if cdata_fields:
+		cdata_spec.other_fields = cdata_fields
+	return cdata_spec
+
+
+def GetCssSpec(css_spec_message):
+	"""Gets the rules of a CssSpec message.
+
+	Args:
+		css_spec_message: CssSpec message.
+	Returns:
+		Dictionary of the allowed at-rules and the declaration, URL and keyframes rules.
+	"""
+	css_spec = {}
+
+	css_spec['allowed_at_rules'] = []
+	for at_rule_spec in css_spec_message.at_rule_spec:
+		if '$DEFAULT' == at_rule_spec.name:
+			continue
+		css_spec['allowed_at_rules'].append( at_rule_spec.name )
+
+	for css_spec_field_name in ( 'allowed_declarations', 'declaration', 'font_url_spec', 'image_url_spec', 'validate_keyframes' ):
+		if not hasattr( css_spec_message, css_spec_field_name ):
+			continue
+		css_spec_field_value = getattr( css_spec_message, css_spec_field_name )
+		if isinstance(css_spec_field_value, (list, collections.Sequence, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
+			css_spec[ css_spec_field_name ] = [ val for val in css_spec_field_value ]
+		elif hasattr( css_spec_field_value, 'ListFields' ):
+			css_spec[ css_spec_field_name ] = {}
+			for (css_spec_field_item_descriptor, css_spec_field_item_value) in css_spec_field_value.ListFields():
+				if isinstance(css_spec_field_item_value, (list, collections.Sequence, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
+					css_spec[ css_spec_field_name ][ css_spec_field_item_descriptor.name ] = [ val for val in css_spec_field_item_value ]
+				else:
+					css_spec[ css_spec_field_name ][ css_spec_field_item_descriptor.name ] = css_spec_field_item_value
+		else:
+			css_spec[ css_spec_field_name ] = css_spec_field_value
+
+	return css_spec
+
+
+def GetTagRules(tag_spec, count):
+	"""Builds the model of a TagSpec message, without its attributes and cdata.
+
+	Args:
+		tag_spec: TagSpec message.
+		count: function which is called with the name of a counter.
+	Returns:
+		TagSpec, or None if the tag spec is left out.
+	"""
+	if tag_spec.html_format:
+		has_amp_format = False
+		for html_format in tag_spec.html_format:
+			if 1 == html_format:
+				has_amp_format = True
+		if not has_amp_format:
+			count('tags skipped: html_format')
+			return None
+
+	# Ignore transformed AMP for now.
+	if tag_spec.enabled_by and 'transformed' in tag_spec.enabled_by:
+		count('tags skipped: transformed')
+		return None
+
+	tag_rules = TagSpec(UnicodeEscape(tag_spec.tag_name).lower())
+
+	if hasattr(tag_spec, 'also_requires_tag') and tag_spec.also_requires_tag:
+		tag_rules.also_requires_tag = [UnicodeEscape(also_requires_tag) for also_requires_tag in tag_spec.also_requires_tag]
+
+	if hasattr(tag_spec, 'requires_extension') and len( tag_spec.requires_extension ) != 0:
+		tag_rules.requires_extension = list( tag_spec.requires_extension )
+
+	if hasattr(tag_spec, 'reference_points') and len( tag_spec.reference_points ) != 0:
+		tag_reference_points = collections.OrderedDict()
+		for reference_point_spec in tag_spec.reference_points:
+			tag_reference_points[ reference_point_spec.tag_spec_name ] = ReferencePoint(reference_point_spec.tag_spec_name, reference_point_spec.mandatory, reference_point_spec.unique)
+		tag_rules.reference_points = tag_reference_points.values()
+
+	if hasattr(tag_spec, 'also_requires_tag_warning') and len( tag_spec.also_requires_tag_warning ) != 0:
+		tag_rules.also_requires_tag_warning = list( tag_spec.also_requires_tag_warning )
+
+	if tag_spec.disallowed_ancestor:
+		tag_rules.disallowed_ancestor = [UnicodeEscape(disallowed_ancestor).lower() for disallowed_ancestor in tag_spec.disallowed_ancestor]
+
+	if tag_spec.HasField('extension_spec'):
+		extension_spec = {}
+		for field in tag_spec.extension_spec.ListFields():
+			if isinstance(field[1], (list, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
+				extension_spec[ field[0].name ] = []
+				for val in field[1]:
+					extension_spec[ field[0].name ].append( val )
+			else:
+				extension_spec[ field[0].name ] = field[1]
+		tag_rules.extension_spec = extension_spec
+
+	if tag_spec.HasField('mandatory'):
+		tag_rules.mandatory = tag_spec.mandatory
+
+	if tag_spec.HasField('mandatory_alternatives'):
+		tag_rules.mandatory_alternatives = UnicodeEscape(tag_spec.mandatory_alternatives)
+
+	if tag_spec.HasField('mandatory_ancestor'):
+		tag_rules.mandatory_ancestor = UnicodeEscape(tag_spec.mandatory_ancestor).lower()
+
+	if tag_spec.HasField('mandatory_ancestor_suggested_alternative'):
+		tag_rules.mandatory_ancestor_suggested_alternative = UnicodeEscape(tag_spec.mandatory_ancestor_suggested_alternative).lower()
+
+	if tag_spec.HasField('mandatory_parent'):
+		tag_rules.mandatory_parent = UnicodeEscape(tag_spec.mandatory_parent).lower()
+
+	if tag_spec.HasField('spec_name'):
+		tag_rules.spec_name = UnicodeEscape(tag_spec.spec_name)
+
+	if tag_spec.HasField('spec_url'):
+		tag_rules.spec_url = UnicodeEscape(tag_spec.spec_url)
+
+	if tag_spec.HasField('unique'):
+		tag_rules.unique = tag_spec.unique
+
+	if tag_spec.HasField('unique_warning'):
+		tag_rules.unique_warning = tag_spec.unique_warning
+
+	if tag_spec.HasField('child_tags'):
+		child_tags = {}
+		for field in tag_spec.child_tags.ListFields():
+			if isinstance(field[1], (int)):
+				child_tags[ field[0].name ] = field[1]
+			elif isinstance(field[1], (list, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
+				child_tags[ field[0].name ] = [ val.lower() for val in field[1] ]
+		tag_rules.child_tags = child_tags
+
+	if tag_spec.HasField('descendant_tag_list'):
+		tag_rules.descendant_tag_list = tag_spec.descendant_tag_list
+
+	if tag_spec.HasField('amp_layout'):
+		amp_layout = {}
+		for field in tag_spec.amp_layout.ListFields():
+			if 'supported_layouts' == field[0].name:
+				amp_layout['supported_layouts'] = [ val for val in field[1] ]
+			else:
+				amp_layout[ field[0].name ] = field[1]
+		tag_rules.amp_layout = amp_layout
+
+	return tag_rules
+
+
+def GetAttrSpecs(attrs, count):
+	"""Builds the models of a list of AttrSpec messages.
+
+	Args:
+		attrs: AttrSpec messages.
+		count: function which is called with the name of a counter.
+	Returns:
+		Dictionary of attribute name to its AttrSpec.
+	"""
+	attr_specs = {}
+	for attr_spec in attrs:
+
+		gotten_attr_spec = GetAttrSpec(attr_spec, count)
+
+		if gotten_attr_spec is not None:
+			attr_specs[gotten_attr_spec.name] = gotten_attr_spec
+
+	return attr_specs
+
+
+def GetAttrSpec(attr_spec, count):
+	"""Builds the model of an AttrSpec message.
+
+	Args:
+		attr_spec: AttrSpec message.
+		count: function which is called with the name of a counter.
+	Returns:
+		AttrSpec, or None if the attribute is left out.
+	"""
+	# Ignore transformed AMP for now.
+	if 'transformed' in attr_spec.enabled_by:
+		count('attrs skipped: transformed')
+		return None
+
+	value_spec = AttrSpec(UnicodeEscape(attr_spec.name))
+
+	# Add alternative names
+	if attr_spec.alternative_names:
+		value_spec.alternative_names = [UnicodeEscape(alternative_name) for alternative_name in attr_spec.alternative_names]
+
+	# Add blacklisted value regex
+	if attr_spec.HasField('blacklisted_value_regex'):
+		value_spec.blacklisted_value_regex = attr_spec.blacklisted_value_regex
+
+	# dispatch_key is an int
+	if attr_spec.HasField('dispatch_key'):
+		value_spec.dispatch_key = attr_spec.dispatch_key
+
+	# mandatory is a boolean
+	if attr_spec.HasField('mandatory'):
+		value_spec.mandatory = attr_spec.mandatory
+
+	# Add allowed value
+	if attr_spec.value:
+		value_spec.value = list( attr_spec.value )
+
+	# value_casei
+	if attr_spec.value_casei:
+		value_spec.value_casei = list( attr_spec.value_casei )
+
+	# value_regex
+	if attr_spec.HasField('value_regex'):
+		value_spec.value_regex = attr_spec.value_regex
+
+	# value_regex_casei
+	if attr_spec.HasField('value_regex_casei'):
+		value_spec.value_regex_casei = attr_spec.value_regex_casei
+
+	#value_properties is a dictionary of dictionaries
+	if attr_spec.HasField('value_properties'):
+		value_properties_dict = {}
+		for (value_properties_key, value_properties_val) in attr_spec.value_properties.ListFields():
+			for value_property in value_properties_val:
+				property_dict = {}
+				for (key,val) in value_property.ListFields():
+					if val != value_property.name:
+						if isinstance(val, unicode):
+							val = UnicodeEscape(val)
+						property_dict[UnicodeEscape(key.name)] = val
+				value_properties_dict[UnicodeEscape(value_property.name)] = property_dict
+		value_spec.value_properties = value_properties_dict
+
+	# value_url is a dictionary
+	if attr_spec.HasField('value_url'):
+		value_url_dict = {}
+		for (value_url_key, value_url_val) in attr_spec.value_url.ListFields():
+			if isinstance(value_url_val, (list, collections.Sequence, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
+				value_url_val_val = []
+				for val in value_url_val:
+					value_url_val_val.append(UnicodeEscape(val))
+			else:
+				value_url_val_val = value_url_val
+			value_url_dict[value_url_key.name] = value_url_val_val
+		value_spec.value_url = value_url_dict
+
+	if hasattr(attr_spec, 'requires_extension') and len( attr_spec.requires_extension ) != 0:
+		value_spec.requires_extension = list( attr_spec.requires_extension )
+
+	return value_spec
+
+
+def UnicodeEscape(string):
+	"""Helper function which escapes unicode characters.
+
+	Args:
+		string: A string which may contain unicode characters.
+	Returns:
+		An escaped string.
+	"""
+	return ('' + string).encode('unicode-escape')
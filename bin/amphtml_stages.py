@@ -0,0 +1,178 @@
+"""
+The cached stage graph which amphtml-update.py runs its pipeline with.
+
+Each stage writes its outputs into the output directory, and is skipped when
+its outputs are in the cache under the key of its inputs:
+
+	import amphtml_stages
+	stage = amphtml_stages.Stage(
+		name='descriptor',
+		deps=[],
+		input_files=['validator/validator.proto'],
+		outputs=['validator.desc'],
+		run=lambda out_dir: GenValidatorDescriptor('validator', out_dir),
+		version='1',
+	)
+	amphtml_stages.RunStages([stage], out_dir, cache_dir)
+"""
+
+import collections
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from multiprocessing.pool import ThreadPool
+
+# A step of the pipeline. Its outputs are cached under a key hashed from its
+# input files, the keys of the stages it depends on, and its version. Stages whose
+# output only depends on their inputs have a fixed version, the others are
+# versioned by the hash of the code generating it.
+Stage = collections.namedtuple('Stage', ['name', 'deps', 'input_files', 'outputs', 'run', 'version'])
+
+
+def HashFiles(paths, salt=''):
+	"""Hashes the contents of files.
+
+	Args:
+		paths: list of file paths.
+		salt: additional string to include in the hash.
+	Returns:
+		Hex digest of the contents.
+	"""
+	digest = hashlib.sha1(salt)
+	for path in paths:
+		digest.update(os.path.basename(path) + '\0')
+		f = open(path, 'rb')
+		for chunk in iter(lambda: f.read(1024 * 1024), ''):
+			digest.update(chunk)
+		f.close()
+		digest.update('\0')
+	return digest.hexdigest()
+
+
+def GetStageKeys(stages):
+	"""Computes the cache key of each stage from its inputs and its dependencies' keys.
+
+	Args:
+		stages: list of stages, ordered so that each stage comes after its dependencies.
+	Returns:
+		Dictionary of stage name to cache key.
+	"""
+	keys = {}
+	for stage in stages:
+		salt = '\0'.join([stage.version, stage.name] + [keys[dep] for dep in stage.deps])
+		keys[stage.name] = HashFiles(stage.input_files, salt)
+	return keys
+
+
+def RunStages(stages, out_dir, cache_dir, profile=None):
+	"""Runs the stages needed to produce the outputs of the last stage into out_dir.
+
+	Stages whose outputs are in the cache are not run. The outputs of a cached
+	stage are only copied into out_dir when a stage depending on them has to run.
+	Stages whose dependencies are satisfied run concurrently.
+
+	Args:
+		stages: list of stages, ordered so that each stage comes after its dependencies.
+		out_dir: directory name of the output directory.
+		cache_dir: directory name of the cache directory, or None to disable caching.
+		profile: object to run the stages with and record them in, with a RunStage()
+			method and a stages dictionary, such as the Profile of amphtml-update.py, or None.
+	Returns:
+		Set of the names of the stages which ran, rather than being restored from the cache or not needed.
+	"""
+	logging.info('entering ...')
+
+	stages_by_name = dict((stage.name, stage) for stage in stages)
+	keys = GetStageKeys(stages)
+
+	def GetCachedDir(stage):
+		if cache_dir is None:
+			return None
+		stage_cache_dir = os.path.join(cache_dir, stage.name, keys[stage.name])
+		if os.path.isdir(stage_cache_dir):
+			return stage_cache_dir
+		return None
+
+	# Work back from the last stage to find which stages need to run or be restored from the cache.
+	to_restore = {}
+	to_run = set()
+	pending = [stages[-1].name]
+	while pending:
+		name = pending.pop()
+		if name in to_restore or name in to_run:
+			continue
+		stage_cache_dir = GetCachedDir(stages_by_name[name])
+		if stage_cache_dir is not None:
+			to_restore[name] = stage_cache_dir
+		else:
+			to_run.add(name)
+			pending.extend(stages_by_name[name].deps)
+
+	for (name, stage_cache_dir) in to_restore.items():
+		logging.info('%s: cache hit' % name)
+		if profile is not None:
+			profile.stages[name] = {'cached': True}
+		for output in stages_by_name[name].outputs:
+			CopyOutput(os.path.join(stage_cache_dir, output), out_dir)
+
+	ran = set(to_run)
+	done = set(to_restore)
+	pool = ThreadPool(max(1, len(to_run)))
+	try:
+		while to_run:
+			ready = [stage for stage in stages if stage.name in to_run and all(dep in done for dep in stage.deps)]
+			for stage in ready:
+				logging.info('%s: running' % stage.name)
+			if profile is None:
+				pool.map(lambda stage: stage.run(out_dir), ready)
+			else:
+				pool.map(lambda stage: profile.RunStage(stage, out_dir), ready)
+			for stage in ready:
+				if cache_dir is not None:
+					StoreStageOutputs(stage, out_dir, os.path.join(cache_dir, stage.name, keys[stage.name]))
+				to_run.remove(stage.name)
+				done.add(stage.name)
+	finally:
+		pool.close()
+
+	logging.info('... done')
+	return ran
+
+
+def StoreStageOutputs(stage, out_dir, stage_cache_dir):
+	"""Copies the outputs of a stage into the cache.
+
+	The outputs are copied into a temporary directory which is then renamed, so
+	that an interrupted run never leaves a partial cache entry behind.
+
+	Args:
+		stage: the stage that ran.
+		out_dir: directory name of the output directory.
+		stage_cache_dir: directory name of the cache entry.
+	"""
+	parent_dir = os.path.dirname(stage_cache_dir)
+	if not os.path.isdir(parent_dir):
+		os.makedirs(parent_dir)
+	tmp_dir = tempfile.mkdtemp(dir=parent_dir)
+	for output in stage.outputs:
+		CopyOutput(os.path.join(out_dir, output), tmp_dir)
+	try:
+		os.rename(tmp_dir, stage_cache_dir)
+	except OSError:
+		# Another run stored the same entry first.
+		shutil.rmtree(tmp_dir)
+
+
+def CopyOutput(src, dest_dir):
+	"""Copies a file or directory output of a stage into a directory.
+
+	Args:
+		src: path of the file or directory to copy.
+		dest_dir: directory to copy into.
+	"""
+	if os.path.isdir(src):
+		shutil.copytree(src, os.path.join(dest_dir, os.path.basename(src)))
+	else:
+		shutil.copy(src, dest_dir)
@@ -0,0 +1,174 @@
+"""
+Benchmark for the Phpize() emitter used by amphtml-update.py.
+
+Compares the native Python emitter against the former approach of piping each
+section through `php -r 'var_export(json_decode(...))'` and cleaning up the
+result with regular expressions. Both paths are also checked to produce
+identical output.
+
+To benchmark with the sections generated from an amphtml checkout, type:
+
+`python bin/phpize-benchmark.py --amphtml=/path/to/amphtml`
+
+Without an amphtml checkout a synthetic data set with a similar shape is used.
+"""
+
+import argparse
+import distutils.spawn
+import imp
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(os.path.dirname(os.path.realpath(__file__)), 'amphtml-update.py'))
+
+
+def PhpizeSubprocess(data, indent=0):
+	"""Converts data into PHP literals by way of var_export() in a PHP subprocess.
+
+	Args:
+		data: Any JSON-serializable.
+		indent: Number of tabs to prefix each line with.
+	Returns:
+		String formatted as PHP literal.
+	"""
+	json_string = json.dumps(data, sort_keys=True, ensure_ascii=False)
+
+	pipe = subprocess.Popen(['php', '-r', 'var_export( json_decode( file_get_contents( "php://stdin" ), true ) );'], stdout=subprocess.PIPE, stdin=subprocess.PIPE, stderr=subprocess.STDOUT)
+	php_stdout = pipe.communicate(input=json_string)[0]
+	php_exported = php_stdout.decode()
+
+	php_exported = re.sub( r'^ +', lambda match: ( len(match.group(0))/2 ) * '\t', php_exported, flags=re.MULTILINE )
+	php_exported = php_exported.replace( 'array (', 'array(' )
+	php_exported = re.sub( r' => \n\s+', ' => ', php_exported, flags=re.MULTILINE )
+	php_exported = re.sub( r'^(\s+)\d+ =>\s*', r'\1', php_exported, flags=re.MULTILINE )
+
+	if indent > 0:
+		php_exported = re.sub( r'^', '\t' * indent, php_exported, flags=re.MULTILINE )
+
+	# Fixups GeneratePHP used to apply to the whole file.
+	php_exported = re.sub("\\(\\s*\\)", "()", php_exported)
+	php_exported = re.sub("'True'", "true", php_exported)
+	php_exported = re.sub("'False'", "false", php_exported)
+	return php_exported
+
+
+def GetAmphtmlSections(amphtml_directory):
+	"""Parses the spec from an amphtml checkout into the sections GeneratePHP emits.
+
+	Args:
+		amphtml_directory: directory of the amphtml repo.
+	Returns:
+		Dictionary of section name to data.
+	"""
+	validator_directory = os.path.realpath(os.path.join(amphtml_directory, 'validator'))
+	out_dir = os.path.join(tempfile.gettempdir(), 'amp_wp_phpize_benchmark')
+
+	amphtml_update.SetupOutDir(out_dir)
+	amphtml_update.GenValidatorDescriptor(validator_directory, out_dir)
+	amphtml_update.GenValidatorRules(validator_directory, out_dir)
+	allowed_tags, attr_lists, descendant_lists, reference_points, versions = amphtml_update.ParseRules(out_dir)
+
+	return {
+		'descendant_tag_lists': descendant_lists,
+		'allowed_tags': allowed_tags,
+		'layout_allowed_attrs': attr_lists['$AMP_LAYOUT_ATTRS'],
+		'globally_allowed_attrs': attr_lists['$GLOBAL_ATTRS'],
+		'reference_points': reference_points,
+	}
+
+
+def GetSyntheticSections(tag_count):
+	"""Builds a data set shaped like the allowed tags table.
+
+	Args:
+		tag_count: Number of tags to generate.
+	Returns:
+		Dictionary of section name to data.
+	"""
+	allowed_tags = {}
+	for i in range(tag_count):
+		attr_spec_list = {}
+		for j in range(12):
+			attr_spec_list['data-attr-%d' % j] = {
+				'mandatory': j == 0,
+				'value': ['value-%d' % k for k in range(j % 4)],
+				'value_regex': '(\\d+)|(it\'s-%d)' % j,
+				'value_url': {'allow_relative': True, 'protocol': ['http', 'https']},
+			}
+		allowed_tags['amp-synthetic-%d' % i] = [
+			{
+				'attr_spec_list': attr_spec_list,
+				'tag_spec': {
+					'amp_layout': {'supported_layouts': [1, 2, 3, 4]},
+					'requires_extension': ['amp-synthetic-%d' % i],
+					'spec_name': 'amp-synthetic-%d' % i,
+				},
+			},
+		]
+	return {
+		'descendant_tag_lists': {'synthetic-descendants': sorted(allowed_tags.keys())},
+		'allowed_tags': allowed_tags,
+		'reference_points': {},
+	}
+
+
+def TimePhpize(phpize, sections, iterations):
+	"""Times converting every section into PHP.
+
+	Args:
+		phpize: function converting data into PHP literals.
+		sections: dictionary of section name to data.
+		iterations: number of times to convert the sections.
+	Returns:
+		Tuple of the fastest duration in seconds and the output for each section.
+	"""
+	best = None
+	for _ in range(iterations):
+		start = time.time()
+		output = dict((name, phpize(data, 1)) for (name, data) in sections.items())
+		duration = time.time() - start
+		if best is None or duration < best:
+			best = duration
+	return best, output
+
+
+def Main():
+	parser = argparse.ArgumentParser(description='Benchmark Phpize() against the var_export() subprocess it replaced.')
+	parser.add_argument('--amphtml', help='Path to an amphtml checkout to take the sections from.')
+	parser.add_argument('--tags', type=int, default=500, help='Number of synthetic tags when no amphtml checkout is supplied.')
+	parser.add_argument('--iterations', type=int, default=5, help='Number of runs; the fastest one is reported.')
+	args = parser.parse_args()
+
+	if args.amphtml:
+		sections = GetAmphtmlSections(args.amphtml)
+	else:
+		sections = GetSyntheticSections(args.tags)
+
+	native_duration, native_output = TimePhpize(amphtml_update.Phpize, sections, args.iterations)
+	output_bytes = sum(len(php) for php in native_output.values())
+
+	sys.stdout.write('Sections: %d, output: %d bytes\n' % (len(sections), output_bytes))
+	sys.stdout.write('Native:     %8.3fs %10.1f MB/s\n' % (native_duration, output_bytes / native_duration / 1e6))
+
+	if not distutils.spawn.find_executable('php'):
+		sys.stdout.write('Subprocess: skipped, php is not installed\n')
+		return
+
+	subprocess_duration, subprocess_output = TimePhpize(PhpizeSubprocess, sections, args.iterations)
+	sys.stdout.write('Subprocess: %8.3fs %10.1f MB/s\n' % (subprocess_duration, output_bytes / subprocess_duration / 1e6))
+	sys.stdout.write('Speedup:    %8.1fx\n' % (subprocess_duration / native_duration))
+
+	mismatched = [name for name in sections if native_output[name] != subprocess_output[name]]
+	if mismatched:
+		sys.stdout.write('Output differs for: %s\n' % ', '.join(sorted(mismatched)))
+		sys.exit(1)
+	sys.stdout.write('Output is identical.\n')
+
+
+if __name__ == '__main__':
+	Main()
@@ -0,0 +1,84 @@
+"""
+Tests for the Phpize() emitter of amphtml-update.py.
+
+The expected literals are what piping the JSON-encoded data through PHP's
+var_export() and the regular expressions GeneratePHP used to clean it up with
+outputs. With PHP installed, that former approach is run too.
+"""
+
+import distutils.spawn
+import imp
+import os
+import sys
+import unittest
+
+BIN_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+sys.path.insert(0, BIN_DIR)
+amphtml_update = imp.load_source('amphtml_update', os.path.join(BIN_DIR, 'amphtml-update.py'))
+
+# Pairs of data and the PHP literal the former approach output for it.
+PHPIZE_CASES = [
+	(None, 'NULL'),
+	(True, 'true'),
+	(False, 'false'),
+	(0, '0'),
+	(-42, '-42'),
+	(1.5, '1.5'),
+	(2.0, '2.0'),
+	(1e25, '1.0E+25'),
+	(1.5e-7, '1.5E-7'),
+	('', "''"),
+	('True', 'true'),
+	('False', 'false'),
+	("it's a \\ path", "'it\\'s a \\\\ path'"),
+	('a\0b', '\'a\' . "\\0" . \'b\''),
+	([], 'array()'),
+	({}, 'array()'),
+	(['a', 1, None], "array(\n\t'a',\n\t1,\n\tNULL,\n)"),
+	(
+		{'b': [], 'a': {'value_regex': '[0-9]+', 'mandatory': True}, 'c': [['x']]},
+		"array(\n\t'a' => array(\n\t\t'mandatory' => true,\n\t\t'value_regex' => '[0-9]+',\n\t),\n\t'b' => array(),\n\t'c' => array(\n\t\tarray(\n\t\t\t'x',\n\t\t),\n\t),\n)",
+	),
+	({'0': 'zero', '1': 'one'}, "array(\n\t'zero',\n\t'one',\n)"),
+	({'01': 'a', '1.5': 'b', '-0': 'c'}, "array(\n\t'-0' => 'c',\n\t'01' => 'a',\n\t'1.5' => 'b',\n)"),
+	({'value': 'line 1\nline 2'}, "array(\n\t'value' => 'line 1\nline 2',\n)"),
+]
+
+
+class PhpizeTest(unittest.TestCase):
+
+	def test_phpize(self):
+		"""Each value is output as the PHP literal the former approach output."""
+		for (data, expected) in PHPIZE_CASES:
+			self.assertEqual(expected, amphtml_update.Phpize(data), repr(data))
+
+	def test_phpize_indent(self):
+		"""Every line is indented, including the continuation lines of multi-line strings."""
+		self.assertEqual("\t\tarray(\n\t\t\t'a' => 'line 1\n\t\tline 2',\n\t\t\t'b' => array(),\n\t\t)", amphtml_update.Phpize({'a': 'line 1\nline 2', 'b': {}}, 2))
+
+	def test_phpize_property(self):
+		"""Properties are output line by line, as the generated class has them."""
+		out = []
+		amphtml_update.PhpizeProperty(out, 'allowed_tags', {'a': [{'tag_spec': {}}]})
+		self.assertEqual([
+			"\tprivate static $allowed_tags = array(",
+			"\t\t'a' => array(",
+			"\t\t\tarray(",
+			"\t\t\t\t'tag_spec' => array(),",
+			"\t\t\t),",
+			"\t\t),",
+			"\t);",
+		], out)
+
+	@unittest.skipUnless(distutils.spawn.find_executable('php'), 'php is not installed')
+	def test_same_as_var_export(self):
+		"""The output is byte-identical to the former approach of running var_export() in a PHP subprocess."""
+		phpize_benchmark = imp.load_source('phpize_benchmark', os.path.join(BIN_DIR, 'phpize-benchmark.py'))
+		for (data, expected) in PHPIZE_CASES:
+			self.assertEqual(phpize_benchmark.PhpizeSubprocess(data), amphtml_update.Phpize(data), repr(data))
+			self.assertEqual(phpize_benchmark.PhpizeSubprocess(data, 1), amphtml_update.Phpize(data, 1), repr(data))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,179 @@
+"""
+Tests for the ProtoParser of amphtml-update.py.
+
+To run the tests of the generator, type:
+
+`python -m unittest discover -s bin/tests`
+"""
+
+import distutils.spawn
+import imp
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from google.protobuf import descriptor_pb2
+from google.protobuf import text_format
+
+BIN_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures')
+
+sys.path.insert(0, BIN_DIR)
+amphtml_update = imp.load_source('amphtml_update', os.path.join(BIN_DIR, 'amphtml-update.py'))
+
+
+def ParseFixture(name):
+	"""Parses a fixture .proto file with ProtoParser.
+
+	Args:
+		name: file name of the fixture.
+	Returns:
+		FileDescriptorProto.
+	"""
+	f = open(os.path.join(FIXTURES_DIR, name))
+	source = f.read()
+	f.close()
+	return amphtml_update.ProtoParser(source, name).Parse()
+
+
+def ClearSkipped(message_protos):
+	"""Clears what ProtoParser skips from the messages of a FileDescriptorProto protoc built.
+
+	Args:
+		message_protos: DescriptorProtos to clear, along with their nested types.
+	"""
+	for message_proto in message_protos:
+		message_proto.ClearField('reserved_range')
+		message_proto.ClearField('reserved_name')
+		message_proto.ClearField('extension_range')
+		ClearSkipped(message_proto.nested_type)
+
+
+class ProtoParserTest(unittest.TestCase):
+
+	def setUp(self):
+		self.file_proto = ParseFixture('nested.proto')
+		self.outer = self.file_proto.message_type[0]
+		self.fields = dict((field.name, field) for field in self.outer.field)
+
+	def test_parse(self):
+		"""The fixture is parsed into the FileDescriptorProto protoc builds, less the options, reserved and extensions statements."""
+		expected = descriptor_pb2.FileDescriptorProto()
+		f = open(os.path.join(FIXTURES_DIR, 'nested.descriptor.txt'))
+		text_format.Merge(f.read(), expected)
+		f.close()
+		self.assertEqual(text_format.MessageToString(expected), text_format.MessageToString(self.file_proto))
+
+	def test_nested_types(self):
+		"""Type names are resolved from the innermost scope out."""
+		self.assertEqual(['Outer', 'Empty'], [message.name for message in self.file_proto.message_type])
+		inner = self.outer.nested_type[0]
+		self.assertEqual('Inner', inner.name)
+		self.assertEqual('Leaf', inner.nested_type[0].name)
+		self.assertEqual('Kind', self.outer.enum_type[0].name)
+
+		inner_fields = dict((field.name, field) for field in inner.field)
+		self.assertEqual('.amp.test.Outer.Inner.Leaf', inner_fields['leaf'].type_name)
+		self.assertEqual(descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE, inner_fields['leaf'].type)
+		self.assertEqual('.amp.test.Outer.Kind', inner_fields['kind'].type_name)
+		self.assertEqual(descriptor_pb2.FieldDescriptorProto.TYPE_ENUM, inner_fields['kind'].type)
+		self.assertEqual('.amp.test.Outer', inner_fields['outer'].type_name)
+		self.assertEqual('.amp.test.Outer.Inner.Leaf', self.fields['leaf'].type_name)
+		self.assertEqual('.amp.test.Outer.Kind', self.fields['kind'].type_name)
+		self.assertEqual('.amp.test.Status', self.fields['status'].type_name)
+
+	def test_oneofs(self):
+		"""The fields of a oneof are optional and point at its declaration."""
+		self.assertEqual(['value'], [oneof.name for oneof in self.outer.oneof_decl])
+		for name in ('text', 'node', 'number'):
+			self.assertTrue(self.fields[name].HasField('oneof_index'))
+			self.assertEqual(0, self.fields[name].oneof_index)
+			self.assertEqual(descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL, self.fields[name].label)
+		self.assertFalse(self.fields['name'].HasField('oneof_index'))
+		self.assertEqual('.amp.test.Outer.Inner.Leaf', self.fields['node'].type_name)
+
+	def test_defaults(self):
+		"""Default values are formatted the way protoc does."""
+		expected = {
+			'count': '-16',
+			'limit': '18446744073709551615',
+			'ratio': '1000',
+			'scale': '-inf',
+			'enabled': 'true',
+			'label': 'a "quoted"\nlabel',
+			'data': '\\001\\002',
+			'status': 'ENABLED',
+			'number': '7',
+		}
+		for (name, field) in self.fields.items():
+			if name in expected:
+				self.assertEqual(expected[name], field.default_value, name)
+			else:
+				self.assertFalse(field.HasField('default_value'), name)
+		self.assertEqual('KIND_TAG', self.outer.nested_type[0].field[1].default_value)
+
+	def test_options(self):
+		"""The packed, deprecated, json_name and allow_alias options are kept."""
+		self.assertTrue(self.fields['values'].options.packed)
+		self.assertTrue(self.fields['status'].options.deprecated)
+		self.assertFalse(self.fields['count'].HasField('options'))
+		self.assertEqual('theLeaf', self.fields['leaf'].json_name)
+		self.assertEqual('count', self.fields['count'].json_name)
+
+		status = self.file_proto.enum_type[0]
+		self.assertTrue(status.options.allow_alias)
+		self.assertEqual([('UNKNOWN', 0), ('ACTIVE', 1), ('ENABLED', 1), ('RETIRED', 2)], [(value.name, value.number) for value in status.value])
+		self.assertTrue(status.value[3].options.deprecated)
+		self.assertEqual(2, self.outer.enum_type[0].value[2].number)
+
+		# File options, reserved and extensions statements are skipped.
+		self.assertFalse(self.file_proto.HasField('options'))
+		self.assertEqual(0, len(self.outer.reserved_range))
+		self.assertEqual(0, len(self.outer.extension_range))
+
+	def test_json_names(self):
+		"""JSON names default to the lower camel case field names."""
+		source = 'syntax = "proto2";\nmessage M {\n  optional string tag_spec_name = 1;\n  optional int32 html_format_2 = 2;\n}\n'
+		file_proto = amphtml_update.ProtoParser(source, 'json.proto').Parse()
+		self.assertEqual(['tagSpecName', 'htmlFormat2'], [field.json_name for field in file_proto.message_type[0].field])
+
+	def test_errors(self):
+		"""Unsupported syntax, statements and types are rejected with the line they are on."""
+		sources = {
+			'syntax = "proto3";\n': 'errors.proto:1: unsupported syntax',
+			'syntax = "proto2";\nimport "other.proto";\n': 'errors.proto:2: unsupported statement',
+			'message M {\n  optional group Result = 1 {\n  }\n}\n': "errors.proto:2: unsupported field type 'group'",
+			'message M {\n  map<string, int32> m = 1;\n}\n': "errors.proto:2: unsupported field or statement 'map'",
+			'message M {\n  optional Missing m = 1;\n}\n': "Missing' in M",
+			'message M {\n  optional string s = 1\n}\n': "errors.proto:3: expected ';'",
+			'message M {\n  optional string s = 1;\n': 'unexpected end of file',
+			'message M {\n  optional string s = 1; #\n}\n': "errors.proto:2: unexpected character '#'",
+		}
+		for (source, message) in sources.items():
+			with self.assertRaises(ValueError) as context:
+				amphtml_update.ProtoParser(source, 'errors.proto').Parse()
+			self.assertIn(message, str(context.exception))
+
+	@unittest.skipUnless(distutils.spawn.find_executable('protoc'), 'protoc is not installed')
+	def test_same_as_protoc(self):
+		"""The FileDescriptorProto equals the one protoc --descriptor_set_out builds, less what ProtoParser skips."""
+		(handle, descriptor_file) = tempfile.mkstemp(suffix='.desc')
+		os.close(handle)
+		try:
+			subprocess.check_call(['protoc', '--descriptor_set_out=%s' % descriptor_file, 'nested.proto'], cwd=FIXTURES_DIR)
+			f = open(descriptor_file, 'rb')
+			file_descriptor_set = descriptor_pb2.FileDescriptorSet.FromString(f.read())
+			f.close()
+		finally:
+			os.unlink(descriptor_file)
+
+		expected = file_descriptor_set.file[0]
+		expected.ClearField('options')
+		ClearSkipped(expected.message_type)
+		self.assertEqual(text_format.MessageToString(expected), text_format.MessageToString(self.file_proto))
+
+
+if __name__ == '__main__':
+	unittest.main()
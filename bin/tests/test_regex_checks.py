@@ -0,0 +1,74 @@
+"""
+Tests for the checks amphtml_regex runs on the regexes of the specs.
+"""
+
+import os
+import sys
+import unittest
+
+BIN_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+sys.path.insert(0, BIN_DIR)
+import amphtml_regex
+
+NESTED_QUANTIFIER = 'nested quantifier: an unbounded repetition contains another which can match the same characters'
+OVERLAPPING_ALTERNATIVES = 'overlapping alternatives: an unbounded repetition has alternatives which match the same characters'
+
+
+class GetRegexProblemsTest(unittest.TestCase):
+
+	def test_nested_quantifiers(self):
+		"""Unbounded repetitions inside unbounded repetitions which can match the same characters are reported."""
+		for regex in (r'(a+)+', r'(\d+)*', r'([0-9]+\.?)+', r'(.*,)*x', r'(a*b*)+c', r'(?:[a-z]+\s?)+$'):
+			self.assertEqual([NESTED_QUANTIFIER], amphtml_regex.GetRegexProblems(regex), regex)
+
+	def test_overlapping_alternatives(self):
+		"""Unbounded repetitions of alternatives which match the same characters are reported."""
+		for regex in (r'(\w|\d)+', r'(a|a)*', r'(?:foo|bar|foo)+', r'([a-f]|[0-9]|\d)+', r'(\s| )+'):
+			self.assertEqual([OVERLAPPING_ALTERNATIVES], amphtml_regex.GetRegexProblems(regex), regex)
+
+	def test_case_insensitive(self):
+		"""Alternatives only overlap case-insensitively for value_regex_casei."""
+		self.assertEqual([], amphtml_regex.GetRegexProblems(r'([a-z]|[A-Z0-9])+'))
+		self.assertEqual([OVERLAPPING_ALTERNATIVES], amphtml_regex.GetRegexProblems(r'([a-z]|[A-Z0-9])+', True))
+
+	def test_safe(self):
+		"""Repetitions which can only match a value one way are not reported."""
+		regexes = (
+			r'[0-9]+(\.[0-9]+)*',
+			r'([a-z]+-)*[a-z]+',
+			r'(ab|cd)+',
+			r'(ab|ac)+',
+			r'(a{1,3})+',
+			r'(\s*,\s*)+',
+			r'https?://[^/]+(/[^/]*)*',
+			r'(auto|fill|fixed|fixed-height|flex-item|intrinsic|nodisplay|responsive)',
+			r'\p{L}+(\s\p{L}+)*',
+			r'(?<name>[a-z]+)-\d+',
+			u'\\x{4e00}+',
+		)
+		for regex in regexes:
+			self.assertEqual([], amphtml_regex.GetRegexProblems(regex), regex)
+
+	def test_invalid(self):
+		"""Regexes which do not parse, or have escapes PCRE does not support, are reported as invalid."""
+		for regex in (r'[a-z', r'(a', r'a{2,1}', r'\Lx'):
+			problems = amphtml_regex.GetRegexProblems(regex)
+			self.assertEqual(1, len(problems), regex)
+			self.assertTrue(problems[0].startswith('invalid: '), regex)
+
+
+class GetPcrePatternTest(unittest.TestCase):
+
+	def test_pcre_patterns(self):
+		"""The regexes are delimited, anchored and given modifiers as the sanitizer matches them."""
+		for (key, (delimiter, modifiers, anchored)) in amphtml_regex.PCRE_PATTERN_FORMATS.items():
+			pattern = amphtml_regex.GetPcrePattern('a%sb\\%sc' % (delimiter, delimiter), key)
+			body = 'a\\%sb\\%sc' % (delimiter, delimiter)
+			if anchored:
+				body = '^(%s)$' % body
+			self.assertEqual(delimiter + body + delimiter + modifiers, pattern, key)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for the snapshot encoders of amphtml_snapshot.
+
+The expected encodings are what PHP's serialize(), igbinary_serialize() and
+msgpack_pack() output for the values which the PHP literals of the same data
+evaluate to.
+"""
+
+import os
+import struct
+import sys
+import unittest
+
+BIN_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+sys.path.insert(0, BIN_DIR)
+import amphtml_snapshot
+
+# Keys which json_decode() turns into integers, strings which are booleans in the
+# PHP literals, and a float.
+DATA = {'b': [1, 'True', None], 'a': 'x', '7': 2.5}
+
+
+class SerializeSnapshotTest(unittest.TestCase):
+
+	def test_serialize(self):
+		"""The data is encoded as serialize() encodes the PHP array."""
+		self.assertEqual('a:3:{i:7;d:2.5;s:1:"a";s:1:"x";s:1:"b";a:3:{i:0;i:1;i:1;b:1;i:2;N;}}', amphtml_snapshot.SerializeSnapshot(DATA, 'serialize'))
+
+	def test_igbinary(self):
+		"""The data is encoded as igbinary_serialize() encodes the PHP array, with repeated strings referring to their first occurrence."""
+		expected = ''.join([
+			'\x00\x00\x00\x02',
+			'\x14\x03',
+			'\x06\x07', '\x0c' + struct.pack('>d', 2.5),
+			'\x11\x01a', '\x11\x01x',
+			'\x11\x01b', '\x14\x03', '\x06\x00\x06\x01', '\x06\x01\x05', '\x06\x02\x00',
+		])
+		self.assertEqual(expected, amphtml_snapshot.SerializeSnapshot(DATA, 'igbinary'))
+		self.assertEqual('\x00\x00\x00\x02\x14\x02\x06\x00\x11\x01s\x06\x01\x0e\x00', amphtml_snapshot.SerializeSnapshot(['s', 's'], 'igbinary'))
+
+	def test_msgpack(self):
+		"""The data is encoded as msgpack_pack() encodes the PHP array, with lists as msgpack arrays."""
+		expected = '\x83\x07\xcb' + struct.pack('>d', 2.5) + '\xa1a\xa1x\xa1b\x93\x01\xc3\xc0'
+		self.assertEqual(expected, amphtml_snapshot.SerializeSnapshot(DATA, 'msgpack'))
+		self.assertEqual('\x93\xcd\x01\x00\xd0\x80\xda\x00\x20' + 'a' * 32, amphtml_snapshot.SerializeSnapshot([256, -128, 'a' * 32], 'msgpack'))
+
+	def test_unknown_format(self):
+		"""Formats other than SNAPSHOT_FORMATS are rejected."""
+		with self.assertRaises(ValueError):
+			amphtml_snapshot.SerializeSnapshot(DATA, 'json')
+
+
+class GetPhpIntKeyTest(unittest.TestCase):
+
+	def test_int_keys(self):
+		"""Only the keys which json_decode() turns into integers are integers."""
+		keys = {
+			'0': 0,
+			'7': 7,
+			'-1': -1,
+			'9223372036854775807': 2 ** 63 - 1,
+			'9223372036854775808': None,
+			'01': None,
+			'-0': None,
+			'1.5': None,
+			'a': None,
+			3: 3,
+			True: None,
+		}
+		for (key, expected) in keys.items():
+			self.assertEqual(expected, amphtml_snapshot.GetPhpIntKey(key), repr(key))
+
+
+if __name__ == '__main__':
+	unittest.main()
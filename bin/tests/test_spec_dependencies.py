@@ -0,0 +1,92 @@
+"""
+Tests for the dependencies amphtml-update.py precomputes for the tag specs.
+"""
+
+import imp
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+BIN_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+sys.path.insert(0, BIN_DIR)
+amphtml_update = imp.load_source('amphtml_update', os.path.join(BIN_DIR, 'amphtml-update.py'))
+
+
+def TagSpec(**tag_spec):
+	"""Builds a tag spec as ParseRules() outputs it.
+
+	Args:
+		**tag_spec: the keys of its tag_spec.
+	Returns:
+		Tag spec.
+	"""
+	return {'tag_spec': tag_spec, 'attr_spec_list': {}, 'precomputed': {}}
+
+
+class AddSpecDependenciesTest(unittest.TestCase):
+
+	def setUp(self):
+		logging.disable(logging.WARNING)
+		self.out_dir = tempfile.mkdtemp()
+		self.allowed_tags = {
+			'amp-a': [TagSpec(spec_name='amp-a', requires_extension=['amp-a'], also_requires_tag=['amp-b'])],
+			'amp-b': [TagSpec(spec_name='amp-b', requires_extension=['amp-b'], also_requires_tag_warning=['amp-a'])],
+			'amp-c': [TagSpec(spec_name='amp-c', requires_extension=['amp-c'], also_requires_tag=['amp-d'], reference_points={'amp-c child': {}, 'amp-c missing': {}})],
+			'script': [
+				TagSpec(spec_name='amp-a script', extension_spec={'name': 'amp-a'}),
+				TagSpec(spec_name='amp-b script', extension_spec={'name': 'amp-b'}),
+			],
+		}
+		self.reference_points = {
+			'amp-c child': {'tag_spec': {}, 'attr_spec_list': {'option': {'mandatory': True, 'value': 'x'}}},
+		}
+
+	def tearDown(self):
+		shutil.rmtree(self.out_dir)
+		logging.disable(logging.NOTSET)
+
+	def test_precomputed(self):
+		"""Required extensions are collected transitively, and reference point attributes are merged."""
+		amphtml_update.AddSpecDependencies(self.out_dir, self.allowed_tags, self.reference_points)
+		self.assertEqual({'required_extensions': ['amp-a', 'amp-b']}, self.allowed_tags['amp-a'][0]['precomputed'])
+		self.assertEqual({'required_extensions': ['amp-a', 'amp-b']}, self.allowed_tags['amp-b'][0]['precomputed'])
+		self.assertEqual({
+			'required_extensions': ['amp-c'],
+			'reference_point_attrs': {'option': {'value': 'x'}},
+		}, self.allowed_tags['amp-c'][0]['precomputed'])
+
+	def test_report(self):
+		"""Cycles and missing dependencies are written to the report."""
+		amphtml_update.AddSpecDependencies(self.out_dir, self.allowed_tags, self.reference_points)
+		f = open(os.path.join(self.out_dir, amphtml_update.DEPENDENCY_REPORT_FILE))
+		report = json.load(f)
+		f.close()
+		self.assertEqual({
+			'cycles': ['amp-a -> amp-b -> amp-a'],
+			'missing': [
+				{'spec': 'amp-c', 'type': 'tag_spec', 'name': 'amp-d'},
+				{'spec': 'amp-c', 'type': 'extension', 'name': 'amp-c'},
+				{'spec': 'amp-c', 'type': 'reference_point', 'name': 'amp-c missing'},
+			],
+		}, report)
+
+	def test_strict(self):
+		"""With --strict-dependencies, cycles and missing dependencies fail the build after the report is written."""
+		with self.assertRaises(ValueError) as context:
+			amphtml_update.AddSpecDependencies(self.out_dir, self.allowed_tags, self.reference_points, True)
+		self.assertIn('Dependency cycle: amp-a -> amp-b -> amp-a', str(context.exception))
+		self.assertIn("amp-c has the reference point 'amp-c missing', which does not exist", str(context.exception))
+		self.assertTrue(os.path.exists(os.path.join(self.out_dir, amphtml_update.DEPENDENCY_REPORT_FILE)))
+
+		del self.allowed_tags['amp-c']
+		self.allowed_tags['amp-b'][0]['tag_spec'].pop('also_requires_tag_warning')
+		amphtml_update.AddSpecDependencies(self.out_dir, self.allowed_tags, self.reference_points, True)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,124 @@
+"""
+Tests for the cached stage graph of amphtml_stages.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+BIN_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+sys.path.insert(0, BIN_DIR)
+import amphtml_stages
+
+
+class RunStagesTest(unittest.TestCase):
+
+	def setUp(self):
+		self.tmp_dir = tempfile.mkdtemp()
+		self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+		self.input_file = os.path.join(self.tmp_dir, 'input.txt')
+		self.WriteFile(self.input_file, 'a')
+		self.runs = 0
+
+	def tearDown(self):
+		shutil.rmtree(self.tmp_dir)
+
+	def WriteFile(self, path, contents):
+		f = open(path, 'w')
+		f.write(contents)
+		f.close()
+
+	def ReadFile(self, path):
+		f = open(path)
+		contents = f.read()
+		f.close()
+		return contents
+
+	def GetStages(self, version='1'):
+		"""Gets a stage copying the input file, and a stage writing the copy twice into a directory."""
+
+		def Copy(out_dir):
+			self.WriteFile(os.path.join(out_dir, 'copy.txt'), self.ReadFile(self.input_file))
+
+		def Double(out_dir):
+			os.mkdir(os.path.join(out_dir, 'double'))
+			self.WriteFile(os.path.join(out_dir, 'double', 'double.txt'), self.ReadFile(os.path.join(out_dir, 'copy.txt')) * 2)
+
+		return [
+			amphtml_stages.Stage(name='copy', deps=(), input_files=[self.input_file], outputs=('copy.txt',), run=Copy, version='1'),
+			amphtml_stages.Stage(name='double', deps=('copy',), input_files=[], outputs=('double',), run=Double, version=version),
+		]
+
+	def Run(self, stages, cache_dir):
+		"""Runs the stages into a new output directory.
+
+		Returns:
+			Tuple of the names of the stages which ran and the output of the last stage.
+		"""
+		self.runs += 1
+		out_dir = os.path.join(self.tmp_dir, 'out-%d' % self.runs)
+		os.mkdir(out_dir)
+		ran = amphtml_stages.RunStages(stages, out_dir, cache_dir)
+		return ran, self.ReadFile(os.path.join(out_dir, 'double', 'double.txt'))
+
+	def test_cache(self):
+		"""Stages only run when their inputs, dependencies or version changed, and are restored from the cache otherwise."""
+		self.assertEqual(({'copy', 'double'}, 'aa'), self.Run(self.GetStages(), self.cache_dir))
+		self.assertEqual((set(), 'aa'), self.Run(self.GetStages(), self.cache_dir))
+		self.assertEqual(({'double'}, 'aa'), self.Run(self.GetStages('2'), self.cache_dir))
+
+		self.WriteFile(self.input_file, 'b')
+		self.assertEqual(({'copy', 'double'}, 'bb'), self.Run(self.GetStages(), self.cache_dir))
+		self.WriteFile(self.input_file, 'a')
+		self.assertEqual((set(), 'aa'), self.Run(self.GetStages(), self.cache_dir))
+
+	def test_no_cache(self):
+		"""Without a cache directory every stage runs."""
+		self.assertEqual(({'copy', 'double'}, 'aa'), self.Run(self.GetStages(), None))
+		self.assertEqual(({'copy', 'double'}, 'aa'), self.Run(self.GetStages(), None))
+		self.assertFalse(os.path.exists(self.cache_dir))
+
+	def test_failed_stage(self):
+		"""The outputs of a stage which fails are not cached."""
+
+		def Fail(out_dir):
+			raise ValueError('failed')
+
+		stages = self.GetStages()
+		stages[1] = stages[1]._replace(run=Fail)
+		with self.assertRaises(ValueError):
+			self.Run(stages, self.cache_dir)
+		self.assertEqual(({'double'}, 'aa'), self.Run(self.GetStages(), self.cache_dir))
+
+
+class HashFilesTest(unittest.TestCase):
+
+	def test_hash_files(self):
+		"""The hash changes with the contents and names of the files and the salt."""
+		tmp_dir = tempfile.mkdtemp()
+		try:
+			path = os.path.join(tmp_dir, 'a.txt')
+			f = open(path, 'w')
+			f.write('a')
+			f.close()
+			digest = amphtml_stages.HashFiles([path])
+			self.assertEqual(digest, amphtml_stages.HashFiles([path]))
+			self.assertNotEqual(digest, amphtml_stages.HashFiles([path], 'salt'))
+
+			other_path = os.path.join(tmp_dir, 'b.txt')
+			shutil.copy(path, other_path)
+			self.assertNotEqual(digest, amphtml_stages.HashFiles([other_path]))
+
+			f = open(path, 'w')
+			f.write('b')
+			f.close()
+			self.assertNotEqual(digest, amphtml_stages.HashFiles([path]))
+		finally:
+			shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -443,11 +443,13 @@ function amp_register_default_scripts( $wp_scripts ) {
 
 	// Get all AMP components as defined in the spec.
 	$extensions = array();
-	foreach ( AMP_Allowed_Tags_Generated::get_allowed_tag( 'script' ) as $script_spec ) {
-		if ( isset( $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['name'], $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['version'] ) ) {
-			$versions = $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['version'];
-			array_pop( $versions );
-			$extensions[ $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['name'] ] = array_pop( $versions );
+	foreach ( AMP_Allowed_Tags_Generated::get_extension_names() as $extension_name ) {
+		foreach ( AMP_Allowed_Tags_Generated::get_extension_script_specs( $extension_name ) as $script_spec ) {
+			if ( isset( $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['version'] ) ) {
+				$versions = $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['version'];
+				array_pop( $versions );
+				$extensions[ $extension_name ] = array_pop( $versions );
+			}
 		}
 	}
 
@@ -599,13 +601,11 @@ function amp_filter_font_style_loader_tag_with_crossorigin_anonymous( $tag, $han
 	static $allowed_font_src_regex = null;
 	unset( $handle );
 	if ( ! $allowed_font_src_regex ) {
-		$spec_name = 'link rel=stylesheet for fonts'; // phpcs:ignore WordPress.WP.EnqueuedResources.NonEnqueuedStylesheet
-		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tag( 'link' ) as $spec_rule ) {
-			if ( isset( $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) && $spec_name === $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) {
-				$allowed_font_src_regex = '@^(' . $spec_rule[ AMP_Rule_Spec::ATTR_SPEC_LIST ]['href']['value_regex'] . ')$@';
-				break;
-			}
+		$css_rules = AMP_Allowed_Tags_Generated::get_css_rules( 'link rel=stylesheet for fonts' ); // phpcs:ignore WordPress.WP.EnqueuedResources.NonEnqueuedStylesheet
+		if ( ! $css_rules ) {
+			return $tag;
 		}
+		$allowed_font_src_regex = $css_rules['font_url_regex'];
 	}
 
 	$href = preg_replace( '#^(http:)?(?=//)#', 'https:', $href );
@@ -454,6 +454,7 @@ class AMP_Allowed_Tags_Generated {
 					'download' => array(),
 					'href' => array(
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
 						'value_url' => array(
 							'allow_empty' => true,
 							'protocol' => array(
@@ -482,16 +483,41 @@ class AMP_Allowed_Tags_Generated {
 								'wh',
 								'whatsapp',
 							),
+							'protocol_set' => array(
+								'bbmi' => true,
+								'bip' => true,
+								'fb-me' => true,
+								'fb-messenger' => true,
+								'ftp' => true,
+								'geo' => true,
+								'http' => true,
+								'https' => true,
+								'intent' => true,
+								'line' => true,
+								'mailto' => true,
+								'maps' => true,
+								'skype' => true,
+								'sms' => true,
+								'snapchat' => true,
+								'tel' => true,
+								'tg' => true,
+								'threema' => true,
+								'twitter' => true,
+								'viber' => true,
+								'web+mastodon' => true,
+								'webcal' => true,
+								'wh' => true,
+								'whatsapp' => true,
+							),
 						),
 					),
 					'hreflang' => array(),
 					'media' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 					'referrerpolicy' => array(),
 					'rel' => array(
 						'blacklisted_value_regex' => '(^|\\s)(components|dns-prefetch|import|manifest|preconnect|prefetch|preload|prerender|serviceworker|stylesheet|subresource|)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(components|dns-prefetch|import|manifest|preconnect|prefetch|preload|prerender|serviceworker|stylesheet|subresource|)(\\s|$)/u',
 					),
 					'role' => array(),
 					'tabindex' => array(),
@@ -501,13 +527,22 @@ class AMP_Allowed_Tags_Generated {
 							'_self',
 							'_top',
 						),
+						'value_set' => array(
+							'_blank' => true,
+							'_self' => true,
+							'_top' => true,
+						),
 					),
 					'type' => array(
 						'value_casei' => array(
 							'text/html',
 						),
+						'value_casei_set' => array(
+							'text/html' => true,
+						),
 					),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#links',
 				),
@@ -516,65 +551,53 @@ class AMP_Allowed_Tags_Generated {
 		'abbr' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'acronym' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'address' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'amp-3d-gltf' => array(
 			array(
 				'attr_spec_list' => array(
-					'alpha' => array(
-						'value' => array(
-							'false',
-							'true',
-						),
-					),
-					'antialiasing' => array(
-						'value' => array(
-							'false',
-							'true',
-						),
-					),
-					'autorotate' => array(
-						'value' => array(
-							'false',
-							'true',
-						),
-					),
+					'alpha' => 1,
+					'antialiasing' => 1,
+					'autorotate' => 1,
 					'clearcolor' => array(),
-					'enablezoom' => array(
-						'value' => array(
-							'false',
-							'true',
-						),
-					),
+					'enablezoom' => 1,
 					'maxpixelratio' => array(
 						'value_regex' => '[+-]?(\\d*\\.)?\\d+',
+						'value_regex_pcre' => '/^([+-]?(\\d*\\.)?\\d+)$/u',
 					),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'src' => 3,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
 					),
-					'src' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'https',
-							),
-						),
+					'required_extensions' => array(
+						'amp-3d-gltf',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -596,19 +619,23 @@ class AMP_Allowed_Tags_Generated {
 		'amp-3q-player' => array(
 			array(
 				'attr_spec_list' => array(
-					'autoplay' => array(
-						'value' => array(
-							'',
-						),
+					'autoplay' => 2,
+					'data-id' => 4,
+					'media' => array(),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-id',
 					),
-					'data-id' => array(
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-3q-player',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -629,26 +656,18 @@ class AMP_Allowed_Tags_Generated {
 		'amp-accordion' => array(
 			array(
 				'attr_spec_list' => array(
-					'animate' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'disable-session-states' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'expand-single-section' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'animate' => 2,
+					'disable-session-states' => 2,
+					'expand-single-section' => 2,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-accordion',
+					),
+					'supported_layouts' => array(
+						'container' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -661,6 +680,9 @@ class AMP_Allowed_Tags_Generated {
 						'child_tag_name_oneof' => array(
 							'section',
 						),
+						'child_tag_name_oneof_set' => array(
+							'section' => true,
+						),
 					),
 					'requires_extension' => array(
 						'amp-accordion',
@@ -673,12 +695,16 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'arguments' => array(),
-					'execute' => array(
-						'mandatory' => true,
+					'execute' => 4,
+					'id' => 5,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'execute',
+						'id',
 					),
-					'id' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-action-macro',
 					),
 				),
 				'tag_spec' => array(
@@ -691,28 +717,23 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-ad' => array(
 			array(
-				'attr_spec_list' => array(
-					'alt' => array(),
-					'json' => array(),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 0,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
 					),
-					'rtc-config' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'required_extensions' => array(
+						'amp-ad',
 					),
-					'template' => array(),
-					'type' => array(
-						'mandatory' => true,
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'fluid' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -741,34 +762,24 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'alt' => array(),
-					'data-multi-size' => array(
-						'dispatch_key' => 2,
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'json' => array(),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 1,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-multi-size',
+						'type',
 					),
-					'rtc-config' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'required_extensions' => array(
+						'amp-ad',
 					),
-					'type' => array(
-						'mandatory' => true,
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'fluid' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -804,31 +815,30 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'alt' => array(),
-					'data-enable-refresh' => array(
-						'dispatch_key' => 2,
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
+					'data-enable-refresh' => 7,
 					'json' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'src' => 6,
+					'type' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-enable-refresh',
+						'type',
 					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'required_extensions' => array(
+						'amp-ad',
 					),
-					'type' => array(
-						'mandatory' => true,
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'fluid' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -864,19 +874,22 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'src' => 8,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-ad-custom',
 					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'fluid' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -905,30 +918,23 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-product-code' => array(),
-					'data-share-media' => array(
-						'value_url' => array(
-							'allow_empty' => true,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
-					'data-share-url' => array(
-						'value_url' => array(
-							'allow_empty' => true,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'data-share-media' => 9,
+					'data-share-url' => 9,
 					'data-widget-id' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-addthis',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -953,16 +959,25 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'config' => array(
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
 						'value_url' => array(
 							'allow_empty' => true,
 							'allow_relative' => true,
 							'protocol' => array(
 								'https',
 							),
+							'protocol_set' => array(
+								'https' => true,
+							),
 						),
 					),
 					'type' => array(),
 				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-analytics',
+					),
+				),
 				'tag_spec' => array(
 					'requires_extension' => array(
 						'amp-analytics',
@@ -977,26 +992,29 @@ class AMP_Allowed_Tags_Generated {
 					'alt' => array(),
 					'attribution' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'object-fit' => array(),
 					'object-position' => array(),
-					'src' => array(
-						'alternative_names' => array(
-							'srcset',
-						),
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'data',
-								'http',
-								'https',
-							),
-						),
+					'src' => 10,
+				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'srcset' => 'src',
+					),
+					'mandatory_attrs' => array(
+						'src',
+					),
+					'required_extensions' => array(
+						'amp-anim',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1022,15 +1040,22 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'trigger' => array(
 						'value' => array(
 							'visibility',
 						),
+						'value_set' => array(
+							'visibility' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-animation',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1043,6 +1068,9 @@ class AMP_Allowed_Tags_Generated {
 						'child_tag_name_oneof' => array(
 							'script',
 						),
+						'child_tag_name_oneof_set' => array(
+							'script' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
 					'requires_extension' => array(
@@ -1054,17 +1082,22 @@ class AMP_Allowed_Tags_Generated {
 		'amp-apester-media' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-apester-channel-token' => array(
-						'value_regex' => '[0-9a-zA-Z]+',
-					),
-					'data-apester-media-id' => array(
-						'value_regex' => '[0-9a-zA-Z]+',
-					),
+					'data-apester-channel-token' => 11,
+					'data-apester-media-id' => 11,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-apester-media',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1087,16 +1120,16 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-app-banner' => array(
 			array(
-				'attr_spec_list' => array(
-					'id' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-						'mandatory' => true,
+				'attr_spec_list' => 2,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'id',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-app-banner',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1120,49 +1153,40 @@ class AMP_Allowed_Tags_Generated {
 					'album' => array(),
 					'artist' => array(),
 					'artwork' => array(),
-					'autoplay' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'autoplay' => 2,
 					'controls' => array(),
 					'controlslist' => array(),
-					'loop' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'loop' => 2,
 					'media' => array(),
-					'muted' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'muted' => 2,
+					'noloading' => 2,
 					'preload' => array(
 						'value_casei' => array(
 							'auto',
 							'metadata',
 							'none',
 						),
-					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
+						'value_casei_set' => array(
+							'auto' => true,
+							'metadata' => true,
+							'none' => true,
 						),
 					),
+					'src' => 6,
 				),
-				'tag_spec' => array(
-					'amp_layout' => array(
-						'defines_default_height' => true,
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-audio',
+					),
+					'supported_layouts' => array(
+						'fixed' => true,
+						'fixed-height' => true,
+						'nodisplay' => true,
+					),
+				),
+				'tag_spec' => array(
+					'amp_layout' => array(
+						'defines_default_height' => true,
 						'defines_default_width' => true,
 						'supported_layouts' => array(
 							2,
@@ -1184,38 +1208,24 @@ class AMP_Allowed_Tags_Generated {
 					'album' => array(),
 					'artist' => array(),
 					'artwork' => array(),
-					'autoplay' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
+					'autoplay' => 12,
 					'controls' => array(),
 					'controlslist' => array(),
-					'loop' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'loop' => 2,
 					'media' => array(),
-					'muted' => array(
-						'value' => array(
-							'',
-						),
+					'muted' => 2,
+					'noloading' => 2,
+					'src' => 6,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'autoplay',
 					),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-audio',
 					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1235,15 +1245,13 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-auto-ads' => array(
 			array(
-				'attr_spec_list' => array(
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 3,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
 					),
-					'type' => array(
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-auto-ads',
 					),
 				),
 				'tag_spec' => array(
@@ -1270,6 +1278,14 @@ class AMP_Allowed_Tags_Generated {
 							'substring',
 							'token-prefix',
 						),
+						'value_casei_set' => array(
+							'custom' => true,
+							'fuzzy' => true,
+							'none' => true,
+							'prefix' => true,
+							'substring' => true,
+							'token-prefix' => true,
+						),
 					),
 					'filter-expr' => array(
 						'requires_extension' => array(
@@ -1281,23 +1297,30 @@ class AMP_Allowed_Tags_Generated {
 					'max-entries' => array(),
 					'media' => array(),
 					'min-characters' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'src' => array(
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
 								'https',
 							),
+							'protocol_set' => array(
+								'https' => true,
+							),
 						),
 					),
 					'submit-on-enter' => array(),
 					'suggest-first' => array(),
 					'template' => array(),
 				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-autocomplete',
+					),
+					'supported_layouts' => array(
+						'container' => true,
+					),
+				),
 				'tag_spec' => array(
 					'amp_layout' => array(
 						'supported_layouts' => array(
@@ -1329,50 +1352,34 @@ class AMP_Allowed_Tags_Generated {
 					'[snap-by]' => array(),
 					'[snap]' => array(),
 					'[visible-count]' => array(),
-					'advance-count' => array(
-						'value_regex' => '([^,]+\\s+(-?\\d+),\\s*)*(-?\\d+)',
-					),
-					'auto-advance' => array(
-						'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
-					),
-					'auto-advance-count' => array(
-						'value_regex' => '([^,]+\\s+(-?\\d+),\\s*)*(-?\\d+)',
-					),
-					'auto-advance-interval' => array(
-						'value_regex' => '([^,]+\\s+(\\d+),\\s*)*(\\d+)',
-					),
-					'auto-advance-loops' => array(
-						'value_regex' => '([^,]+\\s+(\\d+),\\s*)*(\\d+)',
-					),
-					'horizontal' => array(
-						'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
-					),
-					'loop' => array(
-						'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
-					),
+					'advance-count' => 13,
+					'auto-advance' => 14,
+					'auto-advance-count' => 13,
+					'auto-advance-interval' => 15,
+					'auto-advance-loops' => 15,
+					'horizontal' => 14,
+					'loop' => 14,
 					'media' => array(),
-					'mixed-length' => array(
-						'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
-					),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'slide' => array(
-						'value_regex' => '([^,]+\\s+(\\d+),\\s*)*(\\d+)',
-					),
-					'snap' => array(
-						'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
-					),
-					'snap-align' => array(
-						'value_regex' => '([^,]+\\s+(start|center),\\s*)*(start|center)',
-					),
-					'snap-by' => array(
-						'value_regex' => '([^,]+\\s+(\\d+),\\s*)*(\\d+)',
+					'mixed-length' => 14,
+					'noloading' => 2,
+					'slide' => 15,
+					'snap' => 14,
+					'snap-align' => 16,
+					'snap-by' => 15,
+					'visible-count' => 17,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-base-carousel',
 					),
-					'visible-count' => array(
-						'value_regex' => '([^,]+\\s+(\\d+(\\.\\d+)?),\\s*)*(\\d+(\\.\\d+)?)',
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1408,53 +1415,49 @@ class AMP_Allowed_Tags_Generated {
 					'[snap-by]' => array(),
 					'[snap]' => array(),
 					'[visible-count]' => array(),
-					'advance-count' => array(
-						'value_regex' => '([^,]+\\s+(-?\\d+),\\s*)*(-?\\d+)',
-					),
-					'auto-advance' => array(
-						'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
-					),
-					'auto-advance-count' => array(
-						'value_regex' => '([^,]+\\s+(-?\\d+),\\s*)*(-?\\d+)',
-					),
-					'auto-advance-interval' => array(
-						'value_regex' => '([^,]+\\s+(\\d+),\\s*)*(\\d+)',
-					),
-					'auto-advance-loops' => array(
-						'value_regex' => '([^,]+\\s+(\\d+),\\s*)*(\\d+)',
-					),
-					'horizontal' => array(
-						'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
-					),
-					'lightbox' => array(
-						'mandatory' => true,
-					),
-					'loop' => array(
-						'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
-					),
+					'advance-count' => 13,
+					'auto-advance' => 14,
+					'auto-advance-count' => 13,
+					'auto-advance-interval' => 15,
+					'auto-advance-loops' => 15,
+					'horizontal' => 14,
+					'lightbox' => 4,
+					'loop' => 14,
 					'media' => array(),
-					'mixed-length' => array(
-						'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
-					),
-					'noloading' => array(
-						'value' => array(
-							'',
+					'mixed-length' => 14,
+					'noloading' => 2,
+					'slide' => 15,
+					'snap' => 14,
+					'snap-align' => 16,
+					'snap-by' => 15,
+					'visible-count' => 17,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'lightbox',
+					),
+					'reference_point_attrs' => array(
+						'lightbox-exclude' => array(
+							'unique' => false,
+						),
+						'lightbox-thumbnail-id' => array(
+							'unique' => false,
+							'value_regex_casei' => '^[a-z][a-z\\d_-]*',
+							'value_regex_casei_pcre' => '/^(^[a-z][a-z\\d_-]*)$/ui',
 						),
 					),
-					'slide' => array(
-						'value_regex' => '([^,]+\\s+(\\d+),\\s*)*(\\d+)',
-					),
-					'snap' => array(
-						'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
-					),
-					'snap-align' => array(
-						'value_regex' => '([^,]+\\s+(start|center),\\s*)*(start|center)',
-					),
-					'snap-by' => array(
-						'value_regex' => '([^,]+\\s+(\\d+),\\s*)*(\\d+)',
+					'required_extensions' => array(
+						'amp-base-carousel',
+						'amp-lightbox-gallery',
 					),
-					'visible-count' => array(
-						'value_regex' => '([^,]+\\s+(\\d+(\\.\\d+)?),\\s*)*(\\d+(\\.\\d+)?)',
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1494,22 +1497,32 @@ class AMP_Allowed_Tags_Generated {
 					'data-account' => array(
 						'mandatory' => true,
 						'value_regex_casei' => '[0-9a-f]{24}',
+						'value_regex_casei_pcre' => '/^([0-9a-f]{24})$/ui',
 					),
 					'data-content' => array(
 						'value_regex_casei' => '[0-9a-f]{24}',
+						'value_regex_casei_pcre' => '/^([0-9a-f]{24})$/ui',
 					),
-					'data-my-content' => array(
-						'value' => array(
-							'0',
-							'1',
-						),
-					),
+					'data-my-content' => 18,
 					'data-name' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-account',
+					),
+					'required_extensions' => array(
+						'amp-beopinion',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1534,12 +1547,16 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'arguments' => array(),
-					'expression' => array(
-						'mandatory' => true,
+					'expression' => 4,
+					'id' => 5,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'expression',
+						'id',
 					),
-					'id' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-bind',
 					),
 				),
 				'tag_spec' => array(
@@ -1559,27 +1576,40 @@ class AMP_Allowed_Tags_Generated {
 							'number',
 							'true',
 						),
-					),
-					'noautoplay' => array(
-						'value' => array(
-							'',
+						'value_casei_set' => array(
+							'false' => true,
+							'number' => true,
+							'true' => true,
 						),
 					),
+					'noautoplay' => 2,
 					'renderer' => array(
 						'value_casei' => array(
 							'svg',
 							'html',
 						),
-					),
-					'src' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
+						'value_casei_set' => array(
+							'html' => true,
+							'svg' => true,
 						),
 					),
+					'src' => 19,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
+					),
+					'required_extensions' => array(
+						'amp-bodymovin-animation',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
+					),
 				),
 				'tag_spec' => array(
 					'amp_layout' => array(
@@ -1605,29 +1635,34 @@ class AMP_Allowed_Tags_Generated {
 					'autoplay' => array(),
 					'data-dynamic' => array(
 						'value_regex' => '[a-z]+',
+						'value_regex_pcre' => '/^([a-z]+)$/u',
 					),
-					'data-outstream' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'data-partner' => array(
-						'mandatory' => true,
-						'value_regex' => '[0-9]+',
-					),
-					'data-player' => array(
-						'mandatory' => true,
-						'value_regex' => '[0-9]+',
-					),
+					'data-outstream' => 20,
+					'data-partner' => 21,
+					'data-player' => 21,
 					'data-playlist' => array(
 						'value_regex' => '.+',
+						'value_regex_pcre' => '/^(.+)$/u',
 					),
-					'data-video' => array(
-						'value_regex' => '[0-9]+',
-					),
+					'data-video' => 20,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-partner',
+						'data-player',
+					),
+					'required_extensions' => array(
+						'amp-brid-player',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1658,24 +1693,26 @@ class AMP_Allowed_Tags_Generated {
 					'[data-playlist-id]' => array(),
 					'[data-referrer]' => array(),
 					'[data-video-id]' => array(),
-					'autoplay' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'data-account' => array(
-						'mandatory' => true,
+					'autoplay' => 2,
+					'data-account' => 4,
+					'dock' => 22,
+					'media' => array(),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-account',
 					),
-					'dock' => array(
-						'requires_extension' => array(
-							'amp-video-docking',
-						),
+					'required_extensions' => array(
+						'amp-brightcove',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1699,17 +1736,26 @@ class AMP_Allowed_Tags_Generated {
 		'amp-byside-content' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-label' => array(
-						'mandatory' => true,
+					'data-label' => 4,
+					'data-webcare-id' => 4,
+					'media' => array(),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-label',
+						'data-webcare-id',
 					),
-					'data-webcare-id' => array(
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-byside-content',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1732,21 +1778,24 @@ class AMP_Allowed_Tags_Generated {
 		'amp-call-tracking' => array(
 			array(
 				'attr_spec_list' => array(
-					'config' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'config' => 23,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'config',
+					),
+					'required_extensions' => array(
+						'amp-call-tracking',
+					),
+					'supported_layouts' => array(
+						'container' => true,
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1764,6 +1813,9 @@ class AMP_Allowed_Tags_Generated {
 						'child_tag_name_oneof' => array(
 							'a',
 						),
+						'child_tag_name_oneof_set' => array(
+							'a' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
 					'requires_extension' => array(
@@ -1777,38 +1829,28 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'[slide]' => array(),
-					'arrows' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'autoplay' => array(
-						'value_regex' => '(|[0-9]+)',
-					),
+					'arrows' => 2,
+					'autoplay' => 24,
 					'controls' => array(),
-					'delay' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'dots' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'loop' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'delay' => 20,
+					'dots' => 2,
+					'loop' => 2,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'type' => 25,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-carousel',
 					),
-					'type' => array(
-						'value' => array(
-							'slides',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1833,39 +1875,27 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'[slide]' => array(),
-					'arrows' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'autoplay' => array(
-						'value_regex' => '(|[0-9]+)',
-					),
+					'arrows' => 2,
+					'autoplay' => 24,
 					'controls' => array(),
-					'delay' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'dots' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'loop' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'delay' => 20,
+					'dots' => 2,
+					'loop' => 2,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'type' => 26,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
 					),
-					'type' => array(
-						'mandatory' => true,
-						'value' => array(
-							'carousel',
-						),
+					'required_extensions' => array(
+						'amp-carousel',
+					),
+					'supported_layouts' => array(
+						'fixed' => true,
+						'fixed-height' => true,
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1886,41 +1916,43 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'[slide]' => array(),
-					'arrows' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'autoplay' => array(
-						'value_regex' => '(|[0-9]+)',
-					),
+					'arrows' => 2,
+					'autoplay' => 24,
 					'controls' => array(),
-					'delay' => array(
-						'value_regex' => '[0-9]+',
+					'delay' => 20,
+					'dots' => 2,
+					'lightbox' => 4,
+					'loop' => 2,
+					'media' => array(),
+					'noloading' => 2,
+					'type' => 25,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'lightbox',
 					),
-					'dots' => array(
-						'value' => array(
-							'',
+					'reference_point_attrs' => array(
+						'lightbox-exclude' => array(
+							'unique' => false,
 						),
-					),
-					'lightbox' => array(
-						'mandatory' => true,
-					),
-					'loop' => array(
-						'value' => array(
-							'',
+						'lightbox-thumbnail-id' => array(
+							'unique' => false,
+							'value_regex_casei' => '^[a-z][a-z\\d_-]*',
+							'value_regex_casei_pcre' => '/^(^[a-z][a-z\\d_-]*)$/ui',
 						),
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-carousel',
+						'amp-lightbox-gallery',
 					),
-					'type' => array(
-						'value' => array(
-							'slides',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -1956,42 +1988,40 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'[slide]' => array(),
-					'arrows' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'autoplay' => array(
-						'value_regex' => '(|[0-9]+)',
-					),
+					'arrows' => 2,
+					'autoplay' => 24,
 					'controls' => array(),
-					'delay' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'dots' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'lightbox' => array(
-						'mandatory' => true,
+					'delay' => 20,
+					'dots' => 2,
+					'lightbox' => 4,
+					'loop' => 2,
+					'media' => array(),
+					'noloading' => 2,
+					'type' => 26,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'lightbox',
+						'type',
 					),
-					'loop' => array(
-						'value' => array(
-							'',
+					'reference_point_attrs' => array(
+						'lightbox-exclude' => array(
+							'unique' => false,
 						),
-					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
+						'lightbox-thumbnail-id' => array(
+							'unique' => false,
+							'value_regex_casei' => '^[a-z][a-z\\d_-]*',
+							'value_regex_casei_pcre' => '/^(^[a-z][a-z\\d_-]*)$/ui',
 						),
 					),
-					'type' => array(
-						'mandatory' => true,
-						'value' => array(
-							'carousel',
-						),
+					'required_extensions' => array(
+						'amp-carousel',
+						'amp-lightbox-gallery',
+					),
+					'supported_layouts' => array(
+						'fixed' => true,
+						'fixed-height' => true,
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2024,14 +2054,24 @@ class AMP_Allowed_Tags_Generated {
 		'amp-connatix-player' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-player-id' => array(
-						'mandatory' => true,
-					),
+					'data-player-id' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-player-id',
+					),
+					'required_extensions' => array(
+						'amp-connatix-player',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2054,12 +2094,13 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-consent' => array(
 			array(
-				'attr_spec_list' => array(
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 4,
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-consent',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2075,15 +2116,16 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 3,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
 					),
-					'type' => array(
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-consent',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2104,56 +2146,31 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'autoplay' => array(),
-					'data-endscreen-enable' => array(
-						'value' => array(
-							'false',
-							'true',
-						),
-					),
-					'data-info' => array(
-						'value' => array(
-							'false',
-							'true',
-						),
-					),
-					'data-mute' => array(
-						'value' => array(
-							'false',
-							'true',
-						),
-					),
-					'data-sharing-enable' => array(
-						'value' => array(
-							'false',
-							'true',
-						),
-					),
-					'data-start' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'data-ui-highlight' => array(
-						'value_regex_casei' => '([0-9a-f]{3}){1,2}',
-					),
-					'data-ui-logo' => array(
-						'value' => array(
-							'false',
-							'true',
-						),
-					),
-					'data-videoid' => array(
-						'mandatory' => true,
-						'value_regex_casei' => '[a-z0-9]+',
+					'data-endscreen-enable' => 1,
+					'data-info' => 1,
+					'data-mute' => 1,
+					'data-sharing-enable' => 1,
+					'data-start' => 20,
+					'data-ui-highlight' => 27,
+					'data-ui-logo' => 1,
+					'data-videoid' => 28,
+					'dock' => 22,
+					'media' => array(),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-videoid',
 					),
-					'dock' => array(
-						'requires_extension' => array(
-							'amp-video-docking',
-						),
+					'required_extensions' => array(
+						'amp-dailymotion',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2183,9 +2200,16 @@ class AMP_Allowed_Tags_Generated {
 							'minutes',
 							'seconds',
 						),
+						'value_casei_set' => array(
+							'days' => true,
+							'hours' => true,
+							'minutes' => true,
+							'seconds' => true,
+						),
 					),
 					'end-date' => array(
 						'value_regex' => '\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d(:[0-5]\\d(\\.\\d+)?)?(Z|[+-][0-1][0-9]:[0-5][0-9])',
+						'value_regex_pcre' => '/^(\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d(:[0-5]\\d(\\.\\d+)?)?(Z|[+-][0-1][0-9]:[0-5][0-9]))$/u',
 					),
 					'locale' => array(
 						'value_casei' => array(
@@ -2206,31 +2230,60 @@ class AMP_Allowed_Tags_Generated {
 							'zh-cn',
 							'zh-tw',
 						),
-					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
+						'value_casei_set' => array(
+							'de' => true,
+							'en' => true,
+							'es' => true,
+							'fr' => true,
+							'id' => true,
+							'it' => true,
+							'ja' => true,
+							'ko' => true,
+							'nl' => true,
+							'pt' => true,
+							'ru' => true,
+							'th' => true,
+							'tr' => true,
+							'vi' => true,
+							'zh-cn' => true,
+							'zh-tw' => true,
 						),
 					),
-					'offset-seconds' => array(
-						'value_regex' => '-?\\d+',
-					),
+					'media' => array(),
+					'noloading' => 2,
+					'offset-seconds' => 29,
 					'template' => array(),
-					'timeleft-ms' => array(
-						'value_regex' => '\\d+',
-					),
+					'timeleft-ms' => 30,
 					'timestamp-ms' => array(
 						'value_regex' => '\\d{13}',
+						'value_regex_pcre' => '/^(\\d{13})$/u',
 					),
 					'timestamp-seconds' => array(
 						'value_regex' => '\\d{10}',
+						'value_regex_pcre' => '/^(\\d{10})$/u',
 					),
 					'when-ended' => array(
 						'value_casei' => array(
 							'continue',
 							'stop',
 						),
+						'value_casei_set' => array(
+							'continue' => true,
+							'stop' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-date-countdown',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2255,27 +2308,34 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'datetime' => array(
 						'value_regex' => 'now|(\\d{4}-[01]\\d-[0-3]\\d(T[0-2]\\d:[0-5]\\d(:[0-6]\\d(\\.\\d\\d?\\d?)?)?(Z|[+-][0-1]\\d:[0-5]\\d)?)?)',
+						'value_regex_pcre' => '/^(now|(\\d{4}-[01]\\d-[0-3]\\d(T[0-2]\\d:[0-5]\\d(:[0-6]\\d(\\.\\d\\d?\\d?)?)?(Z|[+-][0-1]\\d:[0-5]\\d)?)?))$/u',
 					),
 					'display-in' => array(
 						'value_casei' => array(
 							'utc',
 						),
+						'value_casei_set' => array(
+							'utc' => true,
+						),
 					),
 					'locale' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'offset-seconds' => array(
-						'value_regex' => '-?\\d+',
-					),
-					'timestamp-ms' => array(
-						'value_regex' => '\\d+',
+					'noloading' => 2,
+					'offset-seconds' => 29,
+					'timestamp-ms' => 30,
+					'timestamp-seconds' => 30,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-date-display',
 					),
-					'timestamp-seconds' => array(
-						'value_regex' => '\\d+',
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2301,70 +2361,42 @@ class AMP_Allowed_Tags_Generated {
 					'[max]' => array(),
 					'[min]' => array(),
 					'[src]' => array(),
-					'allow-blocked-ranges' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'allow-blocked-ranges' => 2,
 					'blocked' => array(),
 					'date' => array(),
-					'day-size' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'first-day-of-week' => array(
-						'value_regex' => '[0-6]',
-					),
+					'day-size' => 20,
+					'first-day-of-week' => 31,
 					'format' => array(),
-					'fullscreen' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'fullscreen' => 2,
 					'highlighted' => array(),
 					'input-selector' => array(),
 					'locale' => array(),
 					'max' => array(),
 					'media' => array(),
 					'min' => array(),
-					'mode' => array(
-						'value_casei' => array(
-							'static',
-						),
-					),
+					'mode' => 32,
 					'month-format' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'number-of-months' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'open-after-clear' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'open-after-select' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'noloading' => 2,
+					'number-of-months' => 20,
+					'open-after-clear' => 2,
+					'open-after-select' => 2,
+					'src' => 8,
+					'type' => 33,
+					'week-day-format' => array(),
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-date-picker',
 					),
-					'type' => array(
-						'value_casei' => array(
-							'single',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
-					'week-day-format' => array(),
 				),
 				'tag_spec' => array(
 					'amp_layout' => array(
@@ -2389,19 +2421,11 @@ class AMP_Allowed_Tags_Generated {
 					'[max]' => array(),
 					'[min]' => array(),
 					'[src]' => array(),
-					'allow-blocked-ranges' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'allow-blocked-ranges' => 2,
 					'blocked' => array(),
 					'date' => array(),
-					'day-size' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'first-day-of-week' => array(
-						'value_regex' => '[0-6]',
-					),
+					'day-size' => 20,
+					'first-day-of-week' => 31,
 					'format' => array(),
 					'highlighted' => array(),
 					'input-selector' => array(),
@@ -2409,51 +2433,28 @@ class AMP_Allowed_Tags_Generated {
 					'max' => array(),
 					'media' => array(),
 					'min' => array(),
-					'mode' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'overlay',
-						),
-					),
+					'mode' => 34,
 					'month-format' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'number-of-months' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'open-after-clear' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'open-after-select' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'noloading' => 2,
+					'number-of-months' => 20,
+					'open-after-clear' => 2,
+					'open-after-select' => 2,
+					'src' => 8,
+					'touch-keyboard-editable' => 2,
+					'type' => 33,
+					'week-day-format' => array(),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'mode',
 					),
-					'touch-keyboard-editable' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-date-picker',
 					),
-					'type' => array(
-						'value_casei' => array(
-							'single',
-						),
+					'supported_layouts' => array(
+						'container' => true,
+						'nodisplay' => true,
 					),
-					'week-day-format' => array(),
 				),
 				'tag_spec' => array(
 					'amp_layout' => array(
@@ -2473,80 +2474,50 @@ class AMP_Allowed_Tags_Generated {
 					'[max]' => array(),
 					'[min]' => array(),
 					'[src]' => array(),
-					'allow-blocked-ranges' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'allow-blocked-ranges' => 2,
 					'blocked' => array(),
-					'day-size' => array(
-						'value_regex' => '[0-9]+',
-					),
+					'day-size' => 20,
 					'end-date' => array(),
 					'end-input-selector' => array(),
-					'first-day-of-week' => array(
-						'value_regex' => '[0-6]',
-					),
+					'first-day-of-week' => 31,
 					'format' => array(),
-					'fullscreen' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'fullscreen' => 2,
 					'highlighted' => array(),
 					'locale' => array(),
 					'max' => array(),
-					'maximum-nights' => array(
-						'value_regex' => '[0-9]+',
-					),
+					'maximum-nights' => 20,
 					'media' => array(),
 					'min' => array(),
-					'minimum-nights' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'mode' => array(
-						'value_casei' => array(
-							'static',
-						),
-					),
+					'minimum-nights' => 20,
+					'mode' => 32,
 					'month-format' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'number-of-months' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'open-after-clear' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'open-after-select' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'noloading' => 2,
+					'number-of-months' => 20,
+					'open-after-clear' => 2,
+					'open-after-select' => 2,
+					'src' => 8,
 					'start-date' => array(),
 					'start-input-selector' => array(),
-					'type' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'range',
-						),
-					),
+					'type' => 35,
 					'week-day-format' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-date-picker',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
+					),
+				),
 				'tag_spec' => array(
 					'amp_layout' => array(
 						'supported_layouts' => array(
@@ -2570,80 +2541,45 @@ class AMP_Allowed_Tags_Generated {
 					'[max]' => array(),
 					'[min]' => array(),
 					'[src]' => array(),
-					'allow-blocked-ranges' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'allow-blocked-ranges' => 2,
 					'blocked' => array(),
-					'day-size' => array(
-						'value_regex' => '[0-9]+',
-					),
+					'day-size' => 20,
 					'end-date' => array(),
 					'end-input-selector' => array(),
-					'first-day-of-week' => array(
-						'value_regex' => '[0-6]',
-					),
+					'first-day-of-week' => 31,
 					'format' => array(),
 					'highlighted' => array(),
 					'locale' => array(),
 					'max' => array(),
-					'maximum-nights' => array(
-						'value_regex' => '[0-9]+',
-					),
+					'maximum-nights' => 20,
 					'media' => array(),
 					'min' => array(),
-					'minimum-nights' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'mode' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'overlay',
-						),
-					),
+					'minimum-nights' => 20,
+					'mode' => 34,
 					'month-format' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'number-of-months' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'open-after-clear' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'open-after-select' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'noloading' => 2,
+					'number-of-months' => 20,
+					'open-after-clear' => 2,
+					'open-after-select' => 2,
+					'src' => 8,
 					'start-date' => array(),
 					'start-input-selector' => array(),
-					'touch-keyboard-editable' => array(
-						'value' => array(
-							'',
-						),
+					'touch-keyboard-editable' => 2,
+					'type' => 35,
+					'week-day-format' => array(),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'mode',
+						'type',
 					),
-					'type' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'range',
-						),
+					'required_extensions' => array(
+						'amp-date-picker',
+					),
+					'supported_layouts' => array(
+						'container' => true,
+						'nodisplay' => true,
 					),
-					'week-day-format' => array(),
 				),
 				'tag_spec' => array(
 					'amp_layout' => array(
@@ -2662,19 +2598,25 @@ class AMP_Allowed_Tags_Generated {
 		'amp-delight-player' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-content-id' => array(
-						'mandatory' => true,
+					'data-content-id' => 4,
+					'dock' => 22,
+					'media' => array(),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-content-id',
 					),
-					'dock' => array(
-						'requires_extension' => array(
-							'amp-video-docking',
-						),
+					'required_extensions' => array(
+						'amp-delight-player',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2696,28 +2638,23 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-embed' => array(
 			array(
-				'attr_spec_list' => array(
-					'alt' => array(),
-					'json' => array(),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 0,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
 					),
-					'rtc-config' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'required_extensions' => array(
+						'amp-ad',
 					),
-					'template' => array(),
-					'type' => array(
-						'mandatory' => true,
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'fluid' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2746,34 +2683,24 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'alt' => array(),
-					'data-multi-size' => array(
-						'dispatch_key' => 2,
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'json' => array(),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 1,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-multi-size',
+						'type',
 					),
-					'rtc-config' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'required_extensions' => array(
+						'amp-ad',
 					),
-					'type' => array(
-						'mandatory' => true,
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'fluid' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2810,20 +2737,19 @@ class AMP_Allowed_Tags_Generated {
 		'amp-embedly-card' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-url' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'data-url' => 19,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-url',
+					),
+					'required_extensions' => array(
+						'amp-embedly-card',
+					),
+					'supported_layouts' => array(
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2842,8 +2768,17 @@ class AMP_Allowed_Tags_Generated {
 		'amp-embedly-key' => array(
 			array(
 				'attr_spec_list' => array(
-					'value' => array(
-						'mandatory' => true,
+					'value' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'value',
+					),
+					'required_extensions' => array(
+						'amp-embedly-card',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2862,6 +2797,11 @@ class AMP_Allowed_Tags_Generated {
 		'amp-experiment' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-experiment',
+					),
+				),
 				'tag_spec' => array(
 					'requires_extension' => array(
 						'amp-experiment',
@@ -2873,15 +2813,21 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-facebook' => array(
 			array(
-				'attr_spec_list' => array(
-					'data-href' => array(
-						'mandatory' => true,
+				'attr_spec_list' => 5,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-href',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-facebook',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2903,15 +2849,21 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-facebook-comments' => array(
 			array(
-				'attr_spec_list' => array(
-					'data-href' => array(
-						'mandatory' => true,
+				'attr_spec_list' => 5,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-href',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-facebook-comments',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2933,22 +2885,21 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-facebook-like' => array(
 			array(
-				'attr_spec_list' => array(
-					'data-href' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
+				'attr_spec_list' => 6,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-href',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-facebook-like',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -2970,22 +2921,21 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-facebook-page' => array(
 			array(
-				'attr_spec_list' => array(
-					'data-href' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
+				'attr_spec_list' => 6,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-href',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-facebook-page',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3011,10 +2961,20 @@ class AMP_Allowed_Tags_Generated {
 					'max-font-size' => array(),
 					'media' => array(),
 					'min-font-size' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-fit-text',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3038,24 +2998,27 @@ class AMP_Allowed_Tags_Generated {
 		'amp-font' => array(
 			array(
 				'attr_spec_list' => array(
-					'font-family' => array(
-						'mandatory' => true,
-					),
+					'font-family' => 4,
 					'font-style' => array(),
 					'font-variant' => array(),
 					'font-weight' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'on-error-add-class' => array(),
 					'on-error-remove-class' => array(),
 					'on-load-add-class' => array(),
 					'on-load-remove-class' => array(),
-					'timeout' => array(
-						'value_regex' => '[0-9]+',
+					'timeout' => 20,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'font-family',
+					),
+					'required_extensions' => array(
+						'amp-font',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3073,14 +3036,16 @@ class AMP_Allowed_Tags_Generated {
 		'amp-fx-flying-carpet' => array(
 			array(
 				'attr_spec_list' => array(
-					'height' => array(
-						'mandatory' => true,
-					),
+					'height' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'height',
+					),
+					'required_extensions' => array(
+						'amp-fx-flying-carpet',
 					),
 				),
 				'tag_spec' => array(
@@ -3092,12 +3057,13 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-geo' => array(
 			array(
-				'attr_spec_list' => array(
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 4,
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-geo',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3110,6 +3076,9 @@ class AMP_Allowed_Tags_Generated {
 						'first_child_tag_name_oneof' => array(
 							'script',
 						),
+						'first_child_tag_name_oneof_set' => array(
+							'script' => true,
+						),
 					),
 					'requires_extension' => array(
 						'amp-geo',
@@ -3121,19 +3090,24 @@ class AMP_Allowed_Tags_Generated {
 		'amp-gfycat' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-gfyid' => array(
-						'mandatory' => true,
-					),
+					'data-gfyid' => 4,
 					'media' => array(),
-					'noautoplay' => array(
-						'value' => array(
-							'',
-						),
+					'noautoplay' => 2,
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-gfyid',
 					),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-gfycat',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3156,14 +3130,19 @@ class AMP_Allowed_Tags_Generated {
 		'amp-gist' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-gistid' => array(
-						'mandatory' => true,
-					),
+					'data-gistid' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-gistid',
+					),
+					'required_extensions' => array(
+						'amp-gist',
+					),
+					'supported_layouts' => array(
+						'fixed-height' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3185,20 +3164,24 @@ class AMP_Allowed_Tags_Generated {
 					'[src]' => array(),
 					'[title]' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'src' => 23,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
 					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'required_extensions' => array(
+						'amp-google-document-embed',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3223,14 +3206,23 @@ class AMP_Allowed_Tags_Generated {
 		'amp-hulu' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-eid' => array(
-						'mandatory' => true,
-					),
+					'data-eid' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-eid',
+					),
+					'required_extensions' => array(
+						'amp-hulu',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3255,39 +3247,14 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'[src]' => array(),
 					'allow' => array(),
-					'allowfullscreen' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'allowpaymentrequest' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'allowtransparency' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'frameborder' => array(
-						'value' => array(
-							'0',
-							'1',
-						),
-					),
+					'allowfullscreen' => 2,
+					'allowpaymentrequest' => 2,
+					'allowtransparency' => 2,
+					'frameborder' => 18,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'referrerpolicy' => array(),
-					'resizable' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'resizable' => 2,
 					'sandbox' => array(),
 					'scrolling' => array(
 						'value' => array(
@@ -3295,19 +3262,43 @@ class AMP_Allowed_Tags_Generated {
 							'no',
 							'yes',
 						),
+						'value_set' => array(
+							'auto' => true,
+							'no' => true,
+							'yes' => true,
+						),
 					),
 					'src' => array(
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
 								'data',
 								'https',
 							),
+							'protocol_set' => array(
+								'data' => true,
+								'https' => true,
+							),
 						),
 					),
 					'srcdoc' => array(),
 				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-iframe',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
+					),
+				),
 				'tag_spec' => array(
 					'amp_layout' => array(
 						'supported_layouts' => array(
@@ -3329,20 +3320,8 @@ class AMP_Allowed_Tags_Generated {
 		'amp-ima-video' => array(
 			array(
 				'attr_spec_list' => array(
-					'autoplay' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'data-src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'autoplay' => 2,
+					'data-src' => 6,
 					'data-tag' => array(
 						'mandatory' => true,
 						'value_url' => array(
@@ -3350,23 +3329,29 @@ class AMP_Allowed_Tags_Generated {
 							'protocol' => array(
 								'https',
 							),
+							'protocol_set' => array(
+								'https' => true,
+							),
 						),
 					),
-					'dock' => array(
-						'requires_extension' => array(
-							'amp-video-docking',
-						),
-					),
+					'dock' => 22,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'rotate-to-fullscreen' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-tag',
 					),
-					'rotate-to-fullscreen' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-ima-video',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3391,10 +3376,14 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'controls' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-image-lightbox',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3413,17 +3402,20 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'disable-hint-reappear' => array(),
-					'initial-slider-position' => array(
-						'value_regex' => '0(\\.[0-9]+)?|1(\\.0+)?',
-					),
+					'initial-slider-position' => 36,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'step-size' => 36,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-image-slider',
 					),
-					'step-size' => array(
-						'value_regex' => '0(\\.[0-9]+)?|1(\\.0+)?',
+					'supported_layouts' => array(
+						'fixed' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3440,6 +3432,10 @@ class AMP_Allowed_Tags_Generated {
 							'amp-img',
 							'div',
 						),
+						'child_tag_name_oneof_set' => array(
+							'amp-img' => true,
+							'div' => true,
+						),
 						'mandatory_min_num_child_tags' => 2,
 					),
 					'requires_extension' => array(
@@ -3459,31 +3455,29 @@ class AMP_Allowed_Tags_Generated {
 					'alt' => array(),
 					'attribution' => array(),
 					'lightbox' => array(),
-					'lightbox-thumbnail-id' => array(
-						'value_regex_casei' => '^[a-z][a-z\\d_-]*',
-					),
+					'lightbox-thumbnail-id' => 37,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'object-fit' => array(),
 					'object-position' => array(),
 					'placeholder' => array(),
-					'src' => array(
-						'alternative_names' => array(
-							'srcset',
-						),
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'data',
-								'http',
-								'https',
-							),
-						),
+					'src' => 10,
+				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'srcset' => 'src',
+					),
+					'mandatory_attrs' => array(
+						'src',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3505,14 +3499,24 @@ class AMP_Allowed_Tags_Generated {
 		'amp-imgur' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-imgur-id' => array(
-						'mandatory' => true,
-					),
+					'data-imgur-id' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-imgur-id',
+					),
+					'required_extensions' => array(
+						'amp-imgur',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3536,14 +3540,24 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'alt' => array(),
-					'data-shortcode' => array(
-						'mandatory' => true,
-					),
+					'data-shortcode' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-shortcode',
+					),
+					'required_extensions' => array(
+						'amp-instagram',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3566,24 +3580,18 @@ class AMP_Allowed_Tags_Generated {
 		'amp-install-serviceworker' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-iframe-src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'data-iframe-src' => 6,
+					'src' => 38,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
 					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'required_extensions' => array(
+						'amp-install-serviceworker',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3601,15 +3609,23 @@ class AMP_Allowed_Tags_Generated {
 		'amp-izlesene' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-videoid' => array(
-						'mandatory' => true,
-						'value_regex' => '[0-9]+',
-					),
+					'data-videoid' => 21,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-videoid',
+					),
+					'required_extensions' => array(
+						'amp-izlesene',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3631,15 +3647,28 @@ class AMP_Allowed_Tags_Generated {
 		'amp-jwplayer' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-media-id' => array(
-						'value_regex_casei' => '[0-9a-z]{8}',
-					),
+					'data-media-id' => 39,
 					'data-player-id' => array(
 						'mandatory' => true,
 						'value_regex_casei' => '[0-9a-z]{8}',
+						'value_regex_casei_pcre' => '/^([0-9a-z]{8})$/ui',
 					),
-					'data-playlist-id' => array(
-						'value_regex_casei' => '[0-9a-z]{8}',
+					'data-playlist-id' => 39,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-player-id',
+					),
+					'required_extensions' => array(
+						'amp-jwplayer',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3662,14 +3691,24 @@ class AMP_Allowed_Tags_Generated {
 		'amp-kaltura-player' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-partner' => array(
-						'mandatory' => true,
-					),
+					'data-partner' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-partner',
+					),
+					'required_extensions' => array(
+						'amp-kaltura-player',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3691,12 +3730,17 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-layout' => array(
 			array(
-				'attr_spec_list' => array(
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 4,
+				'precomputed' => array(
+					'supported_layouts' => array(
+						'container' => true,
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3726,17 +3770,26 @@ class AMP_Allowed_Tags_Generated {
 							'fly-in-bottom',
 							'fly-in-top',
 						),
+						'value_casei_set' => array(
+							'fade-in' => true,
+							'fly-in-bottom' => true,
+							'fly-in-top' => true,
+						),
 					),
 					'controls' => array(),
 					'from' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'scrollable' => array(),
 				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-lightbox',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
+					),
+				),
 				'tag_spec' => array(
 					'amp_layout' => array(
 						'supported_layouts' => array(
@@ -3752,6 +3805,14 @@ class AMP_Allowed_Tags_Generated {
 		'amp-link-rewriter' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-link-rewriter',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
+					),
+				),
 				'tag_spec' => array(
 					'amp_layout' => array(
 						'supported_layouts' => array(
@@ -3762,6 +3823,9 @@ class AMP_Allowed_Tags_Generated {
 						'first_child_tag_name_oneof' => array(
 							'script',
 						),
+						'first_child_tag_name_oneof_set' => array(
+							'script' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
 					'requires_extension' => array(
@@ -3777,17 +3841,18 @@ class AMP_Allowed_Tags_Generated {
 					'[is-layout-container]' => array(),
 					'[src]' => array(),
 					'[state]' => array(),
-					'auto-resize' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'auto-resize' => 2,
 					'binding' => array(
 						'value' => array(
 							'always',
 							'no',
 							'refresh',
 						),
+						'value_set' => array(
+							'always' => true,
+							'no' => true,
+							'refresh' => true,
+						),
 					),
 					'credentials' => array(),
 					'items' => array(),
@@ -3796,34 +3861,44 @@ class AMP_Allowed_Tags_Generated {
 							'auto',
 							'manual',
 						),
+						'value_set' => array(
+							'auto' => true,
+							'manual' => true,
+						),
 					),
 					'load-more-bookmark' => array(),
 					'max-items' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'reset-on-refresh' => array(
 						'value' => array(
 							'',
 							'always',
 							'fetch',
 						),
-					),
-					'single-item' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
+						'value_set' => array(
+							'' => true,
+							'always' => true,
+							'fetch' => true,
 						),
 					),
+					'single-item' => array(),
+					'src' => 6,
 					'template' => array(),
 				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-list',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
+					),
+				),
 				'tag_spec' => array(
 					'amp_layout' => array(
 						'supported_layouts' => array(
@@ -3844,25 +3919,14 @@ class AMP_Allowed_Tags_Generated {
 		'amp-list-load-more' => array(
 			array(
 				'attr_spec_list' => array(
-					'load-more-button' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'load-more-end' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'load-more-failed' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'load-more-loading' => array(
-						'value' => array(
-							'',
-						),
+					'load-more-button' => 2,
+					'load-more-end' => 2,
+					'load-more-failed' => 2,
+					'load-more-loading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-list',
 					),
 				),
 				'tag_spec' => array(
@@ -3879,24 +3943,46 @@ class AMP_Allowed_Tags_Generated {
 					'data-max-items-per-page' => array(
 						'mandatory' => true,
 						'value_regex' => '\\d+',
+						'value_regex_pcre' => '/^(\\d+)$/u',
 					),
 					'data-poll-interval' => array(
 						'value_regex' => '\\d{5,}',
+						'value_regex_pcre' => '/^(\\d{5,})$/u',
 					),
-					'disabled' => array(
+					'disabled' => 2,
+					'id' => 5,
+					'sort' => array(
 						'value' => array(
-							'',
+							'ascending',
+						),
+						'value_set' => array(
+							'ascending' => true,
 						),
 					),
-					'id' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-						'mandatory' => true,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-max-items-per-page',
+						'id',
 					),
-					'sort' => array(
-						'value' => array(
-							'ascending',
+					'reference_point_attrs' => array(
+						'items' => array(
+							'unique' => true,
+						),
+						'pagination' => array(
+							'unique' => true,
+						),
+						'update' => array(
+							'unique' => true,
 						),
 					),
+					'required_extensions' => array(
+						'amp-live-list',
+					),
+					'supported_layouts' => array(
+						'container' => true,
+						'fixed-height' => true,
+					),
 				),
 				'tag_spec' => array(
 					'amp_layout' => array(
@@ -3928,15 +4014,20 @@ class AMP_Allowed_Tags_Generated {
 		'amp-mathml' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-formula' => array(
-						'mandatory' => true,
-					),
+					'data-formula' => 4,
 					'inline' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-formula',
+					),
+					'required_extensions' => array(
+						'amp-mathml',
+					),
+					'supported_layouts' => array(
+						'container' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3955,14 +4046,24 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'autoplay' => array(),
-					'data-mediaid' => array(
-						'mandatory' => true,
-					),
+					'data-mediaid' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-mediaid',
+					),
+					'required_extensions' => array(
+						'amp-mowplayer',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -3985,6 +4086,16 @@ class AMP_Allowed_Tags_Generated {
 		'amp-next-page' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(
+					'reference_point_attrs' => array(
+						'separator' => array(
+							'unique' => true,
+						),
+					),
+					'required_extensions' => array(
+						'amp-next-page',
+					),
+				),
 				'tag_spec' => array(
 					'reference_points' => array(
 						'AMP-NEXT-PAGE > [separator]' => array(
@@ -4006,16 +4117,20 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
+					'src' => 23,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
+					),
+					'reference_point_attrs' => array(
+						'separator' => array(
+							'unique' => true,
 						),
 					),
+					'required_extensions' => array(
+						'amp-next-page',
+					),
 				),
 				'tag_spec' => array(
 					'reference_points' => array(
@@ -4034,17 +4149,31 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'data-client' => array(
-						'mandatory' => true,
-					),
-					'data-slot' => array(
-						'mandatory' => true,
-					),
+					'data-client' => 4,
+					'data-slot' => 4,
 					'type' => array(
 						'mandatory' => true,
 						'value' => array(
 							'adsense',
 						),
+						'value_set' => array(
+							'adsense' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-client',
+						'data-slot',
+						'type',
+					),
+					'reference_point_attrs' => array(
+						'separator' => array(
+							'unique' => true,
+						),
+					),
+					'required_extensions' => array(
+						'amp-next-page',
 					),
 				),
 				'tag_spec' => array(
@@ -4066,18 +4195,21 @@ class AMP_Allowed_Tags_Generated {
 		'amp-nexxtv-player' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-client' => array(
-						'mandatory' => true,
-					),
+					'data-client' => 4,
 					'data-mediaid' => array(
 						'mandatory' => true,
 						'value_regex' => '[^=/?:]+',
+						'value_regex_pcre' => '/^([^=\\/?:]+)$/u',
 					),
 					'data-mode' => array(
 						'value' => array(
 							'api',
 							'static',
 						),
+						'value_set' => array(
+							'api' => true,
+							'static' => true,
+						),
 					),
 					'data-origin' => array(
 						'value_url' => array(
@@ -4086,6 +4218,10 @@ class AMP_Allowed_Tags_Generated {
 								'https',
 								'http',
 							),
+							'protocol_set' => array(
+								'http' => true,
+								'https' => true,
+							),
 						),
 					),
 					'data-streamtype' => array(
@@ -4097,12 +4233,33 @@ class AMP_Allowed_Tags_Generated {
 							'playlist-marked',
 							'video',
 						),
+						'value_set' => array(
+							'album' => true,
+							'audio' => true,
+							'live' => true,
+							'playlist' => true,
+							'playlist-marked' => true,
+							'video' => true,
+						),
 					),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-client',
+						'data-mediaid',
+					),
+					'required_extensions' => array(
+						'amp-nexxtv-player',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4125,17 +4282,26 @@ class AMP_Allowed_Tags_Generated {
 		'amp-o2-player' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-bcid' => array(
-						'mandatory' => true,
+					'data-bcid' => 4,
+					'data-pid' => 4,
+					'media' => array(),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-bcid',
+						'data-pid',
 					),
-					'data-pid' => array(
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-o2-player',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4158,20 +4324,26 @@ class AMP_Allowed_Tags_Generated {
 		'amp-ooyala-player' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-embedcode' => array(
-						'mandatory' => true,
-					),
-					'data-pcode' => array(
-						'mandatory' => true,
+					'data-embedcode' => 4,
+					'data-pcode' => 4,
+					'data-playerid' => 4,
+					'media' => array(),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-embedcode',
+						'data-pcode',
+						'data-playerid',
 					),
-					'data-playerid' => array(
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-ooyala-player',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4192,20 +4364,18 @@ class AMP_Allowed_Tags_Generated {
 		'amp-orientation-observer' => array(
 			array(
 				'attr_spec_list' => array(
-					'alpha-range' => array(
-						'value_regex' => '(\\d+)\\s{1}(\\d+)',
-					),
-					'beta-range' => array(
-						'value_regex' => '(\\d+)\\s{1}(\\d+)',
-					),
-					'gamma-range' => array(
-						'value_regex' => '(\\d+)\\s{1}(\\d+)',
-					),
+					'alpha-range' => 40,
+					'beta-range' => 40,
+					'gamma-range' => 40,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-orientation-observer',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4223,33 +4393,24 @@ class AMP_Allowed_Tags_Generated {
 		'amp-pan-zoom' => array(
 			array(
 				'attr_spec_list' => array(
-					'disable-double-tap' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'initial-scale' => array(
-						'value_regex' => '[0-9]+(\\.[0-9]+)?',
-					),
-					'initial-x' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'initial-y' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'max-scale' => array(
-						'value_regex' => '[0-9]+(\\.[0-9]+)?',
-					),
+					'disable-double-tap' => 2,
+					'initial-scale' => 41,
+					'initial-x' => 20,
+					'initial-y' => 20,
+					'max-scale' => 41,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'reset-on-resize' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-pan-zoom',
 					),
-					'reset-on-resize' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4271,14 +4432,24 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'alt' => array(),
-					'data-do' => array(
-						'mandatory' => true,
-					),
+					'data-do' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-do',
+					),
+					'required_extensions' => array(
+						'amp-pinterest',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4304,18 +4475,18 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'allow-ssr-img' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'referrerpolicy' => array(
 						'value' => array(
 							'no-referrer',
 						),
+						'value_set' => array(
+							'no-referrer' => true,
+						),
 					),
 					'src' => array(
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_empty' => true,
@@ -4323,9 +4494,21 @@ class AMP_Allowed_Tags_Generated {
 							'protocol' => array(
 								'https',
 							),
+							'protocol_set' => array(
+								'https' => true,
+							),
 						),
 					),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
+					),
+					'supported_layouts' => array(
+						'fixed' => true,
+						'nodisplay' => true,
+					),
+				),
 				'tag_spec' => array(
 					'amp_layout' => array(
 						'defines_default_height' => true,
@@ -4342,33 +4525,23 @@ class AMP_Allowed_Tags_Generated {
 		'amp-playbuzz' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-comments' => array(
-						'value_casei' => array(
-							'false',
-							'true',
-						),
-					),
+					'data-comments' => 42,
 					'data-item' => array(),
-					'data-item-info' => array(
-						'value_casei' => array(
-							'false',
-							'true',
-						),
-					),
-					'data-share-buttons' => array(
-						'value_casei' => array(
-							'false',
-							'true',
-						),
-					),
+					'data-item-info' => 42,
+					'data-share-buttons' => 42,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'src' => array(),
 				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-playbuzz',
+					),
+					'supported_layouts' => array(
+						'fixed-height' => true,
+						'responsive' => true,
+					),
+				),
 				'tag_spec' => array(
 					'amp_layout' => array(
 						'supported_layouts' => array(
@@ -4387,21 +4560,23 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'intersection-ratios' => array(
 						'value_regex' => '^([0]*?\\.\\d*$|1$|0$)|([0]*?\\.\\d*|1|0)\\s{1}([0]*?\\.\\d*$|1$|0$)',
+						'value_regex_pcre' => '/^(^([0]*?\\.\\d*$|1$|0$)|([0]*?\\.\\d*|1|0)\\s{1}([0]*?\\.\\d*$|1$|0$))$/u',
 					),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'once' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
+					'once' => 2,
 					'target' => array(),
 					'viewport-margins' => array(
 						'value_regex' => '^(\\d+$|\\d+px$|\\d+vh$)|((\\d+|\\d+px|\\d+vh)\\s{1}(\\d+$|\\d+px$|\\d+vh$))',
+						'value_regex_pcre' => '/^(^(\\d+$|\\d+px$|\\d+vh$)|((\\d+|\\d+px|\\d+vh)\\s{1}(\\d+$|\\d+px$|\\d+vh$)))$/u',
+					),
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-position-observer',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4421,23 +4596,31 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'[data-referrer]' => array(),
 					'autoplay' => array(),
-					'data-account' => array(
-						'mandatory' => true,
-						'value_regex' => '[0-9a-zA-Z-]+',
-					),
-					'data-player' => array(
-						'mandatory' => true,
-						'value_regex' => '[0-9a-zA-Z-]+',
-					),
+					'data-account' => 43,
+					'data-player' => 43,
 					'data-terms' => array(),
 					'data-video' => array(
 						'value_regex' => '[0-9a-zA-Z-]+',
+						'value_regex_pcre' => '/^([0-9a-zA-Z-]+)$/u',
 					),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-account',
+						'data-player',
+					),
+					'required_extensions' => array(
+						'amp-powr-player',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4464,12 +4647,24 @@ class AMP_Allowed_Tags_Generated {
 					'data-embed-id' => array(
 						'mandatory' => true,
 						'value_regex' => '[0-9a-z-]+',
+						'value_regex_pcre' => '/^([0-9a-z-]+)$/u',
 					),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-embed-id',
+					),
+					'required_extensions' => array(
+						'amp-reach-player',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4491,17 +4686,28 @@ class AMP_Allowed_Tags_Generated {
 		'amp-recaptcha-input' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-action' => array(
-						'mandatory' => true,
-					),
-					'data-sitekey' => array(
-						'mandatory' => true,
-					),
+					'data-action' => 4,
+					'data-sitekey' => 4,
 					'name' => array(
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/u',
 						'mandatory' => true,
 					),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-action',
+						'data-sitekey',
+						'name',
+					),
+					'required_extensions' => array(
+						'amp-form',
+						'amp-recaptcha-input',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
+					),
+				),
 				'tag_spec' => array(
 					'amp_layout' => array(
 						'supported_layouts' => array(
@@ -4519,33 +4725,38 @@ class AMP_Allowed_Tags_Generated {
 		'amp-reddit' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-embedlive' => array(
-						'value_casei' => array(
-							'false',
-							'true',
-						),
-					),
-					'data-embedparent' => array(
-						'value_casei' => array(
-							'false',
-							'true',
-						),
-					),
+					'data-embedlive' => 42,
+					'data-embedparent' => 42,
 					'data-embedtype' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'comment',
 							'post',
 						),
+						'value_casei_set' => array(
+							'comment' => true,
+							'post' => true,
+						),
 					),
-					'data-src' => array(
-						'mandatory' => true,
-					),
+					'data-src' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-embedtype',
+						'data-src',
+					),
+					'required_extensions' => array(
+						'amp-reddit',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4568,15 +4779,19 @@ class AMP_Allowed_Tags_Generated {
 		'amp-riddle-quiz' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-riddle-id' => array(
-						'mandatory' => true,
-						'value_regex' => '[0-9]+',
-					),
+					'data-riddle-id' => 21,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-riddle-id',
+					),
+					'required_extensions' => array(
+						'amp-riddle-quiz',
+					),
+					'supported_layouts' => array(
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4596,20 +4811,24 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'src' => 23,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
 					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'required_extensions' => array(
+						'amp-script',
+					),
+					'supported_layouts' => array(
+						'container' => true,
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4639,11 +4858,7 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'[disabled]' => array(),
 					'[selected]' => array(),
-					'disabled' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'disabled' => 2,
 					'form' => array(),
 					'keyboard-select-mode' => array(
 						'value_casei' => array(
@@ -4651,20 +4866,51 @@ class AMP_Allowed_Tags_Generated {
 							'none',
 							'select',
 						),
+						'value_casei_set' => array(
+							'focus' => true,
+							'none' => true,
+							'select' => true,
+						),
 					),
 					'media' => array(),
-					'multiple' => array(
-						'value' => array(
-							'',
+					'multiple' => 2,
+					'name' => 0,
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'reference_point_attrs' => array(
+						'disabled' => array(
+							'unique' => false,
+							'value' => array(
+								'',
+							),
+							'value_set' => array(
+								'' => true,
+							),
+						),
+						'option' => array(
+							'unique' => false,
+						),
+						'selected' => array(
+							'unique' => false,
+							'value' => array(
+								'',
+							),
+							'value_set' => array(
+								'' => true,
+							),
 						),
 					),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+					'required_extensions' => array(
+						'amp-selector',
 					),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'container' => true,
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4701,16 +4947,24 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'side' => array(
 						'value' => array(
 							'left',
 							'right',
 						),
+						'value_set' => array(
+							'left' => true,
+							'right' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-sidebar',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4731,6 +4985,14 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-sidebar',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
+					),
+				),
 				'tag_spec' => array(
 					'amp_layout' => array(
 						'supported_layouts' => array(
@@ -4752,24 +5014,28 @@ class AMP_Allowed_Tags_Generated {
 					'custom-redirect-domain' => array(),
 					'custom-tracking-id' => array(
 						'value_regex_casei' => '^.{0,50}$',
+						'value_regex_casei_pcre' => '/^(^.{0,50}$)$/ui',
 					),
 					'excluded-domains' => array(),
 					'link-selector' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'publisher-code' => array(
 						'mandatory' => true,
 						'value_regex_casei' => '^[0-9]+X[0-9]+$',
+						'value_regex_casei_pcre' => '/^(^[0-9]+X[0-9]+$)$/ui',
 					),
-					'tracking' => array(
-						'value' => array(
-							'false',
-							'true',
-						),
+					'tracking' => 1,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'publisher-code',
+					),
+					'required_extensions' => array(
+						'amp-skimlinks',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4787,26 +5053,23 @@ class AMP_Allowed_Tags_Generated {
 		'amp-smartlinks' => array(
 			array(
 				'attr_spec_list' => array(
-					'exclusive-links' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'exclusive-links' => 2,
 					'link-attribute' => array(),
 					'link-selector' => array(),
-					'linkmate' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'linkmate' => 2,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'nrtv-account-name' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'nrtv-account-name',
 					),
-					'nrtv-account-name' => array(
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-smartlinks',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4826,6 +5089,7 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'data-share-endpoint' => array(
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
 						'value_url' => array(
 							'allow_relative' => false,
 							'protocol' => array(
@@ -4848,16 +5112,47 @@ class AMP_Allowed_Tags_Generated {
 								'wh',
 								'whatsapp',
 							),
+							'protocol_set' => array(
+								'bbmi' => true,
+								'fb-me' => true,
+								'fb-messenger' => true,
+								'ftp' => true,
+								'http' => true,
+								'https' => true,
+								'intent' => true,
+								'line' => true,
+								'mailto' => true,
+								'skype' => true,
+								'sms' => true,
+								'snapchat' => true,
+								'tel' => true,
+								'tg' => true,
+								'threema' => true,
+								'viber' => true,
+								'wh' => true,
+								'whatsapp' => true,
+							),
 						),
 					),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'type' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
 					),
-					'type' => array(
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-social-share',
+					),
+					'supported_layouts' => array(
+						'container' => true,
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4881,29 +5176,23 @@ class AMP_Allowed_Tags_Generated {
 		'amp-soundcloud' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-color' => array(
-						'value_regex_casei' => '([0-9a-f]{3}){1,2}',
-					),
-					'data-playlistid' => array(
-						'value_regex' => '[0-9]+',
-					),
+					'data-color' => 27,
+					'data-playlistid' => 20,
 					'data-secret-token' => array(
 						'value_regex' => '[A-Za-z0-9_-]+',
+						'value_regex_pcre' => '/^([A-Za-z0-9_-]+)$/u',
 					),
-					'data-trackid' => array(
-						'value_regex' => '[0-9]+',
-					),
-					'data-visual' => array(
-						'value_casei' => array(
-							'false',
-							'true',
-						),
-					),
+					'data-trackid' => 20,
+					'data-visual' => 42,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-soundcloud',
+					),
+					'supported_layouts' => array(
+						'fixed-height' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4921,35 +5210,42 @@ class AMP_Allowed_Tags_Generated {
 		'amp-springboard-player' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-content-id' => array(
-						'mandatory' => true,
-					),
-					'data-domain' => array(
-						'mandatory' => true,
-					),
-					'data-items' => array(
-						'mandatory' => true,
-					),
+					'data-content-id' => 4,
+					'data-domain' => 4,
+					'data-items' => 4,
 					'data-mode' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'playlist',
 							'video',
 						),
+						'value_casei_set' => array(
+							'playlist' => true,
+							'video' => true,
+						),
 					),
-					'data-player-id' => array(
-						'mandatory' => true,
-						'value_regex_casei' => '[a-z0-9]+',
-					),
-					'data-site-id' => array(
-						'mandatory' => true,
-						'value_regex' => '[0-9]+',
-					),
+					'data-player-id' => 28,
+					'data-site-id' => 21,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-content-id',
+						'data-domain',
+						'data-items',
+						'data-mode',
+						'data-player-id',
+						'data-site-id',
+					),
+					'required_extensions' => array(
+						'amp-springboard-player',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -4972,19 +5268,16 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'[src]' => array(),
 					'credentials' => array(),
-					'id' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-						'mandatory' => true,
-					),
+					'id' => 5,
 					'overridable' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'src' => 6,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'id',
+					),
+					'required_extensions' => array(
+						'amp-bind',
 					),
 				),
 				'tag_spec' => array(
@@ -4992,6 +5285,9 @@ class AMP_Allowed_Tags_Generated {
 						'first_child_tag_name_oneof' => array(
 							'script',
 						),
+						'first_child_tag_name_oneof_set' => array(
+							'script' => true,
+						),
 					),
 					'requires_extension' => array(
 						'amp-bind',
@@ -5003,12 +5299,13 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-sticky-ad' => array(
 			array(
-				'attr_spec_list' => array(
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 4,
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-sticky-ad',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5021,6 +5318,9 @@ class AMP_Allowed_Tags_Generated {
 						'first_child_tag_name_oneof' => array(
 							'amp-ad',
 						),
+						'first_child_tag_name_oneof_set' => array(
+							'amp-ad' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
 					'disallowed_ancestor' => array(
@@ -5036,72 +5336,27 @@ class AMP_Allowed_Tags_Generated {
 		'amp-story' => array(
 			array(
 				'attr_spec_list' => array(
-					'background-audio' => array(
-						'value_url' => array(
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
-					'bookend-config-src' => array(
-						'value_url' => array(
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
-					'poster-landscape-src' => array(
-						'value_url' => array(
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
-					'poster-portrait-src' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
-					'poster-square-src' => array(
-						'value_url' => array(
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
-					'publisher' => array(
-						'mandatory' => true,
-					),
-					'publisher-logo-src' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
-					'standalone' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'supports-landscape' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'title' => array(
-						'mandatory' => true,
+					'background-audio' => 44,
+					'bookend-config-src' => 44,
+					'poster-landscape-src' => 44,
+					'poster-portrait-src' => 45,
+					'poster-square-src' => 44,
+					'publisher' => 4,
+					'publisher-logo-src' => 45,
+					'standalone' => 12,
+					'supports-landscape' => 2,
+					'title' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'poster-portrait-src',
+						'publisher',
+						'publisher-logo-src',
+						'standalone',
+						'title',
+					),
+					'required_extensions' => array(
+						'amp-story',
 					),
 				),
 				'tag_spec' => array(
@@ -5117,6 +5372,17 @@ class AMP_Allowed_Tags_Generated {
 							'amp-story-bookend',
 							'amp-story-page',
 						),
+						'child_tag_name_oneof_set' => array(
+							'amp-analytics' => true,
+							'amp-consent' => true,
+							'amp-geo' => true,
+							'amp-pixel' => true,
+							'amp-sidebar' => true,
+							'amp-story-access' => true,
+							'amp-story-auto-ads' => true,
+							'amp-story-bookend' => true,
+							'amp-story-page' => true,
+						),
 						'mandatory_min_num_child_tags' => 1,
 					),
 					'mandatory_parent' => 'body',
@@ -5130,16 +5396,21 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'type' => array(
 						'value' => array(
 							'blocking',
 							'notification',
 						),
+						'value_set' => array(
+							'blocking' => true,
+							'notification' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-access',
 					),
 				),
 				'tag_spec' => array(
@@ -5153,6 +5424,11 @@ class AMP_Allowed_Tags_Generated {
 		'amp-story-auto-ads' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-story-auto-ads',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-story',
 					'requires_extension' => array(
@@ -5166,19 +5442,12 @@ class AMP_Allowed_Tags_Generated {
 		'amp-story-bookend' => array(
 			array(
 				'attr_spec_list' => array(
-					'layout' => array(
-						'mandatory' => true,
-						'value' => array(
-							'nodisplay',
-						),
-					),
-					'src' => array(
-						'value_url' => array(
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
+					'layout' => 46,
+					'src' => 44,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'layout',
 					),
 				),
 				'tag_spec' => array(
@@ -5190,9 +5459,18 @@ class AMP_Allowed_Tags_Generated {
 		'amp-story-consent' => array(
 			array(
 				'attr_spec_list' => array(
-					'id' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-						'mandatory' => true,
+					'id' => 5,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'id',
+					),
+					'required_extensions' => array(
+						'amp-consent',
+						'amp-story',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5205,6 +5483,9 @@ class AMP_Allowed_Tags_Generated {
 						'child_tag_name_oneof' => array(
 							'script',
 						),
+						'child_tag_name_oneof_set' => array(
+							'script' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
 					'mandatory_parent' => 'amp-consent',
@@ -5218,6 +5499,85 @@ class AMP_Allowed_Tags_Generated {
 		'amp-story-cta-layer' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(
+					'reference_point_attrs' => array(
+						'animate-in' => array(
+							'unique' => false,
+							'value' => array(
+								'drop',
+								'fade-in',
+								'fly-in-bottom',
+								'fly-in-left',
+								'fly-in-right',
+								'fly-in-top',
+								'pan-down',
+								'pan-left',
+								'pan-right',
+								'pan-up',
+								'pulse',
+								'rotate-in-left',
+								'rotate-in-right',
+								'twirl-in',
+								'whoosh-in-left',
+								'whoosh-in-right',
+								'zoom-in',
+								'zoom-out',
+							),
+							'value_set' => array(
+								'drop' => true,
+								'fade-in' => true,
+								'fly-in-bottom' => true,
+								'fly-in-left' => true,
+								'fly-in-right' => true,
+								'fly-in-top' => true,
+								'pan-down' => true,
+								'pan-left' => true,
+								'pan-right' => true,
+								'pan-up' => true,
+								'pulse' => true,
+								'rotate-in-left' => true,
+								'rotate-in-right' => true,
+								'twirl-in' => true,
+								'whoosh-in-left' => true,
+								'whoosh-in-right' => true,
+								'zoom-in' => true,
+								'zoom-out' => true,
+							),
+						),
+						'animate-in-after' => array(
+							'unique' => false,
+						),
+						'animate-in-delay' => array(
+							'unique' => false,
+						),
+						'animate-in-duration' => array(
+							'unique' => false,
+						),
+						'animate-in-timing-function' => array(
+							'unique' => false,
+						),
+						'scale-end' => array(
+							'unique' => false,
+							'value_regex' => '[0-9]+([.][0-9]+)?',
+							'value_regex_pcre' => '/^([0-9]+([.][0-9]+)?)$/u',
+						),
+						'scale-start' => array(
+							'unique' => false,
+							'value_regex' => '[0-9]+([.][0-9]+)?',
+							'value_regex_pcre' => '/^([0-9]+([.][0-9]+)?)$/u',
+						),
+						'translate-x' => array(
+							'unique' => false,
+							'value_regex_casei' => '[0-9]+px',
+							'value_regex_casei_pcre' => '/^([0-9]+px)$/ui',
+						),
+						'translate-y' => array(
+							'unique' => false,
+							'value_regex_casei' => '[0-9]+px',
+							'value_regex_casei_pcre' => '/^([0-9]+px)$/ui',
+						),
+					),
+				),
 				'tag_spec' => array(
 					'descendant_tag_list' => 'amp-story-cta-layer-allowed-descendants',
 					'mandatory_ancestor' => 'amp-story-page',
@@ -5241,6 +5601,232 @@ class AMP_Allowed_Tags_Generated {
 							'thirds',
 							'vertical',
 						),
+						'value_set' => array(
+							'fill' => true,
+							'horizontal' => true,
+							'thirds' => true,
+							'vertical' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'template',
+					),
+					'reference_point_attrs' => array(
+						'align-content' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'space-around',
+								'space-between',
+								'space-evenly',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'space-around' => true,
+								'space-between' => true,
+								'space-evenly' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'align-items' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'align-self' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'animate-in' => array(
+							'unique' => false,
+							'value' => array(
+								'drop',
+								'fade-in',
+								'fly-in-bottom',
+								'fly-in-left',
+								'fly-in-right',
+								'fly-in-top',
+								'pan-down',
+								'pan-left',
+								'pan-right',
+								'pan-up',
+								'pulse',
+								'rotate-in-left',
+								'rotate-in-right',
+								'twirl-in',
+								'whoosh-in-left',
+								'whoosh-in-right',
+								'zoom-in',
+								'zoom-out',
+							),
+							'value_set' => array(
+								'drop' => true,
+								'fade-in' => true,
+								'fly-in-bottom' => true,
+								'fly-in-left' => true,
+								'fly-in-right' => true,
+								'fly-in-top' => true,
+								'pan-down' => true,
+								'pan-left' => true,
+								'pan-right' => true,
+								'pan-up' => true,
+								'pulse' => true,
+								'rotate-in-left' => true,
+								'rotate-in-right' => true,
+								'twirl-in' => true,
+								'whoosh-in-left' => true,
+								'whoosh-in-right' => true,
+								'zoom-in' => true,
+								'zoom-out' => true,
+							),
+						),
+						'animate-in-after' => array(
+							'unique' => false,
+						),
+						'animate-in-delay' => array(
+							'unique' => false,
+						),
+						'animate-in-duration' => array(
+							'unique' => false,
+						),
+						'animate-in-timing-function' => array(
+							'unique' => false,
+						),
+						'data-tooltip-icon' => array(
+							'unique' => false,
+							'value_url' => array(
+								'protocol' => array(
+									'http',
+									'https',
+									'data',
+								),
+								'protocol_set' => array(
+									'data' => true,
+									'http' => true,
+									'https' => true,
+								),
+							),
+						),
+						'grid-area' => array(
+							'unique' => false,
+						),
+						'interactive' => array(
+							'unique' => false,
+							'value' => array(
+								'',
+							),
+							'value_set' => array(
+								'' => true,
+							),
+						),
+						'justify-content' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'space-around',
+								'space-between',
+								'space-evenly',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'space-around' => true,
+								'space-between' => true,
+								'space-evenly' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'justify-items' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'justify-self' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'scale-end' => array(
+							'unique' => false,
+							'value_regex' => '[0-9]+([.][0-9]+)?',
+							'value_regex_pcre' => '/^([0-9]+([.][0-9]+)?)$/u',
+						),
+						'scale-start' => array(
+							'unique' => false,
+							'value_regex' => '[0-9]+([.][0-9]+)?',
+							'value_regex_pcre' => '/^([0-9]+([.][0-9]+)?)$/u',
+						),
+						'target' => array(
+							'unique' => false,
+							'value' => array(
+								'_blank',
+							),
+							'value_set' => array(
+								'_blank' => true,
+							),
+						),
+						'translate-x' => array(
+							'unique' => false,
+							'value_regex_casei' => '[0-9]+px',
+							'value_regex_casei_pcre' => '/^([0-9]+px)$/ui',
+						),
+						'translate-y' => array(
+							'unique' => false,
+							'value_regex_casei' => '[0-9]+px',
+							'value_regex_casei_pcre' => '/^([0-9]+px)$/ui',
+						),
 					),
 				),
 				'tag_spec' => array(
@@ -5263,17 +5849,15 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'auto-advance-after' => array(),
-					'background-audio' => array(
-						'value_url' => array(
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
+					'background-audio' => 44,
+					'id' => 5,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'id',
 					),
-					'id' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-story',
 					),
 				),
 				'tag_spec' => array(
@@ -5285,6 +5869,13 @@ class AMP_Allowed_Tags_Generated {
 							'amp-story-grid-layer',
 							'amp-story-page-attachment',
 						),
+						'child_tag_name_oneof_set' => array(
+							'amp-analytics' => true,
+							'amp-pixel' => true,
+							'amp-story-cta-layer' => true,
+							'amp-story-grid-layer' => true,
+							'amp-story-page-attachment' => true,
+						),
 						'mandatory_min_num_child_tags' => 1,
 					),
 					'mandatory_parent' => 'amp-story',
@@ -5297,11 +5888,11 @@ class AMP_Allowed_Tags_Generated {
 		'amp-story-page-attachment' => array(
 			array(
 				'attr_spec_list' => array(
-					'layout' => array(
-						'mandatory' => true,
-						'value' => array(
-							'nodisplay',
-						),
+					'layout' => 46,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'layout',
 					),
 				),
 				'tag_spec' => array(
@@ -5315,19 +5906,27 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'[datetime]' => array(),
 					'[title]' => array(),
-					'cutoff' => array(
-						'value_regex' => '\\d+',
-					),
+					'cutoff' => 30,
 					'datetime' => array(
 						'mandatory' => true,
 						'value_regex' => '\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d(:[0-5]\\d(\\.\\d+)?)?(Z|[+-][0-1][0-9]:[0-5][0-9])',
+						'value_regex_pcre' => '/^(\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d(:[0-5]\\d(\\.\\d+)?)?(Z|[+-][0-1][0-9]:[0-5][0-9]))$/u',
 					),
 					'locale' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'datetime',
+					),
+					'required_extensions' => array(
+						'amp-timeago',
+					),
+					'supported_layouts' => array(
+						'fixed' => true,
+						'fixed-height' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5349,20 +5948,35 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'overflow-style' => array(
 						'value' => array(
 							'right',
 							'default',
 						),
+						'value_set' => array(
+							'default' => true,
+							'right' => true,
+						),
 					),
 				),
-				'tag_spec' => array(
-					'amp_layout' => array(
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-truncate-text',
+					),
+					'supported_layouts' => array(
+						'container' => true,
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
+					),
+				),
+				'tag_spec' => array(
+					'amp_layout' => array(
 						'supported_layouts' => array(
 							5,
 							6,
@@ -5388,13 +6002,9 @@ class AMP_Allowed_Tags_Generated {
 					'data-conversation' => array(),
 					'data-limit' => array(),
 					'data-link-color' => array(),
-					'data-momentid' => array(
-						'value_regex' => '\\d+',
-					),
+					'data-momentid' => 30,
 					'data-theme' => array(),
-					'data-timeline-id' => array(
-						'value_regex' => '\\d+',
-					),
+					'data-timeline-id' => 30,
 					'data-timeline-owner-screen-name' => array(),
 					'data-timeline-screen-name' => array(),
 					'data-timeline-slug' => array(),
@@ -5406,17 +6016,29 @@ class AMP_Allowed_Tags_Generated {
 								'http',
 								'https',
 							),
+							'protocol_set' => array(
+								'http' => true,
+								'https' => true,
+							),
 						),
 					),
-					'data-timeline-user-id' => array(
-						'value_regex' => '\\d+',
-					),
+					'data-timeline-user-id' => 30,
 					'data-tweetid' => array(),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-twitter',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5439,16 +6061,16 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'amp-user-location' => array(
 			array(
-				'attr_spec_list' => array(
-					'id' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-						'mandatory' => true,
+				'attr_spec_list' => 2,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'id',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-user-location',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5467,34 +6089,25 @@ class AMP_Allowed_Tags_Generated {
 		'amp-user-notification' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-dismiss-href' => array(
-						'value_url' => array(
-							'allow_empty' => false,
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'data-show-if-href' => array(
-						'value_url' => array(
-							'allow_empty' => false,
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'data-dismiss-href' => 47,
+					'data-show-if-href' => 47,
 					'enctype' => array(
 						'value' => array(
 							'application/x-www-form-urlencoded',
 						),
+						'value_set' => array(
+							'application/x-www-form-urlencoded' => true,
+						),
 					),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-user-notification',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5529,78 +6142,38 @@ class AMP_Allowed_Tags_Generated {
 					'artist' => array(),
 					'artwork' => array(),
 					'attribution' => array(),
-					'autoplay' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'controls' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'autoplay' => 2,
+					'controls' => 2,
 					'controlslist' => array(),
 					'crossorigin' => array(),
-					'disableremoteplayback' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'dock' => array(
-						'requires_extension' => array(
-							'amp-video-docking',
-						),
-					),
+					'disableremoteplayback' => 2,
+					'dock' => 22,
 					'lightbox' => array(),
-					'lightbox-thumbnail-id' => array(
-						'value_regex_casei' => '^[a-z][a-z\\d_-]*',
-					),
-					'loop' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'lightbox-thumbnail-id' => 37,
+					'loop' => 2,
 					'media' => array(),
-					'muted' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'noaudio' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'muted' => 2,
+					'noaudio' => 2,
+					'noloading' => 2,
 					'object-fit' => array(),
 					'object-position' => array(),
 					'placeholder' => array(),
 					'poster' => array(),
-					'preload' => array(
-						'value' => array(
-							'auto',
-							'metadata',
-							'none',
-							'',
-						),
-					),
-					'rotate-to-fullscreen' => array(
-						'value' => array(
-							'',
-						),
+					'preload' => 48,
+					'rotate-to-fullscreen' => 2,
+					'src' => 6,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-video',
 					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5642,77 +6215,40 @@ class AMP_Allowed_Tags_Generated {
 					'artist' => array(),
 					'artwork' => array(),
 					'attribution' => array(),
-					'autoplay' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'controls' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'autoplay' => 12,
+					'controls' => 2,
 					'controlslist' => array(),
 					'crossorigin' => array(),
-					'disableremoteplayback' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'dock' => array(
-						'requires_extension' => array(
-							'amp-video-docking',
-						),
-					),
-					'loop' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'disableremoteplayback' => 2,
+					'dock' => 22,
+					'loop' => 2,
 					'media' => array(),
-					'muted' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'noaudio' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'muted' => 2,
+					'noaudio' => 2,
+					'noloading' => 2,
 					'object-fit' => array(),
 					'object-position' => array(),
 					'placeholder' => array(),
-					'poster' => array(
-						'mandatory' => true,
-					),
-					'preload' => array(
-						'value' => array(
-							'auto',
-							'metadata',
-							'none',
-							'',
-						),
+					'poster' => 4,
+					'preload' => 48,
+					'rotate-to-fullscreen' => 2,
+					'src' => 6,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'autoplay',
+						'poster',
 					),
-					'rotate-to-fullscreen' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-video',
 					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5744,53 +6280,35 @@ class AMP_Allowed_Tags_Generated {
 					'artist' => array(),
 					'artwork' => array(),
 					'attribution' => array(),
-					'autoplay' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'dock' => array(
-						'requires_extension' => array(
-							'amp-video-docking',
-						),
-					),
-					'implements-media-session' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'implements-rotate-to-fullscreen' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'autoplay' => 2,
+					'dock' => 22,
+					'implements-media-session' => 2,
+					'implements-rotate-to-fullscreen' => 2,
 					'lightbox' => array(),
-					'lightbox-thumbnail-id' => array(
-						'value_regex_casei' => '^[a-z][a-z\\d_-]*',
-					),
+					'lightbox-thumbnail-id' => 37,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'poster' => array(
-						'mandatory' => true,
-					),
+					'noloading' => 2,
+					'poster' => 4,
 					'referrerpolicy' => array(),
-					'rotate-to-fullscreen' => array(
-						'value' => array(
-							'',
-						),
+					'rotate-to-fullscreen' => 2,
+					'src' => 49,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'poster',
+						'src',
 					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'https',
-							),
-						),
+					'required_extensions' => array(
+						'amp-video-iframe',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5820,51 +6338,39 @@ class AMP_Allowed_Tags_Generated {
 					'artist' => array(),
 					'artwork' => array(),
 					'attribution' => array(),
-					'autoplay' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'dock' => array(
-						'requires_extension' => array(
-							'amp-video-docking',
-						),
-					),
-					'implements-media-session' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'implements-rotate-to-fullscreen' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'autoplay' => 2,
+					'dock' => 22,
+					'implements-media-session' => 2,
+					'implements-rotate-to-fullscreen' => 2,
 					'lightbox' => array(),
-					'lightbox-thumbnail-id' => array(
-						'value_regex_casei' => '^[a-z][a-z\\d_-]*',
-					),
+					'lightbox-thumbnail-id' => 37,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'referrerpolicy' => array(),
-					'rotate-to-fullscreen' => array(
-						'value' => array(
-							'',
-						),
+					'rotate-to-fullscreen' => 2,
+					'src' => 49,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
 					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'https',
-							),
+					'reference_point_attrs' => array(
+						'placeholder' => array(
+							'unique' => true,
 						),
 					),
+					'required_extensions' => array(
+						'amp-video-iframe',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'intrinsic' => true,
+						'nodisplay' => true,
+						'responsive' => true,
+					),
 				),
 				'tag_spec' => array(
 					'amp_layout' => array(
@@ -5895,20 +6401,24 @@ class AMP_Allowed_Tags_Generated {
 		'amp-vimeo' => array(
 			array(
 				'attr_spec_list' => array(
-					'autoplay' => array(
-						'value' => array(
-							'',
-						),
+					'autoplay' => 2,
+					'data-videoid' => 21,
+					'media' => array(),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-videoid',
 					),
-					'data-videoid' => array(
-						'mandatory' => true,
-						'value_regex' => '[0-9]+',
+					'required_extensions' => array(
+						'amp-vimeo',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5930,14 +6440,24 @@ class AMP_Allowed_Tags_Generated {
 		'amp-vine' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-vineid' => array(
-						'mandatory' => true,
-					),
+					'data-vineid' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-vineid',
+					),
+					'required_extensions' => array(
+						'amp-vine',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5964,15 +6484,26 @@ class AMP_Allowed_Tags_Generated {
 					'data-profileid' => array(
 						'mandatory' => true,
 						'value_regex' => '[0-9a-f]*',
+						'value_regex_pcre' => '/^([0-9a-f]*)$/u',
 					),
-					'data-videoid' => array(
-						'mandatory' => true,
-					),
+					'data-videoid' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-profileid',
+						'data-videoid',
+					),
+					'required_extensions' => array(
+						'amp-viqeo-player',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -5994,14 +6525,21 @@ class AMP_Allowed_Tags_Generated {
 		'amp-vk' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-embedtype' => array(
-						'mandatory' => true,
-					),
+					'data-embedtype' => 4,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-embedtype',
+					),
+					'required_extensions' => array(
+						'amp-vk',
+					),
+					'supported_layouts' => array(
+						'fixed' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -6021,52 +6559,44 @@ class AMP_Allowed_Tags_Generated {
 		'amp-web-push' => array(
 			array(
 				'attr_spec_list' => array(
-					'helper-iframe-url' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'helper-iframe-url' => 19,
 					'id' => array(
 						'mandatory' => true,
 						'value' => array(
 							'amp-web-push',
 						),
-					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'permission-dialog-url' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
+						'value_set' => array(
+							'amp-web-push' => true,
 						),
 					),
+					'media' => array(),
+					'noloading' => 2,
+					'permission-dialog-url' => 19,
 					'service-worker-scope' => array(
 						'value_url' => array(
 							'protocol' => array(
 								'https',
 							),
-						),
-					),
-					'service-worker-url' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
+							'protocol_set' => array(
+								'https' => true,
 							),
 						),
 					),
+					'service-worker-url' => 19,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'helper-iframe-url',
+						'id',
+						'permission-dialog-url',
+						'service-worker-url',
+					),
+					'required_extensions' => array(
+						'amp-web-push',
+					),
+					'supported_layouts' => array(
+						'nodisplay' => true,
+					),
 				),
 				'tag_spec' => array(
 					'amp_layout' => array(
@@ -6085,11 +6615,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'noloading' => 2,
 					'visibility' => array(
 						'mandatory' => true,
 						'value' => array(
@@ -6097,6 +6623,22 @@ class AMP_Allowed_Tags_Generated {
 							'subscribed',
 							'unsubscribed',
 						),
+						'value_set' => array(
+							'blocked' => true,
+							'subscribed' => true,
+							'unsubscribed' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'visibility',
+					),
+					'required_extensions' => array(
+						'amp-web-push',
+					),
+					'supported_layouts' => array(
+						'fixed' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -6118,17 +6660,25 @@ class AMP_Allowed_Tags_Generated {
 					'data-media-hashed-id' => array(
 						'mandatory' => true,
 						'value_regex' => '[0-9a-zA-Z]+',
+						'value_regex_pcre' => '/^([0-9a-zA-Z]+)$/u',
 					),
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+					'rotate-to-fullscreen' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-media-hashed-id',
 					),
-					'rotate-to-fullscreen' => array(
-						'value' => array(
-							'',
-						),
+					'required_extensions' => array(
+						'amp-wistia-player',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -6150,17 +6700,26 @@ class AMP_Allowed_Tags_Generated {
 		'amp-yotpo' => array(
 			array(
 				'attr_spec_list' => array(
-					'data-app-key' => array(
-						'mandatory' => true,
+					'data-app-key' => 4,
+					'data-widget-type' => 4,
+					'media' => array(),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'data-app-key',
+						'data-widget-type',
 					),
-					'data-widget-type' => array(
-						'mandatory' => true,
+					'required_extensions' => array(
+						'amp-yotpo',
 					),
-					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -6191,27 +6750,30 @@ class AMP_Allowed_Tags_Generated {
 							'include',
 							'omit',
 						),
-					),
-					'data-live-channelid' => array(
-						'value_regex' => '[^=/?:]+',
-					),
-					'data-videoid' => array(
-						'value_regex' => '[^=/?:]+',
-					),
-					'dock' => array(
-						'requires_extension' => array(
-							'amp-video-docking',
+						'value_casei_set' => array(
+							'include' => true,
+							'omit' => true,
 						),
 					),
+					'data-live-channelid' => 50,
+					'data-videoid' => 50,
+					'dock' => 22,
 					'lightbox' => array(),
-					'lightbox-thumbnail-id' => array(
-						'value_regex_casei' => '^[a-z][a-z\\d_-]*',
-					),
+					'lightbox-thumbnail-id' => 37,
 					'media' => array(),
-					'noloading' => array(
-						'value' => array(
-							'',
-						),
+					'noloading' => 2,
+				),
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-youtube',
+					),
+					'supported_layouts' => array(
+						'fill' => true,
+						'fixed' => true,
+						'fixed-height' => true,
+						'flex-item' => true,
+						'nodisplay' => true,
+						'responsive' => true,
 					),
 				),
 				'tag_spec' => array(
@@ -6234,12 +6796,14 @@ class AMP_Allowed_Tags_Generated {
 		'article' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'aside' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -6251,17 +6815,9 @@ class AMP_Allowed_Tags_Generated {
 					'loop' => array(),
 					'muted' => array(),
 					'preload' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'data',
-								'https',
-							),
-						),
-					),
+					'src' => 51,
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'noscript',
 					'mandatory_ancestor_suggested_alternative' => 'amp-audio',
@@ -6272,6 +6828,7 @@ class AMP_Allowed_Tags_Generated {
 		'b' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -6282,6 +6839,9 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'/',
 						),
+						'value_set' => array(
+							'/' => true,
+						),
 					),
 					'target' => array(
 						'value_casei' => array(
@@ -6289,8 +6849,14 @@ class AMP_Allowed_Tags_Generated {
 							'_self',
 							'_top',
 						),
+						'value_casei_set' => array(
+							'_blank' => true,
+							'_self' => true,
+							'_top' => true,
+						),
 					),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_parent' => 'head',
 					'unique' => true,
@@ -6300,6 +6866,7 @@ class AMP_Allowed_Tags_Generated {
 		'bdi' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -6308,12 +6875,14 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'dir' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'big' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -6321,23 +6890,16 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'align' => array(),
-					'cite' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_empty' => true,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'cite' => 52,
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'body' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory' => true,
 					'mandatory_parent' => 'html',
@@ -6349,6 +6911,7 @@ class AMP_Allowed_Tags_Generated {
 		'br' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -6358,36 +6921,26 @@ class AMP_Allowed_Tags_Generated {
 					'[disabled]' => array(),
 					'[type]' => array(),
 					'[value]' => array(),
-					'disabled' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'disabled' => 2,
+					'name' => 0,
 					'role' => array(),
 					'tabindex' => array(),
 					'type' => array(),
 					'value' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 			array(
 				'attr_spec_list' => array(
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
-					'open-button' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'name' => 0,
+					'open-button' => 2,
 					'role' => array(),
 					'tabindex' => array(),
 					'type' => array(),
 					'value' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'amp-app-banner',
 					'spec_name' => 'amp-app-banner button[open-button]',
@@ -6397,12 +6950,14 @@ class AMP_Allowed_Tags_Generated {
 		'caption' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'center' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -6469,9 +7024,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -6487,6 +7040,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -6496,6 +7050,7 @@ class AMP_Allowed_Tags_Generated {
 		'cite' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -6559,9 +7114,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -6577,6 +7130,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -6586,34 +7140,35 @@ class AMP_Allowed_Tags_Generated {
 		'code' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'col' => array(
 			array(
-				'attr_spec_list' => array(
-					'span' => array(),
-				),
+				'attr_spec_list' => 7,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'colgroup' => array(
 			array(
-				'attr_spec_list' => array(
-					'span' => array(),
-				),
+				'attr_spec_list' => 7,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'data' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'datalist' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'spec_url' => 'https://amp.dev/documentation/components/amp-form',
 				),
@@ -6622,86 +7177,14 @@ class AMP_Allowed_Tags_Generated {
 		'dd' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'defs' => array(
 			array(
-				'attr_spec_list' => array(
-					'alignment-baseline' => array(),
-					'baseline-shift' => array(),
-					'clip' => array(),
-					'clip-path' => array(),
-					'clip-rule' => array(),
-					'color' => array(),
-					'color-interpolation' => array(),
-					'color-interpolation-filters' => array(),
-					'color-profile' => array(),
-					'color-rendering' => array(),
-					'cursor' => array(),
-					'direction' => array(),
-					'display' => array(),
-					'dominant-baseline' => array(),
-					'enable-background' => array(),
-					'externalresourcesrequired' => array(),
-					'fill' => array(),
-					'fill-opacity' => array(),
-					'fill-rule' => array(),
-					'filter' => array(),
-					'flood-color' => array(),
-					'flood-opacity' => array(),
-					'focusable' => array(),
-					'font-family' => array(),
-					'font-size' => array(),
-					'font-size-adjust' => array(),
-					'font-stretch' => array(),
-					'font-style' => array(),
-					'font-variant' => array(),
-					'font-weight' => array(),
-					'glyph-orientation-horizontal' => array(),
-					'glyph-orientation-vertical' => array(),
-					'image-rendering' => array(),
-					'kerning' => array(),
-					'letter-spacing' => array(),
-					'lighting-color' => array(),
-					'marker-end' => array(),
-					'marker-mid' => array(),
-					'marker-start' => array(),
-					'mask' => array(),
-					'opacity' => array(),
-					'overflow' => array(),
-					'pointer-events' => array(),
-					'requiredextensions' => array(),
-					'requiredfeatures' => array(),
-					'shape-rendering' => array(),
-					'stop-color' => array(),
-					'stop-opacity' => array(),
-					'stroke' => array(),
-					'stroke-dasharray' => array(),
-					'stroke-dashoffset' => array(),
-					'stroke-linecap' => array(),
-					'stroke-linejoin' => array(),
-					'stroke-miterlimit' => array(),
-					'stroke-opacity' => array(),
-					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'systemlanguage' => array(),
-					'text-anchor' => array(),
-					'text-decoration' => array(),
-					'text-rendering' => array(),
-					'transform' => array(),
-					'unicode-bidi' => array(),
-					'vector-effect' => array(),
-					'visibility' => array(),
-					'word-spacing' => array(),
-					'writing-mode' => array(),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-				),
+				'attr_spec_list' => 8,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -6710,33 +7193,15 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'del' => array(
 			array(
-				'attr_spec_list' => array(
-					'cite' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_empty' => true,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
-					'datetime' => array(),
-				),
+				'attr_spec_list' => 9,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'desc' => array(
 			array(
-				'attr_spec_list' => array(
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-				),
+				'attr_spec_list' => 10,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -6747,39 +7212,40 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'[open]' => array(),
-					'open' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'open' => 2,
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'dfn' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'dir' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'div' => array(
 			array(
-				'attr_spec_list' => array(
-					'align' => array(),
-				),
+				'attr_spec_list' => 11,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 			array(
 				'attr_spec_list' => array(
 					'align' => array(),
-					'verify-error' => array(
-						'mandatory' => true,
+					'verify-error' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'verify-error',
 					),
 				),
 				'tag_spec' => array(
@@ -6790,11 +7256,13 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'align' => array(),
-					'template' => array(
-						'mandatory' => true,
-					),
-					'verify-error' => array(
-						'mandatory' => true,
+					'template' => 4,
+					'verify-error' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'template',
+						'verify-error',
 					),
 				),
 				'tag_spec' => array(
@@ -6805,8 +7273,11 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'align' => array(),
-					'submitting' => array(
-						'mandatory' => true,
+					'submitting' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'submitting',
 					),
 				),
 				'tag_spec' => array(
@@ -6817,11 +7288,13 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'align' => array(),
-					'submitting' => array(
-						'mandatory' => true,
-					),
-					'template' => array(
-						'mandatory' => true,
+					'submitting' => 4,
+					'template' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'submitting',
+						'template',
 					),
 				),
 				'tag_spec' => array(
@@ -6832,8 +7305,11 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'align' => array(),
-					'submit-success' => array(
-						'mandatory' => true,
+					'submit-success' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'submit-success',
 					),
 				),
 				'tag_spec' => array(
@@ -6844,11 +7320,13 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'align' => array(),
-					'submit-success' => array(
-						'mandatory' => true,
-					),
-					'template' => array(
-						'mandatory' => true,
+					'submit-success' => 4,
+					'template' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'submit-success',
+						'template',
 					),
 				),
 				'tag_spec' => array(
@@ -6859,8 +7337,11 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'align' => array(),
-					'submit-error' => array(
-						'mandatory' => true,
+					'submit-error' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'submit-error',
 					),
 				),
 				'tag_spec' => array(
@@ -6871,11 +7352,13 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'align' => array(),
-					'submit-error' => array(
-						'mandatory' => true,
-					),
-					'template' => array(
-						'mandatory' => true,
+					'submit-error' => 4,
+					'template' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'submit-error',
+						'template',
 					),
 				),
 				'tag_spec' => array(
@@ -6885,8 +7368,11 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'first' => array(
-						'mandatory' => true,
+					'first' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'first',
 					),
 				),
 				'tag_spec' => array(
@@ -6897,8 +7383,11 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'second' => array(
-						'mandatory' => true,
+					'second' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'second',
 					),
 				),
 				'tag_spec' => array(
@@ -6911,12 +7400,14 @@ class AMP_Allowed_Tags_Generated {
 		'dl' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'dt' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -6984,9 +7475,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -7002,6 +7491,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -7011,6 +7501,7 @@ class AMP_Allowed_Tags_Generated {
 		'em' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -7073,9 +7564,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -7094,6 +7583,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -7165,9 +7655,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -7184,6 +7672,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -7192,81 +7681,8 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'feflood' => array(
 			array(
-				'attr_spec_list' => array(
-					'alignment-baseline' => array(),
-					'baseline-shift' => array(),
-					'clip' => array(),
-					'clip-path' => array(),
-					'clip-rule' => array(),
-					'color' => array(),
-					'color-interpolation' => array(),
-					'color-interpolation-filters' => array(),
-					'color-profile' => array(),
-					'color-rendering' => array(),
-					'cursor' => array(),
-					'direction' => array(),
-					'display' => array(),
-					'dominant-baseline' => array(),
-					'enable-background' => array(),
-					'fill' => array(),
-					'fill-opacity' => array(),
-					'fill-rule' => array(),
-					'filter' => array(),
-					'flood-color' => array(),
-					'flood-opacity' => array(),
-					'focusable' => array(),
-					'font-family' => array(),
-					'font-size' => array(),
-					'font-size-adjust' => array(),
-					'font-stretch' => array(),
-					'font-style' => array(),
-					'font-variant' => array(),
-					'font-weight' => array(),
-					'glyph-orientation-horizontal' => array(),
-					'glyph-orientation-vertical' => array(),
-					'height' => array(),
-					'image-rendering' => array(),
-					'kerning' => array(),
-					'letter-spacing' => array(),
-					'lighting-color' => array(),
-					'marker-end' => array(),
-					'marker-mid' => array(),
-					'marker-start' => array(),
-					'mask' => array(),
-					'opacity' => array(),
-					'overflow' => array(),
-					'pointer-events' => array(),
-					'result' => array(),
-					'shape-rendering' => array(),
-					'stop-color' => array(),
-					'stop-opacity' => array(),
-					'stroke' => array(),
-					'stroke-dasharray' => array(),
-					'stroke-dashoffset' => array(),
-					'stroke-linecap' => array(),
-					'stroke-linejoin' => array(),
-					'stroke-miterlimit' => array(),
-					'stroke-opacity' => array(),
-					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'text-anchor' => array(),
-					'text-decoration' => array(),
-					'text-rendering' => array(),
-					'unicode-bidi' => array(),
-					'vector-effect' => array(),
-					'visibility' => array(),
-					'width' => array(),
-					'word-spacing' => array(),
-					'writing-mode' => array(),
-					'x' => array(),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-					'y' => array(),
-				),
+				'attr_spec_list' => 12,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -7334,9 +7750,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -7353,6 +7767,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -7361,81 +7776,8 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'femerge' => array(
 			array(
-				'attr_spec_list' => array(
-					'alignment-baseline' => array(),
-					'baseline-shift' => array(),
-					'clip' => array(),
-					'clip-path' => array(),
-					'clip-rule' => array(),
-					'color' => array(),
-					'color-interpolation' => array(),
-					'color-interpolation-filters' => array(),
-					'color-profile' => array(),
-					'color-rendering' => array(),
-					'cursor' => array(),
-					'direction' => array(),
-					'display' => array(),
-					'dominant-baseline' => array(),
-					'enable-background' => array(),
-					'fill' => array(),
-					'fill-opacity' => array(),
-					'fill-rule' => array(),
-					'filter' => array(),
-					'flood-color' => array(),
-					'flood-opacity' => array(),
-					'focusable' => array(),
-					'font-family' => array(),
-					'font-size' => array(),
-					'font-size-adjust' => array(),
-					'font-stretch' => array(),
-					'font-style' => array(),
-					'font-variant' => array(),
-					'font-weight' => array(),
-					'glyph-orientation-horizontal' => array(),
-					'glyph-orientation-vertical' => array(),
-					'height' => array(),
-					'image-rendering' => array(),
-					'kerning' => array(),
-					'letter-spacing' => array(),
-					'lighting-color' => array(),
-					'marker-end' => array(),
-					'marker-mid' => array(),
-					'marker-start' => array(),
-					'mask' => array(),
-					'opacity' => array(),
-					'overflow' => array(),
-					'pointer-events' => array(),
-					'result' => array(),
-					'shape-rendering' => array(),
-					'stop-color' => array(),
-					'stop-opacity' => array(),
-					'stroke' => array(),
-					'stroke-dasharray' => array(),
-					'stroke-dashoffset' => array(),
-					'stroke-linecap' => array(),
-					'stroke-linejoin' => array(),
-					'stroke-miterlimit' => array(),
-					'stroke-opacity' => array(),
-					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'text-anchor' => array(),
-					'text-decoration' => array(),
-					'text-rendering' => array(),
-					'unicode-bidi' => array(),
-					'vector-effect' => array(),
-					'visibility' => array(),
-					'width' => array(),
-					'word-spacing' => array(),
-					'writing-mode' => array(),
-					'x' => array(),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-					'y' => array(),
-				),
+				'attr_spec_list' => 12,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -7446,14 +7788,13 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'in' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'xml:lang' => array(),
 					'xml:space' => array(),
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -7521,9 +7862,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -7540,6 +7879,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -7551,22 +7891,23 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'[disabled]' => array(),
 					'disabled' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'figcaption' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'figure' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -7631,9 +7972,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -7646,18 +7985,7 @@ class AMP_Allowed_Tags_Generated {
 					'x' => array(),
 					'xlink:actuate' => array(),
 					'xlink:arcrole' => array(),
-					'xlink:href' => array(
-						'alternative_names' => array(
-							'href',
-						),
-						'value_url' => array(
-							'allow_empty' => false,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'xlink:href' => 54,
 					'xlink:role' => array(),
 					'xlink:show' => array(),
 					'xlink:title' => array(),
@@ -7668,6 +7996,11 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'href' => 'xlink:href',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -7677,6 +8010,7 @@ class AMP_Allowed_Tags_Generated {
 		'footer' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -7685,41 +8019,20 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'accept' => array(),
 					'accept-charset' => array(),
-					'action' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'action-xhr' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'action' => 49,
+					'action-xhr' => 55,
 					'autocomplete' => array(),
-					'custom-validation-reporting' => array(
-						'value' => array(
-							'as-you-go',
-							'interact-and-submit',
-							'show-all-on-submit',
-							'show-first-on-submit',
-						),
-					),
+					'custom-validation-reporting' => 56,
 					'enctype' => array(),
 					'method' => array(
 						'value_casei' => array(
 							'get',
 						),
+						'value_casei_set' => array(
+							'get' => true,
+						),
 					),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(ATTRIBUTE_NODE|CDATA_SECTION_NODE|COMMENT_NODE|DOCUMENT_FRAGMENT_NODE|DOCUMENT_NODE|DOCUMENT_POSITION_CONTAINED_BY|DOCUMENT_POSITION_CONTAINS|DOCUMENT_POSITION_DISCONNECTED|DOCUMENT_POSITION_FOLLOWING|DOCUMENT_POSITION_IMPLEMENTATION_SPECIFIC|DOCUMENT_POSITION_PRECEDING|DOCUMENT_TYPE_NODE|ELEMENT_NODE|ENTITY_NODE|ENTITY_REFERENCE_NODE|NOTATION_NODE|PROCESSING_INSTRUCTION_NODE|TEXT_NODE|URL|URLUnencoded|__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|activeElement|addEventListener|adoptNode|alinkColor|all|anchors|append|appendChild|applets|baseURI|bgColor|body|captureEvents|caretPositionFromPoint|caretRangeFromPoint|characterSet|charset|childElementCount|childNodes|children|clear|cloneNode|close|compareDocumentPosition|compatMode|constructor|contains|contentType|cookie|createAttribute|createAttributeNS|createCDATASection|createComment|createDocumentFragment|createElement|createElementNS|createEvent|createExpression|createNSResolver|createNodeIterator|createProcessingInstruction|createRange|createTextNode|createTreeWalker|currentScript|defaultView|designMode|dir|dispatchEvent|doctype|documentElement|documentURI|domain|elementFromPoint|elementsFromPoint|embeds|enableStyleSheetsForSet|evaluate|execCommand|execCommandShowHelp|exitFullscreen|exitPictureInPicture|exitPointerLock|fgColor|firstChild|firstElementChild|focus|fonts|forms|fullscreen|fullscreenElement|fullscreenEnabled|getCSSCanvasContext|getElementById|getElementsByClassName|getElementsByName|getElementsByTagName|getElementsByTagNameNS|getOverrideStyle|getRootNode|getSelection|hasChildNodes|hasFocus|hasOwnProperty|hasStorageAccess|head|hidden|images|implementation|importNode|inputEncoding|insertBefore|isConnected|isDefaultNamespace|isEqualNode|isPrototypeOf|isSameNode|l10n|lastChild|lastElementChild|lastModified|lastStyleSheetSet|linkColor|links|location|lookupNamespaceURI|lookupPrefix|mozCancelFullScreen|mozFullScreen|mozFullScreenElement|mozFullScreenEnabled|mozSetImageElement|msCSSOMElementFloatMetrics|msCapsLockWarningOff|msElementsFromPoint|msElementsFromRect|nextSibling|nodeName|nodeType|nodeValue|normalize|onabort|onactivate|onafterscriptexecute|onanimationcancel|onanimationend|onanimationiteration|onanimationstart|onauxclick|onbeforeactivate|onbeforecopy|onbeforecut|onbeforedeactivate|onbeforeinput|onbeforepaste|onbeforescriptexecute|onblur|oncancel|oncanplay|oncanplaythrough|onchange|onclick|onclose|oncontextmenu|oncopy|oncuechange|oncut|ondblclick|ondeactivate|ondrag|ondragend|ondragenter|ondragexit|ondragleave|ondragover|ondragstart|ondrop|ondurationchange|onemptied|onended|onerror|onfocus|onfreeze|onfullscreenchange|onfullscreenerror|ongotpointercapture|oninput|oninvalid|onkeydown|onkeypress|onkeyup|onload|onloadeddata|onloadedmetadata|onloadend|onloadstart|onlostpointercapture|onmousedown|onmouseenter|onmouseleave|onmousemove|onmouseout|onmouseover|onmouseup|onmousewheel|onmozfullscreenchange|onmozfullscreenerror|onmscontentzoom|onmsgesturechange|onmsgesturedoubletap|onmsgestureend|onmsgesturehold|onmsgesturestart|onmsgesturetap|onmsinertiastart|onmsmanipulationstatechanged|onmssitemodejumplistitemremoved|onmsthumbnailclick|onpaste|onpause|onplay|onplaying|onpointercancel|onpointerdown|onpointerenter|onpointerleave|onpointerlockchange|onpointerlockerror|onpointermove|onpointerout|onpointerover|onpointerup|onprogress|onratechange|onreadystatechange|onrejectionhandled|onreset|onresize|onresume|onscroll|onsearch|onseeked|onseeking|onselect|onselectionchange|onselectstart|onshow|onstalled|onstop|onsubmit|onsuspend|ontimeupdate|ontoggle|ontransitioncancel|ontransitionend|ontransitionrun|ontransitionstart|onunhandledrejection|onvisibilitychange|onvolumechange|onwaiting|onwebkitanimationend|onwebkitanimationiteration|onwebkitanimationstart|onwebkitfullscreenchange|onwebkitfullscreenerror|onwebkitmouseforcechanged|onwebkitmouseforcedown|onwebkitmouseforceup|onwebkitmouseforcewillbegin|onwebkittransitionend|onwheel|open|origin|ownerDocument|parentElement|parentNode|pictureInPictureElement|pictureInPictureEnabled|plugins|pointerLockElement|preferredStyleSheetSet|prepend|previousSibling|propertyIsEnumerable|queryCommandEnabled|queryCommandIndeterm|queryCommandState|queryCommandSupported|queryCommandText|queryCommandValue|querySelector|querySelectorAll|readyState|referrer|registerElement|releaseCapture|releaseEvents|removeChild|removeEventListener|replaceChild|requestStorageAccess|rootElement|scripts|scrollingElement|selectedStyleSheetSet|styleSheetSets|styleSheets|textContent|title|toLocaleString|toSource|toString|updateSettings|valueOf|visibilityState|vlinkColor|wasDiscarded|webkitCancelFullScreen|webkitCurrentFullScreenElement|webkitExitFullscreen|webkitFullScreenKeyboardInputAllowed|webkitFullscreenElement|webkitFullscreenEnabled|webkitHidden|webkitIsFullScreen|webkitVisibilityState|write|writeln|xmlEncoding|xmlStandalone|xmlVersion)(\\s|$)',
-					),
+					'name' => 57,
 					'novalidate' => array(),
 					'target' => array(
 						'mandatory' => true,
@@ -7727,15 +8040,21 @@ class AMP_Allowed_Tags_Generated {
 							'_blank',
 							'_top',
 						),
-					),
-					'verify-xhr' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'protocol' => array(
-								'https',
-							),
+						'value_casei_set' => array(
+							'_blank' => true,
+							'_top' => true,
 						),
 					),
+					'verify-xhr' => 55,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'action',
+						'target',
+					),
+					'required_extensions' => array(
+						'amp-form',
+					),
 				),
 				'tag_spec' => array(
 					'disallowed_ancestor' => array(
@@ -7751,24 +8070,9 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'accept' => array(),
 					'accept-charset' => array(),
-					'action-xhr' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'action-xhr' => 49,
 					'autocomplete' => array(),
-					'custom-validation-reporting' => array(
-						'value' => array(
-							'as-you-go',
-							'interact-and-submit',
-							'show-all-on-submit',
-							'show-first-on-submit',
-						),
-					),
+					'custom-validation-reporting' => 56,
 					'enctype' => array(),
 					'method' => array(
 						'dispatch_key' => 2,
@@ -7776,25 +8080,32 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'post',
 						),
+						'value_casei_set' => array(
+							'post' => true,
+						),
 					),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(ATTRIBUTE_NODE|CDATA_SECTION_NODE|COMMENT_NODE|DOCUMENT_FRAGMENT_NODE|DOCUMENT_NODE|DOCUMENT_POSITION_CONTAINED_BY|DOCUMENT_POSITION_CONTAINS|DOCUMENT_POSITION_DISCONNECTED|DOCUMENT_POSITION_FOLLOWING|DOCUMENT_POSITION_IMPLEMENTATION_SPECIFIC|DOCUMENT_POSITION_PRECEDING|DOCUMENT_TYPE_NODE|ELEMENT_NODE|ENTITY_NODE|ENTITY_REFERENCE_NODE|NOTATION_NODE|PROCESSING_INSTRUCTION_NODE|TEXT_NODE|URL|URLUnencoded|__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|activeElement|addEventListener|adoptNode|alinkColor|all|anchors|append|appendChild|applets|baseURI|bgColor|body|captureEvents|caretPositionFromPoint|caretRangeFromPoint|characterSet|charset|childElementCount|childNodes|children|clear|cloneNode|close|compareDocumentPosition|compatMode|constructor|contains|contentType|cookie|createAttribute|createAttributeNS|createCDATASection|createComment|createDocumentFragment|createElement|createElementNS|createEvent|createExpression|createNSResolver|createNodeIterator|createProcessingInstruction|createRange|createTextNode|createTreeWalker|currentScript|defaultView|designMode|dir|dispatchEvent|doctype|documentElement|documentURI|domain|elementFromPoint|elementsFromPoint|embeds|enableStyleSheetsForSet|evaluate|execCommand|execCommandShowHelp|exitFullscreen|exitPictureInPicture|exitPointerLock|fgColor|firstChild|firstElementChild|focus|fonts|forms|fullscreen|fullscreenElement|fullscreenEnabled|getCSSCanvasContext|getElementById|getElementsByClassName|getElementsByName|getElementsByTagName|getElementsByTagNameNS|getOverrideStyle|getRootNode|getSelection|hasChildNodes|hasFocus|hasOwnProperty|hasStorageAccess|head|hidden|images|implementation|importNode|inputEncoding|insertBefore|isConnected|isDefaultNamespace|isEqualNode|isPrototypeOf|isSameNode|l10n|lastChild|lastElementChild|lastModified|lastStyleSheetSet|linkColor|links|location|lookupNamespaceURI|lookupPrefix|mozCancelFullScreen|mozFullScreen|mozFullScreenElement|mozFullScreenEnabled|mozSetImageElement|msCSSOMElementFloatMetrics|msCapsLockWarningOff|msElementsFromPoint|msElementsFromRect|nextSibling|nodeName|nodeType|nodeValue|normalize|onabort|onactivate|onafterscriptexecute|onanimationcancel|onanimationend|onanimationiteration|onanimationstart|onauxclick|onbeforeactivate|onbeforecopy|onbeforecut|onbeforedeactivate|onbeforeinput|onbeforepaste|onbeforescriptexecute|onblur|oncancel|oncanplay|oncanplaythrough|onchange|onclick|onclose|oncontextmenu|oncopy|oncuechange|oncut|ondblclick|ondeactivate|ondrag|ondragend|ondragenter|ondragexit|ondragleave|ondragover|ondragstart|ondrop|ondurationchange|onemptied|onended|onerror|onfocus|onfreeze|onfullscreenchange|onfullscreenerror|ongotpointercapture|oninput|oninvalid|onkeydown|onkeypress|onkeyup|onload|onloadeddata|onloadedmetadata|onloadend|onloadstart|onlostpointercapture|onmousedown|onmouseenter|onmouseleave|onmousemove|onmouseout|onmouseover|onmouseup|onmousewheel|onmozfullscreenchange|onmozfullscreenerror|onmscontentzoom|onmsgesturechange|onmsgesturedoubletap|onmsgestureend|onmsgesturehold|onmsgesturestart|onmsgesturetap|onmsinertiastart|onmsmanipulationstatechanged|onmssitemodejumplistitemremoved|onmsthumbnailclick|onpaste|onpause|onplay|onplaying|onpointercancel|onpointerdown|onpointerenter|onpointerleave|onpointerlockchange|onpointerlockerror|onpointermove|onpointerout|onpointerover|onpointerup|onprogress|onratechange|onreadystatechange|onrejectionhandled|onreset|onresize|onresume|onscroll|onsearch|onseeked|onseeking|onselect|onselectionchange|onselectstart|onshow|onstalled|onstop|onsubmit|onsuspend|ontimeupdate|ontoggle|ontransitioncancel|ontransitionend|ontransitionrun|ontransitionstart|onunhandledrejection|onvisibilitychange|onvolumechange|onwaiting|onwebkitanimationend|onwebkitanimationiteration|onwebkitanimationstart|onwebkitfullscreenchange|onwebkitfullscreenerror|onwebkitmouseforcechanged|onwebkitmouseforcedown|onwebkitmouseforceup|onwebkitmouseforcewillbegin|onwebkittransitionend|onwheel|open|origin|ownerDocument|parentElement|parentNode|pictureInPictureElement|pictureInPictureEnabled|plugins|pointerLockElement|preferredStyleSheetSet|prepend|previousSibling|propertyIsEnumerable|queryCommandEnabled|queryCommandIndeterm|queryCommandState|queryCommandSupported|queryCommandText|queryCommandValue|querySelector|querySelectorAll|readyState|referrer|registerElement|releaseCapture|releaseEvents|removeChild|removeEventListener|replaceChild|requestStorageAccess|rootElement|scripts|scrollingElement|selectedStyleSheetSet|styleSheetSets|styleSheets|textContent|title|toLocaleString|toSource|toString|updateSettings|valueOf|visibilityState|vlinkColor|wasDiscarded|webkitCancelFullScreen|webkitCurrentFullScreenElement|webkitExitFullscreen|webkitFullScreenKeyboardInputAllowed|webkitFullscreenElement|webkitFullscreenEnabled|webkitHidden|webkitIsFullScreen|webkitVisibilityState|write|writeln|xmlEncoding|xmlStandalone|xmlVersion)(\\s|$)',
-					),
+					'name' => 57,
 					'novalidate' => array(),
 					'target' => array(
 						'value_casei' => array(
 							'_blank',
 							'_top',
 						),
-					),
-					'verify-xhr' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'protocol' => array(
-								'https',
-							),
+						'value_casei_set' => array(
+							'_blank' => true,
+							'_top' => true,
 						),
 					),
+					'verify-xhr' => 55,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'action-xhr',
+						'method',
+					),
+					'required_extensions' => array(
+						'amp-form',
+					),
 				),
 				'tag_spec' => array(
 					'disallowed_ancestor' => array(
@@ -7808,9 +8119,20 @@ class AMP_Allowed_Tags_Generated {
 			),
 		),
 		'g' => array(
+			array(
+				'attr_spec_list' => 8,
+				'precomputed' => array(),
+				'tag_spec' => array(
+					'mandatory_ancestor' => 'svg',
+					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
+				),
+			),
+		),
+		'glyph' => array(
 			array(
 				'attr_spec_list' => array(
 					'alignment-baseline' => array(),
+					'arabic-form' => array(),
 					'baseline-shift' => array(),
 					'clip' => array(),
 					'clip-path' => array(),
@@ -7821,11 +8143,11 @@ class AMP_Allowed_Tags_Generated {
 					'color-profile' => array(),
 					'color-rendering' => array(),
 					'cursor' => array(),
+					'd' => array(),
 					'direction' => array(),
 					'display' => array(),
 					'dominant-baseline' => array(),
 					'enable-background' => array(),
-					'externalresourcesrequired' => array(),
 					'fill' => array(),
 					'fill-opacity' => array(),
 					'fill-rule' => array(),
@@ -7840,8 +8162,10 @@ class AMP_Allowed_Tags_Generated {
 					'font-style' => array(),
 					'font-variant' => array(),
 					'font-weight' => array(),
+					'glyph-name' => array(),
 					'glyph-orientation-horizontal' => array(),
 					'glyph-orientation-vertical' => array(),
+					'horiz-adv-x' => array(),
 					'image-rendering' => array(),
 					'kerning' => array(),
 					'letter-spacing' => array(),
@@ -7851,10 +8175,9 @@ class AMP_Allowed_Tags_Generated {
 					'marker-start' => array(),
 					'mask' => array(),
 					'opacity' => array(),
+					'orientation' => array(),
 					'overflow' => array(),
 					'pointer-events' => array(),
-					'requiredextensions' => array(),
-					'requiredfeatures' => array(),
 					'shape-rendering' => array(),
 					'stop-color' => array(),
 					'stop-opacity' => array(),
@@ -7866,16 +8189,16 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'systemlanguage' => array(),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
-					'transform' => array(),
+					'unicode' => array(),
 					'unicode-bidi' => array(),
 					'vector-effect' => array(),
+					'vert-adv-y' => array(),
+					'vert-origin-x' => array(),
+					'vert-origin-y' => array(),
 					'visibility' => array(),
 					'word-spacing' => array(),
 					'writing-mode' => array(),
@@ -7884,93 +8207,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
-				'tag_spec' => array(
-					'mandatory_ancestor' => 'svg',
-					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
-				),
-			),
-		),
-		'glyph' => array(
-			array(
-				'attr_spec_list' => array(
-					'alignment-baseline' => array(),
-					'arabic-form' => array(),
-					'baseline-shift' => array(),
-					'clip' => array(),
-					'clip-path' => array(),
-					'clip-rule' => array(),
-					'color' => array(),
-					'color-interpolation' => array(),
-					'color-interpolation-filters' => array(),
-					'color-profile' => array(),
-					'color-rendering' => array(),
-					'cursor' => array(),
-					'd' => array(),
-					'direction' => array(),
-					'display' => array(),
-					'dominant-baseline' => array(),
-					'enable-background' => array(),
-					'fill' => array(),
-					'fill-opacity' => array(),
-					'fill-rule' => array(),
-					'filter' => array(),
-					'flood-color' => array(),
-					'flood-opacity' => array(),
-					'focusable' => array(),
-					'font-family' => array(),
-					'font-size' => array(),
-					'font-size-adjust' => array(),
-					'font-stretch' => array(),
-					'font-style' => array(),
-					'font-variant' => array(),
-					'font-weight' => array(),
-					'glyph-name' => array(),
-					'glyph-orientation-horizontal' => array(),
-					'glyph-orientation-vertical' => array(),
-					'horiz-adv-x' => array(),
-					'image-rendering' => array(),
-					'kerning' => array(),
-					'letter-spacing' => array(),
-					'lighting-color' => array(),
-					'marker-end' => array(),
-					'marker-mid' => array(),
-					'marker-start' => array(),
-					'mask' => array(),
-					'opacity' => array(),
-					'orientation' => array(),
-					'overflow' => array(),
-					'pointer-events' => array(),
-					'shape-rendering' => array(),
-					'stop-color' => array(),
-					'stop-opacity' => array(),
-					'stroke' => array(),
-					'stroke-dasharray' => array(),
-					'stroke-dashoffset' => array(),
-					'stroke-linecap' => array(),
-					'stroke-linejoin' => array(),
-					'stroke-miterlimit' => array(),
-					'stroke-opacity' => array(),
-					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'text-anchor' => array(),
-					'text-decoration' => array(),
-					'text-rendering' => array(),
-					'unicode' => array(),
-					'unicode-bidi' => array(),
-					'vector-effect' => array(),
-					'vert-adv-y' => array(),
-					'vert-origin-x' => array(),
-					'vert-origin-y' => array(),
-					'visibility' => array(),
-					'word-spacing' => array(),
-					'writing-mode' => array(),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -8037,9 +8274,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -8051,18 +8286,7 @@ class AMP_Allowed_Tags_Generated {
 					'x' => array(),
 					'xlink:actuate' => array(),
 					'xlink:arcrole' => array(),
-					'xlink:href' => array(
-						'alternative_names' => array(
-							'href',
-						),
-						'value_url' => array(
-							'allow_empty' => false,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'xlink:href' => 54,
 					'xlink:role' => array(),
 					'xlink:show' => array(),
 					'xlink:title' => array(),
@@ -8073,6 +8297,11 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'href' => 'xlink:href',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -8081,55 +8310,50 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'h1' => array(
 			array(
-				'attr_spec_list' => array(
-					'align' => array(),
-				),
+				'attr_spec_list' => 11,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'h2' => array(
 			array(
-				'attr_spec_list' => array(
-					'align' => array(),
-				),
+				'attr_spec_list' => 11,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'h3' => array(
 			array(
-				'attr_spec_list' => array(
-					'align' => array(),
-				),
+				'attr_spec_list' => 11,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'h4' => array(
 			array(
-				'attr_spec_list' => array(
-					'align' => array(),
-				),
+				'attr_spec_list' => 11,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'h5' => array(
 			array(
-				'attr_spec_list' => array(
-					'align' => array(),
-				),
+				'attr_spec_list' => 11,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'h6' => array(
 			array(
-				'attr_spec_list' => array(
-					'align' => array(),
-				),
+				'attr_spec_list' => 11,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'head' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory' => true,
 					'mandatory_parent' => 'html',
@@ -8141,31 +8365,21 @@ class AMP_Allowed_Tags_Generated {
 		'header' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'hgroup' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'hkern' => array(
 			array(
-				'attr_spec_list' => array(
-					'g1' => array(),
-					'g2' => array(),
-					'k' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'u1' => array(),
-					'u2' => array(),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-				),
+				'attr_spec_list' => 13,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -8175,12 +8389,14 @@ class AMP_Allowed_Tags_Generated {
 		'hr' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'html' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory' => true,
 					'mandatory_parent' => '!doctype',
@@ -8192,28 +8408,18 @@ class AMP_Allowed_Tags_Generated {
 		'i' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'iframe' => array(
 			array(
 				'attr_spec_list' => array(
-					'frameborder' => array(
-						'value' => array(
-							'0',
-							'1',
-						),
-					),
+					'frameborder' => 18,
 					'height' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 					'referrerpolicy' => array(),
-					'resizable' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'resizable' => 2,
 					'sandbox' => array(),
 					'scrolling' => array(
 						'value' => array(
@@ -8221,20 +8427,17 @@ class AMP_Allowed_Tags_Generated {
 							'yes',
 							'no',
 						),
-					),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'data',
-								'https',
-							),
+						'value_set' => array(
+							'auto' => true,
+							'no' => true,
+							'yes' => true,
 						),
 					),
+					'src' => 51,
 					'srcdoc' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'noscript',
 					'mandatory_ancestor_suggested_alternative' => 'amp-iframe',
@@ -8303,9 +8506,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -8325,6 +8526,7 @@ class AMP_Allowed_Tags_Generated {
 							'href',
 						),
 						'blacklisted_value_regex' => '(^|\\s)data:image\\/svg\\+xml',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)data:image\\/svg\\+xml/u',
 						'value_url' => array(
 							'allow_empty' => false,
 							'protocol' => array(
@@ -8332,6 +8534,11 @@ class AMP_Allowed_Tags_Generated {
 								'http',
 								'https',
 							),
+							'protocol_set' => array(
+								'data' => true,
+								'http' => true,
+								'https' => true,
+							),
 						),
 					),
 					'xlink:role' => array(),
@@ -8344,6 +8551,11 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'href' => 'xlink:href',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -8362,16 +8574,26 @@ class AMP_Allowed_Tags_Generated {
 							'auto',
 							'sync',
 						),
+						'value_set' => array(
+							'async' => true,
+							'auto' => true,
+							'sync' => true,
+						),
 					),
 					'height' => array(),
 					'ismap' => array(),
 					'longdesc' => array(
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
 						'value_url' => array(
 							'protocol' => array(
 								'http',
 								'https',
 							),
+							'protocol_set' => array(
+								'http' => true,
+								'https' => true,
+							),
 						),
 					),
 					'sizes' => array(),
@@ -8380,6 +8602,7 @@ class AMP_Allowed_Tags_Generated {
 							'srcset',
 						),
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => true,
@@ -8387,10 +8610,22 @@ class AMP_Allowed_Tags_Generated {
 								'data',
 								'https',
 							),
+							'protocol_set' => array(
+								'data' => true,
+								'https' => true,
+							),
 						),
 					),
 					'width' => array(),
 				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'srcset' => 'src',
+					),
+					'mandatory_attrs' => array(
+						'src',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'noscript',
 					'mandatory_ancestor_suggested_alternative' => 'amp-img',
@@ -8438,14 +8673,8 @@ class AMP_Allowed_Tags_Generated {
 					'min' => array(),
 					'minlength' => array(),
 					'multiple' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
-					'no-verify' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'name' => 0,
+					'no-verify' => 2,
 					'pattern' => array(),
 					'placeholder' => array(),
 					'readonly' => array(),
@@ -8457,10 +8686,12 @@ class AMP_Allowed_Tags_Generated {
 					'tabindex' => array(),
 					'type' => array(
 						'blacklisted_value_regex' => '(^|\\s)(button|file|image|password|)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(button|file|image|password|)(\\s|$)/u',
 					),
 					'value' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'spec_url' => 'https://amp.dev/documentation/components/amp-form',
 				),
@@ -8503,14 +8734,8 @@ class AMP_Allowed_Tags_Generated {
 					'min' => array(),
 					'minlength' => array(),
 					'multiple' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
-					'no-verify' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'name' => 0,
+					'no-verify' => 2,
 					'pattern' => array(),
 					'placeholder' => array(),
 					'readonly' => array(),
@@ -8526,10 +8751,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'file',
 						),
+						'value_casei_set' => array(
+							'file' => true,
+						),
 					),
 					'value' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form [method=post]',
 					'spec_name' => 'INPUT [type=file]',
@@ -8574,9 +8807,7 @@ class AMP_Allowed_Tags_Generated {
 					'min' => array(),
 					'minlength' => array(),
 					'multiple' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 					'pattern' => array(),
 					'placeholder' => array(),
 					'readonly' => array(),
@@ -8592,10 +8823,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'password',
 						),
+						'value_casei_set' => array(
+							'password' => true,
+						),
 					),
 					'value' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form [method=post]',
 					'spec_name' => 'INPUT [type=password]',
@@ -8610,6 +8849,19 @@ class AMP_Allowed_Tags_Generated {
 							'search',
 							'text',
 						),
+						'value_casei_set' => array(
+							'search' => true,
+							'text' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-autocomplete',
+						'amp-form',
 					),
 				),
 				'tag_spec' => array(
@@ -8657,21 +8909,18 @@ class AMP_Allowed_Tags_Generated {
 					'list' => array(),
 					'mask' => array(
 						'blacklisted_value_regex' => '(payment-card|date-dd-mm-yyyy|date-mm-dd-yyyy|date-mm-yy|date-yyyy-mm-dd)',
+						'blacklisted_value_regex_pcre' => '/(payment-card|date-dd-mm-yyyy|date-mm-dd-yyyy|date-mm-yy|date-yyyy-mm-dd)/u',
 						'dispatch_key' => 1,
 						'mandatory' => true,
 					),
 					'mask-output' => array(),
-					'mask-trim-zeros' => array(
-						'value_regex' => '\\d+',
-					),
+					'mask-trim-zeros' => 30,
 					'max' => array(),
 					'maxlength' => array(),
 					'min' => array(),
 					'minlength' => array(),
 					'multiple' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 					'pattern' => array(),
 					'placeholder' => array(),
 					'readonly' => array(),
@@ -8681,16 +8930,18 @@ class AMP_Allowed_Tags_Generated {
 					'spellcheck' => array(),
 					'step' => array(),
 					'tabindex' => array(),
-					'type' => array(
-						'value' => array(
-							'text',
-							'tel',
-							'search',
-						),
-					),
+					'type' => 58,
 					'value' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'mask',
+					),
+					'required_extensions' => array(
+						'amp-inputmask',
+					),
+				),
 				'tag_spec' => array(
 					'requires_extension' => array(
 						'amp-inputmask',
@@ -8739,6 +8990,9 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'payment-card',
 						),
+						'value_set' => array(
+							'payment-card' => true,
+						),
 					),
 					'mask-output' => array(),
 					'max' => array(),
@@ -8746,9 +9000,7 @@ class AMP_Allowed_Tags_Generated {
 					'min' => array(),
 					'minlength' => array(),
 					'multiple' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 					'pattern' => array(),
 					'placeholder' => array(),
 					'readonly' => array(),
@@ -8758,16 +9010,18 @@ class AMP_Allowed_Tags_Generated {
 					'spellcheck' => array(),
 					'step' => array(),
 					'tabindex' => array(),
-					'type' => array(
-						'value' => array(
-							'text',
-							'tel',
-							'search',
-						),
-					),
+					'type' => 58,
 					'value' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'mask',
+					),
+					'required_extensions' => array(
+						'amp-inputmask',
+					),
+				),
 				'tag_spec' => array(
 					'requires_extension' => array(
 						'amp-inputmask',
@@ -8816,6 +9070,9 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'date-dd-mm-yyyy',
 						),
+						'value_set' => array(
+							'date-dd-mm-yyyy' => true,
+						),
 					),
 					'mask-output' => array(),
 					'max' => array(),
@@ -8823,9 +9080,7 @@ class AMP_Allowed_Tags_Generated {
 					'min' => array(),
 					'minlength' => array(),
 					'multiple' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 					'pattern' => array(),
 					'placeholder' => array(),
 					'readonly' => array(),
@@ -8835,16 +9090,18 @@ class AMP_Allowed_Tags_Generated {
 					'spellcheck' => array(),
 					'step' => array(),
 					'tabindex' => array(),
-					'type' => array(
-						'value' => array(
-							'text',
-							'tel',
-							'search',
-						),
-					),
+					'type' => 58,
 					'value' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'mask',
+					),
+					'required_extensions' => array(
+						'amp-inputmask',
+					),
+				),
 				'tag_spec' => array(
 					'requires_extension' => array(
 						'amp-inputmask',
@@ -8893,6 +9150,9 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'date-mm-dd-yyyy',
 						),
+						'value_set' => array(
+							'date-mm-dd-yyyy' => true,
+						),
 					),
 					'mask-output' => array(),
 					'max' => array(),
@@ -8900,9 +9160,7 @@ class AMP_Allowed_Tags_Generated {
 					'min' => array(),
 					'minlength' => array(),
 					'multiple' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 					'pattern' => array(),
 					'placeholder' => array(),
 					'readonly' => array(),
@@ -8912,16 +9170,18 @@ class AMP_Allowed_Tags_Generated {
 					'spellcheck' => array(),
 					'step' => array(),
 					'tabindex' => array(),
-					'type' => array(
-						'value' => array(
-							'text',
-							'tel',
-							'search',
-						),
-					),
+					'type' => 58,
 					'value' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'mask',
+					),
+					'required_extensions' => array(
+						'amp-inputmask',
+					),
+				),
 				'tag_spec' => array(
 					'requires_extension' => array(
 						'amp-inputmask',
@@ -8970,6 +9230,9 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'date-mm-yy',
 						),
+						'value_set' => array(
+							'date-mm-yy' => true,
+						),
 					),
 					'mask-output' => array(),
 					'max' => array(),
@@ -8977,9 +9240,7 @@ class AMP_Allowed_Tags_Generated {
 					'min' => array(),
 					'minlength' => array(),
 					'multiple' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 					'pattern' => array(),
 					'placeholder' => array(),
 					'readonly' => array(),
@@ -8989,16 +9250,18 @@ class AMP_Allowed_Tags_Generated {
 					'spellcheck' => array(),
 					'step' => array(),
 					'tabindex' => array(),
-					'type' => array(
-						'value' => array(
-							'text',
-							'tel',
-							'search',
-						),
-					),
+					'type' => 58,
 					'value' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'mask',
+					),
+					'required_extensions' => array(
+						'amp-inputmask',
+					),
+				),
 				'tag_spec' => array(
 					'requires_extension' => array(
 						'amp-inputmask',
@@ -9047,6 +9310,9 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'date-yyyy-mm-dd',
 						),
+						'value_set' => array(
+							'date-yyyy-mm-dd' => true,
+						),
 					),
 					'mask-output' => array(),
 					'max' => array(),
@@ -9054,9 +9320,7 @@ class AMP_Allowed_Tags_Generated {
 					'min' => array(),
 					'minlength' => array(),
 					'multiple' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 					'pattern' => array(),
 					'placeholder' => array(),
 					'readonly' => array(),
@@ -9066,16 +9330,18 @@ class AMP_Allowed_Tags_Generated {
 					'spellcheck' => array(),
 					'step' => array(),
 					'tabindex' => array(),
-					'type' => array(
-						'value' => array(
-							'text',
-							'tel',
-							'search',
-						),
-					),
+					'type' => 58,
 					'value' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'mask',
+					),
+					'required_extensions' => array(
+						'amp-inputmask',
+					),
+				),
 				'tag_spec' => array(
 					'requires_extension' => array(
 						'amp-inputmask',
@@ -9087,25 +9353,15 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'ins' => array(
 			array(
-				'attr_spec_list' => array(
-					'cite' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_empty' => true,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
-					'datetime' => array(),
-				),
+				'attr_spec_list' => 9,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'kbd' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -9114,6 +9370,7 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'for' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'spec_url' => 'https://amp.dev/documentation/components/amp-form',
 				),
@@ -9122,16 +9379,16 @@ class AMP_Allowed_Tags_Generated {
 		'legend' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'li' => array(
 			array(
 				'attr_spec_list' => array(
-					'value' => array(
-						'value_regex' => '[0-9]*',
-					),
+					'value' => 59,
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -9195,9 +9452,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -9217,6 +9472,7 @@ class AMP_Allowed_Tags_Generated {
 					'y1' => array(),
 					'y2' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -9283,9 +9539,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -9298,18 +9552,7 @@ class AMP_Allowed_Tags_Generated {
 					'x2' => array(),
 					'xlink:actuate' => array(),
 					'xlink:arcrole' => array(),
-					'xlink:href' => array(
-						'alternative_names' => array(
-							'href',
-						),
-						'value_url' => array(
-							'allow_empty' => false,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'xlink:href' => 54,
 					'xlink:role' => array(),
 					'xlink:show' => array(),
 					'xlink:title' => array(),
@@ -9321,6 +9564,11 @@ class AMP_Allowed_Tags_Generated {
 					'y1' => array(),
 					'y2' => array(),
 				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'href' => 'xlink:href',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -9330,11 +9578,7 @@ class AMP_Allowed_Tags_Generated {
 		'link' => array(
 			array(
 				'attr_spec_list' => array(
-					'charset' => array(
-						'value_casei' => array(
-							'utf-8',
-						),
-					),
+					'charset' => 60,
 					'color' => array(),
 					'crossorigin' => array(),
 					'href' => array(),
@@ -9342,12 +9586,18 @@ class AMP_Allowed_Tags_Generated {
 					'media' => array(),
 					'rel' => array(
 						'blacklisted_value_regex' => '(^|\\s)(canonical|components|import|manifest|preload|serviceworker|stylesheet|subresource|)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(canonical|components|import|manifest|preload|serviceworker|stylesheet|subresource|)(\\s|$)/u',
 						'mandatory' => true,
 					),
 					'sizes' => array(),
 					'target' => array(),
 					'type' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'rel',
+					),
+				),
 				'tag_spec' => array(
 					'disallowed_ancestor' => array(
 						'template',
@@ -9358,21 +9608,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'charset' => array(
-						'value_casei' => array(
-							'utf-8',
-						),
-					),
+					'charset' => 60,
 					'color' => array(),
 					'crossorigin' => array(),
 					'href' => array(
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
 								'http',
 								'https',
 							),
+							'protocol_set' => array(
+								'http' => true,
+								'https' => true,
+							),
 						),
 					),
 					'hreflang' => array(),
@@ -9383,11 +9634,20 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'canonical',
 						),
+						'value_casei_set' => array(
+							'canonical' => true,
+						),
 					),
 					'sizes' => array(),
 					'target' => array(),
 					'type' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'href',
+						'rel',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory' => true,
 					'mandatory_parent' => 'head',
@@ -9398,22 +9658,10 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'charset' => array(
-						'value_casei' => array(
-							'utf-8',
-						),
-					),
+					'charset' => 60,
 					'color' => array(),
 					'crossorigin' => array(),
-					'href' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'href' => 49,
 					'hreflang' => array(),
 					'media' => array(),
 					'rel' => array(
@@ -9422,11 +9670,20 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'manifest',
 						),
+						'value_casei_set' => array(
+							'manifest' => true,
+						),
 					),
 					'sizes' => array(),
 					'target' => array(),
 					'type' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'href',
+						'rel',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'head',
 					'spec_name' => 'link rel=manifest',
@@ -9436,11 +9693,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'as' => array(),
-					'charset' => array(
-						'value_casei' => array(
-							'utf-8',
-						),
-					),
+					'charset' => 60,
 					'color' => array(),
 					'crossorigin' => array(),
 					'href' => array(),
@@ -9452,11 +9705,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'preload',
 						),
+						'value_casei_set' => array(
+							'preload' => true,
+						),
 					),
 					'sizes' => array(),
 					'target' => array(),
 					'type' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'rel',
+					),
+				),
 				'tag_spec' => array(
 					'disallowed_ancestor' => array(
 						'template',
@@ -9472,6 +9733,7 @@ class AMP_Allowed_Tags_Generated {
 					'href' => array(
 						'mandatory' => true,
 						'value_regex' => 'https://cdn\\.materialdesignicons\\.com/([0-9]+\\.?)+/css/materialdesignicons\\.min\\.css|https://cloud\\.typography\\.com/[0-9]*/[0-9]*/css/fonts\\.css|https://fast\\.fonts\\.net/.*|https://fonts\\.googleapis\\.com/css\\?.*|https://fonts\\.googleapis\\.com/icon\\?.*|https://fonts\\.googleapis\\.com/earlyaccess/.*\\.css|https://maxcdn\\.bootstrapcdn\\.com/font-awesome/([0-9]+\\.?)+/css/font-awesome\\.min\\.css(\\?.*)?|https://(use|pro)\\.fontawesome\\.com/releases/v([0-9]+\\.?)+/css/(all|brands|solid|regular|light|fontawesome)\\.css|https://(use|pro)\\.fontawesome\\.com/[0-9a-zA-Z]+\\.css|https://use\\.typekit\\.net/[\\w\\p{L}\\p{N}_]+\\.css',
+						'value_regex_pcre' => '/^(https:\\/\\/cdn\\.materialdesignicons\\.com\\/([0-9]+\\.?)+\\/css\\/materialdesignicons\\.min\\.css|https:\\/\\/cloud\\.typography\\.com\\/[0-9]*\\/[0-9]*\\/css\\/fonts\\.css|https:\\/\\/fast\\.fonts\\.net\\/.*|https:\\/\\/fonts\\.googleapis\\.com\\/css\\?.*|https:\\/\\/fonts\\.googleapis\\.com\\/icon\\?.*|https:\\/\\/fonts\\.googleapis\\.com\\/earlyaccess\\/.*\\.css|https:\\/\\/maxcdn\\.bootstrapcdn\\.com\\/font-awesome\\/([0-9]+\\.?)+\\/css\\/font-awesome\\.min\\.css(\\?.*)?|https:\\/\\/(use|pro)\\.fontawesome\\.com\\/releases\\/v([0-9]+\\.?)+\\/css\\/(all|brands|solid|regular|light|fontawesome)\\.css|https:\\/\\/(use|pro)\\.fontawesome\\.com\\/[0-9a-zA-Z]+\\.css|https:\\/\\/use\\.typekit\\.net\\/[\\w\\p{L}\\p{N}_]+\\.css)$/u',
 					),
 					'integrity' => array(),
 					'media' => array(),
@@ -9481,12 +9743,17 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'stylesheet',
 						),
-					),
-					'type' => array(
-						'value_casei' => array(
-							'text/css',
+						'value_casei_set' => array(
+							'stylesheet' => true,
 						),
 					),
+					'type' => 61,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'href',
+						'rel',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'head',
@@ -9496,16 +9763,10 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'charset' => array(
-						'value_casei' => array(
-							'utf-8',
-						),
-					),
+					'charset' => 60,
 					'color' => array(),
 					'crossorigin' => array(),
-					'href' => array(
-						'mandatory' => true,
-					),
+					'href' => 4,
 					'hreflang' => array(),
 					'itemprop' => array(
 						'dispatch_key' => 2,
@@ -9513,12 +9774,21 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'sameas',
 						),
+						'value_casei_set' => array(
+							'sameas' => true,
+						),
 					),
 					'media' => array(),
 					'sizes' => array(),
 					'target' => array(),
 					'type' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'href',
+						'itemprop',
+					),
+				),
 				'tag_spec' => array(
 					'spec_name' => 'link itemprop=sameAs',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#html-tags',
@@ -9526,25 +9796,23 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'charset' => array(
-						'value_casei' => array(
-							'utf-8',
-						),
-					),
+					'charset' => 60,
 					'color' => array(),
 					'crossorigin' => array(),
-					'href' => array(
-						'mandatory' => true,
-					),
+					'href' => 4,
 					'hreflang' => array(),
-					'itemprop' => array(
-						'mandatory' => true,
-					),
+					'itemprop' => 4,
 					'media' => array(),
 					'sizes' => array(),
 					'target' => array(),
 					'type' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'href',
+						'itemprop',
+					),
+				),
 				'tag_spec' => array(
 					'spec_name' => 'link itemprop=',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#html-tags',
@@ -9552,25 +9820,23 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'charset' => array(
-						'value_casei' => array(
-							'utf-8',
-						),
-					),
+					'charset' => 60,
 					'color' => array(),
 					'crossorigin' => array(),
-					'href' => array(
-						'mandatory' => true,
-					),
+					'href' => 4,
 					'hreflang' => array(),
 					'media' => array(),
-					'property' => array(
-						'mandatory' => true,
-					),
+					'property' => 4,
 					'sizes' => array(),
 					'target' => array(),
 					'type' => array(),
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'href',
+						'property',
+					),
+				),
 				'tag_spec' => array(
 					'spec_name' => 'link property=',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#html-tags',
@@ -9580,18 +9846,21 @@ class AMP_Allowed_Tags_Generated {
 		'listing' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'main' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'mark' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -9659,9 +9928,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -9677,6 +9944,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -9745,9 +10013,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -9765,6 +10031,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -9780,6 +10047,14 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'utf-8',
 						),
+						'value_casei_set' => array(
+							'utf-8' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'charset',
 					),
 				),
 				'tag_spec' => array(
@@ -9814,6 +10089,15 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'viewport',
 						),
+						'value_set' => array(
+							'viewport' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -9843,6 +10127,15 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'x-ua-compatible',
 						),
+						'value_casei_set' => array(
+							'x-ua-compatible' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'http-equiv',
 					),
 				),
 				'tag_spec' => array(
@@ -9856,6 +10149,7 @@ class AMP_Allowed_Tags_Generated {
 					'content' => array(
 						'mandatory' => true,
 						'value_regex' => '.*app-id=.*',
+						'value_regex_pcre' => '/^(.*app-id=.*)$/u',
 					),
 					'name' => array(
 						'dispatch_key' => 2,
@@ -9863,6 +10157,15 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'apple-itunes-app',
 						),
+						'value_casei_set' => array(
+							'apple-itunes-app' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -9873,15 +10176,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'name' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'amp-experiments-opt-in',
 						),
+						'value_casei_set' => array(
+							'amp-experiments-opt-in' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -9891,20 +10201,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-						'value_url' => array(
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
+					'content' => 3,
 					'name' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'amp-3p-iframe-src',
 						),
+						'value_casei_set' => array(
+							'amp-3p-iframe-src' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -9915,15 +10227,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'name' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'amp-consent-blocking',
 						),
+						'value_casei_set' => array(
+							'amp-consent-blocking' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -9934,15 +10253,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'name' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'amp-experiment-token',
 						),
+						'value_casei_set' => array(
+							'amp-experiment-token' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -9952,15 +10278,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'name' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'amp-link-variable-allowed-origin',
 						),
+						'value_casei_set' => array(
+							'amp-link-variable-allowed-origin' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -9970,15 +10303,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'name' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'amp-google-client-id-api',
 						),
+						'value_casei_set' => array(
+							'amp-google-client-id-api' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -9994,6 +10334,14 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-ad-doubleclick-sra',
 						),
+						'value_casei_set' => array(
+							'amp-ad-doubleclick-sra' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -10003,15 +10351,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'name' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'amp-list-load-more',
 						),
+						'value_casei_set' => array(
+							'amp-list-load-more' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -10021,15 +10376,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'name' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'amp-recaptcha-input',
 						),
+						'value_casei_set' => array(
+							'amp-recaptcha-input' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -10043,10 +10405,12 @@ class AMP_Allowed_Tags_Generated {
 					'itemprop' => array(),
 					'name' => array(
 						'blacklisted_value_regex' => '(^|\\s)(amp-.*|amp4ads-.*|apple-itunes-app|content-disposition|revisit-after|viewport)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(amp-.*|amp4ads-.*|apple-itunes-app|content-disposition|revisit-after|viewport)(\\s|$)/u',
 					),
 					'property' => array(),
 					'scheme' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'spec_name' => 'meta name= and content=',
 				),
@@ -10058,6 +10422,9 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'text/html; charset=utf-8',
 						),
+						'value_casei_set' => array(
+							'text/html; charset=utf-8' => true,
+						),
 					),
 					'http-equiv' => array(
 						'dispatch_key' => 2,
@@ -10065,6 +10432,15 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'content-type',
 						),
+						'value_casei_set' => array(
+							'content-type' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'http-equiv',
 					),
 				),
 				'tag_spec' => array(
@@ -10075,15 +10451,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'http-equiv' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'content-language',
 						),
+						'value_casei_set' => array(
+							'content-language' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'http-equiv',
 					),
 				),
 				'tag_spec' => array(
@@ -10094,15 +10477,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'http-equiv' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'pics-label',
 						),
+						'value_casei_set' => array(
+							'pics-label' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'http-equiv',
 					),
 				),
 				'tag_spec' => array(
@@ -10113,15 +10503,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'http-equiv' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'imagetoolbar',
 						),
+						'value_casei_set' => array(
+							'imagetoolbar' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'http-equiv',
 					),
 				),
 				'tag_spec' => array(
@@ -10137,6 +10534,9 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'text/css',
 						),
+						'value_casei_set' => array(
+							'text/css' => true,
+						),
 					),
 					'http-equiv' => array(
 						'dispatch_key' => 2,
@@ -10144,6 +10544,15 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'content-style-type',
 						),
+						'value_casei_set' => array(
+							'content-style-type' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'http-equiv',
 					),
 				),
 				'tag_spec' => array(
@@ -10159,6 +10568,9 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => array(
+							'text/javascript' => true,
+						),
 					),
 					'http-equiv' => array(
 						'dispatch_key' => 2,
@@ -10166,6 +10578,15 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'content-script-type',
 						),
+						'value_casei_set' => array(
+							'content-script-type' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'http-equiv',
 					),
 				),
 				'tag_spec' => array(
@@ -10176,15 +10597,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'http-equiv' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'origin-trial',
 						),
+						'value_casei_set' => array(
+							'origin-trial' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'http-equiv',
 					),
 				),
 				'tag_spec' => array(
@@ -10195,15 +10623,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'http-equiv' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'resource-type',
 						),
+						'value_casei_set' => array(
+							'resource-type' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'http-equiv',
 					),
 				),
 				'tag_spec' => array(
@@ -10220,6 +10655,10 @@ class AMP_Allowed_Tags_Generated {
 							'off',
 							'on',
 						),
+						'value_casei_set' => array(
+							'off' => true,
+							'on' => true,
+						),
 					),
 					'http-equiv' => array(
 						'dispatch_key' => 2,
@@ -10227,6 +10666,15 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'x-dns-prefetch-control',
 						),
+						'value_casei_set' => array(
+							'x-dns-prefetch-control' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'http-equiv',
 					),
 				),
 				'tag_spec' => array(
@@ -10237,15 +10685,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'name' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'amp-ad-enable-refresh',
 						),
+						'value_casei_set' => array(
+							'amp-ad-enable-refresh' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -10255,15 +10710,22 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'content' => array(
-						'mandatory' => true,
-					),
+					'content' => 4,
 					'name' => array(
 						'dispatch_key' => 2,
 						'mandatory' => true,
 						'value_casei' => array(
 							'amp-to-amp-navigation',
 						),
+						'value_casei_set' => array(
+							'amp-to-amp-navigation' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'content',
+						'name',
 					),
 				),
 				'tag_spec' => array(
@@ -10275,15 +10737,8 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'metadata' => array(
 			array(
-				'attr_spec_list' => array(
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-				),
+				'attr_spec_list' => 10,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -10300,28 +10755,32 @@ class AMP_Allowed_Tags_Generated {
 					'optimum' => array(),
 					'value' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'multicol' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'nav' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 			array(
 				'attr_spec_list' => array(
-					'toolbar' => array(
-						'dispatch_key' => 1,
-						'mandatory' => true,
-					),
-					'toolbar-target' => array(
-						'mandatory' => true,
+					'toolbar' => 62,
+					'toolbar-target' => 4,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'toolbar',
+						'toolbar-target',
 					),
 				),
 				'tag_spec' => array(
@@ -10330,6 +10789,10 @@ class AMP_Allowed_Tags_Generated {
 							'ol',
 							'ul',
 						),
+						'child_tag_name_oneof_set' => array(
+							'ol' => true,
+							'ul' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
 					'mandatory_parent' => 'amp-sidebar',
@@ -10340,18 +10803,21 @@ class AMP_Allowed_Tags_Generated {
 		'nextid' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'nobr' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'noscript' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory' => true,
 					'mandatory_parent' => 'head',
@@ -10362,6 +10828,7 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'disallowed_ancestor' => array(
 						'noscript',
@@ -10373,24 +10840,21 @@ class AMP_Allowed_Tags_Generated {
 		'o:p' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'ol' => array(
 			array(
 				'attr_spec_list' => array(
-					'reversed' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'start' => array(
-						'value_regex' => '[0-9]*',
-					),
+					'reversed' => 2,
+					'start' => 59,
 					'type' => array(
 						'value_regex' => '[1AaIi]',
+						'value_regex_pcre' => '/^([1AaIi])$/u',
 					),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -10402,6 +10866,7 @@ class AMP_Allowed_Tags_Generated {
 					'disabled' => array(),
 					'label' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_parent' => 'select',
 					'spec_url' => 'https://amp.dev/documentation/components/amp-form',
@@ -10420,6 +10885,7 @@ class AMP_Allowed_Tags_Generated {
 					'selected' => array(),
 					'value' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'spec_url' => 'https://amp.dev/documentation/components/amp-form',
 				),
@@ -10430,18 +10896,16 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'for' => array(),
 					'form' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'p' => array(
 			array(
-				'attr_spec_list' => array(
-					'align' => array(),
-				),
+				'attr_spec_list' => 11,
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -10507,9 +10971,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -10525,6 +10987,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -10595,9 +11058,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -10612,18 +11073,7 @@ class AMP_Allowed_Tags_Generated {
 					'x' => array(),
 					'xlink:actuate' => array(),
 					'xlink:arcrole' => array(),
-					'xlink:href' => array(
-						'alternative_names' => array(
-							'href',
-						),
-						'value_url' => array(
-							'allow_empty' => false,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'xlink:href' => 54,
 					'xlink:role' => array(),
 					'xlink:show' => array(),
 					'xlink:title' => array(),
@@ -10634,6 +11084,11 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'href' => 'xlink:href',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -10643,6 +11098,7 @@ class AMP_Allowed_Tags_Generated {
 		'picture' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_parent' => 'noscript',
 					'spec_url' => 'https://amp.dev/documentation/components/amp-img',
@@ -10651,83 +11107,8 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'polygon' => array(
 			array(
-				'attr_spec_list' => array(
-					'alignment-baseline' => array(),
-					'baseline-shift' => array(),
-					'clip' => array(),
-					'clip-path' => array(),
-					'clip-rule' => array(),
-					'color' => array(),
-					'color-interpolation' => array(),
-					'color-interpolation-filters' => array(),
-					'color-profile' => array(),
-					'color-rendering' => array(),
-					'cursor' => array(),
-					'direction' => array(),
-					'display' => array(),
-					'dominant-baseline' => array(),
-					'enable-background' => array(),
-					'externalresourcesrequired' => array(),
-					'fill' => array(),
-					'fill-opacity' => array(),
-					'fill-rule' => array(),
-					'filter' => array(),
-					'flood-color' => array(),
-					'flood-opacity' => array(),
-					'focusable' => array(),
-					'font-family' => array(),
-					'font-size' => array(),
-					'font-size-adjust' => array(),
-					'font-stretch' => array(),
-					'font-style' => array(),
-					'font-variant' => array(),
-					'font-weight' => array(),
-					'glyph-orientation-horizontal' => array(),
-					'glyph-orientation-vertical' => array(),
-					'image-rendering' => array(),
-					'kerning' => array(),
-					'letter-spacing' => array(),
-					'lighting-color' => array(),
-					'marker-end' => array(),
-					'marker-mid' => array(),
-					'marker-start' => array(),
-					'mask' => array(),
-					'opacity' => array(),
-					'overflow' => array(),
-					'pointer-events' => array(),
-					'points' => array(),
-					'requiredextensions' => array(),
-					'requiredfeatures' => array(),
-					'shape-rendering' => array(),
-					'sketch:type' => array(),
-					'stop-color' => array(),
-					'stop-opacity' => array(),
-					'stroke' => array(),
-					'stroke-dasharray' => array(),
-					'stroke-dashoffset' => array(),
-					'stroke-linecap' => array(),
-					'stroke-linejoin' => array(),
-					'stroke-miterlimit' => array(),
-					'stroke-opacity' => array(),
-					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'systemlanguage' => array(),
-					'text-anchor' => array(),
-					'text-decoration' => array(),
-					'text-rendering' => array(),
-					'transform' => array(),
-					'unicode-bidi' => array(),
-					'vector-effect' => array(),
-					'visibility' => array(),
-					'word-spacing' => array(),
-					'writing-mode' => array(),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-				),
+				'attr_spec_list' => 14,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -10736,83 +11117,8 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'polyline' => array(
 			array(
-				'attr_spec_list' => array(
-					'alignment-baseline' => array(),
-					'baseline-shift' => array(),
-					'clip' => array(),
-					'clip-path' => array(),
-					'clip-rule' => array(),
-					'color' => array(),
-					'color-interpolation' => array(),
-					'color-interpolation-filters' => array(),
-					'color-profile' => array(),
-					'color-rendering' => array(),
-					'cursor' => array(),
-					'direction' => array(),
-					'display' => array(),
-					'dominant-baseline' => array(),
-					'enable-background' => array(),
-					'externalresourcesrequired' => array(),
-					'fill' => array(),
-					'fill-opacity' => array(),
-					'fill-rule' => array(),
-					'filter' => array(),
-					'flood-color' => array(),
-					'flood-opacity' => array(),
-					'focusable' => array(),
-					'font-family' => array(),
-					'font-size' => array(),
-					'font-size-adjust' => array(),
-					'font-stretch' => array(),
-					'font-style' => array(),
-					'font-variant' => array(),
-					'font-weight' => array(),
-					'glyph-orientation-horizontal' => array(),
-					'glyph-orientation-vertical' => array(),
-					'image-rendering' => array(),
-					'kerning' => array(),
-					'letter-spacing' => array(),
-					'lighting-color' => array(),
-					'marker-end' => array(),
-					'marker-mid' => array(),
-					'marker-start' => array(),
-					'mask' => array(),
-					'opacity' => array(),
-					'overflow' => array(),
-					'pointer-events' => array(),
-					'points' => array(),
-					'requiredextensions' => array(),
-					'requiredfeatures' => array(),
-					'shape-rendering' => array(),
-					'sketch:type' => array(),
-					'stop-color' => array(),
-					'stop-opacity' => array(),
-					'stroke' => array(),
-					'stroke-dasharray' => array(),
-					'stroke-dashoffset' => array(),
-					'stroke-linecap' => array(),
-					'stroke-linejoin' => array(),
-					'stroke-miterlimit' => array(),
-					'stroke-opacity' => array(),
-					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'systemlanguage' => array(),
-					'text-anchor' => array(),
-					'text-decoration' => array(),
-					'text-rendering' => array(),
-					'transform' => array(),
-					'unicode-bidi' => array(),
-					'vector-effect' => array(),
-					'visibility' => array(),
-					'word-spacing' => array(),
-					'writing-mode' => array(),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-				),
+				'attr_spec_list' => 14,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -10822,6 +11128,7 @@ class AMP_Allowed_Tags_Generated {
 		'pre' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -10831,23 +11138,16 @@ class AMP_Allowed_Tags_Generated {
 					'max' => array(),
 					'value' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'q' => array(
 			array(
 				'attr_spec_list' => array(
-					'cite' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_empty' => true,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'cite' => 52,
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -10917,9 +11217,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -10930,18 +11228,7 @@ class AMP_Allowed_Tags_Generated {
 					'writing-mode' => array(),
 					'xlink:actuate' => array(),
 					'xlink:arcrole' => array(),
-					'xlink:href' => array(
-						'alternative_names' => array(
-							'href',
-						),
-						'value_url' => array(
-							'allow_empty' => false,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'xlink:href' => 54,
 					'xlink:role' => array(),
 					'xlink:show' => array(),
 					'xlink:title' => array(),
@@ -10951,6 +11238,11 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'href' => 'xlink:href',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -10960,6 +11252,7 @@ class AMP_Allowed_Tags_Generated {
 		'rb' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -11026,9 +11319,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -11047,6 +11338,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -11056,48 +11348,49 @@ class AMP_Allowed_Tags_Generated {
 		'rp' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'rt' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'rtc' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'ruby' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		's' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'samp' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'script' => array(
 			array(
 				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
+					'async' => 12,
 					'nonce' => array(),
 					'src' => array(
 						'dispatch_key' => 2,
@@ -11105,18 +11398,24 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'https://cdn.ampproject.org/v0.js',
 						),
-					),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
+						'value_set' => array(
+							'https://cdn.ampproject.org/v0.js' => true,
 						),
 					),
+					'type' => 63,
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'contents',
 						'regex' => '.',
 					),
+					'blacklisted_cdata_regex_pcre' => '@.@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
+						'src',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory' => true,
@@ -11135,6 +11434,9 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/ld+json',
 						),
+						'value_casei_set' => array(
+							'application/ld+json' => true,
+						),
 					),
 				),
 				'cdata' => array(
@@ -11142,6 +11444,12 @@ class AMP_Allowed_Tags_Generated {
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
 				),
 				'tag_spec' => array(
 					'spec_name' => 'script type=application/ld+json',
@@ -11155,20 +11463,25 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-rtc',
 						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
+						'value_casei_set' => array(
+							'amp-rtc' => true,
 						),
 					),
+					'nonce' => array(),
+					'type' => 64,
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'id',
+						'type',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'head',
@@ -11177,20 +11490,18 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 15,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-ima-video',
@@ -11198,18 +11509,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11223,18 +11526,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11248,18 +11543,13 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+					'required_extensions' => array(
+						'amp-access',
 					),
 				),
 				'tag_spec' => array(
@@ -11278,18 +11568,13 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+					'required_extensions' => array(
+						'amp-access',
 					),
 				),
 				'tag_spec' => array(
@@ -11307,18 +11592,13 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+					'required_extensions' => array(
+						'amp-access',
 					),
 				),
 				'tag_spec' => array(
@@ -11336,18 +11616,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11370,20 +11642,28 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-access',
 						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
+						'value_set' => array(
+							'amp-access' => true,
 						),
 					),
+					'nonce' => array(),
+					'type' => 64,
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'id',
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-access',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'head',
@@ -11395,18 +11675,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11422,18 +11694,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11447,18 +11711,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11473,18 +11729,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11501,18 +11749,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11526,18 +11766,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11553,21 +11785,21 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-analytics',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-analytics',
@@ -11579,18 +11811,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11606,18 +11830,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11631,21 +11847,21 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-animation',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-animation',
@@ -11656,18 +11872,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11683,18 +11891,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11709,18 +11909,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11736,18 +11928,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11761,18 +11945,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11786,21 +11962,21 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-autocomplete',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-autocomplete',
@@ -11811,18 +11987,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11836,18 +12004,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11861,18 +12021,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11887,24 +12039,24 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
 					'max_bytes' => 100000,
 					'max_bytes_spec_url' => 'https://amp.dev/documentation/components/amp-bind#state',
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-bind',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-state',
 					'requires_extension' => array(
@@ -11915,18 +12067,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11940,18 +12084,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11967,18 +12103,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -11994,18 +12122,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12019,18 +12139,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12045,18 +12157,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12072,18 +12176,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12097,18 +12193,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12122,21 +12210,21 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-consent',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-consent',
@@ -12148,18 +12236,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12175,18 +12255,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12200,18 +12272,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12225,18 +12289,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12250,18 +12306,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12275,18 +12323,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12302,18 +12342,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12327,18 +12359,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12355,24 +12379,21 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
 					'max_bytes' => 15000,
 					'max_bytes_spec_url' => 'https://amp.dev/documentation/components/amp-experiment#configuration',
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-experiment',
 					'spec_name' => 'amp-experiment extension .json script',
@@ -12380,18 +12401,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12405,18 +12418,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12430,18 +12435,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12455,18 +12452,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12482,18 +12471,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12509,18 +12490,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12536,18 +12509,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12563,18 +12528,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12589,18 +12546,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12616,18 +12565,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12641,21 +12582,21 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-geo',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-geo',
@@ -12667,18 +12608,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12694,18 +12627,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12719,18 +12644,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12744,18 +12661,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12769,18 +12678,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12796,18 +12697,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12821,18 +12714,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12848,18 +12733,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12873,18 +12750,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12898,18 +12767,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12924,18 +12785,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12951,18 +12804,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -12978,18 +12823,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13004,18 +12841,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13031,18 +12860,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13058,18 +12879,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13084,18 +12897,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13111,18 +12916,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13136,21 +12933,21 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-link-rewriter',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-link-rewriter',
@@ -13161,18 +12958,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13188,18 +12977,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13216,18 +12997,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13241,18 +13014,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13266,18 +13031,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13306,12 +13063,18 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-mustache',
 						),
+						'value_set' => array(
+							'amp-mustache' => true,
+						),
 					),
 					'type' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'text/plain',
 						),
+						'value_casei_set' => array(
+							'text/plain' => true,
+						),
 					),
 				),
 				'cdata' => array(
@@ -13319,6 +13082,16 @@ class AMP_Allowed_Tags_Generated {
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'template',
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-mustache',
+					),
 				),
 				'tag_spec' => array(
 					'disallowed_ancestor' => array(
@@ -13336,18 +13109,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13361,13 +13126,13 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
+				'attr_spec_list' => 15,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-next-page',
 					),
 				),
 				'tag_spec' => array(
@@ -13380,18 +13145,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13405,18 +13162,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13432,18 +13181,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13457,18 +13198,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13482,18 +13215,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13507,18 +13232,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13534,18 +13251,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13559,18 +13268,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13584,18 +13285,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13609,18 +13302,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13636,18 +13321,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13661,18 +13338,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13687,18 +13356,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13712,18 +13373,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13737,18 +13390,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13763,18 +13408,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13790,18 +13427,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13815,18 +13444,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13840,18 +13461,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13867,18 +13480,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13894,18 +13499,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13921,18 +13518,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13951,18 +13540,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -13976,21 +13557,21 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-story-auto-ads',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-story-auto-ads',
@@ -14002,18 +13583,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14031,13 +13604,13 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
+				'attr_spec_list' => 15,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-story',
 					),
 				),
 				'tag_spec' => array(
@@ -14050,21 +13623,22 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-consent',
+						'amp-story',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-story-consent',
@@ -14077,18 +13651,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14110,20 +13676,28 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-subscriptions',
 						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
+						'value_set' => array(
+							'amp-subscriptions' => true,
 						),
 					),
+					'nonce' => array(),
+					'type' => 64,
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'id',
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-subscriptions',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'head',
@@ -14135,18 +13709,13 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+					'required_extensions' => array(
+						'amp-subscriptions',
 					),
 				),
 				'tag_spec' => array(
@@ -14164,18 +13733,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14189,18 +13750,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14214,18 +13767,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14241,18 +13786,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14266,21 +13803,21 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'nonce' => array(),
-					'type' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value_casei' => array(
-							'application/json',
-						),
-					),
-				),
+				'attr_spec_list' => 17,
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
 					),
+					'blacklisted_cdata_regex_pcre' => '@<!--@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-user-location',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-user-location',
@@ -14292,18 +13829,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14319,18 +13848,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14345,18 +13866,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14370,18 +13883,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14397,18 +13902,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14424,18 +13921,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14451,18 +13940,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14476,18 +13957,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14501,18 +13974,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14526,18 +13991,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14551,18 +14008,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14577,18 +14026,10 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'async' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/javascript',
-						),
+				'attr_spec_list' => 16,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'async',
 					),
 				),
 				'tag_spec' => array(
@@ -14607,6 +14048,7 @@ class AMP_Allowed_Tags_Generated {
 		'section' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'disallowed_ancestor' => array(
 						'amp-accordion',
@@ -14615,12 +14057,9 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'expanded' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'expanded' => 2,
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'child_tags' => array(
 						'first_child_tag_name_oneof' => array(
@@ -14632,6 +14071,15 @@ class AMP_Allowed_Tags_Generated {
 							'h6',
 							'header',
 						),
+						'first_child_tag_name_oneof_set' => array(
+							'h1' => true,
+							'h2' => true,
+							'h3' => true,
+							'h4' => true,
+							'h5' => true,
+							'h6' => true,
+							'header' => true,
+						),
 						'mandatory_num_child_tags' => 2,
 					),
 					'mandatory_parent' => 'amp-accordion',
@@ -14650,17 +14098,12 @@ class AMP_Allowed_Tags_Generated {
 					'autofocus' => array(),
 					'disabled' => array(),
 					'multiple' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
-					'no-verify' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'name' => 0,
+					'no-verify' => 2,
 					'required' => array(),
 					'size' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'spec_url' => 'https://amp.dev/documentation/components/amp-form',
 				),
@@ -14669,16 +14112,16 @@ class AMP_Allowed_Tags_Generated {
 		'slot' => array(
 			array(
 				'attr_spec_list' => array(
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
+					'name' => 0,
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'small' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -14740,9 +14183,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -14756,6 +14197,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -14769,6 +14211,7 @@ class AMP_Allowed_Tags_Generated {
 					'sizes' => array(),
 					'srcset' => array(
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -14776,10 +14219,16 @@ class AMP_Allowed_Tags_Generated {
 								'http',
 								'https',
 							),
+							'protocol_set' => array(
+								'data' => true,
+								'http' => true,
+								'https' => true,
+							),
 						),
 					),
 					'type' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_parent' => 'picture',
 					'spec_name' => 'picture > source',
@@ -14787,21 +14236,8 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'[src]' => array(),
-					'[type]' => array(),
-					'media' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'type' => array(),
-				),
+				'attr_spec_list' => 18,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-video',
 					'spec_name' => 'amp-video > source',
@@ -14809,21 +14245,8 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'[src]' => array(),
-					'[type]' => array(),
-					'media' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'type' => array(),
-				),
+				'attr_spec_list' => 18,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-audio',
 					'spec_name' => 'amp-audio > source',
@@ -14831,20 +14254,11 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'media' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'type' => array(
-						'mandatory' => true,
+				'attr_spec_list' => 19,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
+						'type',
 					),
 				),
 				'tag_spec' => array(
@@ -14854,20 +14268,11 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'media' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'type' => array(
-						'mandatory' => true,
+				'attr_spec_list' => 19,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
+						'type',
 					),
 				),
 				'tag_spec' => array(
@@ -14877,20 +14282,11 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'[src]' => array(),
-					'[type]' => array(),
-					'media' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => true,
-							'protocol' => array(
-								'https',
-							),
-						),
+				'attr_spec_list' => 18,
+				'precomputed' => array(
+					'required_extensions' => array(
+						'amp-ima-video',
 					),
-					'type' => array(),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-ima-video',
@@ -14904,25 +14300,21 @@ class AMP_Allowed_Tags_Generated {
 		'spacer' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'span' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'stop' => array(
 			array(
-				'attr_spec_list' => array(
-					'offset' => array(),
-					'stop-color' => array(),
-					'stop-opacity' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-				),
+				'attr_spec_list' => 20,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'lineargradient',
 					'spec_name' => 'lineargradient > stop',
@@ -14930,14 +14322,8 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'offset' => array(),
-					'stop-color' => array(),
-					'stop-opacity' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-				),
+				'attr_spec_list' => 20,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'radialgradient',
 					'spec_name' => 'radialgradient > stop',
@@ -14948,36 +14334,30 @@ class AMP_Allowed_Tags_Generated {
 		'strike' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'strong' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'style' => array(
 			array(
 				'attr_spec_list' => array(
-					'amp-custom' => array(
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
+					'amp-custom' => 12,
 					'nonce' => array(),
-					'type' => array(
-						'value_casei' => array(
-							'text/css',
-						),
-					),
+					'type' => 61,
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'CSS !important',
 						'regex' => '!\\s*important',
 					),
+					'blacklisted_cdata_regex_pcre' => '@!\\s*important@u',
 					'css_spec' => array(
 						'allowed_at_rules' => array(
 							'font-face',
@@ -15009,6 +14389,11 @@ class AMP_Allowed_Tags_Generated {
 					'max_bytes' => 50000,
 					'max_bytes_spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#maximum-size',
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'amp-custom',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'head',
 					'spec_name' => 'style amp-custom',
@@ -15017,18 +14402,15 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'amp-boilerplate' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-				),
+				'attr_spec_list' => 21,
 				'cdata' => array(
 					'cdata_regex' => '\\s*body\\s*{\\s*-webkit-animation:\\s*-amp-start\\s+8s\\s+steps\\(1,\\s*end\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*-moz-animation:\\s*-amp-start\\s+8s\\s+steps\\s*\\(1\\s*,\\s*end\\s*\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*-ms-animation:\\s*-amp-start\\s+8s\\s+steps\\s*\\(1\\s*,\\s*end\\s*\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*animation:\\s*-amp-start\\s+8s\\s+steps\\(1,\\s*end\\)\\s+0s\\s+1\\s+normal\\s+both;?\\s*}\\s*@-webkit-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@-moz-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@-ms-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@-o-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*',
+					'cdata_regex_pcre' => '@\\s*body\\s*{\\s*-webkit-animation:\\s*-amp-start\\s+8s\\s+steps\\(1,\\s*end\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*-moz-animation:\\s*-amp-start\\s+8s\\s+steps\\s*\\(1\\s*,\\s*end\\s*\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*-ms-animation:\\s*-amp-start\\s+8s\\s+steps\\s*\\(1\\s*,\\s*end\\s*\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*animation:\\s*-amp-start\\s+8s\\s+steps\\(1,\\s*end\\)\\s+0s\\s+1\\s+normal\\s+both;?\\s*}\\s*\\@-webkit-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*\\@-moz-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*\\@-ms-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*\\@-o-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*\\@keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'amp-boilerplate',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory' => true,
@@ -15039,18 +14421,15 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'amp-boilerplate' => array(
-						'dispatch_key' => 3,
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
-					'nonce' => array(),
-				),
+				'attr_spec_list' => 21,
 				'cdata' => array(
 					'cdata_regex' => '\\s*body\\s*{\\s*-webkit-animation:\\s*none;\\s*-moz-animation:\\s*none;\\s*-ms-animation:\\s*none;\\s*animation:\\s*none;?\\s*}\\s*',
+					'cdata_regex_pcre' => '@\\s*body\\s*{\\s*-webkit-animation:\\s*none;\\s*-moz-animation:\\s*none;\\s*-ms-animation:\\s*none;\\s*animation:\\s*none;?\\s*}\\s*@u',
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'amp-boilerplate',
+					),
 				),
 				'tag_spec' => array(
 					'mandatory' => true,
@@ -15063,13 +14442,7 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'amp-keyframes' => array(
-						'dispatch_key' => 1,
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
+					'amp-keyframes' => 66,
 				),
 				'cdata' => array(
 					'css_spec' => array(
@@ -15092,6 +14465,11 @@ class AMP_Allowed_Tags_Generated {
 					'max_bytes' => 500000,
 					'max_bytes_spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#keyframes-stylesheet',
 				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'amp-keyframes',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'body',
 					'spec_name' => 'style[amp-keyframes]',
@@ -15102,12 +14480,14 @@ class AMP_Allowed_Tags_Generated {
 		'sub' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'summary' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_parent' => 'details',
 				),
@@ -15116,6 +14496,7 @@ class AMP_Allowed_Tags_Generated {
 		'sup' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -15182,9 +14563,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -15196,6 +14575,10 @@ class AMP_Allowed_Tags_Generated {
 							'1.0',
 							'1.1',
 						),
+						'value_set' => array(
+							'1.0' => true,
+							'1.1' => true,
+						),
 					),
 					'viewbox' => array(),
 					'visibility' => array(),
@@ -15210,6 +14593,7 @@ class AMP_Allowed_Tags_Generated {
 					'y' => array(),
 					'zoomandpan' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
 				),
@@ -15273,9 +14657,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -15290,6 +14672,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -15354,9 +14737,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'text-anchor' => array(),
 					'text-decoration' => array(),
 					'text-rendering' => array(),
@@ -15371,6 +14752,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -15382,23 +14764,20 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'align' => array(),
 					'bgcolor' => array(),
-					'border' => array(
-						'value' => array(
-							'0',
-							'1',
-						),
-					),
+					'border' => 18,
 					'cellpadding' => array(),
 					'cellspacing' => array(),
 					'sortable' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'tbody' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -15414,26 +14793,25 @@ class AMP_Allowed_Tags_Generated {
 					'valign' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'template' => array(
 			array(
 				'attr_spec_list' => array(
-					'date-template' => array(
-						'dispatch_key' => 1,
-						'mandatory' => true,
-						'value' => array(
-							'',
-						),
-					),
+					'date-template' => 66,
 					'dates' => array(),
 					'default' => array(),
-					'type' => array(
-						'mandatory' => true,
-						'value' => array(
-							'amp-mustache',
-						),
+					'type' => 67,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'date-template',
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-mustache',
 					),
 				),
 				'tag_spec' => array(
@@ -15446,15 +14824,16 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'info-template' => array(
-						'dispatch_key' => 1,
-						'mandatory' => true,
+					'info-template' => 62,
+					'type' => 67,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'info-template',
+						'type',
 					),
-					'type' => array(
-						'mandatory' => true,
-						'value' => array(
-							'amp-mustache',
-						),
+					'required_extensions' => array(
+						'amp-mustache',
 					),
 				),
 				'tag_spec' => array(
@@ -15467,11 +14846,14 @@ class AMP_Allowed_Tags_Generated {
 			),
 			array(
 				'attr_spec_list' => array(
-					'type' => array(
-						'mandatory' => true,
-						'value' => array(
-							'amp-mustache',
-						),
+					'type' => 67,
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'required_extensions' => array(
+						'amp-mustache',
 					),
 				),
 				'tag_spec' => array(
@@ -15498,6 +14880,232 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-mustache',
 						),
+						'value_set' => array(
+							'amp-mustache' => true,
+						),
+					),
+				),
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'type',
+					),
+					'reference_point_attrs' => array(
+						'align-content' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'space-around',
+								'space-between',
+								'space-evenly',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'space-around' => true,
+								'space-between' => true,
+								'space-evenly' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'align-items' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'align-self' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'animate-in' => array(
+							'unique' => false,
+							'value' => array(
+								'drop',
+								'fade-in',
+								'fly-in-bottom',
+								'fly-in-left',
+								'fly-in-right',
+								'fly-in-top',
+								'pan-down',
+								'pan-left',
+								'pan-right',
+								'pan-up',
+								'pulse',
+								'rotate-in-left',
+								'rotate-in-right',
+								'twirl-in',
+								'whoosh-in-left',
+								'whoosh-in-right',
+								'zoom-in',
+								'zoom-out',
+							),
+							'value_set' => array(
+								'drop' => true,
+								'fade-in' => true,
+								'fly-in-bottom' => true,
+								'fly-in-left' => true,
+								'fly-in-right' => true,
+								'fly-in-top' => true,
+								'pan-down' => true,
+								'pan-left' => true,
+								'pan-right' => true,
+								'pan-up' => true,
+								'pulse' => true,
+								'rotate-in-left' => true,
+								'rotate-in-right' => true,
+								'twirl-in' => true,
+								'whoosh-in-left' => true,
+								'whoosh-in-right' => true,
+								'zoom-in' => true,
+								'zoom-out' => true,
+							),
+						),
+						'animate-in-after' => array(
+							'unique' => false,
+						),
+						'animate-in-delay' => array(
+							'unique' => false,
+						),
+						'animate-in-duration' => array(
+							'unique' => false,
+						),
+						'animate-in-timing-function' => array(
+							'unique' => false,
+						),
+						'data-tooltip-icon' => array(
+							'unique' => false,
+							'value_url' => array(
+								'protocol' => array(
+									'http',
+									'https',
+									'data',
+								),
+								'protocol_set' => array(
+									'data' => true,
+									'http' => true,
+									'https' => true,
+								),
+							),
+						),
+						'grid-area' => array(
+							'unique' => false,
+						),
+						'interactive' => array(
+							'unique' => false,
+							'value' => array(
+								'',
+							),
+							'value_set' => array(
+								'' => true,
+							),
+						),
+						'justify-content' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'space-around',
+								'space-between',
+								'space-evenly',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'space-around' => true,
+								'space-between' => true,
+								'space-evenly' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'justify-items' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'justify-self' => array(
+							'unique' => false,
+							'value' => array(
+								'center',
+								'end',
+								'start',
+								'stretch',
+							),
+							'value_set' => array(
+								'center' => true,
+								'end' => true,
+								'start' => true,
+								'stretch' => true,
+							),
+						),
+						'scale-end' => array(
+							'unique' => false,
+							'value_regex' => '[0-9]+([.][0-9]+)?',
+							'value_regex_pcre' => '/^([0-9]+([.][0-9]+)?)$/u',
+						),
+						'scale-start' => array(
+							'unique' => false,
+							'value_regex' => '[0-9]+([.][0-9]+)?',
+							'value_regex_pcre' => '/^([0-9]+([.][0-9]+)?)$/u',
+						),
+						'target' => array(
+							'unique' => false,
+							'value' => array(
+								'_blank',
+							),
+							'value_set' => array(
+								'_blank' => true,
+							),
+						),
+						'translate-x' => array(
+							'unique' => false,
+							'value_regex_casei' => '[0-9]+px',
+							'value_regex_casei_pcre' => '/^([0-9]+px)$/ui',
+						),
+						'translate-y' => array(
+							'unique' => false,
+							'value_regex_casei' => '[0-9]+px',
+							'value_regex_casei_pcre' => '/^([0-9]+px)$/ui',
+						),
+					),
+					'required_extensions' => array(
+						'amp-mustache',
 					),
 				),
 				'tag_spec' => array(
@@ -15583,9 +15191,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -15604,6 +15210,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -15641,14 +15248,8 @@ class AMP_Allowed_Tags_Generated {
 					'disabled' => array(),
 					'maxlength' => array(),
 					'minlength' => array(),
-					'name' => array(
-						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					),
-					'no-verify' => array(
-						'value' => array(
-							'',
-						),
-					),
+					'name' => 0,
+					'no-verify' => 2,
 					'pattern' => array(),
 					'placeholder' => array(),
 					'readonly' => array(),
@@ -15660,6 +15261,7 @@ class AMP_Allowed_Tags_Generated {
 					'spellcheck' => array(),
 					'wrap' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'spec_url' => 'https://amp.dev/documentation/components/amp-form',
 				),
@@ -15727,9 +15329,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -15741,18 +15341,7 @@ class AMP_Allowed_Tags_Generated {
 					'writing-mode' => array(),
 					'xlink:actuate' => array(),
 					'xlink:arcrole' => array(),
-					'xlink:href' => array(
-						'alternative_names' => array(
-							'href',
-						),
-						'value_url' => array(
-							'allow_empty' => false,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'xlink:href' => 54,
 					'xlink:role' => array(),
 					'xlink:show' => array(),
 					'xlink:title' => array(),
@@ -15762,6 +15351,11 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'href' => 'xlink:href',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -15771,6 +15365,7 @@ class AMP_Allowed_Tags_Generated {
 		'tfoot' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -15789,12 +15384,14 @@ class AMP_Allowed_Tags_Generated {
 					'valign' => array(),
 					'width' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'thead' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -15803,6 +15400,7 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'datetime' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -15811,20 +15409,14 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'[text]' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'spec_name' => 'title',
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-				),
+				'attr_spec_list' => 10,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_name' => 'svg title',
@@ -15840,37 +15432,17 @@ class AMP_Allowed_Tags_Generated {
 					'height' => array(),
 					'valign' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'track' => array(
 			array(
-				'attr_spec_list' => array(
-					'default' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'kind' => array(
-						'value' => array(
-							'captions',
-							'chapters',
-							'descriptions',
-							'metadata',
-						),
-					),
-					'label' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
+				'attr_spec_list' => 22,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
 					),
-					'srclang' => array(),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'audio',
@@ -15878,31 +15450,12 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'default' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'kind' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'subtitles',
-						),
-					),
-					'label' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'srclang' => array(
-						'mandatory' => true,
+				'attr_spec_list' => 23,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'kind',
+						'src',
+						'srclang',
 					),
 				),
 				'tag_spec' => array(
@@ -15911,32 +15464,11 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'default' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'kind' => array(
-						'value' => array(
-							'captions',
-							'chapters',
-							'descriptions',
-							'metadata',
-						),
-					),
-					'label' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
+				'attr_spec_list' => 22,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
 					),
-					'srclang' => array(),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'video',
@@ -15944,31 +15476,12 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'default' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'kind' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'subtitles',
-						),
-					),
-					'label' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'srclang' => array(
-						'mandatory' => true,
+				'attr_spec_list' => 23,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'kind',
+						'src',
+						'srclang',
 					),
 				),
 				'tag_spec' => array(
@@ -15977,70 +15490,24 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'[label]' => array(),
-					'[src]' => array(),
-					'[srclang]' => array(),
-					'default' => array(
-						'value' => array(
-							'',
-						),
+				'attr_spec_list' => 24,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
 					),
-					'kind' => array(
-						'value' => array(
-							'captions',
-							'chapters',
-							'descriptions',
-							'metadata',
-						),
-					),
-					'label' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'srclang' => array(),
-				),
-				'tag_spec' => array(
-					'mandatory_parent' => 'amp-audio',
-					'spec_name' => 'amp-audio > track',
-				),
-			),
-			array(
-				'attr_spec_list' => array(
-					'[label]' => array(),
-					'[src]' => array(),
-					'[srclang]' => array(),
-					'default' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'kind' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'subtitles',
-						),
-					),
-					'label' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'srclang' => array(
-						'mandatory' => true,
+				),
+				'tag_spec' => array(
+					'mandatory_parent' => 'amp-audio',
+					'spec_name' => 'amp-audio > track',
+				),
+			),
+			array(
+				'attr_spec_list' => 25,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'kind',
+						'src',
+						'srclang',
 					),
 				),
 				'tag_spec' => array(
@@ -16049,35 +15516,11 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'[label]' => array(),
-					'[src]' => array(),
-					'[srclang]' => array(),
-					'default' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'kind' => array(
-						'value' => array(
-							'captions',
-							'chapters',
-							'descriptions',
-							'metadata',
-						),
-					),
-					'label' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
+				'attr_spec_list' => 24,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
 					),
-					'srclang' => array(),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-video',
@@ -16085,34 +15528,12 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'[label]' => array(),
-					'[src]' => array(),
-					'[srclang]' => array(),
-					'default' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'kind' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'subtitles',
-						),
-					),
-					'label' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'srclang' => array(
-						'mandatory' => true,
+				'attr_spec_list' => 25,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'kind',
+						'src',
+						'srclang',
 					),
 				),
 				'tag_spec' => array(
@@ -16121,35 +15542,11 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'[label]' => array(),
-					'[src]' => array(),
-					'[srclang]' => array(),
-					'default' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'kind' => array(
-						'value' => array(
-							'captions',
-							'chapters',
-							'descriptions',
-							'metadata',
-						),
-					),
-					'label' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
+				'attr_spec_list' => 24,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'src',
 					),
-					'srclang' => array(),
 				),
 				'tag_spec' => array(
 					'mandatory_parent' => 'amp-ima-video',
@@ -16157,34 +15554,12 @@ class AMP_Allowed_Tags_Generated {
 				),
 			),
 			array(
-				'attr_spec_list' => array(
-					'[label]' => array(),
-					'[src]' => array(),
-					'[srclang]' => array(),
-					'default' => array(
-						'value' => array(
-							'',
-						),
-					),
-					'kind' => array(
-						'mandatory' => true,
-						'value_casei' => array(
-							'subtitles',
-						),
-					),
-					'label' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'mandatory' => true,
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'https',
-							),
-						),
-					),
-					'srclang' => array(
-						'mandatory' => true,
+				'attr_spec_list' => 25,
+				'precomputed' => array(
+					'mandatory_attrs' => array(
+						'kind',
+						'src',
+						'srclang',
 					),
 				),
 				'tag_spec' => array(
@@ -16253,9 +15628,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -16267,18 +15640,7 @@ class AMP_Allowed_Tags_Generated {
 					'writing-mode' => array(),
 					'xlink:actuate' => array(),
 					'xlink:arcrole' => array(),
-					'xlink:href' => array(
-						'alternative_names' => array(
-							'href',
-						),
-						'value_url' => array(
-							'allow_empty' => false,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'xlink:href' => 54,
 					'xlink:role' => array(),
 					'xlink:show' => array(),
 					'xlink:title' => array(),
@@ -16288,6 +15650,11 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns' => array(),
 					'xmlns:xlink' => array(),
 				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'href' => 'xlink:href',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -16357,9 +15724,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -16377,6 +15742,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -16386,18 +15752,21 @@ class AMP_Allowed_Tags_Generated {
 		'tt' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'u' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
 		'ul' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -16461,9 +15830,7 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-miterlimit' => array(),
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -16478,18 +15845,7 @@ class AMP_Allowed_Tags_Generated {
 					'x' => array(),
 					'xlink:actuate' => array(),
 					'xlink:arcrole' => array(),
-					'xlink:href' => array(
-						'alternative_names' => array(
-							'href',
-						),
-						'value_url' => array(
-							'allow_empty' => false,
-							'protocol' => array(
-								'http',
-								'https',
-							),
-						),
-					),
+					'xlink:href' => 54,
 					'xlink:role' => array(),
 					'xlink:show' => array(),
 					'xlink:title' => array(),
@@ -16500,6 +15856,11 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'y' => array(),
 				),
+				'precomputed' => array(
+					'attr_aliases' => array(
+						'href' => 'xlink:href',
+					),
+				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -16509,6 +15870,7 @@ class AMP_Allowed_Tags_Generated {
 		'var' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -16523,18 +15885,10 @@ class AMP_Allowed_Tags_Generated {
 					'playsinline' => array(),
 					'poster' => array(),
 					'preload' => array(),
-					'src' => array(
-						'blacklisted_value_regex' => '__amp_source_origin',
-						'value_url' => array(
-							'allow_relative' => false,
-							'protocol' => array(
-								'data',
-								'https',
-							),
-						),
-					),
+					'src' => 51,
 					'width' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'noscript',
 					'mandatory_ancestor_suggested_alternative' => 'amp-video',
@@ -16547,9 +15901,7 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'externalresourcesrequired' => array(),
 					'preserveaspectratio' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
+					'style' => 53,
 					'viewbox' => array(),
 					'viewtarget' => array(),
 					'xml:lang' => array(),
@@ -16558,6 +15910,7 @@ class AMP_Allowed_Tags_Generated {
 					'xmlns:xlink' => array(),
 					'zoomandpan' => array(),
 				),
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -16566,20 +15919,8 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'vkern' => array(
 			array(
-				'attr_spec_list' => array(
-					'g1' => array(),
-					'g2' => array(),
-					'k' => array(),
-					'style' => array(
-						'blacklisted_value_regex' => '!\\s*important',
-					),
-					'u1' => array(),
-					'u2' => array(),
-					'xml:lang' => array(),
-					'xml:space' => array(),
-					'xmlns' => array(),
-					'xmlns:xlink' => array(),
-				),
+				'attr_spec_list' => 13,
+				'precomputed' => array(),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'svg',
 					'spec_url' => 'https://amp.dev/documentation/guides-and-tutorials/learn/spec/amphtml#svg',
@@ -16589,6 +15930,7 @@ class AMP_Allowed_Tags_Generated {
 		'wbr' => array(
 			array(
 				'attr_spec_list' => array(),
+				'precomputed' => array(),
 				'tag_spec' => array(),
 			),
 		),
@@ -16662,6 +16004,7 @@ class AMP_Allowed_Tags_Generated {
 				'amp-fx-collection',
 			),
 			'value_regex_casei' => '(fade-in|fade-in-scroll|float-in-bottom|float-in-top|fly-in-bottom|fly-in-left|fly-in-right|fly-in-top|parallax)(\\s|fade-in|fade-in-scroll|float-in-bottom|float-in-top|fly-in-bottom|fly-in-left|fly-in-right|fly-in-top|parallax)*',
+			'value_regex_casei_pcre' => '/^((fade-in|fade-in-scroll|float-in-bottom|float-in-top|fly-in-bottom|fly-in-left|fly-in-right|fly-in-top|parallax)(\\s|fade-in|fade-in-scroll|float-in-bottom|float-in-top|fly-in-bottom|fly-in-left|fly-in-right|fly-in-top|parallax)*)$/ui',
 		),
 		'aria-activedescendant' => array(),
 		'aria-atomic' => array(),
@@ -16702,6 +16045,7 @@ class AMP_Allowed_Tags_Generated {
 		'autoscroll' => array(),
 		'class' => array(
 			'blacklisted_value_regex' => '(^|\\W)i-amphtml-',
+			'blacklisted_value_regex_pcre' => '/(^|\\W)i-amphtml-/u',
 		),
 		'content' => array(),
 		'datatype' => array(),
@@ -16711,15 +16055,22 @@ class AMP_Allowed_Tags_Generated {
 			'value' => array(
 				'',
 			),
+			'value_set' => array(
+				'' => true,
+			),
 		),
 		'hidden' => array(
 			'value' => array(
 				'',
 			),
+			'value_set' => array(
+				'' => true,
+			),
 		),
 		'i-amp-access-id' => array(),
 		'id' => array(
 			'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+			'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/u',
 		),
 		'inlist' => array(),
 		'itemid' => array(),
@@ -16734,11 +16085,15 @@ class AMP_Allowed_Tags_Generated {
 			'value' => array(
 				'',
 			),
+			'value_set' => array(
+				'' => true,
+			),
 		),
 		'prefix' => array(),
 		'property' => array(),
 		'rel' => array(
 			'blacklisted_value_regex' => '(^|\\s)(canonical|components|dns-prefetch|import|manifest|preconnect|preload|prerender|serviceworker|stylesheet|subresource)(\\s|$)',
+			'blacklisted_value_regex_pcre' => '/(^|\\s)(canonical|components|dns-prefetch|import|manifest|preconnect|preload|prerender|serviceworker|stylesheet|subresource)(\\s|$)/u',
 		),
 		'resource' => array(),
 		'rev' => array(),
@@ -16746,6 +16101,7 @@ class AMP_Allowed_Tags_Generated {
 		'slot' => array(),
 		'style' => array(
 			'blacklisted_value_regex' => '(!\\s*important|<!--)',
+			'blacklisted_value_regex_pcre' => '/(!\\s*important|<!--)/u',
 		),
 		'subscriptions-action' => array(
 			'requires_extension' => array(
@@ -16759,6 +16115,9 @@ class AMP_Allowed_Tags_Generated {
 			'value' => array(
 				'',
 			),
+			'value_set' => array(
+				'' => true,
+			),
 		),
 		'subscriptions-decorate' => array(
 			'requires_extension' => array(
@@ -16772,6 +16131,9 @@ class AMP_Allowed_Tags_Generated {
 			'value' => array(
 				'',
 			),
+			'value_set' => array(
+				'' => true,
+			),
 		),
 		'subscriptions-display' => array(
 			'requires_extension' => array(
@@ -16788,6 +16150,12 @@ class AMP_Allowed_Tags_Generated {
 				'content-not-granted',
 				'loading',
 			),
+			'value_casei_set' => array(
+				'actions' => true,
+				'content' => true,
+				'content-not-granted' => true,
+				'loading' => true,
+			),
 		),
 		'subscriptions-service' => array(
 			'requires_extension' => array(
@@ -16811,6 +16179,17 @@ class AMP_Allowed_Tags_Generated {
 				'typeMismatch',
 				'valueMissing',
 			),
+			'value_set' => array(
+				'badInput' => true,
+				'customError' => true,
+				'patternMismatch' => true,
+				'rangeOverflow' => true,
+				'rangeUnderflow' => true,
+				'stepMismatch' => true,
+				'tooLong' => true,
+				'typeMismatch' => true,
+				'valueMissing' => true,
+			),
 		),
 		'vocab' => array(),
 	);
@@ -16818,50 +16197,32 @@ class AMP_Allowed_Tags_Generated {
 
 	private static $reference_points = array(
 		'AMP-BASE-CAROUSEL lightbox [child]' => array(
-			'attr_spec_list' => array(
-				'lightbox-thumbnail-id' => array(
-					'value_regex_casei' => '^[a-z][a-z\\d_-]*',
-				),
-			),
+			'attr_spec_list' => 26,
 			'tag_spec' => array(
 				'spec_name' => 'AMP-BASE-CAROUSEL lightbox [child]',
 			),
 		),
 		'AMP-BASE-CAROUSEL lightbox [lightbox-exclude]' => array(
-			'attr_spec_list' => array(
-				'lightbox-exclude' => array(
-					'mandatory' => true,
-				),
-			),
+			'attr_spec_list' => 27,
 			'tag_spec' => array(
 				'spec_name' => 'AMP-BASE-CAROUSEL lightbox [lightbox-exclude]',
 			),
 		),
 		'AMP-CAROUSEL lightbox [child]' => array(
-			'attr_spec_list' => array(
-				'lightbox-thumbnail-id' => array(
-					'value_regex_casei' => '^[a-z][a-z\\d_-]*',
-				),
-			),
+			'attr_spec_list' => 26,
 			'tag_spec' => array(
 				'spec_name' => 'AMP-CAROUSEL lightbox [child]',
 			),
 		),
 		'AMP-CAROUSEL lightbox [lightbox-exclude]' => array(
-			'attr_spec_list' => array(
-				'lightbox-exclude' => array(
-					'mandatory' => true,
-				),
-			),
+			'attr_spec_list' => 27,
 			'tag_spec' => array(
 				'spec_name' => 'AMP-CAROUSEL lightbox [lightbox-exclude]',
 			),
 		),
 		'AMP-LIVE-LIST [items]' => array(
 			'attr_spec_list' => array(
-				'items' => array(
-					'mandatory' => true,
-				),
+				'items' => 4,
 			),
 			'tag_spec' => array(
 				'reference_points' => array(
@@ -16876,15 +16237,10 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'AMP-LIVE-LIST [items] item' => array(
 			'attr_spec_list' => array(
-				'data-sort-time' => array(
-					'mandatory' => true,
-				),
+				'data-sort-time' => 4,
 				'data-tombstone' => array(),
 				'data-update-time' => array(),
-				'id' => array(
-					'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
-					'mandatory' => true,
-				),
+				'id' => 5,
 			),
 			'tag_spec' => array(
 				'spec_name' => 'AMP-LIVE-LIST [items] item',
@@ -16893,9 +16249,7 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'AMP-LIVE-LIST [pagination]' => array(
 			'attr_spec_list' => array(
-				'pagination' => array(
-					'mandatory' => true,
-				),
+				'pagination' => 4,
 			),
 			'tag_spec' => array(
 				'spec_name' => 'AMP-LIVE-LIST [pagination]',
@@ -16904,9 +16258,7 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'AMP-LIVE-LIST [update]' => array(
 			'attr_spec_list' => array(
-				'update' => array(
-					'mandatory' => true,
-				),
+				'update' => 4,
 			),
 			'tag_spec' => array(
 				'spec_name' => 'AMP-LIVE-LIST [update]',
@@ -16915,9 +16267,7 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'AMP-NEXT-PAGE > [separator]' => array(
 			'attr_spec_list' => array(
-				'separator' => array(
-					'mandatory' => true,
-				),
+				'separator' => 4,
 			),
 			'tag_spec' => array(
 				'mandatory_parent' => 'amp-next-page',
@@ -16942,19 +16292,9 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'AMP-SELECTOR option' => array(
 			'attr_spec_list' => array(
-				'disabled' => array(
-					'value' => array(
-						'',
-					),
-				),
-				'option' => array(
-					'mandatory' => true,
-				),
-				'selected' => array(
-					'value' => array(
-						'',
-					),
-				),
+				'disabled' => 2,
+				'option' => 4,
+				'selected' => 2,
 			),
 			'tag_spec' => array(
 				'spec_name' => 'AMP-SELECTOR option',
@@ -16963,44 +16303,15 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'AMP-STORY-CTA-LAYER animate-in' => array(
 			'attr_spec_list' => array(
-				'animate-in' => array(
-					'value' => array(
-						'drop',
-						'fade-in',
-						'fly-in-bottom',
-						'fly-in-left',
-						'fly-in-right',
-						'fly-in-top',
-						'pan-down',
-						'pan-left',
-						'pan-right',
-						'pan-up',
-						'pulse',
-						'rotate-in-left',
-						'rotate-in-right',
-						'twirl-in',
-						'whoosh-in-left',
-						'whoosh-in-right',
-						'zoom-in',
-						'zoom-out',
-					),
-				),
+				'animate-in' => 70,
 				'animate-in-after' => array(),
 				'animate-in-delay' => array(),
 				'animate-in-duration' => array(),
 				'animate-in-timing-function' => array(),
-				'scale-end' => array(
-					'value_regex' => '[0-9]+([.][0-9]+)?',
-				),
-				'scale-start' => array(
-					'value_regex' => '[0-9]+([.][0-9]+)?',
-				),
-				'translate-x' => array(
-					'value_regex_casei' => '[0-9]+px',
-				),
-				'translate-y' => array(
-					'value_regex_casei' => '[0-9]+px',
-				),
+				'scale-end' => 71,
+				'scale-start' => 71,
+				'translate-x' => 72,
+				'translate-y' => 72,
 			),
 			'tag_spec' => array(
 				'reference_points' => array(
@@ -17015,63 +16326,18 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'AMP-STORY-GRID-LAYER animate-in' => array(
 			'attr_spec_list' => array(
-				'animate-in' => array(
-					'value' => array(
-						'drop',
-						'fade-in',
-						'fly-in-bottom',
-						'fly-in-left',
-						'fly-in-right',
-						'fly-in-top',
-						'pan-down',
-						'pan-left',
-						'pan-right',
-						'pan-up',
-						'pulse',
-						'rotate-in-left',
-						'rotate-in-right',
-						'twirl-in',
-						'whoosh-in-left',
-						'whoosh-in-right',
-						'zoom-in',
-						'zoom-out',
-					),
-				),
+				'animate-in' => 70,
 				'animate-in-after' => array(),
 				'animate-in-delay' => array(),
 				'animate-in-duration' => array(),
 				'animate-in-timing-function' => array(),
-				'data-tooltip-icon' => array(
-					'value_url' => array(
-						'protocol' => array(
-							'http',
-							'https',
-							'data',
-						),
-					),
-				),
-				'interactive' => array(
-					'value' => array(
-						'',
-					),
-				),
-				'scale-end' => array(
-					'value_regex' => '[0-9]+([.][0-9]+)?',
-				),
-				'scale-start' => array(
-					'value_regex' => '[0-9]+([.][0-9]+)?',
-				),
-				'target' => array(
-					'value' => array(
-						'_blank',
-					),
-				),
-				'translate-x' => array(
-					'value_regex_casei' => '[0-9]+px',
-				),
-				'translate-y' => array(
-					'value_regex_casei' => '[0-9]+px',
-				),
+				'data-tooltip-icon' => 73,
+				'interactive' => 2,
+				'scale-end' => 71,
+				'scale-start' => 71,
+				'target' => 74,
+				'translate-x' => 72,
+				'translate-y' => 72,
 			),
 			'tag_spec' => array(
 				'reference_points' => array(
@@ -17086,118 +16352,25 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'AMP-STORY-GRID-LAYER default' => array(
 			'attr_spec_list' => array(
-				'align-content' => array(
-					'value' => array(
-						'center',
-						'end',
-						'space-around',
-						'space-between',
-						'space-evenly',
-						'start',
-						'stretch',
-					),
-				),
-				'align-items' => array(
-					'value' => array(
-						'center',
-						'end',
-						'start',
-						'stretch',
-					),
-				),
-				'align-self' => array(
-					'value' => array(
-						'center',
-						'end',
-						'start',
-						'stretch',
-					),
-				),
-				'animate-in' => array(
-					'value' => array(
-						'drop',
-						'fade-in',
-						'fly-in-bottom',
-						'fly-in-left',
-						'fly-in-right',
-						'fly-in-top',
-						'pan-down',
-						'pan-left',
-						'pan-right',
-						'pan-up',
-						'pulse',
-						'rotate-in-left',
-						'rotate-in-right',
-						'twirl-in',
-						'whoosh-in-left',
-						'whoosh-in-right',
-						'zoom-in',
-						'zoom-out',
-					),
-				),
+				'align-content' => 75,
+				'align-items' => 76,
+				'align-self' => 76,
+				'animate-in' => 70,
 				'animate-in-after' => array(),
 				'animate-in-delay' => array(),
 				'animate-in-duration' => array(),
 				'animate-in-timing-function' => array(),
-				'data-tooltip-icon' => array(
-					'value_url' => array(
-						'protocol' => array(
-							'http',
-							'https',
-							'data',
-						),
-					),
-				),
+				'data-tooltip-icon' => 73,
 				'grid-area' => array(),
-				'interactive' => array(
-					'value' => array(
-						'',
-					),
-				),
-				'justify-content' => array(
-					'value' => array(
-						'center',
-						'end',
-						'space-around',
-						'space-between',
-						'space-evenly',
-						'start',
-						'stretch',
-					),
-				),
-				'justify-items' => array(
-					'value' => array(
-						'center',
-						'end',
-						'start',
-						'stretch',
-					),
-				),
-				'justify-self' => array(
-					'value' => array(
-						'center',
-						'end',
-						'start',
-						'stretch',
-					),
-				),
-				'scale-end' => array(
-					'value_regex' => '[0-9]+([.][0-9]+)?',
-				),
-				'scale-start' => array(
-					'value_regex' => '[0-9]+([.][0-9]+)?',
-				),
-				'target' => array(
-					'value' => array(
-						'_blank',
-					),
-				),
-				'translate-x' => array(
-					'value_regex_casei' => '[0-9]+px',
-				),
-				'translate-y' => array(
-					'value_regex_casei' => '[0-9]+px',
-				),
+				'interactive' => 2,
+				'justify-content' => 75,
+				'justify-items' => 76,
+				'justify-self' => 76,
+				'scale-end' => 71,
+				'scale-start' => 71,
+				'target' => 74,
+				'translate-x' => 72,
+				'translate-y' => 72,
 			),
 			'tag_spec' => array(
 				'reference_points' => array(
@@ -17212,9 +16385,7 @@ class AMP_Allowed_Tags_Generated {
 		),
 		'AMP-VIDEO-IFRAME > [placeholder]' => array(
 			'attr_spec_list' => array(
-				'placeholder' => array(
-					'mandatory' => true,
-				),
+				'placeholder' => 4,
 			),
 			'tag_spec' => array(
 				'spec_name' => 'AMP-VIDEO-IFRAME > [placeholder]',
@@ -17223,6 +16394,2315 @@ class AMP_Allowed_Tags_Generated {
 		),
 	);
 
+	private static $shared_attr_specs = array(
+		array(
+			'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+			'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/u',
+		),
+		array(
+			'value' => array(
+				'false',
+				'true',
+			),
+			'value_set' => array(
+				'false' => true,
+				'true' => true,
+			),
+		),
+		array(
+			'value' => array(
+				'',
+			),
+			'value_set' => array(
+				'' => true,
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value_url' => array(
+				'protocol' => array(
+					'https',
+				),
+				'protocol_set' => array(
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'mandatory' => true,
+		),
+		array(
+			'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+			'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/u',
+			'mandatory' => true,
+		),
+		array(
+			'blacklisted_value_regex' => '__amp_source_origin',
+			'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
+			'value_url' => array(
+				'allow_relative' => true,
+				'protocol' => array(
+					'https',
+				),
+				'protocol_set' => array(
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'dispatch_key' => 2,
+			'mandatory' => true,
+			'value' => array(
+				'',
+			),
+			'value_set' => array(
+				'' => true,
+			),
+		),
+		array(
+			'blacklisted_value_regex' => '__amp_source_origin',
+			'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
+			'value_url' => array(
+				'allow_relative' => false,
+				'protocol' => array(
+					'https',
+				),
+				'protocol_set' => array(
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'value_url' => array(
+				'allow_empty' => true,
+				'protocol' => array(
+					'http',
+					'https',
+				),
+				'protocol_set' => array(
+					'http' => true,
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'alternative_names' => array(
+				'srcset',
+			),
+			'blacklisted_value_regex' => '__amp_source_origin',
+			'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
+			'mandatory' => true,
+			'value_url' => array(
+				'protocol' => array(
+					'data',
+					'http',
+					'https',
+				),
+				'protocol_set' => array(
+					'data' => true,
+					'http' => true,
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'value_regex' => '[0-9a-zA-Z]+',
+			'value_regex_pcre' => '/^([0-9a-zA-Z]+)$/u',
+		),
+		array(
+			'mandatory' => true,
+			'value' => array(
+				'',
+			),
+			'value_set' => array(
+				'' => true,
+			),
+		),
+		array(
+			'value_regex' => '([^,]+\\s+(-?\\d+),\\s*)*(-?\\d+)',
+			'value_regex_pcre' => '/^(([^,]+\\s+(-?\\d+),\\s*)*(-?\\d+))$/u',
+		),
+		array(
+			'value_regex' => '([^,]+\\s+(true|false),\\s*)*(true|false)',
+			'value_regex_pcre' => '/^(([^,]+\\s+(true|false),\\s*)*(true|false))$/u',
+		),
+		array(
+			'value_regex' => '([^,]+\\s+(\\d+),\\s*)*(\\d+)',
+			'value_regex_pcre' => '/^(([^,]+\\s+(\\d+),\\s*)*(\\d+))$/u',
+		),
+		array(
+			'value_regex' => '([^,]+\\s+(start|center),\\s*)*(start|center)',
+			'value_regex_pcre' => '/^(([^,]+\\s+(start|center),\\s*)*(start|center))$/u',
+		),
+		array(
+			'value_regex' => '([^,]+\\s+(\\d+(\\.\\d+)?),\\s*)*(\\d+(\\.\\d+)?)',
+			'value_regex_pcre' => '/^(([^,]+\\s+(\\d+(\\.\\d+)?),\\s*)*(\\d+(\\.\\d+)?))$/u',
+		),
+		array(
+			'value' => array(
+				'0',
+				'1',
+			),
+			'value_set' => array(
+				true,
+				true,
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value_url' => array(
+				'allow_relative' => false,
+				'protocol' => array(
+					'https',
+				),
+				'protocol_set' => array(
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'value_regex' => '[0-9]+',
+			'value_regex_pcre' => '/^([0-9]+)$/u',
+		),
+		array(
+			'mandatory' => true,
+			'value_regex' => '[0-9]+',
+			'value_regex_pcre' => '/^([0-9]+)$/u',
+		),
+		array(
+			'requires_extension' => array(
+				'amp-video-docking',
+			),
+		),
+		array(
+			'blacklisted_value_regex' => '__amp_source_origin',
+			'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
+			'mandatory' => true,
+			'value_url' => array(
+				'allow_relative' => false,
+				'protocol' => array(
+					'https',
+				),
+				'protocol_set' => array(
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'value_regex' => '(|[0-9]+)',
+			'value_regex_pcre' => '/^((|[0-9]+))$/u',
+		),
+		array(
+			'value' => array(
+				'slides',
+			),
+			'value_set' => array(
+				'slides' => true,
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value' => array(
+				'carousel',
+			),
+			'value_set' => array(
+				'carousel' => true,
+			),
+		),
+		array(
+			'value_regex_casei' => '([0-9a-f]{3}){1,2}',
+			'value_regex_casei_pcre' => '/^(([0-9a-f]{3}){1,2})$/ui',
+		),
+		array(
+			'mandatory' => true,
+			'value_regex_casei' => '[a-z0-9]+',
+			'value_regex_casei_pcre' => '/^([a-z0-9]+)$/ui',
+		),
+		array(
+			'value_regex' => '-?\\d+',
+			'value_regex_pcre' => '/^(-?\\d+)$/u',
+		),
+		array(
+			'value_regex' => '\\d+',
+			'value_regex_pcre' => '/^(\\d+)$/u',
+		),
+		array(
+			'value_regex' => '[0-6]',
+			'value_regex_pcre' => '/^([0-6])$/u',
+		),
+		array(
+			'value_casei' => array(
+				'static',
+			),
+			'value_casei_set' => array(
+				'static' => true,
+			),
+		),
+		array(
+			'value_casei' => array(
+				'single',
+			),
+			'value_casei_set' => array(
+				'single' => true,
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value_casei' => array(
+				'overlay',
+			),
+			'value_casei_set' => array(
+				'overlay' => true,
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value_casei' => array(
+				'range',
+			),
+			'value_casei_set' => array(
+				'range' => true,
+			),
+		),
+		array(
+			'value_regex' => '0(\\.[0-9]+)?|1(\\.0+)?',
+			'value_regex_pcre' => '/^(0(\\.[0-9]+)?|1(\\.0+)?)$/u',
+		),
+		array(
+			'value_regex_casei' => '^[a-z][a-z\\d_-]*',
+			'value_regex_casei_pcre' => '/^(^[a-z][a-z\\d_-]*)$/ui',
+		),
+		array(
+			'blacklisted_value_regex' => '__amp_source_origin',
+			'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
+			'mandatory' => true,
+			'value_url' => array(
+				'allow_relative' => true,
+				'protocol' => array(
+					'https',
+				),
+				'protocol_set' => array(
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'value_regex_casei' => '[0-9a-z]{8}',
+			'value_regex_casei_pcre' => '/^([0-9a-z]{8})$/ui',
+		),
+		array(
+			'value_regex' => '(\\d+)\\s{1}(\\d+)',
+			'value_regex_pcre' => '/^((\\d+)\\s{1}(\\d+))$/u',
+		),
+		array(
+			'value_regex' => '[0-9]+(\\.[0-9]+)?',
+			'value_regex_pcre' => '/^([0-9]+(\\.[0-9]+)?)$/u',
+		),
+		array(
+			'value_casei' => array(
+				'false',
+				'true',
+			),
+			'value_casei_set' => array(
+				'false' => true,
+				'true' => true,
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value_regex' => '[0-9a-zA-Z-]+',
+			'value_regex_pcre' => '/^([0-9a-zA-Z-]+)$/u',
+		),
+		array(
+			'value_url' => array(
+				'protocol' => array(
+					'http',
+					'https',
+				),
+				'protocol_set' => array(
+					'http' => true,
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value_url' => array(
+				'protocol' => array(
+					'http',
+					'https',
+				),
+				'protocol_set' => array(
+					'http' => true,
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value' => array(
+				'nodisplay',
+			),
+			'value_set' => array(
+				'nodisplay' => true,
+			),
+		),
+		array(
+			'value_url' => array(
+				'allow_empty' => false,
+				'allow_relative' => false,
+				'protocol' => array(
+					'https',
+				),
+				'protocol_set' => array(
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'value' => array(
+				'auto',
+				'metadata',
+				'none',
+				'',
+			),
+			'value_set' => array(
+				'' => true,
+				'auto' => true,
+				'metadata' => true,
+				'none' => true,
+			),
+		),
+		array(
+			'blacklisted_value_regex' => '__amp_source_origin',
+			'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
+			'mandatory' => true,
+			'value_url' => array(
+				'protocol' => array(
+					'https',
+				),
+				'protocol_set' => array(
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'value_regex' => '[^=/?:]+',
+			'value_regex_pcre' => '/^([^=\\/?:]+)$/u',
+		),
+		array(
+			'blacklisted_value_regex' => '__amp_source_origin',
+			'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
+			'value_url' => array(
+				'allow_relative' => false,
+				'protocol' => array(
+					'data',
+					'https',
+				),
+				'protocol_set' => array(
+					'data' => true,
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'blacklisted_value_regex' => '__amp_source_origin',
+			'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
+			'value_url' => array(
+				'allow_empty' => true,
+				'protocol' => array(
+					'http',
+					'https',
+				),
+				'protocol_set' => array(
+					'http' => true,
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'blacklisted_value_regex' => '!\\s*important',
+			'blacklisted_value_regex_pcre' => '/!\\s*important/u',
+		),
+		array(
+			'alternative_names' => array(
+				'href',
+			),
+			'value_url' => array(
+				'allow_empty' => false,
+				'protocol' => array(
+					'http',
+					'https',
+				),
+				'protocol_set' => array(
+					'http' => true,
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'blacklisted_value_regex' => '__amp_source_origin',
+			'blacklisted_value_regex_pcre' => '/__amp_source_origin/u',
+			'value_url' => array(
+				'protocol' => array(
+					'https',
+				),
+				'protocol_set' => array(
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'value' => array(
+				'as-you-go',
+				'interact-and-submit',
+				'show-all-on-submit',
+				'show-first-on-submit',
+			),
+			'value_set' => array(
+				'as-you-go' => true,
+				'interact-and-submit' => true,
+				'show-all-on-submit' => true,
+				'show-first-on-submit' => true,
+			),
+		),
+		array(
+			'blacklisted_value_regex' => '(^|\\s)(ATTRIBUTE_NODE|CDATA_SECTION_NODE|COMMENT_NODE|DOCUMENT_FRAGMENT_NODE|DOCUMENT_NODE|DOCUMENT_POSITION_CONTAINED_BY|DOCUMENT_POSITION_CONTAINS|DOCUMENT_POSITION_DISCONNECTED|DOCUMENT_POSITION_FOLLOWING|DOCUMENT_POSITION_IMPLEMENTATION_SPECIFIC|DOCUMENT_POSITION_PRECEDING|DOCUMENT_TYPE_NODE|ELEMENT_NODE|ENTITY_NODE|ENTITY_REFERENCE_NODE|NOTATION_NODE|PROCESSING_INSTRUCTION_NODE|TEXT_NODE|URL|URLUnencoded|__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|activeElement|addEventListener|adoptNode|alinkColor|all|anchors|append|appendChild|applets|baseURI|bgColor|body|captureEvents|caretPositionFromPoint|caretRangeFromPoint|characterSet|charset|childElementCount|childNodes|children|clear|cloneNode|close|compareDocumentPosition|compatMode|constructor|contains|contentType|cookie|createAttribute|createAttributeNS|createCDATASection|createComment|createDocumentFragment|createElement|createElementNS|createEvent|createExpression|createNSResolver|createNodeIterator|createProcessingInstruction|createRange|createTextNode|createTreeWalker|currentScript|defaultView|designMode|dir|dispatchEvent|doctype|documentElement|documentURI|domain|elementFromPoint|elementsFromPoint|embeds|enableStyleSheetsForSet|evaluate|execCommand|execCommandShowHelp|exitFullscreen|exitPictureInPicture|exitPointerLock|fgColor|firstChild|firstElementChild|focus|fonts|forms|fullscreen|fullscreenElement|fullscreenEnabled|getCSSCanvasContext|getElementById|getElementsByClassName|getElementsByName|getElementsByTagName|getElementsByTagNameNS|getOverrideStyle|getRootNode|getSelection|hasChildNodes|hasFocus|hasOwnProperty|hasStorageAccess|head|hidden|images|implementation|importNode|inputEncoding|insertBefore|isConnected|isDefaultNamespace|isEqualNode|isPrototypeOf|isSameNode|l10n|lastChild|lastElementChild|lastModified|lastStyleSheetSet|linkColor|links|location|lookupNamespaceURI|lookupPrefix|mozCancelFullScreen|mozFullScreen|mozFullScreenElement|mozFullScreenEnabled|mozSetImageElement|msCSSOMElementFloatMetrics|msCapsLockWarningOff|msElementsFromPoint|msElementsFromRect|nextSibling|nodeName|nodeType|nodeValue|normalize|onabort|onactivate|onafterscriptexecute|onanimationcancel|onanimationend|onanimationiteration|onanimationstart|onauxclick|onbeforeactivate|onbeforecopy|onbeforecut|onbeforedeactivate|onbeforeinput|onbeforepaste|onbeforescriptexecute|onblur|oncancel|oncanplay|oncanplaythrough|onchange|onclick|onclose|oncontextmenu|oncopy|oncuechange|oncut|ondblclick|ondeactivate|ondrag|ondragend|ondragenter|ondragexit|ondragleave|ondragover|ondragstart|ondrop|ondurationchange|onemptied|onended|onerror|onfocus|onfreeze|onfullscreenchange|onfullscreenerror|ongotpointercapture|oninput|oninvalid|onkeydown|onkeypress|onkeyup|onload|onloadeddata|onloadedmetadata|onloadend|onloadstart|onlostpointercapture|onmousedown|onmouseenter|onmouseleave|onmousemove|onmouseout|onmouseover|onmouseup|onmousewheel|onmozfullscreenchange|onmozfullscreenerror|onmscontentzoom|onmsgesturechange|onmsgesturedoubletap|onmsgestureend|onmsgesturehold|onmsgesturestart|onmsgesturetap|onmsinertiastart|onmsmanipulationstatechanged|onmssitemodejumplistitemremoved|onmsthumbnailclick|onpaste|onpause|onplay|onplaying|onpointercancel|onpointerdown|onpointerenter|onpointerleave|onpointerlockchange|onpointerlockerror|onpointermove|onpointerout|onpointerover|onpointerup|onprogress|onratechange|onreadystatechange|onrejectionhandled|onreset|onresize|onresume|onscroll|onsearch|onseeked|onseeking|onselect|onselectionchange|onselectstart|onshow|onstalled|onstop|onsubmit|onsuspend|ontimeupdate|ontoggle|ontransitioncancel|ontransitionend|ontransitionrun|ontransitionstart|onunhandledrejection|onvisibilitychange|onvolumechange|onwaiting|onwebkitanimationend|onwebkitanimationiteration|onwebkitanimationstart|onwebkitfullscreenchange|onwebkitfullscreenerror|onwebkitmouseforcechanged|onwebkitmouseforcedown|onwebkitmouseforceup|onwebkitmouseforcewillbegin|onwebkittransitionend|onwheel|open|origin|ownerDocument|parentElement|parentNode|pictureInPictureElement|pictureInPictureEnabled|plugins|pointerLockElement|preferredStyleSheetSet|prepend|previousSibling|propertyIsEnumerable|queryCommandEnabled|queryCommandIndeterm|queryCommandState|queryCommandSupported|queryCommandText|queryCommandValue|querySelector|querySelectorAll|readyState|referrer|registerElement|releaseCapture|releaseEvents|removeChild|removeEventListener|replaceChild|requestStorageAccess|rootElement|scripts|scrollingElement|selectedStyleSheetSet|styleSheetSets|styleSheets|textContent|title|toLocaleString|toSource|toString|updateSettings|valueOf|visibilityState|vlinkColor|wasDiscarded|webkitCancelFullScreen|webkitCurrentFullScreenElement|webkitExitFullscreen|webkitFullScreenKeyboardInputAllowed|webkitFullscreenElement|webkitFullscreenEnabled|webkitHidden|webkitIsFullScreen|webkitVisibilityState|write|writeln|xmlEncoding|xmlStandalone|xmlVersion)(\\s|$)',
+			'blacklisted_value_regex_pcre' => '/(^|\\s)(ATTRIBUTE_NODE|CDATA_SECTION_NODE|COMMENT_NODE|DOCUMENT_FRAGMENT_NODE|DOCUMENT_NODE|DOCUMENT_POSITION_CONTAINED_BY|DOCUMENT_POSITION_CONTAINS|DOCUMENT_POSITION_DISCONNECTED|DOCUMENT_POSITION_FOLLOWING|DOCUMENT_POSITION_IMPLEMENTATION_SPECIFIC|DOCUMENT_POSITION_PRECEDING|DOCUMENT_TYPE_NODE|ELEMENT_NODE|ENTITY_NODE|ENTITY_REFERENCE_NODE|NOTATION_NODE|PROCESSING_INSTRUCTION_NODE|TEXT_NODE|URL|URLUnencoded|__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|activeElement|addEventListener|adoptNode|alinkColor|all|anchors|append|appendChild|applets|baseURI|bgColor|body|captureEvents|caretPositionFromPoint|caretRangeFromPoint|characterSet|charset|childElementCount|childNodes|children|clear|cloneNode|close|compareDocumentPosition|compatMode|constructor|contains|contentType|cookie|createAttribute|createAttributeNS|createCDATASection|createComment|createDocumentFragment|createElement|createElementNS|createEvent|createExpression|createNSResolver|createNodeIterator|createProcessingInstruction|createRange|createTextNode|createTreeWalker|currentScript|defaultView|designMode|dir|dispatchEvent|doctype|documentElement|documentURI|domain|elementFromPoint|elementsFromPoint|embeds|enableStyleSheetsForSet|evaluate|execCommand|execCommandShowHelp|exitFullscreen|exitPictureInPicture|exitPointerLock|fgColor|firstChild|firstElementChild|focus|fonts|forms|fullscreen|fullscreenElement|fullscreenEnabled|getCSSCanvasContext|getElementById|getElementsByClassName|getElementsByName|getElementsByTagName|getElementsByTagNameNS|getOverrideStyle|getRootNode|getSelection|hasChildNodes|hasFocus|hasOwnProperty|hasStorageAccess|head|hidden|images|implementation|importNode|inputEncoding|insertBefore|isConnected|isDefaultNamespace|isEqualNode|isPrototypeOf|isSameNode|l10n|lastChild|lastElementChild|lastModified|lastStyleSheetSet|linkColor|links|location|lookupNamespaceURI|lookupPrefix|mozCancelFullScreen|mozFullScreen|mozFullScreenElement|mozFullScreenEnabled|mozSetImageElement|msCSSOMElementFloatMetrics|msCapsLockWarningOff|msElementsFromPoint|msElementsFromRect|nextSibling|nodeName|nodeType|nodeValue|normalize|onabort|onactivate|onafterscriptexecute|onanimationcancel|onanimationend|onanimationiteration|onanimationstart|onauxclick|onbeforeactivate|onbeforecopy|onbeforecut|onbeforedeactivate|onbeforeinput|onbeforepaste|onbeforescriptexecute|onblur|oncancel|oncanplay|oncanplaythrough|onchange|onclick|onclose|oncontextmenu|oncopy|oncuechange|oncut|ondblclick|ondeactivate|ondrag|ondragend|ondragenter|ondragexit|ondragleave|ondragover|ondragstart|ondrop|ondurationchange|onemptied|onended|onerror|onfocus|onfreeze|onfullscreenchange|onfullscreenerror|ongotpointercapture|oninput|oninvalid|onkeydown|onkeypress|onkeyup|onload|onloadeddata|onloadedmetadata|onloadend|onloadstart|onlostpointercapture|onmousedown|onmouseenter|onmouseleave|onmousemove|onmouseout|onmouseover|onmouseup|onmousewheel|onmozfullscreenchange|onmozfullscreenerror|onmscontentzoom|onmsgesturechange|onmsgesturedoubletap|onmsgestureend|onmsgesturehold|onmsgesturestart|onmsgesturetap|onmsinertiastart|onmsmanipulationstatechanged|onmssitemodejumplistitemremoved|onmsthumbnailclick|onpaste|onpause|onplay|onplaying|onpointercancel|onpointerdown|onpointerenter|onpointerleave|onpointerlockchange|onpointerlockerror|onpointermove|onpointerout|onpointerover|onpointerup|onprogress|onratechange|onreadystatechange|onrejectionhandled|onreset|onresize|onresume|onscroll|onsearch|onseeked|onseeking|onselect|onselectionchange|onselectstart|onshow|onstalled|onstop|onsubmit|onsuspend|ontimeupdate|ontoggle|ontransitioncancel|ontransitionend|ontransitionrun|ontransitionstart|onunhandledrejection|onvisibilitychange|onvolumechange|onwaiting|onwebkitanimationend|onwebkitanimationiteration|onwebkitanimationstart|onwebkitfullscreenchange|onwebkitfullscreenerror|onwebkitmouseforcechanged|onwebkitmouseforcedown|onwebkitmouseforceup|onwebkitmouseforcewillbegin|onwebkittransitionend|onwheel|open|origin|ownerDocument|parentElement|parentNode|pictureInPictureElement|pictureInPictureEnabled|plugins|pointerLockElement|preferredStyleSheetSet|prepend|previousSibling|propertyIsEnumerable|queryCommandEnabled|queryCommandIndeterm|queryCommandState|queryCommandSupported|queryCommandText|queryCommandValue|querySelector|querySelectorAll|readyState|referrer|registerElement|releaseCapture|releaseEvents|removeChild|removeEventListener|replaceChild|requestStorageAccess|rootElement|scripts|scrollingElement|selectedStyleSheetSet|styleSheetSets|styleSheets|textContent|title|toLocaleString|toSource|toString|updateSettings|valueOf|visibilityState|vlinkColor|wasDiscarded|webkitCancelFullScreen|webkitCurrentFullScreenElement|webkitExitFullscreen|webkitFullScreenKeyboardInputAllowed|webkitFullscreenElement|webkitFullscreenEnabled|webkitHidden|webkitIsFullScreen|webkitVisibilityState|write|writeln|xmlEncoding|xmlStandalone|xmlVersion)(\\s|$)/u',
+		),
+		array(
+			'value' => array(
+				'text',
+				'tel',
+				'search',
+			),
+			'value_set' => array(
+				'search' => true,
+				'tel' => true,
+				'text' => true,
+			),
+		),
+		array(
+			'value_regex' => '[0-9]*',
+			'value_regex_pcre' => '/^([0-9]*)$/u',
+		),
+		array(
+			'value_casei' => array(
+				'utf-8',
+			),
+			'value_casei_set' => array(
+				'utf-8' => true,
+			),
+		),
+		array(
+			'value_casei' => array(
+				'text/css',
+			),
+			'value_casei_set' => array(
+				'text/css' => true,
+			),
+		),
+		array(
+			'dispatch_key' => 1,
+			'mandatory' => true,
+		),
+		array(
+			'value_casei' => array(
+				'text/javascript',
+			),
+			'value_casei_set' => array(
+				'text/javascript' => true,
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value_casei' => array(
+				'application/json',
+			),
+			'value_casei_set' => array(
+				'application/json' => true,
+			),
+		),
+		array(
+			'dispatch_key' => 3,
+			'mandatory' => true,
+			'value_casei' => array(
+				'application/json',
+			),
+			'value_casei_set' => array(
+				'application/json' => true,
+			),
+		),
+		array(
+			'dispatch_key' => 1,
+			'mandatory' => true,
+			'value' => array(
+				'',
+			),
+			'value_set' => array(
+				'' => true,
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value' => array(
+				'amp-mustache',
+			),
+			'value_set' => array(
+				'amp-mustache' => true,
+			),
+		),
+		array(
+			'value' => array(
+				'captions',
+				'chapters',
+				'descriptions',
+				'metadata',
+			),
+			'value_set' => array(
+				'captions' => true,
+				'chapters' => true,
+				'descriptions' => true,
+				'metadata' => true,
+			),
+		),
+		array(
+			'mandatory' => true,
+			'value_casei' => array(
+				'subtitles',
+			),
+			'value_casei_set' => array(
+				'subtitles' => true,
+			),
+		),
+		array(
+			'value' => array(
+				'drop',
+				'fade-in',
+				'fly-in-bottom',
+				'fly-in-left',
+				'fly-in-right',
+				'fly-in-top',
+				'pan-down',
+				'pan-left',
+				'pan-right',
+				'pan-up',
+				'pulse',
+				'rotate-in-left',
+				'rotate-in-right',
+				'twirl-in',
+				'whoosh-in-left',
+				'whoosh-in-right',
+				'zoom-in',
+				'zoom-out',
+			),
+			'value_set' => array(
+				'drop' => true,
+				'fade-in' => true,
+				'fly-in-bottom' => true,
+				'fly-in-left' => true,
+				'fly-in-right' => true,
+				'fly-in-top' => true,
+				'pan-down' => true,
+				'pan-left' => true,
+				'pan-right' => true,
+				'pan-up' => true,
+				'pulse' => true,
+				'rotate-in-left' => true,
+				'rotate-in-right' => true,
+				'twirl-in' => true,
+				'whoosh-in-left' => true,
+				'whoosh-in-right' => true,
+				'zoom-in' => true,
+				'zoom-out' => true,
+			),
+		),
+		array(
+			'value_regex' => '[0-9]+([.][0-9]+)?',
+			'value_regex_pcre' => '/^([0-9]+([.][0-9]+)?)$/u',
+		),
+		array(
+			'value_regex_casei' => '[0-9]+px',
+			'value_regex_casei_pcre' => '/^([0-9]+px)$/ui',
+		),
+		array(
+			'value_url' => array(
+				'protocol' => array(
+					'http',
+					'https',
+					'data',
+				),
+				'protocol_set' => array(
+					'data' => true,
+					'http' => true,
+					'https' => true,
+				),
+			),
+		),
+		array(
+			'value' => array(
+				'_blank',
+			),
+			'value_set' => array(
+				'_blank' => true,
+			),
+		),
+		array(
+			'value' => array(
+				'center',
+				'end',
+				'space-around',
+				'space-between',
+				'space-evenly',
+				'start',
+				'stretch',
+			),
+			'value_set' => array(
+				'center' => true,
+				'end' => true,
+				'space-around' => true,
+				'space-between' => true,
+				'space-evenly' => true,
+				'start' => true,
+				'stretch' => true,
+			),
+		),
+		array(
+			'value' => array(
+				'center',
+				'end',
+				'start',
+				'stretch',
+			),
+			'value_set' => array(
+				'center' => true,
+				'end' => true,
+				'start' => true,
+				'stretch' => true,
+			),
+		),
+	);
+
+	private static $shared_attr_spec_lists = array(
+		array(
+			'alt' => array(),
+			'json' => array(),
+			'media' => array(),
+			'noloading' => 2,
+			'rtc-config' => array(),
+			'src' => 6,
+			'template' => array(),
+			'type' => 4,
+		),
+		array(
+			'alt' => array(),
+			'data-multi-size' => 7,
+			'json' => array(),
+			'media' => array(),
+			'noloading' => 2,
+			'rtc-config' => array(),
+			'src' => 6,
+			'type' => 4,
+		),
+		array(
+			'id' => 5,
+			'media' => array(),
+			'noloading' => 2,
+		),
+		array(
+			'media' => array(),
+			'noloading' => 2,
+			'type' => 4,
+		),
+		array(
+			'media' => array(),
+			'noloading' => 2,
+		),
+		array(
+			'data-href' => 4,
+			'media' => array(),
+			'noloading' => 2,
+		),
+		array(
+			'data-href' => array(
+				'mandatory' => true,
+				'value_url' => array(
+					'allow_relative' => false,
+					'protocol' => array(
+						'http',
+						'https',
+					),
+					'protocol_set' => array(
+						'http' => true,
+						'https' => true,
+					),
+				),
+			),
+			'media' => array(),
+			'noloading' => 2,
+		),
+		array(
+			'span' => array(),
+		),
+		array(
+			'alignment-baseline' => array(),
+			'baseline-shift' => array(),
+			'clip' => array(),
+			'clip-path' => array(),
+			'clip-rule' => array(),
+			'color' => array(),
+			'color-interpolation' => array(),
+			'color-interpolation-filters' => array(),
+			'color-profile' => array(),
+			'color-rendering' => array(),
+			'cursor' => array(),
+			'direction' => array(),
+			'display' => array(),
+			'dominant-baseline' => array(),
+			'enable-background' => array(),
+			'externalresourcesrequired' => array(),
+			'fill' => array(),
+			'fill-opacity' => array(),
+			'fill-rule' => array(),
+			'filter' => array(),
+			'flood-color' => array(),
+			'flood-opacity' => array(),
+			'focusable' => array(),
+			'font-family' => array(),
+			'font-size' => array(),
+			'font-size-adjust' => array(),
+			'font-stretch' => array(),
+			'font-style' => array(),
+			'font-variant' => array(),
+			'font-weight' => array(),
+			'glyph-orientation-horizontal' => array(),
+			'glyph-orientation-vertical' => array(),
+			'image-rendering' => array(),
+			'kerning' => array(),
+			'letter-spacing' => array(),
+			'lighting-color' => array(),
+			'marker-end' => array(),
+			'marker-mid' => array(),
+			'marker-start' => array(),
+			'mask' => array(),
+			'opacity' => array(),
+			'overflow' => array(),
+			'pointer-events' => array(),
+			'requiredextensions' => array(),
+			'requiredfeatures' => array(),
+			'shape-rendering' => array(),
+			'stop-color' => array(),
+			'stop-opacity' => array(),
+			'stroke' => array(),
+			'stroke-dasharray' => array(),
+			'stroke-dashoffset' => array(),
+			'stroke-linecap' => array(),
+			'stroke-linejoin' => array(),
+			'stroke-miterlimit' => array(),
+			'stroke-opacity' => array(),
+			'stroke-width' => array(),
+			'style' => 53,
+			'systemlanguage' => array(),
+			'text-anchor' => array(),
+			'text-decoration' => array(),
+			'text-rendering' => array(),
+			'transform' => array(),
+			'unicode-bidi' => array(),
+			'vector-effect' => array(),
+			'visibility' => array(),
+			'word-spacing' => array(),
+			'writing-mode' => array(),
+			'xml:lang' => array(),
+			'xml:space' => array(),
+			'xmlns' => array(),
+			'xmlns:xlink' => array(),
+		),
+		array(
+			'cite' => 52,
+			'datetime' => array(),
+		),
+		array(
+			'style' => 53,
+			'xml:lang' => array(),
+			'xml:space' => array(),
+			'xmlns' => array(),
+			'xmlns:xlink' => array(),
+		),
+		array(
+			'align' => array(),
+		),
+		array(
+			'alignment-baseline' => array(),
+			'baseline-shift' => array(),
+			'clip' => array(),
+			'clip-path' => array(),
+			'clip-rule' => array(),
+			'color' => array(),
+			'color-interpolation' => array(),
+			'color-interpolation-filters' => array(),
+			'color-profile' => array(),
+			'color-rendering' => array(),
+			'cursor' => array(),
+			'direction' => array(),
+			'display' => array(),
+			'dominant-baseline' => array(),
+			'enable-background' => array(),
+			'fill' => array(),
+			'fill-opacity' => array(),
+			'fill-rule' => array(),
+			'filter' => array(),
+			'flood-color' => array(),
+			'flood-opacity' => array(),
+			'focusable' => array(),
+			'font-family' => array(),
+			'font-size' => array(),
+			'font-size-adjust' => array(),
+			'font-stretch' => array(),
+			'font-style' => array(),
+			'font-variant' => array(),
+			'font-weight' => array(),
+			'glyph-orientation-horizontal' => array(),
+			'glyph-orientation-vertical' => array(),
+			'height' => array(),
+			'image-rendering' => array(),
+			'kerning' => array(),
+			'letter-spacing' => array(),
+			'lighting-color' => array(),
+			'marker-end' => array(),
+			'marker-mid' => array(),
+			'marker-start' => array(),
+			'mask' => array(),
+			'opacity' => array(),
+			'overflow' => array(),
+			'pointer-events' => array(),
+			'result' => array(),
+			'shape-rendering' => array(),
+			'stop-color' => array(),
+			'stop-opacity' => array(),
+			'stroke' => array(),
+			'stroke-dasharray' => array(),
+			'stroke-dashoffset' => array(),
+			'stroke-linecap' => array(),
+			'stroke-linejoin' => array(),
+			'stroke-miterlimit' => array(),
+			'stroke-opacity' => array(),
+			'stroke-width' => array(),
+			'style' => 53,
+			'text-anchor' => array(),
+			'text-decoration' => array(),
+			'text-rendering' => array(),
+			'unicode-bidi' => array(),
+			'vector-effect' => array(),
+			'visibility' => array(),
+			'width' => array(),
+			'word-spacing' => array(),
+			'writing-mode' => array(),
+			'x' => array(),
+			'xml:lang' => array(),
+			'xml:space' => array(),
+			'xmlns' => array(),
+			'xmlns:xlink' => array(),
+			'y' => array(),
+		),
+		array(
+			'g1' => array(),
+			'g2' => array(),
+			'k' => array(),
+			'style' => 53,
+			'u1' => array(),
+			'u2' => array(),
+			'xml:lang' => array(),
+			'xml:space' => array(),
+			'xmlns' => array(),
+			'xmlns:xlink' => array(),
+		),
+		array(
+			'alignment-baseline' => array(),
+			'baseline-shift' => array(),
+			'clip' => array(),
+			'clip-path' => array(),
+			'clip-rule' => array(),
+			'color' => array(),
+			'color-interpolation' => array(),
+			'color-interpolation-filters' => array(),
+			'color-profile' => array(),
+			'color-rendering' => array(),
+			'cursor' => array(),
+			'direction' => array(),
+			'display' => array(),
+			'dominant-baseline' => array(),
+			'enable-background' => array(),
+			'externalresourcesrequired' => array(),
+			'fill' => array(),
+			'fill-opacity' => array(),
+			'fill-rule' => array(),
+			'filter' => array(),
+			'flood-color' => array(),
+			'flood-opacity' => array(),
+			'focusable' => array(),
+			'font-family' => array(),
+			'font-size' => array(),
+			'font-size-adjust' => array(),
+			'font-stretch' => array(),
+			'font-style' => array(),
+			'font-variant' => array(),
+			'font-weight' => array(),
+			'glyph-orientation-horizontal' => array(),
+			'glyph-orientation-vertical' => array(),
+			'image-rendering' => array(),
+			'kerning' => array(),
+			'letter-spacing' => array(),
+			'lighting-color' => array(),
+			'marker-end' => array(),
+			'marker-mid' => array(),
+			'marker-start' => array(),
+			'mask' => array(),
+			'opacity' => array(),
+			'overflow' => array(),
+			'pointer-events' => array(),
+			'points' => array(),
+			'requiredextensions' => array(),
+			'requiredfeatures' => array(),
+			'shape-rendering' => array(),
+			'sketch:type' => array(),
+			'stop-color' => array(),
+			'stop-opacity' => array(),
+			'stroke' => array(),
+			'stroke-dasharray' => array(),
+			'stroke-dashoffset' => array(),
+			'stroke-linecap' => array(),
+			'stroke-linejoin' => array(),
+			'stroke-miterlimit' => array(),
+			'stroke-opacity' => array(),
+			'stroke-width' => array(),
+			'style' => 53,
+			'systemlanguage' => array(),
+			'text-anchor' => array(),
+			'text-decoration' => array(),
+			'text-rendering' => array(),
+			'transform' => array(),
+			'unicode-bidi' => array(),
+			'vector-effect' => array(),
+			'visibility' => array(),
+			'word-spacing' => array(),
+			'writing-mode' => array(),
+			'xml:lang' => array(),
+			'xml:space' => array(),
+			'xmlns' => array(),
+			'xmlns:xlink' => array(),
+		),
+		array(
+			'type' => 65,
+		),
+		array(
+			'async' => 12,
+			'nonce' => array(),
+			'type' => 63,
+		),
+		array(
+			'nonce' => array(),
+			'type' => 65,
+		),
+		array(
+			'[src]' => array(),
+			'[type]' => array(),
+			'media' => array(),
+			'src' => 6,
+			'type' => array(),
+		),
+		array(
+			'media' => array(),
+			'src' => 38,
+			'type' => 4,
+		),
+		array(
+			'offset' => array(),
+			'stop-color' => array(),
+			'stop-opacity' => array(),
+			'style' => 53,
+		),
+		array(
+			'amp-boilerplate' => array(
+				'dispatch_key' => 3,
+				'mandatory' => true,
+				'value' => array(
+					'',
+				),
+				'value_set' => array(
+					'' => true,
+				),
+			),
+			'nonce' => array(),
+		),
+		array(
+			'default' => 2,
+			'kind' => 68,
+			'label' => array(),
+			'src' => 23,
+			'srclang' => array(),
+		),
+		array(
+			'default' => 2,
+			'kind' => 69,
+			'label' => array(),
+			'src' => 23,
+			'srclang' => 4,
+		),
+		array(
+			'[label]' => array(),
+			'[src]' => array(),
+			'[srclang]' => array(),
+			'default' => 2,
+			'kind' => 68,
+			'label' => array(),
+			'src' => 23,
+			'srclang' => array(),
+		),
+		array(
+			'[label]' => array(),
+			'[src]' => array(),
+			'[srclang]' => array(),
+			'default' => 2,
+			'kind' => 69,
+			'label' => array(),
+			'src' => 23,
+			'srclang' => 4,
+		),
+		array(
+			'lightbox-thumbnail-id' => 37,
+		),
+		array(
+			'lightbox-exclude' => 4,
+		),
+	);
+
+	private static $resolved_allowed_tags = array();
+	private static $resolved_reference_points = array();
+	private static $resolved_attr_spec_lists = array();
+
+	private static $spec_name_index = array(
+		'AMP-BASE-CAROUSEL [lightbox]' => array(
+			'amp-base-carousel',
+			1,
+		),
+		'AMP-CAROUSEL [lightbox] [type=carousel]' => array(
+			'amp-carousel',
+			3,
+		),
+		'AMP-CAROUSEL [lightbox] [type=slides]' => array(
+			'amp-carousel',
+			2,
+		),
+		'AMP-CAROUSEL [type=carousel]' => array(
+			'amp-carousel',
+			1,
+		),
+		'AMP-CAROUSEL [type=slides]' => array(
+			'amp-carousel',
+			0,
+		),
+		'AMP-IMAGE-SLIDER > DIV [first]' => array(
+			'div',
+			9,
+		),
+		'AMP-IMAGE-SLIDER > DIV [second]' => array(
+			'div',
+			10,
+		),
+		'AMP-VIDEO-IFRAME with [placeholder]' => array(
+			'amp-video-iframe',
+			1,
+		),
+		'AMP-VIDEO-IFRAME[poster]' => array(
+			'amp-video-iframe',
+			0,
+		),
+		'FORM DIV [submit-error]' => array(
+			'div',
+			7,
+		),
+		'FORM DIV [submit-error][template]' => array(
+			'div',
+			8,
+		),
+		'FORM DIV [submit-success]' => array(
+			'div',
+			5,
+		),
+		'FORM DIV [submit-success][template]' => array(
+			'div',
+			6,
+		),
+		'FORM DIV [submitting]' => array(
+			'div',
+			3,
+		),
+		'FORM DIV [submitting][template]' => array(
+			'div',
+			4,
+		),
+		'FORM DIV [verify-error]' => array(
+			'div',
+			1,
+		),
+		'FORM DIV [verify-error][template]' => array(
+			'div',
+			2,
+		),
+		'FORM [method=GET]' => array(
+			'form',
+			0,
+		),
+		'FORM [method=POST]' => array(
+			'form',
+			1,
+		),
+		'INPUT [type=file]' => array(
+			'input',
+			1,
+		),
+		'INPUT [type=password]' => array(
+			'input',
+			2,
+		),
+		'SCRIPT type=text/plain' => array(
+			'script',
+			84,
+		),
+		'amp-access extension .json script' => array(
+			'script',
+			10,
+		),
+		'amp-accordion > section' => array(
+			'section',
+			1,
+		),
+		'amp-ad extension .js script' => array(
+			'script',
+			14,
+		),
+		'amp-ad with data-enable-refresh attribute' => array(
+			'amp-ad',
+			2,
+		),
+		'amp-ad with data-multi-size attribute' => array(
+			'amp-ad',
+			1,
+		),
+		'amp-ad-custom extension .js script' => array(
+			'script',
+			13,
+		),
+		'amp-analytics extension .json script' => array(
+			'script',
+			17,
+		),
+		'amp-animation extension .json script' => array(
+			'script',
+			20,
+		),
+		'amp-app-banner button[open-button]' => array(
+			'button',
+			1,
+		),
+		'amp-audio > source' => array(
+			'source',
+			2,
+		),
+		'amp-audio > track' => array(
+			'track',
+			4,
+		),
+		'amp-audio > track[kind=subtitles]' => array(
+			'track',
+			5,
+		),
+		'amp-autocomplete' => array(
+			'amp-autocomplete',
+			0,
+		),
+		'amp-autocomplete > input' => array(
+			'input',
+			3,
+		),
+		'amp-autocomplete JSON' => array(
+			'script',
+			26,
+		),
+		'amp-bind extension .json script' => array(
+			'script',
+			30,
+		),
+		'amp-consent [type]' => array(
+			'amp-consent',
+			1,
+		),
+		'amp-consent extension .json script' => array(
+			'script',
+			39,
+		),
+		'amp-date-picker > template [date-template]' => array(
+			'template',
+			0,
+		),
+		'amp-date-picker > template [info-template]' => array(
+			'template',
+			1,
+		),
+		'amp-date-picker[type=range][mode=overlay]' => array(
+			'amp-date-picker',
+			3,
+		),
+		'amp-date-picker[type=range][mode=static]' => array(
+			'amp-date-picker',
+			2,
+		),
+		'amp-date-picker[type=single][mode=overlay]' => array(
+			'amp-date-picker',
+			1,
+		),
+		'amp-date-picker[type=single][mode=static]' => array(
+			'amp-date-picker',
+			0,
+		),
+		'amp-embed with data-multi-size attribute' => array(
+			'amp-embed',
+			1,
+		),
+		'amp-experiment extension .json script' => array(
+			'script',
+			48,
+		),
+		'amp-geo extension .json script' => array(
+			'script',
+			59,
+		),
+		'amp-ima-video > script[type=application/json]' => array(
+			'script',
+			3,
+		),
+		'amp-ima-video > source' => array(
+			'source',
+			5,
+		),
+		'amp-ima-video > track' => array(
+			'track',
+			8,
+		),
+		'amp-ima-video > track[kind=subtitles]' => array(
+			'track',
+			9,
+		),
+		'amp-link-rewriter extension .json script' => array(
+			'script',
+			78,
+		),
+		'amp-next-page [type=adsense]' => array(
+			'amp-next-page',
+			2,
+		),
+		'amp-next-page extension .json configuration' => array(
+			'script',
+			86,
+		),
+		'amp-next-page with inline config' => array(
+			'amp-next-page',
+			0,
+		),
+		'amp-next-page with src attribute' => array(
+			'amp-next-page',
+			1,
+		),
+		'amp-sidebar > nav' => array(
+			'nav',
+			1,
+		),
+		'amp-state' => array(
+			'amp-state',
+			0,
+		),
+		'amp-story >> amp-audio' => array(
+			'amp-audio',
+			1,
+		),
+		'amp-story >> amp-sidebar' => array(
+			'amp-sidebar',
+			1,
+		),
+		'amp-story >> amp-video' => array(
+			'amp-video',
+			1,
+		),
+		'amp-story-auto-ads > template' => array(
+			'template',
+			3,
+		),
+		'amp-story-auto-ads config script' => array(
+			'script',
+			110,
+		),
+		'amp-story-bookend extension .json script' => array(
+			'script',
+			112,
+		),
+		'amp-story-consent extension .json script' => array(
+			'script',
+			113,
+		),
+		'amp-subscriptions extension .json script' => array(
+			'script',
+			115,
+		),
+		'amp-user-location extension .json script' => array(
+			'script',
+			121,
+		),
+		'amp-video > source' => array(
+			'source',
+			1,
+		),
+		'amp-video > track' => array(
+			'track',
+			6,
+		),
+		'amp-video > track[kind=subtitles]' => array(
+			'track',
+			7,
+		),
+		'amp-video extension .js script' => array(
+			'script',
+			125,
+		),
+		'amp-video-docking' => array(
+			'script',
+			123,
+		),
+		'amphtml engine v0.js script' => array(
+			'script',
+			0,
+		),
+		'audio > source' => array(
+			'source',
+			3,
+		),
+		'audio > track' => array(
+			'track',
+			0,
+		),
+		'audio > track[kind=subtitles]' => array(
+			'track',
+			1,
+		),
+		'head > style[amp-boilerplate]' => array(
+			'style',
+			1,
+		),
+		'input [mask=date-dd-mm-yyyy]' => array(
+			'input',
+			6,
+		),
+		'input [mask=date-mm-dd-yyyy]' => array(
+			'input',
+			7,
+		),
+		'input [mask=date-mm-yy]' => array(
+			'input',
+			8,
+		),
+		'input [mask=date-yyyy-mm-dd]' => array(
+			'input',
+			9,
+		),
+		'input [mask=payment-card]' => array(
+			'input',
+			5,
+		),
+		'input [mask] (custom mask)' => array(
+			'input',
+			4,
+		),
+		'lineargradient > stop' => array(
+			'stop',
+			0,
+		),
+		'link itemprop=' => array(
+			'link',
+			6,
+		),
+		'link itemprop=sameAs' => array(
+			'link',
+			5,
+		),
+		'link property=' => array(
+			'link',
+			7,
+		),
+		'link rel=' => array(
+			'link',
+			0,
+		),
+		'link rel=canonical' => array(
+			'link',
+			1,
+		),
+		'link rel=manifest' => array(
+			'link',
+			2,
+		),
+		'link rel=preload' => array(
+			'link',
+			3,
+		),
+		'link rel=stylesheet for fonts' => array(
+			'link',
+			4,
+		),
+		'meta charset=utf-8' => array(
+			'meta',
+			0,
+		),
+		'meta http-equiv=Content-Script-Type' => array(
+			'meta',
+			19,
+		),
+		'meta http-equiv=Content-Style-Type' => array(
+			'meta',
+			18,
+		),
+		'meta http-equiv=Content-Type' => array(
+			'meta',
+			14,
+		),
+		'meta http-equiv=X-UA-Compatible' => array(
+			'meta',
+			2,
+		),
+		'meta http-equiv=content-language' => array(
+			'meta',
+			15,
+		),
+		'meta http-equiv=imagetoolbar' => array(
+			'meta',
+			17,
+		),
+		'meta http-equiv=origin-trial' => array(
+			'meta',
+			20,
+		),
+		'meta http-equiv=pics-label' => array(
+			'meta',
+			16,
+		),
+		'meta http-equiv=resource-type' => array(
+			'meta',
+			21,
+		),
+		'meta http-equiv=x-dns-prefetch-control' => array(
+			'meta',
+			22,
+		),
+		'meta name= and content=' => array(
+			'meta',
+			13,
+		),
+		'meta name=amp-3p-iframe-src' => array(
+			'meta',
+			5,
+		),
+		'meta name=amp-ad-doubleclick-sra' => array(
+			'meta',
+			10,
+		),
+		'meta name=amp-ad-enable-refresh' => array(
+			'meta',
+			23,
+		),
+		'meta name=amp-consent-blocking' => array(
+			'meta',
+			6,
+		),
+		'meta name=amp-experiment-token' => array(
+			'meta',
+			7,
+		),
+		'meta name=amp-experiments-opt-in' => array(
+			'meta',
+			4,
+		),
+		'meta name=amp-google-clientid-id-api' => array(
+			'meta',
+			9,
+		),
+		'meta name=amp-link-variable-allowed-origin' => array(
+			'meta',
+			8,
+		),
+		'meta name=amp-list-load-more' => array(
+			'meta',
+			11,
+		),
+		'meta name=amp-recaptcha-input' => array(
+			'meta',
+			12,
+		),
+		'meta name=amp-to-amp-navigation' => array(
+			'meta',
+			24,
+		),
+		'meta name=apple-itunes-app' => array(
+			'meta',
+			3,
+		),
+		'meta name=viewport' => array(
+			'meta',
+			1,
+		),
+		'noscript > style[amp-boilerplate]' => array(
+			'style',
+			2,
+		),
+		'noscript enclosure for boilerplate' => array(
+			'noscript',
+			0,
+		),
+		'picture > source' => array(
+			'source',
+			0,
+		),
+		'radialgradient > stop' => array(
+			'stop',
+			1,
+		),
+		'script id=amp-rtc' => array(
+			'script',
+			2,
+		),
+		'script type=application/ld+json' => array(
+			'script',
+			1,
+		),
+		'style amp-custom' => array(
+			'style',
+			0,
+		),
+		'style[amp-keyframes]' => array(
+			'style',
+			3,
+		),
+		'svg title' => array(
+			'title',
+			1,
+		),
+		'title' => array(
+			'title',
+			0,
+		),
+		'video > source' => array(
+			'source',
+			4,
+		),
+		'video > track' => array(
+			'track',
+			2,
+		),
+		'video > track[kind=subtitles]' => array(
+			'track',
+			3,
+		),
+	);
+
+	private static $dispatch_tables = array(
+		'amp-ad' => array(
+			'data-enable-refresh' => array(
+				'value' => array(
+					'' => array(
+						2,
+					),
+				),
+			),
+			'data-multi-size' => array(
+				'value' => array(
+					'' => array(
+						1,
+					),
+				),
+			),
+		),
+		'amp-embed' => array(
+			'data-multi-size' => array(
+				'value' => array(
+					'' => array(
+						1,
+					),
+				),
+			),
+		),
+		'form' => array(
+			'method' => array(
+				'value_casei' => array(
+					'post' => array(
+						1,
+					),
+				),
+			),
+		),
+		'input' => array(
+			'mask' => array(
+				'name' => array(
+					4,
+				),
+				'value' => array(
+					'date-dd-mm-yyyy' => array(
+						6,
+					),
+					'date-mm-dd-yyyy' => array(
+						7,
+					),
+					'date-mm-yy' => array(
+						8,
+					),
+					'date-yyyy-mm-dd' => array(
+						9,
+					),
+					'payment-card' => array(
+						5,
+					),
+				),
+			),
+			'type' => array(
+				'value_casei' => array(
+					'file' => array(
+						1,
+					),
+					'password' => array(
+						2,
+					),
+				),
+			),
+		),
+		'link' => array(
+			'itemprop' => array(
+				'value_casei' => array(
+					'sameas' => array(
+						5,
+					),
+				),
+			),
+			'rel' => array(
+				'value_casei' => array(
+					'canonical' => array(
+						1,
+					),
+					'manifest' => array(
+						2,
+					),
+					'preload' => array(
+						3,
+					),
+					'stylesheet' => array(
+						4,
+					),
+				),
+			),
+		),
+		'meta' => array(
+			'charset' => array(
+				'name' => array(
+					0,
+				),
+			),
+			'http-equiv' => array(
+				'value_casei' => array(
+					'content-language' => array(
+						15,
+					),
+					'content-script-type' => array(
+						19,
+					),
+					'content-style-type' => array(
+						18,
+					),
+					'content-type' => array(
+						14,
+					),
+					'imagetoolbar' => array(
+						17,
+					),
+					'origin-trial' => array(
+						20,
+					),
+					'pics-label' => array(
+						16,
+					),
+					'resource-type' => array(
+						21,
+					),
+					'x-dns-prefetch-control' => array(
+						22,
+					),
+					'x-ua-compatible' => array(
+						2,
+					),
+				),
+			),
+			'name' => array(
+				'value' => array(
+					'viewport' => array(
+						1,
+					),
+				),
+				'value_casei' => array(
+					'amp-3p-iframe-src' => array(
+						5,
+					),
+					'amp-ad-doubleclick-sra' => array(
+						10,
+					),
+					'amp-ad-enable-refresh' => array(
+						23,
+					),
+					'amp-consent-blocking' => array(
+						6,
+					),
+					'amp-experiment-token' => array(
+						7,
+					),
+					'amp-experiments-opt-in' => array(
+						4,
+					),
+					'amp-google-client-id-api' => array(
+						9,
+					),
+					'amp-link-variable-allowed-origin' => array(
+						8,
+					),
+					'amp-list-load-more' => array(
+						11,
+					),
+					'amp-recaptcha-input' => array(
+						12,
+					),
+					'amp-to-amp-navigation' => array(
+						24,
+					),
+					'apple-itunes-app' => array(
+						3,
+					),
+				),
+			),
+		),
+		'nav' => array(
+			'toolbar' => array(
+				'name' => array(
+					1,
+				),
+			),
+		),
+		'script' => array(
+			'id' => array(
+				'value' => array(
+					'amp-access' => array(
+						10,
+					),
+					'amp-subscriptions' => array(
+						115,
+					),
+				),
+				'value_casei' => array(
+					'amp-rtc' => array(
+						2,
+					),
+				),
+			),
+			'src' => array(
+				'value' => array(
+					'https://cdn.ampproject.org/v0.js' => array(
+						0,
+					),
+				),
+			),
+			'template' => array(
+				'value' => array(
+					'amp-mustache' => array(
+						84,
+					),
+				),
+			),
+			'type' => array(
+				'value_casei' => array(
+					'application/ld+json' => array(
+						1,
+					),
+				),
+				'value_casei_parent' => array(
+					'application/json' => array(
+						'amp-analytics' => array(
+							17,
+						),
+						'amp-animation' => array(
+							20,
+						),
+						'amp-autocomplete' => array(
+							26,
+						),
+						'amp-consent' => array(
+							39,
+						),
+						'amp-experiment' => array(
+							48,
+						),
+						'amp-geo' => array(
+							59,
+						),
+						'amp-ima-video' => array(
+							3,
+						),
+						'amp-link-rewriter' => array(
+							78,
+						),
+						'amp-next-page' => array(
+							86,
+						),
+						'amp-state' => array(
+							30,
+						),
+						'amp-story-auto-ads' => array(
+							110,
+						),
+						'amp-story-bookend' => array(
+							112,
+						),
+						'amp-story-consent' => array(
+							113,
+						),
+						'amp-user-location' => array(
+							121,
+						),
+					),
+				),
+			),
+		),
+		'style' => array(
+			'amp-boilerplate' => array(
+				'value_parent' => array(
+					'' => array(
+						'head' => array(
+							1,
+						),
+						'noscript' => array(
+							2,
+						),
+					),
+				),
+			),
+			'amp-keyframes' => array(
+				'name' => array(
+					3,
+				),
+			),
+		),
+		'template' => array(
+			'date-template' => array(
+				'name' => array(
+					0,
+				),
+			),
+			'info-template' => array(
+				'name' => array(
+					1,
+				),
+			),
+			'type' => array(
+				'value_parent' => array(
+					'amp-mustache' => array(
+						'amp-story-auto-ads' => array(
+							3,
+						),
+					),
+				),
+			),
+		),
+	);
+
+	private static $css_rules = array(
+		'link rel=stylesheet for fonts' => array(
+			'font_url_regex' => '/^(https:\\/\\/cdn\\.materialdesignicons\\.com\\/([0-9]+\\.?)+\\/css\\/materialdesignicons\\.min\\.css|https:\\/\\/cloud\\.typography\\.com\\/[0-9]*\\/[0-9]*\\/css\\/fonts\\.css|https:\\/\\/fast\\.fonts\\.net\\/.*|https:\\/\\/fonts\\.googleapis\\.com\\/css\\?.*|https:\\/\\/fonts\\.googleapis\\.com\\/icon\\?.*|https:\\/\\/fonts\\.googleapis\\.com\\/earlyaccess\\/.*\\.css|https:\\/\\/maxcdn\\.bootstrapcdn\\.com\\/font-awesome\\/([0-9]+\\.?)+\\/css\\/font-awesome\\.min\\.css(\\?.*)?|https:\\/\\/(use|pro)\\.fontawesome\\.com\\/releases\\/v([0-9]+\\.?)+\\/css\\/(all|brands|solid|regular|light|fontawesome)\\.css|https:\\/\\/(use|pro)\\.fontawesome\\.com\\/[0-9a-zA-Z]+\\.css|https:\\/\\/use\\.typekit\\.net\\/[\\w\\p{L}\\p{N}_]+\\.css)$/u',
+		),
+		'style amp-custom' => array(
+			'allowed_at_rules' => array(
+				'font-face' => true,
+				'keyframes' => true,
+				'media' => true,
+				'page' => true,
+				'supports' => true,
+			),
+			'declaration' => array(),
+			'max_bytes' => 50000,
+			'validate_keyframes' => false,
+		),
+		'style[amp-keyframes]' => array(
+			'allowed_at_rules' => array(
+				'keyframes' => true,
+				'media' => true,
+				'supports' => true,
+			),
+			'declaration' => array(
+				'animation-timing-function' => true,
+				'offset-distance' => true,
+				'opacity' => true,
+				'transform' => true,
+				'visibility' => true,
+			),
+			'max_bytes' => 500000,
+			'validate_keyframes' => true,
+		),
+	);
+
+	private static $extension_script_index = array(
+		'amp-3d-gltf' => array(
+			4,
+		),
+		'amp-3q-player' => array(
+			5,
+		),
+		'amp-access' => array(
+			9,
+		),
+		'amp-access-laterpay' => array(
+			6,
+		),
+		'amp-access-poool' => array(
+			7,
+		),
+		'amp-access-scroll' => array(
+			8,
+		),
+		'amp-accordion' => array(
+			11,
+		),
+		'amp-action-macro' => array(
+			12,
+		),
+		'amp-ad' => array(
+			14,
+		),
+		'amp-ad-custom' => array(
+			13,
+		),
+		'amp-addthis' => array(
+			15,
+		),
+		'amp-analytics' => array(
+			16,
+		),
+		'amp-anim' => array(
+			18,
+		),
+		'amp-animation' => array(
+			19,
+		),
+		'amp-apester-media' => array(
+			21,
+		),
+		'amp-app-banner' => array(
+			22,
+		),
+		'amp-audio' => array(
+			23,
+		),
+		'amp-auto-ads' => array(
+			24,
+		),
+		'amp-autocomplete' => array(
+			25,
+		),
+		'amp-base-carousel' => array(
+			27,
+		),
+		'amp-beopinion' => array(
+			28,
+		),
+		'amp-bind' => array(
+			29,
+		),
+		'amp-bodymovin-animation' => array(
+			31,
+		),
+		'amp-brid-player' => array(
+			32,
+		),
+		'amp-brightcove' => array(
+			33,
+		),
+		'amp-byside-content' => array(
+			34,
+		),
+		'amp-call-tracking' => array(
+			35,
+		),
+		'amp-carousel' => array(
+			36,
+		),
+		'amp-connatix-player' => array(
+			37,
+		),
+		'amp-consent' => array(
+			38,
+		),
+		'amp-dailymotion' => array(
+			40,
+		),
+		'amp-date-countdown' => array(
+			41,
+		),
+		'amp-date-display' => array(
+			42,
+		),
+		'amp-date-picker' => array(
+			43,
+		),
+		'amp-delight-player' => array(
+			44,
+		),
+		'amp-dynamic-css-classes' => array(
+			45,
+		),
+		'amp-embedly-card' => array(
+			46,
+		),
+		'amp-experiment' => array(
+			47,
+		),
+		'amp-facebook' => array(
+			52,
+		),
+		'amp-facebook-comments' => array(
+			49,
+		),
+		'amp-facebook-like' => array(
+			50,
+		),
+		'amp-facebook-page' => array(
+			51,
+		),
+		'amp-fit-text' => array(
+			53,
+		),
+		'amp-font' => array(
+			54,
+		),
+		'amp-form' => array(
+			55,
+		),
+		'amp-fx-collection' => array(
+			56,
+		),
+		'amp-fx-flying-carpet' => array(
+			57,
+		),
+		'amp-geo' => array(
+			58,
+		),
+		'amp-gfycat' => array(
+			60,
+		),
+		'amp-gist' => array(
+			61,
+		),
+		'amp-google-document-embed' => array(
+			62,
+		),
+		'amp-hulu' => array(
+			63,
+		),
+		'amp-iframe' => array(
+			64,
+		),
+		'amp-ima-video' => array(
+			65,
+		),
+		'amp-image-lightbox' => array(
+			66,
+		),
+		'amp-image-slider' => array(
+			67,
+		),
+		'amp-imgur' => array(
+			68,
+		),
+		'amp-inputmask' => array(
+			69,
+		),
+		'amp-instagram' => array(
+			70,
+		),
+		'amp-install-serviceworker' => array(
+			71,
+		),
+		'amp-izlesene' => array(
+			72,
+		),
+		'amp-jwplayer' => array(
+			73,
+		),
+		'amp-kaltura-player' => array(
+			74,
+		),
+		'amp-lightbox' => array(
+			76,
+		),
+		'amp-lightbox-gallery' => array(
+			75,
+		),
+		'amp-link-rewriter' => array(
+			77,
+		),
+		'amp-list' => array(
+			79,
+		),
+		'amp-live-list' => array(
+			80,
+		),
+		'amp-mathml' => array(
+			81,
+		),
+		'amp-mowplayer' => array(
+			82,
+		),
+		'amp-mustache' => array(
+			83,
+		),
+		'amp-next-page' => array(
+			85,
+		),
+		'amp-nexxtv-player' => array(
+			87,
+		),
+		'amp-o2-player' => array(
+			88,
+		),
+		'amp-ooyala-player' => array(
+			89,
+		),
+		'amp-orientation-observer' => array(
+			90,
+		),
+		'amp-pan-zoom' => array(
+			91,
+		),
+		'amp-pinterest' => array(
+			92,
+		),
+		'amp-playbuzz' => array(
+			93,
+		),
+		'amp-position-observer' => array(
+			94,
+		),
+		'amp-powr-player' => array(
+			95,
+		),
+		'amp-reach-player' => array(
+			96,
+		),
+		'amp-recaptcha-input' => array(
+			97,
+		),
+		'amp-reddit' => array(
+			98,
+		),
+		'amp-riddle-quiz' => array(
+			99,
+		),
+		'amp-script' => array(
+			100,
+		),
+		'amp-selector' => array(
+			101,
+		),
+		'amp-sidebar' => array(
+			102,
+		),
+		'amp-skimlinks' => array(
+			103,
+		),
+		'amp-smartlinks' => array(
+			104,
+		),
+		'amp-social-share' => array(
+			105,
+		),
+		'amp-soundcloud' => array(
+			106,
+		),
+		'amp-springboard-player' => array(
+			107,
+		),
+		'amp-sticky-ad' => array(
+			108,
+		),
+		'amp-story' => array(
+			111,
+		),
+		'amp-story-auto-ads' => array(
+			109,
+		),
+		'amp-subscriptions' => array(
+			114,
+		),
+		'amp-subscriptions-google' => array(
+			116,
+		),
+		'amp-timeago' => array(
+			117,
+		),
+		'amp-truncate-text' => array(
+			118,
+		),
+		'amp-twitter' => array(
+			119,
+		),
+		'amp-user-location' => array(
+			120,
+		),
+		'amp-user-notification' => array(
+			122,
+		),
+		'amp-video' => array(
+			125,
+		),
+		'amp-video-docking' => array(
+			123,
+		),
+		'amp-video-iframe' => array(
+			124,
+		),
+		'amp-vimeo' => array(
+			126,
+		),
+		'amp-vine' => array(
+			127,
+		),
+		'amp-viqeo-player' => array(
+			128,
+		),
+		'amp-vk' => array(
+			129,
+		),
+		'amp-web-push' => array(
+			130,
+		),
+		'amp-wistia-player' => array(
+			131,
+		),
+		'amp-yotpo' => array(
+			132,
+		),
+		'amp-youtube' => array(
+			133,
+		),
+	);
+
 
 	/**
 	 * Get allowed tags.
@@ -17231,6 +18711,11 @@ class AMP_Allowed_Tags_Generated {
 	 * @return array Allowed tags.
 	 */
 	public static function get_allowed_tags() {
+		if ( count( self::$resolved_allowed_tags ) !== count( self::$allowed_tags ) ) {
+			foreach ( array_keys( self::$allowed_tags ) as $node_name ) {
+				self::get_allowed_tag( $node_name );
+			}
+		}
 		return self::$allowed_tags;
 	}
 
@@ -17244,10 +18729,14 @@ class AMP_Allowed_Tags_Generated {
 	 * @return array|null Allowed tag, or null if the tag does not exist.
 	 */
 	public static function get_allowed_tag( $node_name ) {
-		if ( isset( self::$allowed_tags[ $node_name ] ) ) {
-			return self::$allowed_tags[ $node_name ];
+		if ( ! isset( self::$allowed_tags[ $node_name ] ) ) {
+			return null;
+		}
+		if ( ! isset( self::$resolved_allowed_tags[ $node_name ] ) ) {
+			self::$allowed_tags[ $node_name ]          = self::resolve_tag_specs( self::$allowed_tags[ $node_name ] );
+			self::$resolved_allowed_tags[ $node_name ] = true;
 		}
-		return null;
+		return self::$allowed_tags[ $node_name ];
 	}
 
 	/**
@@ -17284,10 +18773,144 @@ class AMP_Allowed_Tags_Generated {
 	 * @return array|null Reference point spec, or null if does not exist.
 	 */
 	public static function get_reference_point_spec( $tag_spec_name ) {
-		if ( isset( self::$reference_points[ $tag_spec_name ] ) ) {
-			return self::$reference_points[ $tag_spec_name ];
+		if ( ! isset( self::$reference_points[ $tag_spec_name ] ) ) {
+			return null;
+		}
+		if ( ! isset( self::$resolved_reference_points[ $tag_spec_name ] ) ) {
+			self::$reference_points[ $tag_spec_name ]          = self::resolve_tag_spec( self::$reference_points[ $tag_spec_name ] );
+			self::$resolved_reference_points[ $tag_spec_name ] = true;
+		}
+		return self::$reference_points[ $tag_spec_name ];
+	}
+
+	/**
+	 * Get the tag spec with a given spec name.
+	 *
+	 * @since 1.2
+	 * @param string $spec_name Spec name.
+	 * @return array|null Tag spec, or null if there is no tag spec with the name.
+	 */
+	public static function get_tag_spec_by_spec_name( $spec_name ) {
+		if ( ! isset( self::$spec_name_index[ $spec_name ] ) ) {
+			return null;
+		}
+		list( $node_name, $spec_id ) = self::$spec_name_index[ $spec_name ];
+		$tag_specs                   = self::get_allowed_tag( $node_name );
+		return $tag_specs[ $spec_id ];
+	}
+
+	/**
+	 * Get the indexes of the tag specs of a tag which are dispatched by an attribute.
+	 *
+	 * Dispatching narrows down the specs a tag can match by an attribute such as script[type],
+	 * link[rel] or meta[name], without looping over each of the tag's specs. Some specs are only
+	 * dispatched by the attribute's value when the element's parent is their mandatory parent.
+	 *
+	 * @since 1.2
+	 * @param string      $node_name   Tag name.
+	 * @param string      $attr_name   Attribute name.
+	 * @param string|null $attr_value  Attribute value, or null to only get the tag specs dispatched by the presence of the attribute.
+	 * @param string|null $parent_name Tag name of the element's parent, or null to leave out the tag specs dispatched along with their parent.
+	 * @return int[] Indexes of the tag specs in the tag's specs, in ascending order.
+	 */
+	public static function get_dispatched_tag_spec_ids( $node_name, $attr_name, $attr_value = null, $parent_name = null ) {
+		if ( ! isset( self::$dispatch_tables[ $node_name ][ $attr_name ] ) ) {
+			return array();
+		}
+		$dispatch_table = self::$dispatch_tables[ $node_name ][ $attr_name ];
+
+		$spec_ids = isset( $dispatch_table['name'] ) ? $dispatch_table['name'] : array();
+		if ( null !== $attr_value ) {
+			if ( isset( $dispatch_table['value'][ $attr_value ] ) ) {
+				$spec_ids = array_merge( $spec_ids, $dispatch_table['value'][ $attr_value ] );
+			}
+			if ( isset( $dispatch_table['value_parent'][ $attr_value ][ $parent_name ] ) ) {
+				$spec_ids = array_merge( $spec_ids, $dispatch_table['value_parent'][ $attr_value ][ $parent_name ] );
+			}
+			$attr_value = strtolower( $attr_value );
+			if ( isset( $dispatch_table['value_casei'][ $attr_value ] ) ) {
+				$spec_ids = array_merge( $spec_ids, $dispatch_table['value_casei'][ $attr_value ] );
+			}
+			if ( isset( $dispatch_table['value_casei_parent'][ $attr_value ][ $parent_name ] ) ) {
+				$spec_ids = array_merge( $spec_ids, $dispatch_table['value_casei_parent'][ $attr_value ][ $parent_name ] );
+			}
+		}
+		$spec_ids = array_unique( $spec_ids );
+		sort( $spec_ids );
+		return $spec_ids;
+	}
+
+	/**
+	 * Get the tag specs of a tag which are dispatched by an attribute.
+	 *
+	 * @since 1.2
+	 * @see AMP_Allowed_Tags_Generated::get_dispatched_tag_spec_ids()
+	 * @param string      $node_name   Tag name.
+	 * @param string      $attr_name   Attribute name.
+	 * @param string|null $attr_value  Attribute value, or null to only get the tag specs dispatched by the presence of the attribute.
+	 * @param string|null $parent_name Tag name of the element's parent, or null to leave out the tag specs dispatched along with their parent.
+	 * @return array Tag specs, keyed by their index in the tag's specs.
+	 */
+	public static function get_dispatched_tag_specs( $node_name, $attr_name, $attr_value = null, $parent_name = null ) {
+		$spec_ids = self::get_dispatched_tag_spec_ids( $node_name, $attr_name, $attr_value, $parent_name );
+		if ( empty( $spec_ids ) ) {
+			return array();
+		}
+
+		$tag_specs            = self::get_allowed_tag( $node_name );
+		$dispatched_tag_specs = array();
+		foreach ( $spec_ids as $spec_id ) {
+			$dispatched_tag_specs[ $spec_id ] = $tag_specs[ $spec_id ];
+		}
+		return $dispatched_tag_specs;
+	}
+
+	/**
+	 * Get the CSS rules of a style or font stylesheet tag spec.
+	 *
+	 * The CSS rules of style[amp-custom] and style[amp-keyframes] have the allowed at-rules and declarations as sets,
+	 * along with validate_keyframes and max_bytes. The CSS rules of a font stylesheet link have the font_url_regex
+	 * the href has to match, which is anchored and delimited for preg_match().
+	 *
+	 * @since 1.2
+	 * @param string $spec_name Spec name, such as 'style amp-custom', 'style[amp-keyframes]' or 'link rel=stylesheet for fonts'.
+	 * @return array|null CSS rules, or null if the tag spec does not exist or has no CSS rules.
+	 */
+	public static function get_css_rules( $spec_name ) {
+		if ( ! isset( self::$css_rules[ $spec_name ] ) ) {
+			return null;
+		}
+		return self::$css_rules[ $spec_name ];
+	}
+
+	/**
+	 * Get the names of the extensions, which each have a script tag spec.
+	 *
+	 * @since 1.2
+	 * @return string[] Extension names, such as 'amp-carousel'.
+	 */
+	public static function get_extension_names() {
+		return array_keys( self::$extension_script_index );
+	}
+
+	/**
+	 * Get the script tag specs of an extension.
+	 *
+	 * @since 1.2
+	 * @param string $extension_name Extension name, such as 'amp-carousel'.
+	 * @return array Script tag specs, keyed by their index in the specs of the script tag.
+	 */
+	public static function get_extension_script_specs( $extension_name ) {
+		if ( ! isset( self::$extension_script_index[ $extension_name ] ) ) {
+			return array();
 		}
-		return null;
+
+		$tag_specs    = self::get_allowed_tag( 'script' );
+		$script_specs = array();
+		foreach ( self::$extension_script_index[ $extension_name ] as $spec_id ) {
+			$script_specs[ $spec_id ] = $tag_specs[ $spec_id ];
+		}
+		return $script_specs;
 	}
 
 	/**
@@ -17310,5 +18933,55 @@ class AMP_Allowed_Tags_Generated {
 		return self::$layout_allowed_attrs;
 	}
 
+	/**
+	 * Resolve the references of tag specs to the attribute specs they share with other tag specs.
+	 *
+	 * @since 1.2
+	 * @param array $tag_specs Tag specs.
+	 * @return array Tag specs.
+	 */
+	private static function resolve_tag_specs( $tag_specs ) {
+		foreach ( $tag_specs as $i => $tag_spec ) {
+			$tag_specs[ $i ] = self::resolve_tag_spec( $tag_spec );
+		}
+		return $tag_specs;
+	}
+
+	/**
+	 * Resolve the references of a tag spec to the attribute specs it shares with other tag specs.
+	 *
+	 * @since 1.2
+	 * @param array $tag_spec Tag spec.
+	 * @return array Tag spec.
+	 */
+	private static function resolve_tag_spec( $tag_spec ) {
+		$tag_spec['attr_spec_list'] = self::resolve_attr_spec_list( $tag_spec['attr_spec_list'] );
+		return $tag_spec;
+	}
+
+	/**
+	 * Resolve an attribute spec list, which is either the index of a shared list or has the indexes of shared attribute specs.
+	 *
+	 * @since 1.2
+	 * @param array|int $attr_spec_list Attribute spec list, or the index of a shared attribute spec list.
+	 * @return array Attribute spec list.
+	 */
+	private static function resolve_attr_spec_list( $attr_spec_list ) {
+		if ( is_int( $attr_spec_list ) ) {
+			$id = $attr_spec_list;
+			if ( ! isset( self::$resolved_attr_spec_lists[ $id ] ) ) {
+				self::$shared_attr_spec_lists[ $id ]   = self::resolve_attr_spec_list( self::$shared_attr_spec_lists[ $id ] );
+				self::$resolved_attr_spec_lists[ $id ] = true;
+			}
+			return self::$shared_attr_spec_lists[ $id ];
+		}
+		foreach ( $attr_spec_list as $attr_name => $attr_spec ) {
+			if ( is_int( $attr_spec ) ) {
+				$attr_spec_list[ $attr_name ] = self::$shared_attr_specs[ $attr_spec ];
+			}
+		}
+		return $attr_spec_list;
+	}
+
 }
 
@@ -54,6 +54,31 @@ abstract class AMP_Rule_Spec {
 	const VALUE_PROPERTIES        = 'value_properties';
 	const VALUE_URL               = 'value_url';
 
+	/**
+	 * Enumerations as value => true sets, which the generated specs have next to (or instead of) the lists.
+	 *
+	 * @since 1.2
+	 */
+	const VALUE_SET            = 'value_set';
+	const VALUE_CASEI_SET      = 'value_casei_set';
+	const ALLOWED_PROTOCOL_SET = 'protocol_set';
+
+	/**
+	 * Regexes as PCRE patterns, which the generated specs have next to the regexes, delimited and with their anchors and modifiers.
+	 *
+	 * @since 1.2
+	 */
+	const VALUE_REGEX_PCRE             = 'value_regex_pcre';
+	const VALUE_REGEX_CASEI_PCRE       = 'value_regex_casei_pcre';
+	const BLACKLISTED_VALUE_REGEX_PCRE = 'blacklisted_value_regex_pcre';
+
+	/**
+	 * Facts which the generated tag specs have precomputed: mandatory_attrs, attr_aliases, supported_layouts, required_extensions and reference_point_attrs.
+	 *
+	 * @since 1.2
+	 */
+	const PRECOMPUTED = 'precomputed';
+
 	/**
 	 * Supported layout values.
 	 *
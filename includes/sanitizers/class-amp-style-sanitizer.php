@@ -125,12 +125,13 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 	private $pending_stylesheets = array();
 
 	/**
-	 * Spec for style[amp-custom] cdata.
+	 * CSS rules for style[amp-custom].
 	 *
-	 * @since 1.0
+	 * @since 1.2
+	 * @see AMP_Allowed_Tags_Generated::get_css_rules()
 	 * @var array
 	 */
-	private $style_custom_cdata_spec;
+	private $style_custom_css_rules;
 
 	/**
 	 * The style[amp-custom] element.
@@ -140,12 +141,13 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 	private $amp_custom_style_element;
 
 	/**
-	 * Spec for style[amp-keyframes] cdata.
+	 * CSS rules for style[amp-keyframes].
 	 *
-	 * @since 1.0
+	 * @since 1.2
+	 * @see AMP_Allowed_Tags_Generated::get_css_rules()
 	 * @var array
 	 */
-	private $style_keyframes_cdata_spec;
+	private $style_keyframes_css_rules;
 
 	/**
 	 * Regex for allowed font stylesheet URL.
@@ -341,23 +343,12 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 	public function __construct( DOMDocument $dom, array $args = array() ) {
 		parent::__construct( $dom, $args );
 
-		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tag( 'style' ) as $spec_rule ) {
-			if ( ! isset( $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) ) {
-				continue;
-			}
-			if ( 'style[amp-keyframes]' === $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) {
-				$this->style_keyframes_cdata_spec = $spec_rule[ AMP_Rule_Spec::CDATA ];
-			} elseif ( 'style amp-custom' === $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) {
-				$this->style_custom_cdata_spec = $spec_rule[ AMP_Rule_Spec::CDATA ];
-			}
-		}
+		$this->style_keyframes_css_rules = AMP_Allowed_Tags_Generated::get_css_rules( 'style[amp-keyframes]' );
+		$this->style_custom_css_rules    = AMP_Allowed_Tags_Generated::get_css_rules( 'style amp-custom' );
 
-		$spec_name = 'link rel=stylesheet for fonts'; // phpcs:ignore WordPress.WP.EnqueuedResources.NonEnqueuedStylesheet
-		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tag( 'link' ) as $spec_rule ) {
-			if ( isset( $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) && $spec_name === $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) {
-				$this->allowed_font_src_regex = '@^(' . $spec_rule[ AMP_Rule_Spec::ATTR_SPEC_LIST ]['href']['value_regex'] . ')$@';
-				break;
-			}
+		$css_rules = AMP_Allowed_Tags_Generated::get_css_rules( 'link rel=stylesheet for fonts' ); // phpcs:ignore WordPress.WP.EnqueuedResources.NonEnqueuedStylesheet
+		if ( $css_rules ) {
+			$this->allowed_font_src_regex = $css_rules['font_url_regex'];
 		}
 
 		$guessurl = site_url();
@@ -1053,7 +1044,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 		// @todo Any @keyframes rules could be removed from amp-custom and instead added to amp-keyframes.
 		$is_keyframes = $element->hasAttribute( 'amp-keyframes' );
 		$stylesheet   = trim( $element->textContent );
-		$cdata_spec   = $is_keyframes ? $this->style_keyframes_cdata_spec : $this->style_custom_cdata_spec;
+		$css_rules    = $is_keyframes ? $this->style_keyframes_css_rules : $this->style_custom_css_rules;
 
 		// Honor the style's media attribute.
 		$media = $element->getAttribute( 'media' );
@@ -1064,9 +1055,9 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 		$processed = $this->process_stylesheet(
 			$stylesheet,
 			array(
-				'allowed_at_rules'   => $cdata_spec['css_spec']['allowed_at_rules'],
-				'property_whitelist' => $cdata_spec['css_spec']['declaration'],
-				'validate_keyframes' => $cdata_spec['css_spec']['validate_keyframes'],
+				'allowed_at_rules'   => $css_rules['allowed_at_rules'],
+				'property_whitelist' => $css_rules['declaration'],
+				'validate_keyframes' => $css_rules['validate_keyframes'],
 			)
 		);
 
@@ -1180,8 +1171,8 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 		$processed = $this->process_stylesheet(
 			$stylesheet,
 			array(
-				'allowed_at_rules'   => $this->style_custom_cdata_spec['css_spec']['allowed_at_rules'],
-				'property_whitelist' => $this->style_custom_cdata_spec['css_spec']['declaration'],
+				'allowed_at_rules'   => $this->style_custom_css_rules['allowed_at_rules'],
+				'property_whitelist' => $this->style_custom_css_rules['declaration'],
 				'stylesheet_url'     => $href,
 				'stylesheet_path'    => $css_file_path,
 			)
@@ -1254,11 +1245,11 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 	 * @param array  $options {
 	 *     Options.
 	 *
-	 *     @type string[] $property_whitelist          Exclusively-allowed properties.
+	 *     @type bool[]   $property_whitelist          Exclusively-allowed properties, as a set of property names to true.
 	 *     @type string[] $property_blacklist          Disallowed properties.
 	 *     @type string   $stylesheet_url              Original URL for stylesheet when originating via link or @import.
 	 *     @type string   $stylesheet_path             Original filesystem path for stylesheet when originating via link or @import.
-	 *     @type array    $allowed_at_rules            Allowed @-rules.
+	 *     @type bool[]   $allowed_at_rules            Allowed @-rules, as a set of at-rule names to true.
 	 *     @type bool     $validate_keyframes          Whether keyframes should be validated.
 	 * }
 	 * @return array {
@@ -1793,7 +1784,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 					$this->process_css_declaration_block( $css_item, $css_list, $options )
 				);
 			} elseif ( $css_item instanceof AtRuleBlockList ) {
-				if ( ! in_array( $css_item->atRuleName(), $options['allowed_at_rules'], true ) ) {
+				if ( ! isset( $options['allowed_at_rules'][ $css_item->atRuleName() ] ) ) {
 					$error     = array(
 						'code'    => self::ILLEGAL_AT_RULE_ERROR_CODE,
 						'at_rule' => $css_item->atRuleName(),
@@ -1814,7 +1805,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 					$this->parse_import_stylesheet( $css_item, $css_list, $options )
 				);
 			} elseif ( $css_item instanceof AtRuleSet ) {
-				if ( ! in_array( $css_item->atRuleName(), $options['allowed_at_rules'], true ) ) {
+				if ( ! isset( $options['allowed_at_rules'][ $css_item->atRuleName() ] ) ) {
 					$error     = array(
 						'code'    => self::ILLEGAL_AT_RULE_ERROR_CODE,
 						'at_rule' => $css_item->atRuleName(),
@@ -1831,7 +1822,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 					);
 				}
 			} elseif ( $css_item instanceof KeyFrame ) {
-				if ( ! in_array( 'keyframes', $options['allowed_at_rules'], true ) ) {
+				if ( ! isset( $options['allowed_at_rules']['keyframes'] ) ) {
 					$error     = array(
 						'code'    => self::ILLEGAL_AT_RULE_ERROR_CODE,
 						'at_rule' => $css_item->atRuleName(),
@@ -1953,7 +1944,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 			$properties = $ruleset->getRules();
 			foreach ( $properties as $property ) {
 				$vendorless_property_name = preg_replace( '/^-\w+-/', '', $property->getRule() );
-				if ( ! in_array( $vendorless_property_name, $options['property_whitelist'], true ) ) {
+				if ( ! isset( $options['property_whitelist'][ $vendorless_property_name ] ) ) {
 					$error     = array(
 						'code'           => 'illegal_css_property',
 						'property_name'  => $property->getRule(),
@@ -2206,7 +2197,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 				$properties = $rules->getRules();
 				foreach ( $properties as $property ) {
 					$vendorless_property_name = preg_replace( '/^-\w+-/', '', $property->getRule() );
-					if ( ! in_array( $vendorless_property_name, $options['property_whitelist'], true ) ) {
+					if ( ! isset( $options['property_whitelist'][ $vendorless_property_name ] ) ) {
 						$error     = array(
 							'code'           => 'illegal_css_property',
 							'property_name'  => $property->getRule(),
@@ -2348,7 +2339,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 			$rule,
 			array(
 				'allowed_at_rules'   => array(),
-				'property_whitelist' => $this->style_custom_cdata_spec['css_spec']['declaration'],
+				'property_whitelist' => $this->style_custom_css_rules['declaration'],
 			)
 		);
 
@@ -2386,14 +2377,14 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 		$stylesheet_groups = array(
 			'custom'    => array(
 				'source_map_comment'  => "\n\n/*# sourceURL=amp-custom.css */",
-				'cdata_spec'          => $this->style_custom_cdata_spec,
+				'css_rules'           => $this->style_custom_css_rules,
 				'pending_stylesheets' => array(),
 				'included_count'      => 0,
 				'import_front_matter' => '', // Extra @import statements that are prepended when fetch fails and validation error is rejected.
 			),
 			'keyframes' => array(
 				'source_map_comment'  => "\n\n/*# sourceURL=amp-keyframes.css */",
-				'cdata_spec'          => $this->style_keyframes_cdata_spec,
+				'css_rules'           => $this->style_keyframes_css_rules,
 				'pending_stylesheets' => array(),
 				'included_count'      => 0,
 				'import_front_matter' => '',
@@ -2803,7 +2794,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	private function finalize_stylesheet_group( $group, $group_config ) {
 		$included_count = 0;
-		$max_bytes      = $group_config['cdata_spec']['max_bytes'] - strlen( $group_config['source_map_comment'] );
+		$max_bytes      = $group_config['css_rules']['max_bytes'] - strlen( $group_config['source_map_comment'] );
 
 		$previously_seen_stylesheet_index = array();
 		$indices_by_stylesheet_element_id = array();
@@ -67,6 +67,30 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	protected $visited_unique_tag_specs = array();
 
+	/**
+	 * Descendant tag lists that have been looked up, as sets of the tag names.
+	 *
+	 * @since 1.2
+	 * @var array[]
+	 */
+	private $descendant_tag_sets = array();
+
+	/**
+	 * Number of the generated tag specs of each tag, which the dispatch tables index, or empty if the allowed tags are not the generated ones.
+	 *
+	 * @since 1.2
+	 * @var int[]
+	 */
+	private $generated_tag_spec_counts = array();
+
+	/**
+	 * Indexes of the generated tag specs of each tag without a dispatch key, as sets, for the tags that have been looked up.
+	 *
+	 * @since 1.2
+	 * @var array[]
+	 */
+	private $undispatched_tag_spec_ids = array();
+
 	/**
 	 * Stack.
 	 *
@@ -117,6 +141,11 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 
 		parent::__construct( $dom, $args );
 
+		// Tag specs added below come after the generated ones, so that the indexes of the dispatch tables still apply.
+		if ( ! isset( $args['amp_allowed_tags'] ) ) {
+			$this->generated_tag_spec_counts = array_map( 'count', $this->args['amp_allowed_tags'] );
+		}
+
 		if ( ! empty( $this->args['allow_dirty_styles'] ) ) {
 
 			// Allow style attribute on all elements.
@@ -192,7 +221,11 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		foreach ( $this->allowed_tags as &$tag_specs ) {
 			foreach ( $tag_specs as &$tag_spec ) {
 				if ( isset( $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ) {
-					$tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] = $this->process_alternate_names( $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] );
+					$attr_aliases = null;
+					if ( isset( $tag_spec[ AMP_Rule_Spec::PRECOMPUTED ] ) ) {
+						$attr_aliases = isset( $tag_spec[ AMP_Rule_Spec::PRECOMPUTED ]['attr_aliases'] ) ? $tag_spec[ AMP_Rule_Spec::PRECOMPUTED ]['attr_aliases'] : array();
+					}
+					$tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] = $this->process_alternate_names( $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ], $attr_aliases );
 				}
 			}
 		}
@@ -223,10 +256,15 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 *
 	 * @since 0.7
 	 *
-	 * @param array $attr_spec_list Attribute spec list.
+	 * @param array      $attr_spec_list Attribute spec list.
+	 * @param array|null $attr_aliases   Precomputed attribute names by their alternative names, or null if they are not precomputed for the list.
 	 * @return array Modified attribute spec list.
 	 */
-	private function process_alternate_names( $attr_spec_list ) {
+	private function process_alternate_names( $attr_spec_list, $attr_aliases = null ) {
+		if ( null !== $attr_aliases ) {
+			$this->rev_alternate_attr_name_lookup = array_merge( $this->rev_alternate_attr_name_lookup, $attr_aliases );
+		}
+
 		foreach ( $attr_spec_list as $attr_name => &$attr_spec ) {
 			if ( '[' === $attr_name[0] ) {
 				$placeholder_attr_name = $this->args['amp_bind_placeholder_prefix'] . trim( $attr_name, '[]' );
@@ -234,10 +272,13 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 					$attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] = array();
 				}
 				$attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ][] = $placeholder_attr_name;
+				if ( null !== $attr_aliases ) {
+					$this->rev_alternate_attr_name_lookup[ $placeholder_attr_name ] = $attr_name;
+				}
 			}
 
 			// Save all alternative names in lookup to improve performance.
-			if ( isset( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
+			if ( null === $attr_aliases && isset( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
 				foreach ( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] as $alternative_name ) {
 					$this->rev_alternate_attr_name_lookup[ $alternative_name ] = $attr_name;
 				}
@@ -303,6 +344,9 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 				AMP_Rule_Spec::VALUE     => $extension_spec['name'],
 				AMP_Rule_Spec::MANDATORY => true,
 			);
+			if ( isset( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ] ) ) {
+				$rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['mandatory_attrs'][] = $custom_attr;
+			}
 
 			$versions = array_unique(
 				array_merge(
@@ -330,35 +374,119 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 				if ( empty( $parent_rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['reference_points'] ) ) {
 					continue;
 				}
-				foreach ( $parent_rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['reference_points'] as $reference_point_spec_name => $reference_point_spec_instance_attrs ) {
-					$reference_point = AMP_Allowed_Tags_Generated::get_reference_point_spec( $reference_point_spec_name );
-					if ( empty( $reference_point[ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ) {
-						/*
-						 * See special case for amp-selector in AMP_Tag_And_Attribute_Sanitizer::is_amp_allowed_attribute()
-						 * where its reference point applies to any descendant elements, not just direct children.
-						 */
-						continue;
+				foreach ( $this->get_reference_point_attrs( $parent_rule_spec ) as $attr_name => $reference_point_spec_attr ) {
+					$rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ][ $attr_name ] = $reference_point_spec_attr;
+					if ( isset( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['mandatory_attrs'] ) ) {
+						$rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['mandatory_attrs'] = array_values( array_diff( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['mandatory_attrs'], array( $attr_name ) ) );
 					}
-					foreach ( $reference_point[ AMP_Rule_Spec::ATTR_SPEC_LIST ] as $attr_name => $reference_point_spec_attr ) {
-						$reference_point_spec_attr = array_merge(
-							$reference_point_spec_attr,
-							$reference_point_spec_instance_attrs
-						);
+				}
+			}
+		}
+		return $rule_spec;
+	}
 
-						/*
-						 * Ignore mandatory constraint for now since this would end up causing other sibling children
-						 * getting removed due to missing a mandatory attribute. To sanitize this it would require
-						 * higher-level processing to look at an element's surrounding context, similar to how the
-						 * sanitizer does not yet handle the mandatory_oneof constraint.
-						 */
-						unset( $reference_point_spec_attr['mandatory'] );
+	/**
+	 * Get the attribute specs which the reference points of a rule spec allow on the children of its elements.
+	 *
+	 * @since 1.2
+	 *
+	 * @param array $rule_spec Rule spec with reference points.
+	 * @return array Attribute specs, keyed by attribute name.
+	 */
+	private function get_reference_point_attrs( $rule_spec ) {
+		if ( isset( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ] ) ) {
+			return isset( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['reference_point_attrs'] ) ? $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['reference_point_attrs'] : array();
+		}
+
+		$reference_point_attrs = array();
+		foreach ( $rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['reference_points'] as $reference_point_spec_name => $reference_point_spec_instance_attrs ) {
+			$reference_point = AMP_Allowed_Tags_Generated::get_reference_point_spec( $reference_point_spec_name );
+			if ( empty( $reference_point[ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ) {
+				/*
+				 * See special case for amp-selector in AMP_Tag_And_Attribute_Sanitizer::is_amp_allowed_attribute()
+				 * where its reference point applies to any descendant elements, not just direct children.
+				 */
+				continue;
+			}
+			foreach ( $reference_point[ AMP_Rule_Spec::ATTR_SPEC_LIST ] as $attr_name => $reference_point_spec_attr ) {
+				$reference_point_spec_attr = array_merge(
+					$reference_point_spec_attr,
+					$reference_point_spec_instance_attrs
+				);
+
+				/*
+				 * Ignore mandatory constraint for now since this would end up causing other sibling children
+				 * getting removed due to missing a mandatory attribute. To sanitize this it would require
+				 * higher-level processing to look at an element's surrounding context, similar to how the
+				 * sanitizer does not yet handle the mandatory_oneof constraint.
+				 */
+				unset( $reference_point_spec_attr['mandatory'] );
 
-						$rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ][ $attr_name ] = $reference_point_spec_attr;
+				$reference_point_attrs[ $attr_name ] = $reference_point_spec_attr;
+			}
+		}
+		return $reference_point_attrs;
+	}
+
+	/**
+	 * Get the lists of rule specs of a node's tag to try in turn, narrowed down by the node's attributes.
+	 *
+	 * Like in the AMP validator, an attribute such as script[type], link[rel] or meta[name] which matches
+	 * the dispatch key of some of the generated tag specs narrows the candidates down to them, so that the
+	 * other tag specs do not need to be scored. Some tag specs are only dispatched along with the node's
+	 * parent. If none of the dispatched tag specs allows the node, the tag specs without a dispatch key are
+	 * tried next. Tag specs which the sanitizer args add are always candidates.
+	 *
+	 * @since 1.2
+	 *
+	 * @param DOMElement $node Node.
+	 * @return array[][] Lists of rule specs, keyed by their index in the tag's rule specs.
+	 */
+	private function get_dispatched_rule_spec_lists( $node ) {
+		$rule_spec_list = $this->allowed_tags[ $node->nodeName ];
+		if ( ! isset( $this->generated_tag_spec_counts[ $node->nodeName ] ) || ! $node->hasAttributes() ) {
+			return array( $rule_spec_list );
+		}
+
+		$parent_name = $node->parentNode ? $node->parentNode->nodeName : null;
+		foreach ( $node->attributes as $attr_name => $attr_node ) {
+			$spec_ids = AMP_Allowed_Tags_Generated::get_dispatched_tag_spec_ids( $node->nodeName, $attr_name, $attr_node->nodeValue, $parent_name );
+			if ( empty( $spec_ids ) ) {
+				continue;
+			}
+
+			$generated_rule_spec_list = array_slice( $rule_spec_list, 0, $this->generated_tag_spec_counts[ $node->nodeName ], true );
+			if ( ! isset( $this->undispatched_tag_spec_ids[ $node->nodeName ] ) ) {
+				$this->undispatched_tag_spec_ids[ $node->nodeName ] = array();
+				foreach ( $generated_rule_spec_list as $id => $rule_spec ) {
+					if ( ! $this->has_dispatch_key( $rule_spec ) ) {
+						$this->undispatched_tag_spec_ids[ $node->nodeName ][ $id ] = true;
 					}
 				}
 			}
+			return array(
+				array_intersect_key( $rule_spec_list, array_flip( $spec_ids ) ) + array_diff_key( $rule_spec_list, $generated_rule_spec_list ),
+				array_intersect_key( $rule_spec_list, $this->undispatched_tag_spec_ids[ $node->nodeName ] ),
+			);
 		}
-		return $rule_spec;
+		return array( $rule_spec_list );
+	}
+
+	/**
+	 * Determine whether any attribute spec of a rule spec has a dispatch key.
+	 *
+	 * @since 1.2
+	 *
+	 * @param array $rule_spec Rule spec.
+	 * @return bool Whether the rule spec is dispatched by an attribute.
+	 */
+	private function has_dispatch_key( $rule_spec ) {
+		foreach ( $rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] as $attr_spec ) {
+			if ( isset( $attr_spec['dispatch_key'] ) ) {
+				return true;
+			}
+		}
+		return false;
 	}
 
 	/**
@@ -397,13 +525,18 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		 * based on tag name of the node.
 		 */
 		$rule_spec_list_to_validate = array();
-		$rule_spec_list             = array();
+		$rule_spec_lists            = array();
 		if ( isset( $this->allowed_tags[ $node->nodeName ] ) ) {
-			$rule_spec_list = $this->allowed_tags[ $node->nodeName ];
+			$rule_spec_lists = $this->get_dispatched_rule_spec_lists( $node );
 		}
-		foreach ( $rule_spec_list as $id => $rule_spec ) {
-			if ( $this->validate_tag_spec_for_node( $node, $rule_spec[ AMP_Rule_Spec::TAG_SPEC ] ) ) {
-				$rule_spec_list_to_validate[ $id ] = $this->get_rule_spec_list_to_validate( $node, $rule_spec );
+		foreach ( $rule_spec_lists as $rule_spec_list ) {
+			foreach ( $rule_spec_list as $id => $rule_spec ) {
+				if ( $this->validate_tag_spec_for_node( $node, $rule_spec[ AMP_Rule_Spec::TAG_SPEC ] ) ) {
+					$rule_spec_list_to_validate[ $id ] = $this->get_rule_spec_list_to_validate( $node, $rule_spec );
+				}
+			}
+			if ( ! empty( $rule_spec_list_to_validate ) ) {
+				break;
 			}
 		}
 
@@ -414,9 +547,12 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		}
 
 		// The remaining validations all have to do with attributes.
-		$attr_spec_list = array();
-		$tag_spec       = array();
-		$cdata          = array();
+		$attr_spec_list      = array();
+		$tag_spec            = array();
+		$cdata               = array();
+		$mandatory_attrs     = null;
+		$supported_layouts   = null;
+		$required_extensions = null;
 
 		/*
 		 * If we have exactly one rule_spec, use it's attr_spec_list
@@ -429,6 +565,11 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			if ( isset( $rule_spec[ AMP_Rule_Spec::CDATA ] ) ) {
 				$cdata = $rule_spec[ AMP_Rule_Spec::CDATA ];
 			}
+			$mandatory_attrs     = $this->get_precomputed_mandatory_attrs( $rule_spec );
+			$required_extensions = $this->get_precomputed_required_extensions( $rule_spec );
+			if ( isset( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['supported_layouts'] ) ) {
+				$supported_layouts = array_keys( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['supported_layouts'] );
+			}
 		} else {
 			/*
 			 * If there is more than one valid rule_spec for this node,
@@ -464,13 +605,18 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 				if ( isset( $rule_spec_list_to_validate[ $spec_ids_sorted[0] ][ AMP_Rule_Spec::CDATA ] ) ) {
 					$cdata = $rule_spec_list_to_validate[ $spec_ids_sorted[0] ][ AMP_Rule_Spec::CDATA ];
 				}
+				$mandatory_attrs     = $this->get_precomputed_mandatory_attrs( $rule_spec_list_to_validate[ $spec_ids_sorted[0] ] );
+				$required_extensions = $this->get_precomputed_required_extensions( $rule_spec_list_to_validate[ $spec_ids_sorted[0] ] );
+				if ( isset( $rule_spec_list_to_validate[ $spec_ids_sorted[0] ][ AMP_Rule_Spec::PRECOMPUTED ]['supported_layouts'] ) ) {
+					$supported_layouts = array_keys( $rule_spec_list_to_validate[ $spec_ids_sorted[0] ][ AMP_Rule_Spec::PRECOMPUTED ]['supported_layouts'] );
+				}
 			} else {
 				// This should not happen very often, but...
 				// If we're here, then we're not sure which spec should
 				// be used. Let's use the top scoring ones.
 				foreach ( $spec_ids_sorted as $id ) {
 					$spec_list = isset( $rule_spec_list_to_validate[ $id ][ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ? $rule_spec_list_to_validate[ $id ][ AMP_Rule_Spec::ATTR_SPEC_LIST ] : null;
-					if ( ! $this->is_missing_mandatory_attribute( $spec_list, $node ) ) {
+					if ( ! $this->is_missing_mandatory_attribute( $spec_list, $node, $this->get_precomputed_mandatory_attrs( $rule_spec_list_to_validate[ $id ] ) ) ) {
 						$attr_spec_list = array_merge( $attr_spec_list, $spec_list );
 						$tag_spec       = array_merge(
 							$tag_spec,
@@ -488,7 +634,12 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			}
 		}
 
-		if ( ! empty( $attr_spec_list ) && $this->is_missing_mandatory_attribute( $attr_spec_list, $node ) ) {
+		// Only the tag specs of a class generated with --instrument-spec-matches have a profile key.
+		if ( isset( $tag_spec['profile_key'] ) ) {
+			AMP_Allowed_Tags_Generated::record_spec_match( $node->nodeName, $tag_spec['profile_key'] );
+		}
+
+		if ( ! empty( $attr_spec_list ) && $this->is_missing_mandatory_attribute( $attr_spec_list, $node, $mandatory_attrs ) ) {
 			$this->remove_node( $node );
 			return;
 		}
@@ -512,9 +663,14 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			$merged_attr_spec_list = array_merge( $merged_attr_spec_list, $this->layout_allowed_attributes );
 
 			if ( isset( $tag_spec['amp_layout']['supported_layouts'] ) ) {
-				$layouts = wp_array_slice_assoc( AMP_Rule_Spec::$layout_enum, $tag_spec['amp_layout']['supported_layouts'] );
+				if ( null !== $supported_layouts ) {
+					$layouts = $supported_layouts;
+				} else {
+					$layouts = wp_array_slice_assoc( AMP_Rule_Spec::$layout_enum, $tag_spec['amp_layout']['supported_layouts'] );
+				}
 
 				$merged_attr_spec_list['layout'][ AMP_Rule_Spec::VALUE_REGEX_CASEI ] = '(' . implode( '|', $layouts ) . ')';
+				unset( $merged_attr_spec_list['layout'][ AMP_Rule_Spec::VALUE_REGEX_CASEI_PCRE ] );
 			}
 		}
 
@@ -565,11 +721,15 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 
 		// Add required AMP component scripts if the element is still in the document.
 		if ( $node->parentNode ) {
-			if ( ! empty( $tag_spec['also_requires_tag_warning'] ) ) {
-				$this->script_components[] = strtok( $tag_spec['also_requires_tag_warning'][0], ' ' );
-			}
-			if ( ! empty( $tag_spec['requires_extension'] ) ) {
-				$this->script_components = array_merge( $this->script_components, $tag_spec['requires_extension'] );
+			if ( null !== $required_extensions ) {
+				$this->script_components = array_merge( $this->script_components, $required_extensions );
+			} else {
+				if ( ! empty( $tag_spec['also_requires_tag_warning'] ) ) {
+					$this->script_components[] = strtok( $tag_spec['also_requires_tag_warning'][0], ' ' );
+				}
+				if ( ! empty( $tag_spec['requires_extension'] ) ) {
+					$this->script_components = array_merge( $this->script_components, $tag_spec['requires_extension'] );
+				}
 			}
 
 			// Add required AMP components for attributes.
@@ -601,22 +761,61 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		}
 	}
 
+	/**
+	 * Get the precomputed names of the mandatory attributes of a rule spec.
+	 *
+	 * @since 1.2
+	 *
+	 * @param array $rule_spec Rule spec.
+	 * @return string[]|null Attribute names, or null if they are not precomputed for the rule spec.
+	 */
+	private function get_precomputed_mandatory_attrs( $rule_spec ) {
+		if ( ! isset( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ] ) ) {
+			return null;
+		}
+		return isset( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['mandatory_attrs'] ) ? $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['mandatory_attrs'] : array();
+	}
+
+	/**
+	 * Get the precomputed names of the extensions a rule spec requires, including through the tags it requires.
+	 *
+	 * @since 1.2
+	 *
+	 * @param array $rule_spec Rule spec.
+	 * @return string[]|null Extension names, or null if they are not precomputed for the rule spec.
+	 */
+	private function get_precomputed_required_extensions( $rule_spec ) {
+		if ( ! isset( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ] ) ) {
+			return null;
+		}
+		return isset( $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['required_extensions'] ) ? $rule_spec[ AMP_Rule_Spec::PRECOMPUTED ]['required_extensions'] : array();
+	}
+
 	/**
 	 * Whether a node is missing a mandatory attribute.
 	 *
-	 * @param array      $attr_spec The attribute specification.
-	 * @param DOMElement $node      The DOMElement of the node to check.
+	 * @param array         $attr_spec       The attribute specification.
+	 * @param DOMElement    $node            The DOMElement of the node to check.
+	 * @param string[]|null $mandatory_attrs Precomputed names of the mandatory attributes of the specification, or null to look for them (since 1.2).
 	 * @return boolean $is_missing boolean Whether a required attribute is missing.
 	 */
-	public function is_missing_mandatory_attribute( $attr_spec, $node ) {
+	public function is_missing_mandatory_attribute( $attr_spec, $node, $mandatory_attrs = null ) {
 		if ( ! is_array( $attr_spec ) ) {
 			return false;
 		}
-		foreach ( $attr_spec as $attr_name => $attr_spec_rule_value ) {
+		if ( null === $mandatory_attrs ) {
+			$mandatory_attrs = array();
+			foreach ( $attr_spec as $attr_name => $attr_spec_rule_value ) {
+				if ( isset( $attr_spec_rule_value[ AMP_Rule_Spec::MANDATORY ] ) && true === $attr_spec_rule_value[ AMP_Rule_Spec::MANDATORY ] ) {
+					$mandatory_attrs[] = $attr_name;
+				}
+			}
+		}
+		foreach ( $mandatory_attrs as $attr_name ) {
+			$attr_spec_rule_value = isset( $attr_spec[ $attr_name ] ) ? $attr_spec[ $attr_name ] : array();
 			if ( '\u' === substr( $attr_name, 0, 2 ) ) {
 				$attr_name = html_entity_decode( '&#x' . substr( $attr_name, 2 ) . ';' ); // Probably ⚡.
 			}
-			$is_mandatory     = isset( $attr_spec_rule_value[ AMP_Rule_Spec::MANDATORY ] ) ? ( true === $attr_spec_rule_value[ AMP_Rule_Spec::MANDATORY ] ) : false;
 			$attribute_exists = false;
 			if ( method_exists( $node, 'hasAttribute' ) ) {
 				$attribute_exists = $node->hasAttribute( $attr_name );
@@ -629,7 +828,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 					}
 				}
 			}
-			if ( $is_mandatory && ! $attribute_exists ) {
+			if ( ! $attribute_exists ) {
 				return true;
 			}
 		}
@@ -647,12 +846,22 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	private function validate_cdata_for_node( $element, $cdata_spec ) {
 		if ( isset( $cdata_spec['blacklisted_cdata_regex'] ) ) {
-			if ( preg_match( '@' . $cdata_spec['blacklisted_cdata_regex']['regex'] . '@u', $element->textContent ) ) {
+			if ( isset( $cdata_spec['blacklisted_cdata_regex_pcre'] ) ) {
+				$pattern = $cdata_spec['blacklisted_cdata_regex_pcre'];
+			} else {
+				$pattern = '@' . $cdata_spec['blacklisted_cdata_regex']['regex'] . '@u';
+			}
+			if ( preg_match( $pattern, $element->textContent ) ) {
 				return new WP_Error( $cdata_spec['blacklisted_cdata_regex']['error_message'] );
 			}
 		} elseif ( isset( $cdata_spec['cdata_regex'] ) ) {
-			$delimiter = false === strpos( $cdata_spec['cdata_regex'], '@' ) ? '@' : '#';
-			if ( ! preg_match( $delimiter . $cdata_spec['cdata_regex'] . $delimiter . 'u', $element->textContent ) ) {
+			if ( isset( $cdata_spec['cdata_regex_pcre'] ) ) {
+				$pattern = $cdata_spec['cdata_regex_pcre'];
+			} else {
+				$delimiter = false === strpos( $cdata_spec['cdata_regex'], '@' ) ? '@' : '#';
+				$pattern   = $delimiter . $cdata_spec['cdata_regex'] . $delimiter . 'u';
+			}
+			if ( ! preg_match( $pattern, $element->textContent ) ) {
 				return new WP_Error( 'cdata_regex' );
 			}
 		}
@@ -697,9 +906,12 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		}
 
 		if ( ! empty( $tag_spec[ AMP_Rule_Spec::DESCENDANT_TAG_LIST ] ) ) {
-			$allowed_tags = AMP_Allowed_Tags_Generated::get_descendant_tag_list( $tag_spec[ AMP_Rule_Spec::DESCENDANT_TAG_LIST ] );
-			if ( ! empty( $allowed_tags ) ) {
-				$this->remove_disallowed_descendants( $node, $allowed_tags );
+			$descendant_tag_list = $tag_spec[ AMP_Rule_Spec::DESCENDANT_TAG_LIST ];
+			if ( ! isset( $this->descendant_tag_sets[ $descendant_tag_list ] ) ) {
+				$this->descendant_tag_sets[ $descendant_tag_list ] = array_fill_keys( (array) AMP_Allowed_Tags_Generated::get_descendant_tag_list( $descendant_tag_list ), true );
+			}
+			if ( ! empty( $this->descendant_tag_sets[ $descendant_tag_list ] ) ) {
+				$this->remove_disallowed_descendants( $node, $this->descendant_tag_sets[ $descendant_tag_list ] );
 			}
 		}
 
@@ -791,7 +1003,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * Check 'value' - case sensitive
 			 * Given attribute's value must exactly equal value of the rule to pass.
 			 */
-			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE ] ) ) {
+			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE ] ) || isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_SET ] ) ) {
 				$result = $this->check_attr_spec_rule_value( $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
@@ -819,7 +1031,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * Given attribute's value must be a case insensitive match to the value of
 			 * the rule to pass.
 			 */
-			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_CASEI ] ) ) {
+			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_CASEI ] ) || isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_CASEI_SET ] ) ) {
 				$result = $this->check_attr_spec_rule_value_casei( $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
@@ -846,7 +1058,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * If given attribute's value is a URL with a protocol, the protocol must
 			 * be in the array specified by the rule's value to pass.
 			 */
-			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL ] ) ) {
+			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL ] ) || isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL_SET ] ) ) {
 				$result = $this->check_attr_spec_rule_allowed_protocol( $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
@@ -1031,10 +1243,10 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			$should_remove_node = false;
 			$attr_spec_rule     = $attr_spec_list[ $attr_name ];
 
-			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE ] ) &&
+			if ( ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE ] ) || isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_SET ] ) ) &&
 				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_value( $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
-			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_CASEI ] ) &&
+			} elseif ( ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_CASEI ] ) || isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_CASEI_SET ] ) ) &&
 				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_value_casei( $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX ] ) &&
@@ -1043,7 +1255,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI ] ) &&
 				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_value_regex_casei( $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
-			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL ] ) &&
+			} elseif ( ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL ] ) || isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL_SET ] ) ) &&
 				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_allowed_protocol( $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ] ) &&
@@ -1140,9 +1352,10 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 *                                        is no rule for this attribute.
 	 */
 	private function check_attr_spec_rule_value( $node, $attr_name, $attr_spec_rule ) {
-		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE ] ) ) {
+		$spec_values = $this->get_enum_set( $attr_spec_rule, AMP_Rule_Spec::VALUE, AMP_Rule_Spec::VALUE_SET );
+		if ( isset( $spec_values ) ) {
 			if ( $node->hasAttribute( $attr_name ) ) {
-				if ( $this->check_matching_attribute_value( $attr_name, $node->getAttribute( $attr_name ), $attr_spec_rule[ AMP_Rule_Spec::VALUE ] ) ) {
+				if ( $this->check_matching_attribute_value( $attr_name, $node->getAttribute( $attr_name ), $spec_values ) ) {
 					return AMP_Rule_Spec::PASS;
 				} else {
 					return AMP_Rule_Spec::FAIL;
@@ -1150,7 +1363,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
 				foreach ( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] as $alternative_name ) {
 					if ( $node->hasAttribute( $alternative_name ) ) {
-						if ( $this->check_matching_attribute_value( $attr_name, $node->getAttribute( $alternative_name ), $attr_spec_rule[ AMP_Rule_Spec::VALUE ] ) ) {
+						if ( $this->check_matching_attribute_value( $attr_name, $node->getAttribute( $alternative_name ), $spec_values ) ) {
 							return AMP_Rule_Spec::PASS;
 						} else {
 							return AMP_Rule_Spec::FAIL;
@@ -1169,34 +1382,55 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 *
 	 * @since 0.7.0
 	 * @since 1.0.0 The spec value is now an array.
+	 * @since 1.2.0 The spec values are now a set.
 	 *
-	 * @param string       $attr_name   Attribute name.
-	 * @param string       $attr_value  Attribute value.
-	 * @param string|array $spec_values Attribute spec value(s).
+	 * @param string $attr_name   Attribute name.
+	 * @param string $attr_value  Attribute value.
+	 * @param array  $spec_values Attribute spec values, as keys.
 	 * @return bool Is value valid.
 	 */
 	private function check_matching_attribute_value( $attr_name, $attr_value, $spec_values ) {
-		if ( is_string( $spec_values ) ) {
-			$spec_values = (array) $spec_values;
+		if ( isset( $spec_values[ $attr_value ] ) ) {
+			return true;
 		}
-		foreach ( $spec_values as $spec_value ) {
-			if ( $spec_value === $attr_value ) {
-				return true;
-			}
 
-			// Check for boolean attribute.
-			$is_bool_match = (
-				'' === $spec_value
-				&&
-				in_array( $attr_name, AMP_Rule_Spec::$boolean_attributes, true )
-				&&
-				strtolower( $attr_value ) === strtolower( $attr_name )
-			);
-			if ( $is_bool_match ) {
-				return true;
-			}
+		// Check for boolean attribute.
+		return (
+			isset( $spec_values[''] )
+			&&
+			in_array( $attr_name, AMP_Rule_Spec::$boolean_attributes, true )
+			&&
+			strtolower( $attr_value ) === strtolower( $attr_name )
+		);
+	}
+
+	/**
+	 * Get an enumeration of a spec as a set, for looking up values with isset() rather than in_array().
+	 *
+	 * The generated specs have the set next to the list, or instead of it when generated with
+	 * `--enum-format=set`. For other specs, such as the ones passed in the sanitizer args, the
+	 * set is built from the list.
+	 *
+	 * @since 1.2
+	 *
+	 * @param array  $spec     Spec.
+	 * @param string $list_key Key of the enumeration as a list.
+	 * @param string $set_key  Key of the enumeration as a set.
+	 * @param bool   $casei    Whether the values are case-insensitive, in which case the set is lowercase.
+	 * @return array|null Set of values as keys, or null if the spec has no such enumeration.
+	 */
+	private function get_enum_set( $spec, $list_key, $set_key, $casei = false ) {
+		if ( isset( $spec[ $set_key ] ) ) {
+			return $spec[ $set_key ];
 		}
-		return false;
+		if ( ! isset( $spec[ $list_key ] ) ) {
+			return null;
+		}
+		$values = (array) $spec[ $list_key ];
+		if ( $casei ) {
+			$values = array_map( 'strtolower', $values );
+		}
+		return array_fill_keys( $values, true );
 	}
 
 	/**
@@ -1213,30 +1447,25 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 *                                        is no rule for this attribute.
 	 */
 	private function check_attr_spec_rule_value_casei( $node, $attr_name, $attr_spec_rule ) {
-		if ( ! isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_CASEI ] ) ) {
+		$rule_values = $this->get_enum_set( $attr_spec_rule, AMP_Rule_Spec::VALUE_CASEI, AMP_Rule_Spec::VALUE_CASEI_SET, true );
+		if ( empty( $rule_values ) ) {
 			return AMP_Rule_Spec::NOT_APPLICABLE;
 		}
 
-		$result      = AMP_Rule_Spec::NOT_APPLICABLE;
-		$rule_values = (array) $attr_spec_rule[ AMP_Rule_Spec::VALUE_CASEI ];
-		foreach ( $rule_values as $rule_value ) {
-			$rule_value = strtolower( $rule_value );
-			if ( $node->hasAttribute( $attr_name ) ) {
-				$attr_value = strtolower( $node->getAttribute( $attr_name ) );
-				if ( $attr_value === (string) $rule_value ) {
-					return AMP_Rule_Spec::PASS;
-				} else {
-					$result = AMP_Rule_Spec::FAIL;
-				}
-			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
-				foreach ( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] as $alternative_name ) {
-					if ( $node->hasAttribute( $alternative_name ) ) {
-						$attr_value = strtolower( $node->getAttribute( $alternative_name ) );
-						if ( $attr_value === (string) $rule_value ) {
-							return AMP_Rule_Spec::PASS;
-						} else {
-							$result = AMP_Rule_Spec::FAIL;
-						}
+		$result = AMP_Rule_Spec::NOT_APPLICABLE;
+		if ( $node->hasAttribute( $attr_name ) ) {
+			if ( isset( $rule_values[ strtolower( $node->getAttribute( $attr_name ) ) ] ) ) {
+				return AMP_Rule_Spec::PASS;
+			} else {
+				$result = AMP_Rule_Spec::FAIL;
+			}
+		} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
+			foreach ( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] as $alternative_name ) {
+				if ( $node->hasAttribute( $alternative_name ) ) {
+					if ( isset( $rule_values[ strtolower( $node->getAttribute( $alternative_name ) ) ] ) ) {
+						return AMP_Rule_Spec::PASS;
+					} else {
+						$result = AMP_Rule_Spec::FAIL;
 					}
 				}
 			}
@@ -1260,16 +1489,22 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	private function check_attr_spec_rule_value_regex( $node, $attr_name, $attr_spec_rule ) {
 		// Check 'value_regex' - case sensitive regex match.
 		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX ] ) && $node->hasAttribute( $attr_name ) ) {
-			$rule_value = $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX ];
-			$rule_value = str_replace( '/', '\\/', $rule_value );
-
-			/*
-			 * The regex pattern has '^' and '$' though they are not in the AMP spec.
-			 * Leaving them out would allow both '_blank' and 'yyy_blankzzz' to be
-			 * matched by a regex rule of '(_blank|_self|_top)'. As the AMP JS validator
-			 * only accepts '_blank' we leave it this way for now.
-			 */
-			if ( preg_match( '/^(' . $rule_value . ')$/u', $node->getAttribute( $attr_name ) ) ) {
+			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_PCRE ] ) ) {
+				$pattern = $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_PCRE ];
+			} else {
+				$rule_value = $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX ];
+				$rule_value = str_replace( '/', '\\/', $rule_value );
+
+				/*
+				 * The regex pattern has '^' and '$' though they are not in the AMP spec.
+				 * Leaving them out would allow both '_blank' and 'yyy_blankzzz' to be
+				 * matched by a regex rule of '(_blank|_self|_top)'. As the AMP JS validator
+				 * only accepts '_blank' we leave it this way for now. The generated specs
+				 * have the pattern with these anchors already.
+				 */
+				$pattern = '/^(' . $rule_value . ')$/u';
+			}
+			if ( preg_match( $pattern, $node->getAttribute( $attr_name ) ) ) {
 				return AMP_Rule_Spec::PASS;
 			} else {
 				return AMP_Rule_Spec::FAIL;
@@ -1296,11 +1531,16 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		 * Check 'value_regex_casei' - case insensitive regex match
 		 */
 		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI ] ) && $node->hasAttribute( $attr_name ) ) {
-			$rule_value = $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI ];
-			$rule_value = str_replace( '/', '\\/', $rule_value );
+			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI_PCRE ] ) ) {
+				$pattern = $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI_PCRE ];
+			} else {
+				$rule_value = $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI ];
+				$rule_value = str_replace( '/', '\\/', $rule_value );
 
-			// See note above regarding the '^' and '$' that are added here.
-			if ( preg_match( '/^(' . $rule_value . ')$/ui', $node->getAttribute( $attr_name ) ) ) {
+				// See note above regarding the '^' and '$' that are added here.
+				$pattern = '/^(' . $rule_value . ')$/ui';
+			}
+			if ( preg_match( $pattern, $node->getAttribute( $attr_name ) ) ) {
 				return AMP_Rule_Spec::PASS;
 			} else {
 				return AMP_Rule_Spec::FAIL;
@@ -1383,11 +1623,12 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 *                                        is no rule for this attribute.
 	 */
 	private function check_attr_spec_rule_allowed_protocol( $node, $attr_name, $attr_spec_rule ) {
-		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL ] ) ) {
+		$allowed_protocols = isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ] ) ? $this->get_enum_set( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ], AMP_Rule_Spec::ALLOWED_PROTOCOL, AMP_Rule_Spec::ALLOWED_PROTOCOL_SET ) : null;
+		if ( isset( $allowed_protocols ) ) {
 			if ( $node->hasAttribute( $attr_name ) ) {
 				foreach ( $this->extract_attribute_urls( $node->getAttributeNode( $attr_name ) ) as $url ) {
 					$url_scheme = $this->parse_protocol( $url );
-					if ( isset( $url_scheme ) && ! in_array( strtolower( $url_scheme ), $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL ], true ) ) {
+					if ( isset( $url_scheme ) && ! isset( $allowed_protocols[ strtolower( $url_scheme ) ] ) ) {
 						return AMP_Rule_Spec::FAIL;
 					}
 				}
@@ -1397,7 +1638,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 					if ( $node->hasAttribute( $alternative_name ) ) {
 						foreach ( $this->extract_attribute_urls( $node->getAttributeNode( $alternative_name ), $attr_name ) as $url ) {
 							$url_scheme = $this->parse_protocol( $url );
-							if ( isset( $url_scheme ) && ! in_array( strtolower( $url_scheme ), $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL ], true ) ) {
+							if ( isset( $url_scheme ) && ! isset( $allowed_protocols[ strtolower( $url_scheme ) ] ) ) {
 								return AMP_Rule_Spec::FAIL;
 							}
 						}
@@ -1558,7 +1799,11 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	private function check_attr_spec_rule_blacklisted_value_regex( $node, $attr_name, $attr_spec_rule ) {
 		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX ] ) ) {
-			$pattern = '/' . $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX ] . '/u';
+			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX_PCRE ] ) ) {
+				$pattern = $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX_PCRE ];
+			} else {
+				$pattern = '/' . $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX ] . '/u';
+			}
 			if ( $node->hasAttribute( $attr_name ) ) {
 				$attr_value = $node->getAttribute( $attr_name );
 				if ( preg_match( $pattern, $attr_value ) ) {
@@ -1820,8 +2065,10 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	/**
 	 * Loop through node's descendants and remove the ones that are not whitelisted.
 	 *
+	 * @since 1.2 The allowed descendant tags are now a set.
+	 *
 	 * @param DOMNode $node Node.
-	 * @param array   $allowed_descendants List of allowed descendant tags.
+	 * @param array   $allowed_descendants Set of allowed descendant tags, as keys.
 	 */
 	private function remove_disallowed_descendants( $node, $allowed_descendants ) {
 		if ( ! $node->hasChildNodes() ) {
@@ -1837,7 +2084,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		}
 
 		foreach ( $child_elements as $child_element ) {
-			if ( ! in_array( $child_element->nodeName, $allowed_descendants, true ) ) {
+			if ( ! isset( $allowed_descendants[ $child_element->nodeName ] ) ) {
 				$this->remove_invalid_child( $child_element );
 			} else {
 				$this->remove_disallowed_descendants( $child_element, $allowed_descendants );
@@ -1852,10 +2099,12 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 * @param array   $child_tags {
 	 *     List of allowed child tags.
 	 *
-	 *     @type array $first_child_tag_name_oneof   List of tag names that are allowed as the first element child.
-	 *     @type array $child_tag_name_oneof         List of tag names that are allowed as children.
-	 *     @type int   $mandatory_num_child_tags     Mandatory number of child tags.
-	 *     @type int   $mandatory_min_num_child_tags Mandatory minimum number of child tags.
+	 *     @type array $first_child_tag_name_oneof     List of tag names that are allowed as the first element child.
+	 *     @type array $first_child_tag_name_oneof_set Set of the same tag names, as keys.
+	 *     @type array $child_tag_name_oneof           List of tag names that are allowed as children.
+	 *     @type array $child_tag_name_oneof_set       Set of the same tag names, as keys.
+	 *     @type int   $mandatory_num_child_tags       Mandatory number of child tags.
+	 *     @type int   $mandatory_min_num_child_tags   Mandatory minimum number of child tags.
 	 * }
 	 * @return bool Whether the element satisfies the requirements, or else it should be removed.
 	 */
@@ -1869,15 +2118,17 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		}
 
 		// If the first element is not of the required type, invalidate the entire element.
-		if ( isset( $child_tags['first_child_tag_name_oneof'] ) && ! empty( $child_elements[0] ) && ! in_array( $child_elements[0]->nodeName, $child_tags['first_child_tag_name_oneof'], true ) ) {
+		$first_child_tag_names = $this->get_enum_set( $child_tags, 'first_child_tag_name_oneof', 'first_child_tag_name_oneof_set' );
+		if ( isset( $first_child_tag_names ) && ! empty( $child_elements[0] ) && ! isset( $first_child_tag_names[ $child_elements[0]->nodeName ] ) ) {
 			return false;
 		}
 
 		// Verify that all of the child are among the set of allowed elements.
-		$removed_count = 0;
-		if ( isset( $child_tags['child_tag_name_oneof'] ) ) {
+		$removed_count   = 0;
+		$child_tag_names = $this->get_enum_set( $child_tags, 'child_tag_name_oneof', 'child_tag_name_oneof_set' );
+		if ( isset( $child_tag_names ) ) {
 			foreach ( $child_elements as $child_element ) {
-				if ( ! in_array( $child_element->nodeName, $child_tags['child_tag_name_oneof'], true ) ) {
+				if ( ! isset( $child_tag_names[ $child_element->nodeName ] ) ) {
 					$removed_count++;
 					$this->remove_invalid_child( $child_element );
 				}
@@ -0,0 +1,159 @@
+<?php
+/**
+ * Benchmark of cold loading the generated allowed tags in each format.
+ *
+ * Generate the class in each format to compare into its own directory, for example with
+ * `bin/amphtml-update.py <amphtml-dir> --output=/tmp/serialize/class-amp-allowed-tags-generated.php --snapshot-format=serialize`,
+ * and pass the generated class files to this script, which does not need WordPress:
+ *
+ *     php tests/benchmark/load-allowed-tags.php /tmp/php/class-amp-allowed-tags-generated.php /tmp/serialize/class-amp-allowed-tags-generated.php [...]
+ *
+ * Each load happens in a new PHP process with opcache disabled, like on a cold worker without opcache.
+ * Set the ITERATIONS environment variable to change the number of processes per file; the median is reported.
+ *
+ * With --footprint, the footprint of a single class file is written to STDOUT as JSON instead, which
+ * `bin/amphtml-update.py --footprint` compares with a baseline. Besides the medians of the loads, it has
+ * the memory the class takes up in opcache and the size of the strings it adds to the interned strings
+ * buffer, if the opcache extension is available:
+ *
+ *     php tests/benchmark/load-allowed-tags.php --footprint /tmp/php/class-amp-allowed-tags-generated.php
+ *
+ * @package AMP
+ */
+
+// phpcs:disable WordPress.WP.AlternativeFunctions, WordPress.Security.EscapeOutput.OutputNotEscaped, WordPress.PHP.DiscouragedPHPFunctions
+
+if ( isset( $argv[1] ) && '--load' === $argv[1] ) {
+	$memory = memory_get_usage();
+	$start  = microtime( true );
+	require $argv[2];
+	$compile = microtime( true ) - $start;
+	AMP_Allowed_Tags_Generated::get_allowed_tag( 'a' );
+	$first_access = microtime( true ) - $start;
+	AMP_Allowed_Tags_Generated::get_allowed_tags();
+	echo json_encode(
+		array(
+			'compile'      => $compile,
+			'first_access' => $first_access,
+			'all_tags'     => microtime( true ) - $start,
+			'memory'       => memory_get_usage() - $memory,
+			'peak_memory'  => memory_get_peak_usage(),
+		)
+	);
+	exit;
+}
+
+if ( isset( $argv[1] ) && '--load-opcache' === $argv[1] ) {
+	$status = function_exists( 'opcache_get_status' ) ? opcache_get_status( false ) : false;
+	if ( ! $status ) {
+		echo json_encode( array() );
+		exit;
+	}
+	$interned_strings = $status['interned_strings_usage']['used_memory'];
+	require $argv[2];
+	AMP_Allowed_Tags_Generated::get_allowed_tags();
+	$status = opcache_get_status( true );
+	$script = realpath( $argv[2] );
+	echo json_encode(
+		array(
+			'opcache_memory'           => isset( $status['scripts'][ $script ] ) ? $status['scripts'][ $script ]['memory_consumption'] : null,
+			'opcache_interned_strings' => $status['interned_strings_usage']['used_memory'] - $interned_strings,
+		)
+	);
+	exit;
+}
+
+$footprint = isset( $argv[1] ) && '--footprint' === $argv[1];
+$files     = array_slice( $argv, $footprint ? 2 : 1 );
+if ( empty( $files ) || ( $footprint && count( $files ) > 1 ) ) {
+	fwrite( STDERR, "Usage: php tests/benchmark/load-allowed-tags.php <class-file>...\n" );
+	fwrite( STDERR, "       php tests/benchmark/load-allowed-tags.php --footprint <class-file>\n" );
+	exit( 1 );
+}
+
+$iterations = getenv( 'ITERATIONS' ) ? max( 1, (int) getenv( 'ITERATIONS' ) ) : 11;
+
+/**
+ * Get the median of a list of numbers.
+ *
+ * @param float[] $values Numbers.
+ * @return float Median.
+ */
+function amp_benchmark_median( $values ) {
+	sort( $values );
+	return $values[ (int) floor( count( $values ) / 2 ) ];
+}
+
+/**
+ * Run this script in a new PHP process to load a class file.
+ *
+ * @param string $mode    Either '--load' or '--load-opcache'.
+ * @param string $file    Class file.
+ * @param array  $ini_set PHP settings of the process.
+ * @return array Measurements.
+ */
+function amp_benchmark_run( $mode, $file, $ini_set ) {
+	$command = escapeshellarg( PHP_BINARY );
+	foreach ( $ini_set as $name => $value ) {
+		$command .= sprintf( ' -d %s=%s', $name, escapeshellarg( $value ) );
+	}
+	$command .= sprintf( ' %s %s %s', escapeshellarg( __FILE__ ), $mode, escapeshellarg( realpath( $file ) ) );
+
+	$result = json_decode( shell_exec( $command ), true );
+	if ( ! is_array( $result ) ) {
+		fwrite( STDERR, "Loading $file failed.\n" );
+		exit( 1 );
+	}
+	return $result;
+}
+
+/**
+ * Get the medians of loading a class file in new PHP processes with opcache disabled.
+ *
+ * @param string $file       Class file.
+ * @param int    $iterations Number of processes.
+ * @return array Median of each measurement.
+ */
+function amp_benchmark_load( $file, $iterations ) {
+	$results = array();
+	for ( $i = 0; $i < $iterations; $i++ ) {
+		foreach ( amp_benchmark_run( '--load', $file, array( 'opcache.enable_cli' => '0' ) ) as $key => $value ) {
+			$results[ $key ][] = $value;
+		}
+	}
+	return array_map( 'amp_benchmark_median', $results );
+}
+
+if ( $footprint ) {
+	$result = amp_benchmark_load( $files[0], $iterations );
+	$result = array_merge(
+		array( 'php_version' => PHP_VERSION ),
+		$result,
+		amp_benchmark_run(
+			'--load-opcache',
+			$files[0],
+			array(
+				'opcache.enable'                  => '1',
+				'opcache.enable_cli'              => '1',
+				'opcache.memory_consumption'      => '256',
+				'opcache.interned_strings_buffer' => '64',
+			)
+		)
+	);
+	echo json_encode( $result ) . "\n";
+	exit;
+}
+
+printf( "%-60s %12s %12s %12s %12s %12s\n", 'File', 'Compile (ms)', 'First (ms)', 'All (ms)', 'Memory (MB)', 'Peak (MB)' );
+foreach ( $files as $file ) {
+	$result = amp_benchmark_load( $file, $iterations );
+	printf(
+		"%-60s %12.2f %12.2f %12.2f %12.1f %12.1f\n",
+		$file,
+		$result['compile'] * 1000,
+		$result['first_access'] * 1000,
+		$result['all_tags'] * 1000,
+		$result['memory'] / 1024 / 1024,
+		$result['peak_memory'] / 1024 / 1024
+	);
+}
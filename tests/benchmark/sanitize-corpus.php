@@ -0,0 +1,66 @@
+<?php
+/**
+ * Benchmark of the tag and attribute sanitizer over a corpus of HTML documents.
+ *
+ * Run it with WP-CLI from a site with the plugin active, passing a directory of HTML files:
+ *
+ *     wp eval-file tests/benchmark/sanitize-corpus.php /path/to/corpus [iterations]
+ *
+ * To compare the formats of the generated allowed tags, regenerate them with a different
+ * `--enum-format` (see bin/amphtml-update.py) between runs.
+ *
+ * To record a spec match profile, generate the allowed tags with `--instrument-spec-matches` and
+ * pass the file to write the profile to, which `bin/amphtml-update.py --spec-profile=<file>` then
+ * orders the tag specs by:
+ *
+ *     wp eval-file tests/benchmark/sanitize-corpus.php /path/to/corpus 1 /path/to/spec-profile.json
+ *
+ * @package AMP
+ */
+
+// phpcs:disable WordPress.WP.AlternativeFunctions, WordPress.Security.EscapeOutput.OutputNotEscaped
+
+if ( empty( $args[0] ) || ! is_dir( $args[0] ) ) {
+	WP_CLI::error( 'Usage: wp eval-file tests/benchmark/sanitize-corpus.php <corpus-dir> [iterations] [spec-profile-file]' );
+}
+
+$corpus     = glob( trailingslashit( $args[0] ) . '*.html' );
+$iterations = isset( $args[1] ) ? max( 1, (int) $args[1] ) : 5;
+$profile    = isset( $args[2] ) ? $args[2] : null;
+if ( empty( $corpus ) ) {
+	WP_CLI::error( 'The corpus directory has no .html files.' );
+}
+if ( $profile && ! method_exists( 'AMP_Allowed_Tags_Generated', 'get_spec_match_counts' ) ) {
+	WP_CLI::error( 'Recording a spec match profile needs the allowed tags generated with --instrument-spec-matches.' );
+}
+
+$documents = array();
+foreach ( $corpus as $file ) {
+	$documents[ basename( $file ) ] = file_get_contents( $file );
+}
+
+// Warm up, so that loading the allowed tags is not counted.
+AMP_Allowed_Tags_Generated::get_allowed_tags();
+
+$best = null;
+for ( $i = 0; $i < $iterations; $i++ ) {
+	$duration = 0.0;
+	foreach ( $documents as $html ) {
+		$dom   = AMP_DOM_Utils::get_dom( $html );
+		$start = microtime( true );
+		AMP_Content_Sanitizer::sanitize_document( $dom, array( 'AMP_Tag_And_Attribute_Sanitizer' => array() ), array() );
+		$duration += microtime( true ) - $start;
+	}
+	if ( null === $best || $duration < $best ) {
+		$best = $duration;
+	}
+}
+
+WP_CLI::line( sprintf( 'Documents: %d, iterations: %d', count( $documents ), $iterations ) );
+WP_CLI::line( sprintf( 'Fastest iteration: %.1f ms (%.2f ms per document)', $best * 1000, $best * 1000 / count( $documents ) ) );
+WP_CLI::line( sprintf( 'Peak memory: %.1f MB', memory_get_peak_usage() / 1024 / 1024 ) );
+
+if ( $profile ) {
+	file_put_contents( $profile, wp_json_encode( AMP_Allowed_Tags_Generated::get_spec_match_counts(), JSON_PRETTY_PRINT ) . "\n" );
+	WP_CLI::success( sprintf( 'Wrote the spec match profile to %s', $profile ) );
+}
@@ -0,0 +1,252 @@
+<?php
+/**
+ * Tests for AMP_Allowed_Tags_Generated.
+ *
+ * @package AMP
+ * @since 1.2
+ */
+
+/**
+ * Tests for AMP_Allowed_Tags_Generated.
+ *
+ * @covers AMP_Allowed_Tags_Generated
+ */
+class Test_AMP_Allowed_Tags_Generated extends WP_UnitTestCase {
+
+	/**
+	 * Test that every tag spec with a spec name is found by it.
+	 *
+	 * @covers AMP_Allowed_Tags_Generated::get_tag_spec_by_spec_name()
+	 */
+	public function test_get_tag_spec_by_spec_name() {
+		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tags() as $tag_specs ) {
+			foreach ( $tag_specs as $tag_spec ) {
+				if ( isset( $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) ) {
+					$this->assertSame( $tag_spec, AMP_Allowed_Tags_Generated::get_tag_spec_by_spec_name( $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) );
+				}
+			}
+		}
+
+		$this->assertNull( AMP_Allowed_Tags_Generated::get_tag_spec_by_spec_name( 'does not exist' ) );
+	}
+
+	/**
+	 * Test that the references to shared attribute specs are resolved.
+	 *
+	 * @covers AMP_Allowed_Tags_Generated::get_allowed_tags()
+	 * @covers AMP_Allowed_Tags_Generated::get_allowed_tag()
+	 */
+	public function test_shared_attr_specs_are_resolved() {
+		$allowed_tags = AMP_Allowed_Tags_Generated::get_allowed_tags();
+		foreach ( $allowed_tags as $node_name => $tag_specs ) {
+			$this->assertSame( $tag_specs, AMP_Allowed_Tags_Generated::get_allowed_tag( $node_name ) );
+			foreach ( $tag_specs as $tag_spec ) {
+				$this->assertInternalType( 'array', $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] );
+				foreach ( $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] as $attr_spec ) {
+					$this->assertInternalType( 'array', $attr_spec );
+				}
+			}
+		}
+
+		$tag_specs = AMP_Allowed_Tags_Generated::get_allowed_tag( 'amp-img' );
+		$this->assertArrayHasKey( 'src', $tag_specs[0][ AMP_Rule_Spec::ATTR_SPEC_LIST ] );
+		$this->assertArrayHasKey( AMP_Rule_Spec::VALUE_URL, $tag_specs[0][ AMP_Rule_Spec::ATTR_SPEC_LIST ]['src'] );
+	}
+
+	/**
+	 * Test getting the tag specs dispatched by an attribute.
+	 *
+	 * @covers AMP_Allowed_Tags_Generated::get_dispatched_tag_specs()
+	 * @covers AMP_Allowed_Tags_Generated::get_dispatched_tag_spec_ids()
+	 */
+	public function test_get_dispatched_tag_specs() {
+		$tag_specs = AMP_Allowed_Tags_Generated::get_dispatched_tag_specs( 'link', 'rel', 'STYLESHEET' );
+		$this->assertNotEmpty( $tag_specs );
+		$this->assertSame( array_keys( $tag_specs ), AMP_Allowed_Tags_Generated::get_dispatched_tag_spec_ids( 'link', 'rel', 'STYLESHEET' ) );
+		$link_specs = AMP_Allowed_Tags_Generated::get_allowed_tag( 'link' );
+		foreach ( $tag_specs as $spec_id => $tag_spec ) {
+			$this->assertSame( $link_specs[ $spec_id ], $tag_spec );
+			$this->assertContains( 'stylesheet', $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ]['rel']['value_casei'] );
+		}
+
+		$tag_specs = AMP_Allowed_Tags_Generated::get_dispatched_tag_specs( 'style', 'amp-keyframes' );
+		$this->assertCount( 1, $tag_specs );
+		$tag_spec = current( $tag_specs );
+		$this->assertSame( 'style[amp-keyframes]', $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] );
+
+		$this->assertSame( array(), AMP_Allowed_Tags_Generated::get_dispatched_tag_specs( 'link', 'rel', 'unknown' ) );
+		$this->assertSame( array(), AMP_Allowed_Tags_Generated::get_dispatched_tag_specs( 'div', 'class', 'foo' ) );
+		$this->assertSame( array(), AMP_Allowed_Tags_Generated::get_dispatched_tag_spec_ids( 'div', 'class', 'foo' ) );
+
+		// The template of amp-story-auto-ads is only dispatched by its type within amp-story-auto-ads.
+		$this->assertSame( array(), AMP_Allowed_Tags_Generated::get_dispatched_tag_spec_ids( 'template', 'type', 'amp-mustache' ) );
+		$this->assertSame( array(), AMP_Allowed_Tags_Generated::get_dispatched_tag_spec_ids( 'template', 'type', 'amp-mustache', 'amp-list' ) );
+		$tag_specs = AMP_Allowed_Tags_Generated::get_dispatched_tag_specs( 'template', 'type', 'amp-mustache', 'amp-story-auto-ads' );
+		$this->assertCount( 1, $tag_specs );
+		$tag_spec = current( $tag_specs );
+		$this->assertSame( 'amp-story-auto-ads', $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['mandatory_parent'] );
+	}
+
+	/**
+	 * Test that the precomputed facts of each tag spec agree with its attribute specs and layouts.
+	 *
+	 * @covers AMP_Allowed_Tags_Generated::get_allowed_tags()
+	 */
+	public function test_precomputed_facts() {
+		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tags() as $tag_specs ) {
+			foreach ( $tag_specs as $tag_spec ) {
+				$this->assertArrayHasKey( AMP_Rule_Spec::PRECOMPUTED, $tag_spec );
+				$precomputed = $tag_spec[ AMP_Rule_Spec::PRECOMPUTED ];
+
+				$mandatory_attrs = array();
+				$attr_aliases    = array();
+				foreach ( $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] as $attr_name => $attr_spec ) {
+					if ( ! empty( $attr_spec[ AMP_Rule_Spec::MANDATORY ] ) ) {
+						$mandatory_attrs[] = $attr_name;
+					}
+					if ( isset( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
+						foreach ( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] as $alternative_name ) {
+							$attr_aliases[ $alternative_name ] = $attr_name;
+						}
+					}
+				}
+				sort( $mandatory_attrs );
+				$this->assertSame( $mandatory_attrs, isset( $precomputed['mandatory_attrs'] ) ? $precomputed['mandatory_attrs'] : array() );
+				$this->assertEquals( $attr_aliases, isset( $precomputed['attr_aliases'] ) ? $precomputed['attr_aliases'] : array() );
+
+				if ( isset( $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['amp_layout']['supported_layouts'] ) ) {
+					$layouts = array_values( wp_array_slice_assoc( AMP_Rule_Spec::$layout_enum, $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['amp_layout']['supported_layouts'] ) );
+					sort( $layouts );
+					$this->assertSame( $layouts, array_keys( $precomputed['supported_layouts'] ) );
+				} else {
+					$this->assertArrayNotHasKey( 'supported_layouts', $precomputed );
+				}
+			}
+		}
+
+		$tag_specs = AMP_Allowed_Tags_Generated::get_allowed_tag( 'amp-img' );
+		$this->assertContains( 'src', $tag_specs[0][ AMP_Rule_Spec::PRECOMPUTED ]['mandatory_attrs'] );
+	}
+
+	/**
+	 * Test that the precomputed dependencies of each tag spec agree with the tag specs and reference points it requires.
+	 *
+	 * @covers AMP_Allowed_Tags_Generated::get_allowed_tags()
+	 */
+	public function test_precomputed_dependencies() {
+		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tags() as $tag_specs ) {
+			foreach ( $tag_specs as $tag_spec ) {
+				$precomputed         = $tag_spec[ AMP_Rule_Spec::PRECOMPUTED ];
+				$required_extensions = isset( $precomputed['required_extensions'] ) ? $precomputed['required_extensions'] : array();
+				if ( isset( $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['requires_extension'] ) ) {
+					$this->assertEmpty( array_diff( $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['requires_extension'], $required_extensions ) );
+				}
+				if ( isset( $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['also_requires_tag_warning'] ) ) {
+					foreach ( $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['also_requires_tag_warning'] as $spec_name ) {
+						$required_tag_spec = AMP_Allowed_Tags_Generated::get_tag_spec_by_spec_name( $spec_name );
+						if ( isset( $required_tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec'] ) ) {
+							$this->assertContains( $required_tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['name'], $required_extensions );
+						}
+					}
+				}
+
+				$reference_point_attrs = array();
+				if ( isset( $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['reference_points'] ) ) {
+					foreach ( $tag_spec[ AMP_Rule_Spec::TAG_SPEC ]['reference_points'] as $spec_name => $instance_attrs ) {
+						$reference_point = AMP_Allowed_Tags_Generated::get_reference_point_spec( $spec_name );
+						if ( empty( $reference_point[ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ) {
+							continue;
+						}
+						foreach ( $reference_point[ AMP_Rule_Spec::ATTR_SPEC_LIST ] as $attr_name => $attr_spec ) {
+							$attr_spec = array_merge( $attr_spec, $instance_attrs );
+							unset( $attr_spec[ AMP_Rule_Spec::MANDATORY ] );
+							$reference_point_attrs[ $attr_name ] = $attr_spec;
+						}
+					}
+				}
+				$this->assertEquals( $reference_point_attrs, isset( $precomputed['reference_point_attrs'] ) ? $precomputed['reference_point_attrs'] : array() );
+			}
+		}
+	}
+
+	/**
+	 * Test getting the script tag specs of an extension.
+	 *
+	 * @covers AMP_Allowed_Tags_Generated::get_extension_names()
+	 * @covers AMP_Allowed_Tags_Generated::get_extension_script_specs()
+	 */
+	public function test_get_extension_script_specs() {
+		$extension_names = AMP_Allowed_Tags_Generated::get_extension_names();
+		$this->assertContains( 'amp-carousel', $extension_names );
+
+		$script_specs = AMP_Allowed_Tags_Generated::get_allowed_tag( 'script' );
+		foreach ( $extension_names as $extension_name ) {
+			$extension_script_specs = AMP_Allowed_Tags_Generated::get_extension_script_specs( $extension_name );
+			$this->assertNotEmpty( $extension_script_specs );
+			foreach ( $extension_script_specs as $spec_id => $script_spec ) {
+				$this->assertSame( $script_specs[ $spec_id ], $script_spec );
+				$this->assertSame( $extension_name, $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['name'] );
+			}
+		}
+
+		$this->assertSame( array(), AMP_Allowed_Tags_Generated::get_extension_script_specs( 'amp-does-not-exist' ) );
+	}
+
+	/**
+	 * Test getting the CSS rules of the style and font stylesheet tag specs.
+	 *
+	 * @covers AMP_Allowed_Tags_Generated::get_css_rules()
+	 */
+	public function test_get_css_rules() {
+		foreach ( array( 'style amp-custom', 'style[amp-keyframes]' ) as $spec_name ) {
+			$tag_spec  = AMP_Allowed_Tags_Generated::get_tag_spec_by_spec_name( $spec_name );
+			$css_spec  = $tag_spec[ AMP_Rule_Spec::CDATA ]['css_spec'];
+			$css_rules = AMP_Allowed_Tags_Generated::get_css_rules( $spec_name );
+			$this->assertSame( $css_spec['allowed_at_rules'], array_keys( $css_rules['allowed_at_rules'] ) );
+			$this->assertSame( $css_spec['declaration'], array_keys( $css_rules['declaration'] ) );
+			$this->assertSame( $css_spec['validate_keyframes'], $css_rules['validate_keyframes'] );
+			$this->assertSame( $tag_spec[ AMP_Rule_Spec::CDATA ]['max_bytes'], $css_rules['max_bytes'] );
+		}
+
+		$tag_spec  = AMP_Allowed_Tags_Generated::get_tag_spec_by_spec_name( 'link rel=stylesheet for fonts' ); // phpcs:ignore WordPress.WP.EnqueuedResources.NonEnqueuedStylesheet
+		$css_rules = AMP_Allowed_Tags_Generated::get_css_rules( 'link rel=stylesheet for fonts' ); // phpcs:ignore WordPress.WP.EnqueuedResources.NonEnqueuedStylesheet
+		$this->assertSame( $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ]['href'][ AMP_Rule_Spec::VALUE_REGEX_PCRE ], $css_rules['font_url_regex'] );
+		$this->assertSame( 1, preg_match( $css_rules['font_url_regex'], 'https://fonts.googleapis.com/css?family=Tangerine' ) );
+		$this->assertSame( 0, preg_match( $css_rules['font_url_regex'], 'https://example.com/fonts.css' ) );
+
+		$this->assertNull( AMP_Allowed_Tags_Generated::get_css_rules( 'amp-img' ) );
+	}
+
+	/**
+	 * Test that each regex of the specs has a PCRE pattern which compiles.
+	 *
+	 * @covers AMP_Allowed_Tags_Generated::get_allowed_tags()
+	 */
+	public function test_pcre_patterns() {
+		$keys = array(
+			AMP_Rule_Spec::VALUE_REGEX             => '/^(%s)$/u',
+			AMP_Rule_Spec::VALUE_REGEX_CASEI       => '/^(%s)$/ui',
+			AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX => '/%s/u',
+		);
+		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tags() as $tag_specs ) {
+			foreach ( $tag_specs as $tag_spec ) {
+				foreach ( $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] as $attr_spec ) {
+					foreach ( $keys as $key => $format ) {
+						if ( ! isset( $attr_spec[ $key ] ) ) {
+							continue;
+						}
+						$pattern = $attr_spec[ $key . '_pcre' ];
+						$this->assertSame( sprintf( $format, str_replace( '/', '\\/', str_replace( '\\/', '/', $attr_spec[ $key ] ) ) ), $pattern );
+						$this->assertNotFalse( preg_match( $pattern, '' ), $pattern );
+					}
+				}
+				if ( isset( $tag_spec[ AMP_Rule_Spec::CDATA ]['blacklisted_cdata_regex'] ) ) {
+					$this->assertNotFalse( preg_match( $tag_spec[ AMP_Rule_Spec::CDATA ]['blacklisted_cdata_regex_pcre'], '' ) );
+				}
+				if ( isset( $tag_spec[ AMP_Rule_Spec::CDATA ]['cdata_regex'] ) ) {
+					$this->assertNotFalse( preg_match( $tag_spec[ AMP_Rule_Spec::CDATA ]['cdata_regex_pcre'], '' ) );
+				}
+			}
+		}
+	}
+}
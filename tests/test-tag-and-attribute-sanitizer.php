@@ -1553,6 +1553,38 @@ class AMP_Tag_And_Attribute_Sanitizer_Test extends WP_UnitTestCase {
 		$this->assertFalse( $sanitizer->is_missing_mandatory_attribute( $spec_non_array, $node ) );
 	}
 
+	/**
+	 * Tests that the tag specs added by the sanitizer args remain candidates when an attribute dispatches a tag to its generated tag specs.
+	 *
+	 * @covers AMP_Tag_And_Attribute_Sanitizer::get_dispatched_rule_spec_lists()
+	 */
+	public function test_dispatched_rule_spec_list_keeps_added_tag_specs() {
+		$source    = '<link rel="stylesheet" href="https://example.com/style.css">';
+		$dom       = AMP_DOM_Utils::get_dom_from_content( $source );
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom, array( 'allow_dirty_styles' => true ) );
+		$sanitizer->sanitize();
+		$this->assertEqualMarkup( $source, AMP_DOM_Utils::get_content_from_dom( $dom ) );
+
+		$dom       = AMP_DOM_Utils::get_dom_from_content( $source );
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom );
+		$sanitizer->sanitize();
+		$this->assertEqualMarkup( '', AMP_DOM_Utils::get_content_from_dom( $dom ) );
+	}
+
+	/**
+	 * Tests that tag specs dispatched along with their mandatory parent only narrow down the candidates under that parent.
+	 *
+	 * @covers AMP_Tag_And_Attribute_Sanitizer::get_dispatched_rule_spec_lists()
+	 */
+	public function test_dispatched_rule_spec_lists_by_parent() {
+		$source    = '<amp-list src="https://example.com/items.json" width="400" height="100" layout="fixed"><template type="amp-mustache">{{title}}</template></amp-list>';
+		$dom       = AMP_DOM_Utils::get_dom_from_content( $source );
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom );
+		$sanitizer->sanitize();
+		$this->assertEqualMarkup( $source, AMP_DOM_Utils::get_content_from_dom( $dom ) );
+		$this->assertEqualSets( array( 'amp-list', 'amp-mustache' ), array_keys( $sanitizer->get_scripts() ) );
+	}
+
 	/**
 	 * Test sanitization of tags and attributes.
 	 *